@@ -0,0 +1,82 @@
+"""Benchmark mémoire et débit de l'analyse syntaxique.
+
+Mesure, pour un appel contenant un grand tableau d'entiers :
+- le nombre d'octets alloués par nœud d'AST (via ``tracemalloc``) ;
+- le débit de l'analyse syntaxique (nœuds par seconde).
+
+Trois modes de construction sont comparés : standard (une enveloppe
+``ArgumentNode`` par argument), compact (``compact_arguments=True``) et
+colonnaire (``SyntaxAnalyzer.parse_columnar``).
+
+Usage :
+    python benchmarks/bench_ast_memory.py --size 1000000
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+from baobab_geek_interpreter.lexical.lexical_analyzer import LexicalAnalyzer
+from baobab_geek_interpreter.lexical.token import Token
+from baobab_geek_interpreter.syntax.syntax_analyzer import SyntaxAnalyzer
+
+
+def build_tokens(size: int) -> List[Token]:
+    """Construit les tokens d'un appel ``bench([0, 1, ..., size - 1], 1, 2, 3)``.
+
+    :param size: Nombre d'éléments du tableau.
+    :type size: int
+    :return: Liste des tokens.
+    :rtype: List[Token]
+    """
+    values = ", ".join(str(i) for i in range(size))
+    return LexicalAnalyzer().analyze(f"bench([{values}], 1, 2, 3)")
+
+
+def measure(tokens: List[Token], mode: str) -> Tuple[float, float, float]:
+    """Mesure la mémoire et la durée d'une analyse syntaxique.
+
+    :param tokens: Tokens à analyser.
+    :type tokens: List[Token]
+    :param mode: Mode de construction (``standard``, ``compact`` ou ``columnar``).
+    :type mode: str
+    :return: Octets par nœud, durée en secondes, nœuds par seconde.
+    :rtype: Tuple[float, float, float]
+    """
+    parser = SyntaxAnalyzer(compact_arguments=mode == "compact")
+    parse: Callable[[List[Token]], Any] = (
+        parser.parse_columnar if mode == "columnar" else parser.parse
+    )
+    node_count = len(tokens) // 2
+
+    tracemalloc.start()
+    ast = parse(tokens)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del ast
+
+    start = time.perf_counter()
+    parse(tokens)
+    elapsed = time.perf_counter() - start
+    return allocated / node_count, elapsed, node_count / elapsed
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--size", type=int, default=100_000, help="taille du tableau")
+    options = arg_parser.parse_args()
+
+    tokens = build_tokens(options.size)
+    print(f"Tableau de {options.size} éléments ({len(tokens)} tokens)")
+    for mode in ("standard", "compact", "columnar"):
+        per_node, elapsed, throughput = measure(tokens, mode)
+        print(
+            f"{mode:>9} : {per_node:6.1f} octets/nœud, "
+            f"{elapsed * 1000:8.1f} ms, {throughput:,.0f} nœuds/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark de la sérialisation binaire des appels analysés.
+
+Compare, pour des appels contenant de grands tableaux :
+- le rechargement par ``ASTSerializer.loads`` ;
+- la ré-analyse lexicale et syntaxique de la source d'origine ;
+- ``pickle.loads`` de l'AST objet, à titre de référence.
+
+Affiche aussi la taille des données produites par chaque méthode.
+
+Usage :
+    python benchmarks/bench_ast_serializer.py --size 100000
+"""
+
+import argparse
+import pickle
+import time
+from typing import Any, Callable, Dict
+
+from baobab_geek_interpreter.lexical.lexical_analyzer import LexicalAnalyzer
+from baobab_geek_interpreter.syntax.ast_serializer import ASTSerializer
+from baobab_geek_interpreter.syntax.syntax_analyzer import SyntaxAnalyzer
+
+
+def build_sources(size: int) -> Dict[str, str]:
+    """Construit les sources des appels mesurés.
+
+    :param size: Nombre d'éléments des tableaux.
+    :type size: int
+    :return: Sources indexées par nom de cas.
+    :rtype: Dict[str, str]
+    """
+    ints = ", ".join(str(i * 7919) for i in range(size))
+    floats = ", ".join(f"{i * 0.5}" for i in range(size))
+    strings = ", ".join(f'"item{i}"' for i in range(size))
+    return {
+        "int64": f"bench([{ints}], 1)",
+        "float64": f"bench([{floats}], 2.5)",
+        "string": f"bench([{strings}])",
+    }
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    """Retourne la meilleure durée d'exécution sur plusieurs essais.
+
+    :param func: Fonction à mesurer.
+    :type func: Callable[[], Any]
+    :param repeat: Nombre d'essais.
+    :type repeat: int
+    :return: Durée minimale en secondes.
+    :rtype: float
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--size", type=int, default=100_000, help="taille des tableaux")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="nombre d'essais")
+    options = arg_parser.parse_args()
+
+    lexer = LexicalAnalyzer()
+    parser = SyntaxAnalyzer(compact_arguments=True)
+    for case, source in build_sources(options.size).items():
+        ast = parser.parse(lexer.analyze(source))
+        data = ASTSerializer.dumps(ast)
+        pickled = pickle.dumps(ast, protocol=pickle.HIGHEST_PROTOCOL)
+
+        reparse = best_of(lambda src=source: parser.parse(lexer.analyze(src)), options.repeat)
+        load = best_of(lambda raw=data: ASTSerializer.loads(raw), options.repeat)
+        unpickle = best_of(lambda raw=pickled: pickle.loads(raw), options.repeat)
+        dump = best_of(lambda node=ast: ASTSerializer.dumps(node), options.repeat)
+
+        print(
+            f"[{case}] source {len(source):,} o, binaire {len(data):,} o, pickle {len(pickled):,} o"
+        )
+        print(f"  ré-analyse : {reparse * 1000:8.1f} ms")
+        print(f"  loads      : {load * 1000:8.1f} ms ({reparse / load:5.1f}x plus rapide)")
+        print(f"  pickle     : {unpickle * 1000:8.1f} ms")
+        print(f"  dumps      : {dump * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Benchmark de la découverte des services.
+
+Génère un paquet temporaire de modules de services, puis compare :
+- le parcours des modules déjà importés par ``inspect.getmembers`` (ancienne
+  implémentation de ``SymbolTable.discover_services``) et par
+  ``vars(module)`` (``SymbolTable.discover_services``) ;
+- la découverte récursive du paquet, imports compris
+  (``SymbolTable.discover_package``), en série et en parallèle.
+
+Usage :
+    python benchmarks/bench_discovery.py --modules 300
+"""
+
+import argparse
+import inspect
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, List
+
+from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+
+MODULE_TEMPLATE = '''
+from baobab_geek_interpreter.execution.service_decorator import service
+
+LIMIT = 100
+NAMES = [str(i) for i in range(LIMIT)]
+
+class Helper:
+    """Classe auxiliaire."""
+
+    def run(self):
+        return LIMIT
+
+def helper(x):
+    return x
+'''
+
+SERVICE_TEMPLATE = """
+@service
+def service_{module}_{index}(x: int) -> int:
+    return x + {index}
+"""
+
+
+def write_package(root: Path, name: str, modules: int, services: int) -> None:
+    """Écrit un paquet de modules de services, répartis en sous-paquets.
+
+    :param root: Répertoire du paquet.
+    :type root: Path
+    :param name: Nom du paquet.
+    :type name: str
+    :param modules: Nombre de modules.
+    :type modules: int
+    :param services: Nombre de services par module.
+    :type services: int
+    """
+    for index in range(modules):
+        package = root / name / f"group_{index % 10}"
+        package.mkdir(parents=True, exist_ok=True)
+        (package / "__init__.py").touch()
+        body = MODULE_TEMPLATE + "".join(
+            SERVICE_TEMPLATE.format(module=index, index=service) for service in range(services)
+        )
+        (package / f"module_{index}.py").write_text(body)
+    (root / name / "__init__.py").touch()
+
+
+def getmembers_scan(table: SymbolTable, module: ModuleType) -> None:
+    """Ancienne découverte des services d'un module par ``inspect.getmembers``.
+
+    :param table: Table des symboles.
+    :type table: SymbolTable
+    :param module: Module à analyser.
+    :type module: ModuleType
+    """
+    for name, obj in inspect.getmembers(module):
+        if callable(obj) and getattr(obj, "_is_service", False):
+            table.register(getattr(obj, "_service_name", name), obj)
+
+
+def best(func: Callable[[], Any], repeat: int) -> float:
+    """Retourne la meilleure durée d'une fonction sur plusieurs essais.
+
+    :param func: Fonction à mesurer.
+    :type func: Callable[[], Any]
+    :param repeat: Nombre d'essais.
+    :type repeat: int
+    :return: Durée minimale en secondes.
+    :rtype: float
+    """
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--modules", type=int, default=300, help="nombre de modules")
+    arg_parser.add_argument("--services", type=int, default=5, help="services par module")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="nombre d'essais")
+    arg_parser.add_argument("--workers", type=int, default=8, help="threads d'import")
+    options = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        sys.path.insert(0, directory)
+        names = ["bench_serial", "bench_parallel"]
+        for name in names:
+            write_package(root, name, options.modules, options.services)
+
+        for name, parallel in zip(names, (False, True)):
+            report = SymbolTable().discover_package(
+                name, parallel=parallel, max_workers=options.workers
+            )
+            mode = "parallèle" if parallel else "série"
+            print(
+                f"[paquet, imports compris, {mode}] {report['modules']} modules, "
+                f"{report['services']} services en {report['seconds'] * 1e3:8.2f} ms"
+            )
+
+        modules: List[ModuleType] = [
+            module for key, module in sys.modules.items() if key.startswith("bench_serial.")
+        ]
+
+        def old() -> None:
+            table = SymbolTable()
+            for module in modules:
+                getmembers_scan(table, module)
+
+        def new() -> None:
+            table = SymbolTable()
+            for module in modules:
+                table.discover_services(module)
+
+        before = best(old, options.repeat)
+        after = best(new, options.repeat)
+        print(
+            f"[modules importés] inspect.getmembers {before * 1e3:8.2f} ms, "
+            f"vars(module) {after * 1e3:8.2f} ms ({before / after:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Benchmark du coût d'import du paquet.
+
+Lance un nouveau processus Python par instruction d'import mesurée et
+rapporte :
+- le coût total d'import relevé par ``python -X importtime`` (somme des
+  durées cumulées des imports de premier niveau, hors modules déjà importés
+  par le démarrage de Python) ;
+- la durée réelle de l'instruction, meilleure de plusieurs exécutions ;
+- les modules les plus coûteux ;
+- les sous-systèmes optionnels importés (``OPTIONAL``) : l'instruction
+  « interpréteur » ne doit en importer aucun, ils le sont à leur première
+  utilisation.
+
+Les exports des paquets sont paresseux (PEP 562) : ``import
+baobab_geek_interpreter`` n'importe aucun module de l'interpréteur, et
+l'instruction « tous les exports » mesure l'équivalent de l'ancien import
+complet.
+
+Usage :
+    python benchmarks/bench_import.py --repeat 5
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+import baobab_geek_interpreter
+
+STATEMENTS = {
+    "paquet seul": "import baobab_geek_interpreter",
+    "décorateur service": "from baobab_geek_interpreter import service",
+    "interpréteur": "from baobab_geek_interpreter import Interpreter",
+    "tous les exports": (
+        "import baobab_geek_interpreter as p; "
+        "[getattr(p, n) for n in p.__all__]; "
+        "import baobab_geek_interpreter.cache, baobab_geek_interpreter.execution, "
+        "baobab_geek_interpreter.lexical, baobab_geek_interpreter.semantic, "
+        "baobab_geek_interpreter.syntax, baobab_geek_interpreter.vm; "
+        "[getattr(sys.modules[m], n) for m in list(sys.modules) "
+        "if m.startswith('baobab_geek_interpreter') and m.count('.') == 1 "
+        "for n in getattr(sys.modules[m], '__all__', [])]"
+    ),
+}
+
+OPTIONAL = [
+    "asyncio",
+    "concurrent.futures",
+    "multiprocessing",
+    "sqlite3",
+    "baobab_geek_interpreter.cache.disk_call_cache",
+    "baobab_geek_interpreter.execution.micro_batcher",
+    "baobab_geek_interpreter.execution.result_stream",
+    "baobab_geek_interpreter.execution.service_process_pool",
+    "baobab_geek_interpreter.semantic.service_manifest",
+    "baobab_geek_interpreter.vm.code_generator",
+    "baobab_geek_interpreter.vm.compiler",
+]
+
+WALL_CLOCK = """
+import sys
+import time
+
+start = time.perf_counter()
+exec(sys.argv[1])
+print(time.perf_counter() - start)
+"""
+
+
+def run(arguments: List[str], env: Dict[str, str]) -> subprocess.CompletedProcess:
+    """Lance un nouveau processus Python.
+
+    :param arguments: Arguments de l'interpréteur Python.
+    :type arguments: List[str]
+    :param env: Variables d'environnement.
+    :type env: Dict[str, str]
+    :return: Processus terminé, sorties capturées.
+    :rtype: subprocess.CompletedProcess
+    """
+    return subprocess.run(
+        [sys.executable, *arguments], env=env, check=True, capture_output=True, text=True
+    )
+
+
+def import_times(statement: str, env: Dict[str, str]) -> List[Tuple[str, int, int]]:
+    """Relève les durées d'import d'une instruction par ``-X importtime``.
+
+    :param statement: Instruction Python.
+    :type statement: str
+    :param env: Variables d'environnement.
+    :type env: Dict[str, str]
+    :return: Nom (indenté selon la profondeur), durée propre et durée cumulée
+        en microsecondes de chaque import.
+    :rtype: List[Tuple[str, int, int]]
+    """
+    stderr = run(["-X", "importtime", "-c", f"import sys; {statement}"], env).stderr
+    times = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, cumulative, name = line[len("import time:") :].split("|")
+        times.append((name.rstrip()[1:], int(self_time), int(cumulative)))
+    return times
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--repeat", type=int, default=5, help="nombre d'exécutions")
+    arg_parser.add_argument("--top", type=int, default=5, help="modules les plus coûteux")
+    options = arg_parser.parse_args()
+
+    source = Path(baobab_geek_interpreter.__file__).parent.parent
+    env = dict(os.environ, PYTHONPATH=str(source))
+    startup: Set[str] = {name.strip() for name, _, _ in import_times("pass", env)}
+
+    for label, statement in STATEMENTS.items():
+        times = [entry for entry in import_times(statement, env) if entry[0].strip() not in startup]
+        total = sum(cumulative for name, _, cumulative in times if not name.startswith(" "))
+        wall = min(
+            float(run(["-c", WALL_CLOCK, f"import sys; {statement}"], env).stdout)
+            for _ in range(options.repeat)
+        )
+        heaviest = sorted(times, key=lambda entry: entry[1], reverse=True)[: options.top]
+        print(
+            f"[{label}] importtime {total / 1e3:7.2f} ms, durée réelle {wall * 1e3:7.2f} ms, "
+            f"{len(times)} modules"
+        )
+        for name, self_time, _ in heaviest:
+            print(f"    {self_time / 1e3:6.2f} ms  {name.strip()}")
+        loaded = {name.strip() for name, _, _ in times}
+        optional = [module for module in OPTIONAL if module in loaded]
+        print(f"    optionnels : {', '.join(optional) or 'aucun'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Benchmark du démarrage à froid d'un worker avec et sans manifeste de services.
+
+Génère un paquet temporaire de services (par défaut 50 modules de 10
+services, soit 500 services), puis mesure dans un nouveau processus Python :
+- l'import de l'interpréteur et l'enregistrement des services par
+  ``Interpreter.register_package`` (import de tous les modules) ;
+- l'import de l'interpréteur et ``Interpreter.load_manifest`` sur le
+  manifeste précalculé (``ServiceManifest``).
+
+Sont mesurés séparément l'import de l'interpréteur, commun aux deux modes,
+l'enregistrement des services et le premier appel d'un service, qui importe
+son module dans le second mode.
+
+Usage :
+    python benchmarks/bench_manifest.py --modules 50 --services 10
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import List, Tuple
+
+import baobab_geek_interpreter
+from baobab_geek_interpreter.semantic.service_manifest import ServiceManifest
+
+MODULE_TEMPLATE = """
+import decimal
+import fractions
+import statistics
+from typing import List
+
+from baobab_geek_interpreter.execution.service_decorator import service
+"""
+
+SERVICE_TEMPLATE = """
+@service
+def service_{module}_{index}(values: List[int], factor: int = {index}) -> int:
+    return statistics.median(values) * factor
+"""
+
+WORKER = """
+import sys
+import time
+
+start = time.perf_counter()
+from baobab_geek_interpreter import Interpreter
+
+interpreter = Interpreter()
+imported = time.perf_counter()
+if sys.argv[1] == "manifest":
+    interpreter.load_manifest(sys.argv[2])
+else:
+    interpreter.register_package("bench_services")
+ready = time.perf_counter()
+interpreter.interpret("service_0_1([1, 2, 3], 2)")
+called = time.perf_counter()
+print(imported - start, ready - imported, called - ready, len(interpreter.list_services()))
+"""
+
+
+def write_package(root: Path, modules: int, services: int) -> None:
+    """Écrit le paquet de services ``bench_services``.
+
+    :param root: Répertoire parent du paquet.
+    :type root: Path
+    :param modules: Nombre de modules.
+    :type modules: int
+    :param services: Nombre de services par module.
+    :type services: int
+    """
+    package = root / "bench_services"
+    package.mkdir()
+    (package / "__init__.py").touch()
+    for module in range(modules):
+        body = MODULE_TEMPLATE + "".join(
+            SERVICE_TEMPLATE.format(module=module, index=index) for index in range(services)
+        )
+        (package / f"module_{module}.py").write_text(body)
+
+
+def run_worker(mode: str, manifest: Path, env: dict) -> Tuple[float, float, float, int]:
+    """Démarre un worker dans un nouveau processus.
+
+    :param mode: ``"manifest"`` ou ``"import"``.
+    :type mode: str
+    :param manifest: Chemin du manifeste.
+    :type manifest: Path
+    :param env: Variables d'environnement du processus.
+    :type env: dict
+    :return: Durées de l'import de l'interpréteur, de l'enregistrement des
+        services et du premier appel, puis nombre de services.
+    :rtype: Tuple[float, float, float, int]
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", WORKER, mode, str(manifest)],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    return float(output[0]), float(output[1]), float(output[2]), int(output[3])
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--modules", type=int, default=50, help="nombre de modules")
+    arg_parser.add_argument("--services", type=int, default=10, help="services par module")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="nombre de démarrages")
+    options = arg_parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        write_package(root, options.modules, options.services)
+        sys.path.insert(0, directory)
+        manifest = root / "services.json"
+        ServiceManifest.build(["bench_services"], recursive=True).save(manifest)
+        source = Path(baobab_geek_interpreter.__file__).parent.parent
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([directory, str(source)]))
+
+        for mode, label in (("import", "import des modules"), ("manifest", "manifeste")):
+            runs: List[Tuple[float, float, float, int]] = [
+                run_worker(mode, manifest, env) for _ in range(options.repeat)
+            ]
+            imported, registered, first_call = (
+                min(run[index] for run in runs) for index in range(3)
+            )
+            print(
+                f"[{label:18}] {runs[0][3]} services, import de l'interpréteur "
+                f"{imported * 1e3:7.2f} ms, enregistrement {registered * 1e3:7.2f} ms, "
+                f"premier appel {first_call * 1e3:6.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
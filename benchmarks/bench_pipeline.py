@@ -0,0 +1,122 @@
+"""Benchmark de la mémoire d'un pipeline de services.
+
+Interprète un pipeline de trois services traitant N entiers (10 millions par
+défaut) et mesure le pic de mémoire allouée (``tracemalloc``) :
+- services générateurs (``Iterator[int]``) : les éléments circulent un à un
+  d'un service au suivant ;
+- services retournant des listes (``list[int]``) : chaque étape matérialise
+  sa liste complète.
+
+Usage :
+    python benchmarks/bench_pipeline.py --size 10000000
+"""
+
+import argparse
+import time
+import tracemalloc
+from typing import Iterable, Iterator, Tuple
+
+from baobab_geek_interpreter import Interpreter, service
+
+
+@service
+def numbers(count: int) -> Iterator[int]:
+    """Produit les entiers de 0 à ``count`` exclu.
+
+    :param count: Nombre d'entiers.
+    :type count: int
+    :return: Flux des entiers.
+    :rtype: Iterator[int]
+    """
+    return iter(range(count))
+
+
+@service
+def evens(values: Iterator[int]) -> Iterator[int]:
+    """Filtre les entiers pairs d'un flux.
+
+    :param values: Flux d'entiers.
+    :type values: Iterator[int]
+    :return: Flux des entiers pairs.
+    :rtype: Iterator[int]
+    """
+    return (value for value in values if value % 2 == 0)
+
+
+@service
+def number_list(count: int) -> list[int]:
+    """Retourne la liste des entiers de 0 à ``count`` exclu.
+
+    :param count: Nombre d'entiers.
+    :type count: int
+    :return: Liste des entiers.
+    :rtype: list[int]
+    """
+    return list(range(count))
+
+
+@service
+def even_list(values: list[int]) -> list[int]:
+    """Retourne la liste des entiers pairs d'une liste.
+
+    :param values: Liste d'entiers.
+    :type values: list[int]
+    :return: Liste des entiers pairs.
+    :rtype: list[int]
+    """
+    return [value for value in values if value % 2 == 0]
+
+
+@service
+def total(values: Iterable[int]) -> int:
+    """Retourne la somme des entiers reçus.
+
+    :param values: Entiers, en liste ou en flux.
+    :type values: Iterable[int]
+    :return: Somme des entiers.
+    :rtype: int
+    """
+    return sum(values)
+
+
+def measure(interpreter: Interpreter, source: str) -> Tuple[float, int]:
+    """Interprète un pipeline et mesure sa durée et son pic de mémoire.
+
+    :param interpreter: Interpréteur.
+    :type interpreter: Interpreter
+    :param source: Code source du pipeline.
+    :type source: str
+    :return: Durée en secondes et pic de mémoire en octets.
+    :rtype: Tuple[float, int]
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    interpreter.interpret(source)
+    duration = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, peak
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--size", type=int, default=10_000_000, help="nombre d'éléments")
+    options = arg_parser.parse_args()
+
+    interpreter = Interpreter()
+    for func in (numbers, evens, number_list, even_list, total):
+        interpreter.register_service(func.__name__, func)
+
+    print(f"pipeline de {options.size:,} entiers")
+    for label, source in (
+        ("générateurs", f"numbers({options.size}) | evens() | total()"),
+        ("listes", f"number_list({options.size}) | even_list() | total()"),
+    ):
+        duration, peak = measure(interpreter, source)
+        print(f"  {label:12s} {duration * 1000:8.1f} ms, pic mémoire {peak / 1024:12,.1f} Kio")
+    interpreter.close()
+
+
+if __name__ == "__main__":
+    main()
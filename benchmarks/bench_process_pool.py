@@ -0,0 +1,107 @@
+"""Benchmark de l'exécution des services dans un pool de processus.
+
+Exécute un service limité par le processeur (comptage naïf de nombres
+premiers) depuis plusieurs threads :
+- en ligne, dans les threads appelants (sérialisés par le GIL) ;
+- dans un ``ServiceProcessPool`` (``@service(executor="process")``).
+
+Affiche le débit de chaque mode et l'accélération obtenue, pour un nombre
+croissant de processus.
+
+Usage :
+    python benchmarks/bench_process_pool.py --calls 64 --limit 30000
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from baobab_geek_interpreter import Interpreter, service
+from baobab_geek_interpreter.execution.service_process_pool import ServiceProcessPool
+
+
+def count_primes(limit: int) -> int:
+    """Compte les nombres premiers inférieurs à ``limit`` par divisions successives.
+
+    :param limit: Borne exclue.
+    :type limit: int
+    :return: Nombre de nombres premiers.
+    :rtype: int
+    """
+    count = 0
+    for candidate in range(2, limit):
+        divisor = 2
+        while divisor * divisor <= candidate:
+            if candidate % divisor == 0:
+                break
+            divisor += 1
+        else:
+            count += 1
+    return count
+
+
+@service
+def primes_inline(limit: int) -> int:
+    """Service exécuté dans le thread appelant."""
+    return count_primes(limit)
+
+
+@service(executor="process")
+def primes_process(limit: int) -> int:
+    """Service exécuté dans un processus de travail."""
+    return count_primes(limit)
+
+
+def run(interpreter: Interpreter, source: str, calls: int, threads: int) -> float:
+    """Interprète ``calls`` fois une source depuis plusieurs threads.
+
+    :param interpreter: Interpréteur configuré.
+    :type interpreter: Interpreter
+    :param source: Code source interprété.
+    :type source: str
+    :param calls: Nombre d'appels.
+    :type calls: int
+    :param threads: Nombre de threads appelants.
+    :type threads: int
+    :return: Durée totale en secondes.
+    :rtype: float
+    """
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        list(pool.map(lambda _: interpreter.interpret(source), range(calls)))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--calls", type=int, default=64, help="nombre d'appels")
+    arg_parser.add_argument("--limit", type=int, default=30_000, help="borne du comptage")
+    arg_parser.add_argument(
+        "--max-workers", type=int, default=os.cpu_count() or 1, help="nombre maximal de processus"
+    )
+    options = arg_parser.parse_args()
+
+    inline = Interpreter()
+    inline.register_service("primes", primes_inline)
+    baseline = run(inline, f"primes({options.limit})", options.calls, options.max_workers)
+    print(f"en ligne ({options.max_workers} threads) : {options.calls / baseline:8.1f} appels/s")
+
+    workers = 1
+    while workers <= options.max_workers:
+        with ServiceProcessPool(max_workers=workers) as pool:
+            interpreter = Interpreter(process_pool=pool)
+            interpreter.register_service("primes", primes_process)
+            # Démarrage des processus hors mesure
+            run(interpreter, "primes(10)", workers, workers)
+            elapsed = run(interpreter, f"primes({options.limit})", options.calls, workers)
+        print(
+            f"processus ({workers:2d})         : {options.calls / elapsed:8.1f} appels/s "
+            f"({baseline / elapsed:5.2f}x)"
+        )
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark de la transmission des grands tableaux aux processus de travail.
+
+Appelle, dans un ``ServiceProcessPool``, un service recevant un tableau de
+flottants (10 millions d'éléments par défaut) :
+- tableau sérialisé par ``pickle`` (comportement par défaut) ;
+- tableau copié en mémoire partagée (``shared_memory_threshold``), reçu par
+  le service comme une ``memoryview`` sans copie.
+
+Deux services sont mesurés : ``length`` ne lit pas les éléments (coût de
+transmission seul) et ``total`` les parcourt tous.
+
+Usage :
+    python benchmarks/bench_shared_memory.py --size 10000000
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Optional, Sequence
+
+from baobab_geek_interpreter.execution.service_process_pool import ServiceProcessPool
+
+
+def length(values: Sequence[float]) -> int:
+    """Retourne le nombre d'éléments du tableau reçu.
+
+    :param values: Tableau reçu.
+    :type values: Sequence[float]
+    :return: Nombre d'éléments.
+    :rtype: int
+    """
+    return len(values)
+
+
+def total(values: Sequence[float]) -> float:
+    """Retourne la somme des éléments du tableau reçu.
+
+    :param values: Tableau reçu.
+    :type values: Sequence[float]
+    :return: Somme des éléments.
+    :rtype: float
+    """
+    return sum(values)
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    """Retourne la meilleure durée d'exécution sur plusieurs essais.
+
+    :param func: Fonction à mesurer.
+    :type func: Callable[[], Any]
+    :param repeat: Nombre d'essais.
+    :type repeat: int
+    :return: Durée minimale en secondes.
+    :rtype: float
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(values: list, threshold: Optional[int], repeat: int) -> dict:
+    """Mesure les appels des services pour un mode de transmission.
+
+    :param values: Tableau transmis.
+    :type values: list
+    :param threshold: Seuil de transmission en mémoire partagée.
+    :type threshold: Optional[int]
+    :param repeat: Nombre d'essais.
+    :type repeat: int
+    :return: Durées en secondes indexées par nom de service.
+    :rtype: dict
+    """
+    with ServiceProcessPool(max_workers=1, shared_memory_threshold=threshold) as pool:
+        pool.call(length, ([0.0],))
+        return {
+            func.__name__: best_of(lambda f=func: pool.call(f, (values,)), repeat)
+            for func in (length, total)
+        }
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--size", type=int, default=10_000_000, help="taille du tableau")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="nombre d'essais")
+    options = arg_parser.parse_args()
+
+    values = [i * 0.5 for i in range(options.size)]
+    pickled = measure(values, None, options.repeat)
+    shared = measure(values, 1, options.repeat)
+    print(f"tableau de {options.size:,} flottants")
+    for name, duration in pickled.items():
+        print(
+            f"  {name:6s} pickle {duration * 1000:8.1f} ms, "
+            f"mémoire partagée {shared[name] * 1000:8.1f} ms "
+            f"({duration / shared[name]:4.1f}x plus rapide)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Benchmark de la validation des arguments par les caches de formes de types.
+
+Compare, pour des arguments déjà extraits de l'AST, le coût :
+- de la vérification complète (tableaux puis ``TypeChecker.check_types``) ;
+- de ``SemanticAnalyzer.check_arguments`` avec une forme déjà validée
+  (``TypeShapeCache``).
+
+Usage :
+    python benchmarks/bench_type_shape_cache.py --calls 20000
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from baobab_geek_interpreter.semantic.semantic_analyzer import SemanticAnalyzer
+from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+from baobab_geek_interpreter.semantic.type_checker import TypeChecker
+
+
+def add(a: int, b: int) -> int:
+    """Additionne deux entiers.
+
+    :param a: Premier entier.
+    :type a: int
+    :param b: Second entier.
+    :type b: int
+    :return: Somme.
+    :rtype: int
+    """
+    return a + b
+
+
+def scale(values: list[float], factor: float) -> list[float]:
+    """Multiplie les éléments d'un tableau.
+
+    :param values: Éléments.
+    :type values: list[float]
+    :param factor: Facteur.
+    :type factor: float
+    :return: Éléments multipliés.
+    :rtype: list[float]
+    """
+    return [value * factor for value in values]
+
+
+def build_cases(size: int) -> Dict[str, Tuple[str, Callable[..., Any], List[Any]]]:
+    """Construit les appels mesurés.
+
+    :param size: Nombre d'éléments du tableau.
+    :type size: int
+    :return: Nom du service, fonction et arguments, indexés par nom de cas.
+    :rtype: Dict[str, Tuple[str, Callable[..., Any], List[Any]]]
+    """
+    return {
+        "scalaires": ("add", add, [1, 2]),
+        f"tableau ({size})": ("scale", scale, [[float(i) for i in range(size)], 2.0]),
+    }
+
+
+def per_call(func: Callable[[], Any], calls: int, repeat: int) -> float:
+    """Retourne la meilleure durée moyenne d'un appel sur plusieurs essais.
+
+    :param func: Fonction à mesurer.
+    :type func: Callable[[], Any]
+    :param calls: Nombre d'appels par essai.
+    :type calls: int
+    :param repeat: Nombre d'essais.
+    :type repeat: int
+    :return: Durée minimale par appel en secondes.
+    :rtype: float
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--calls", type=int, default=20_000, help="appels par essai")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="nombre d'essais")
+    arg_parser.add_argument("--size", type=int, default=100, help="taille du tableau")
+    options = arg_parser.parse_args()
+
+    analyzer = SemanticAnalyzer(SymbolTable())
+    for case, (name, func, args) in build_cases(options.size).items():
+
+        def full(func: Callable[..., Any] = func, args: List[Any] = args) -> None:
+            for value in args:
+                if isinstance(value, list):
+                    TypeChecker.is_array_homogeneous(value)
+                    TypeChecker.has_nested_arrays(value)
+            assert TypeChecker.check_types(func, args)
+
+        def cached(
+            name: str = name, func: Callable[..., Any] = func, args: List[Any] = args
+        ) -> None:
+            analyzer.check_arguments(name, func, args)
+
+        complete = per_call(full, options.calls, options.repeat)
+        shape = per_call(cached, options.calls, options.repeat)
+        print(
+            f"[{case}] vérification complète {complete * 1e6:8.2f} µs, "
+            f"forme en cache {shape * 1e6:8.2f} µs ({complete / shape:4.1f}x)"
+        )
+    print(analyzer.get_type_cache_stats())
+
+
+if __name__ == "__main__":
+    main()
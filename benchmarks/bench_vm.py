@@ -0,0 +1,142 @@
+"""Benchmark de l'exécution des appels compilés par la machine virtuelle.
+
+Compare, pour des appels déjà analysés, le coût d'exécution :
+- du parcours de l'AST par le visiteur (``Executor.execute``) ;
+- du programme compilé exécuté par la machine virtuelle
+  (``Executor.execute_program``) ;
+- de la fonction Python générée pour ce programme (``CodeGenerator``, voir
+  ``Interpreter.prepare``).
+
+Les cas mesurés sont un petit appel, un appel profond (appels imbriqués en
+chaîne), un appel large (nombreux appels imbriqués) et un appel contenant un
+tableau.
+
+Usage :
+    python benchmarks/bench_vm.py --calls 20000
+"""
+
+import argparse
+import time
+from typing import Any, Callable, Dict
+
+from baobab_geek_interpreter.execution.executor import Executor
+from baobab_geek_interpreter.lexical.lexical_analyzer import LexicalAnalyzer
+from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+from baobab_geek_interpreter.syntax.syntax_analyzer import SyntaxAnalyzer
+from baobab_geek_interpreter.vm.code_generator import CodeGenerator
+from baobab_geek_interpreter.vm.compiler import Compiler
+
+
+def add(a: int, b: int) -> int:
+    """Additionne deux entiers.
+
+    :param a: Premier entier.
+    :type a: int
+    :param b: Second entier.
+    :type b: int
+    :return: Somme.
+    :rtype: int
+    """
+    return a + b
+
+
+def total(values: list[int]) -> int:
+    """Additionne les entiers d'un tableau.
+
+    :param values: Entiers.
+    :type values: list[int]
+    :return: Somme.
+    :rtype: int
+    """
+    return sum(values)
+
+
+def build_sources(depth: int, width: int, size: int) -> Dict[str, str]:
+    """Construit les sources des appels mesurés.
+
+    :param depth: Profondeur de l'appel profond.
+    :type depth: int
+    :param width: Nombre d'appels imbriqués de l'appel large.
+    :type width: int
+    :param size: Nombre d'éléments du tableau.
+    :type size: int
+    :return: Sources indexées par nom de cas.
+    :rtype: Dict[str, str]
+    """
+    deep = "0"
+    for _ in range(depth):
+        deep = f"add({deep}, 1)"
+    wide = "add(1, 1)"
+    for index in range(width - 1):
+        wide = f"add({wide}, add({index}, 1))"
+    numbers = ", ".join(str(i) for i in range(size))
+    return {
+        "petit": "add(1, 2)",
+        f"profond ({depth})": deep,
+        f"large ({width})": wide,
+        f"tableau ({size})": f"total([{numbers}])",
+    }
+
+
+def per_call(func: Callable[[], Any], calls: int, repeat: int) -> float:
+    """Retourne la meilleure durée moyenne d'un appel sur plusieurs essais.
+
+    :param func: Fonction à mesurer.
+    :type func: Callable[[], Any]
+    :param calls: Nombre d'appels par essai.
+    :type calls: int
+    :param repeat: Nombre d'essais.
+    :type repeat: int
+    :return: Durée minimale par appel en secondes.
+    :rtype: float
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, (time.perf_counter() - start) / calls)
+    return best
+
+
+def main() -> None:
+    """Point d'entrée du benchmark."""
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--calls", type=int, default=20_000, help="appels par essai")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="nombre d'essais")
+    arg_parser.add_argument("--depth", type=int, default=50, help="profondeur de l'appel profond")
+    arg_parser.add_argument("--width", type=int, default=16, help="largeur de l'appel large")
+    arg_parser.add_argument("--size", type=int, default=100, help="taille du tableau")
+    options = arg_parser.parse_args()
+
+    table = SymbolTable()
+    table.register("add", add)
+    table.register("total", total)
+    lexer = LexicalAnalyzer()
+    parser = SyntaxAnalyzer(table)
+    executor = Executor(table)
+    compiler = Compiler(table)
+    generator = CodeGenerator(table)
+
+    for case, source in build_sources(options.depth, options.width, options.size).items():
+        ast = parser.parse(lexer.analyze(source))
+        program = compiler.compile(ast)
+        prepared = generator.generate(program, executor.link(program), lambda *args: None)
+        assert executor.execute(ast) == executor.execute_program(program) == prepared()
+
+        visitor = per_call(lambda node=ast: executor.execute(node), options.calls, options.repeat)
+        vm = per_call(
+            lambda code=program: executor.execute_program(code), options.calls, options.repeat
+        )
+        generated = per_call(prepared, options.calls, options.repeat)
+        print(
+            f"[{case}] {len(program.instructions)} instructions : visiteur "
+            f"{visitor * 1e6:8.2f} µs, machine virtuelle {vm * 1e6:8.2f} µs "
+            f"({visitor / vm:4.1f}x), fonction générée {generated * 1e6:8.2f} µs "
+            f"({visitor / generated:4.1f}x)"
+        )
+    executor.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,9 @@
 
 Interpréteur pour le langage 'geek' permettant le développement rapide d'API de services.
 
+Les exports du paquet et de ses sous-paquets sont chargés paresseusement
+(PEP 562) : un module n'est importé qu'au premier accès à l'un de ses noms.
+
 :Example:
     >>> from baobab_geek_interpreter import Interpreter, service
     >>>
@@ -19,27 +22,33 @@ Interpréteur pour le langage 'geek' permettant le développement rapide d'API d
     >>> print(result)  # 30
 """
 
-from baobab_geek_interpreter.exceptions.base_exception import (
-    BaobabGeekInterpreterException,
-)
-from baobab_geek_interpreter.exceptions.execution_exception import (
-    BaobabExecutionException,
-)
-from baobab_geek_interpreter.exceptions.lexical_exception import (
-    BaobabLexicalAnalyserException,
-)
-from baobab_geek_interpreter.exceptions.semantic_exception import (
-    BaobabSemanticAnalyserException,
-)
-from baobab_geek_interpreter.exceptions.syntax_exception import (
-    BaobabSyntaxAnalyserException,
-)
-from baobab_geek_interpreter.execution.service_decorator import service
-from baobab_geek_interpreter.interpreter import Interpreter
+from baobab_geek_interpreter.lazy_exports import lazy_exports
+
+TYPE_CHECKING = False  # typing.TYPE_CHECKING, sans importer typing au démarrage
+if TYPE_CHECKING:
+    from baobab_geek_interpreter.exceptions.base_exception import (
+        BaobabGeekInterpreterException,
+    )
+    from baobab_geek_interpreter.exceptions.execution_exception import (
+        BaobabExecutionException,
+    )
+    from baobab_geek_interpreter.exceptions.lexical_exception import (
+        BaobabLexicalAnalyserException,
+    )
+    from baobab_geek_interpreter.exceptions.semantic_exception import (
+        BaobabSemanticAnalyserException,
+    )
+    from baobab_geek_interpreter.exceptions.syntax_exception import (
+        BaobabSyntaxAnalyserException,
+    )
+    from baobab_geek_interpreter.execution.service_decorator import service
+    from baobab_geek_interpreter.interpreter import Interpreter
+    from baobab_geek_interpreter.semantic.validation_level import ValidationLevel
 
 __all__ = [
     "Interpreter",
     "service",
+    "ValidationLevel",
     "BaobabGeekInterpreterException",
     "BaobabLexicalAnalyserException",
     "BaobabSyntaxAnalyserException",
@@ -48,3 +57,17 @@ __all__ = [
 ]
 
 __version__ = "1.0.0"
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BaobabGeekInterpreterException": "baobab_geek_interpreter.exceptions.base_exception",
+        "BaobabExecutionException": "baobab_geek_interpreter.exceptions.execution_exception",
+        "BaobabLexicalAnalyserException": "baobab_geek_interpreter.exceptions.lexical_exception",
+        "BaobabSemanticAnalyserException": "baobab_geek_interpreter.exceptions.semantic_exception",
+        "BaobabSyntaxAnalyserException": "baobab_geek_interpreter.exceptions.syntax_exception",
+        "service": "baobab_geek_interpreter.execution.service_decorator",
+        "Interpreter": "baobab_geek_interpreter.interpreter",
+        "ValidationLevel": "baobab_geek_interpreter.semantic.validation_level",
+    },
+)
@@ -0,0 +1,16 @@
+"""Module pour les caches de l'interpréteur."""
+
+from baobab_geek_interpreter.lazy_exports import lazy_exports
+
+TYPE_CHECKING = False  # typing.TYPE_CHECKING, sans importer typing au démarrage
+if TYPE_CHECKING:
+    from baobab_geek_interpreter.cache.disk_call_cache import DiskCallCache
+
+__all__ = ["DiskCallCache"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "DiskCallCache": "baobab_geek_interpreter.cache.disk_call_cache",
+    },
+)
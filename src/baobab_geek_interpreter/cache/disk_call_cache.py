@@ -0,0 +1,195 @@
+"""Module contenant le cache persistant des appels analysés."""
+
+import hashlib
+import os
+import sqlite3
+import threading
+from typing import Optional, Union
+
+from baobab_geek_interpreter.semantic.bound_call import BoundCall
+from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+from baobab_geek_interpreter.syntax.ast_serializer import ASTSerializer
+
+
+class DiskCallCache:
+    """Cache persistant (SQLite) des appels analysés et validés.
+
+    Chaque entrée est indexée par le condensé SHA-256 du code source et
+    contient le nom du service, l'empreinte de sa signature au moment de la
+    validation (:meth:`SymbolTable.signature_fingerprint`) et l'appel
+    sérialisé par :class:`ASTSerializer`.
+
+    Lors d'une relecture, l'empreinte enregistrée est comparée à celle du
+    service actuellement enregistré : si la signature a changé (ou si le
+    service n'existe plus), l'entrée est supprimée et l'appel doit être
+    analysé à nouveau. Sinon, l'appel lié est reconstruit sans analyse
+    lexicale, syntaxique ni sémantique.
+
+    Le cache peut être partagé entre plusieurs threads ; un verrou sérialise
+    les accès à la connexion.
+
+    :param path: Chemin du fichier de base de données (``":memory:"`` pour
+        un cache non persistant).
+    :type path: Union[str, os.PathLike]
+
+    :ivar hits: Nombre d'appels retrouvés dans le cache.
+    :type hits: int
+    :ivar misses: Nombre d'appels absents du cache.
+    :type misses: int
+    :ivar invalidations: Nombre d'entrées supprimées car périmées.
+    :type invalidations: int
+
+    :Example:
+        >>> table = SymbolTable()
+        >>> table.register("add", lambda a, b: a + b)
+        >>> cache = DiskCallCache(":memory:")
+        >>> cache.store("add(1, 2)", BoundCall("add", table.get("add"), (1, 2)), table)
+        >>> cache.load("add(1, 2)", table).arguments
+        (1, 2)
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike[str]"]) -> None:
+        """Ouvre (ou crée) le cache.
+
+        :param path: Chemin du fichier de base de données.
+        :type path: Union[str, os.PathLike]
+        """
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(os.fspath(path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS calls ("
+            "source_hash TEXT PRIMARY KEY, service TEXT NOT NULL, "
+            "fingerprint TEXT NOT NULL, payload BLOB NOT NULL)"
+        )
+        self._connection.commit()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(source: str) -> str:
+        """Calcule la clé d'un code source.
+
+        :param source: Code source.
+        :type source: str
+        :return: Condensé SHA-256 hexadécimal.
+        :rtype: str
+        """
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+    def load(self, source: str, symbol_table: SymbolTable) -> Optional[BoundCall]:
+        """Recherche l'appel lié correspondant à un code source.
+
+        :param source: Code source de l'appel.
+        :type source: str
+        :param symbol_table: Table des symboles courante.
+        :type symbol_table: SymbolTable
+        :return: Appel lié prêt à être exécuté, ou None si absent ou périmé.
+        :rtype: Optional[BoundCall]
+        """
+        key = self._key(source)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT service, fingerprint, payload FROM calls WHERE source_hash = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        service_name, fingerprint, payload = row
+        current = symbol_table.signature_fingerprint(service_name)
+        if current != fingerprint:
+            self._invalidate(key)
+            return None
+        try:
+            name, values = ASTSerializer.loads_values(payload)
+        except ValueError:
+            self._invalidate(key)
+            return None
+
+        # L'empreinte correspond : le service est enregistré.
+        func = symbol_table.get(name)
+        slot = symbol_table.slot_of(name)
+        if func is None or slot is None:  # pragma: no cover
+            self._invalidate(key)
+            return None
+        self.hits += 1
+        return BoundCall(name, func, tuple(values), slot, symbol_table.generation(slot))
+
+    def store(self, source: str, bound: BoundCall, symbol_table: SymbolTable) -> None:
+        """Enregistre l'appel lié issu de l'analyse d'un code source.
+
+        Les appels dont la signature du service ne peut pas être inspectée ou
+        dont les arguments ne sont pas sérialisables ne sont pas enregistrés.
+
+        :param source: Code source de l'appel.
+        :type source: str
+        :param bound: Appel lié validé par l'analyse sémantique.
+        :type bound: BoundCall
+        :param symbol_table: Table des symboles ayant servi à la validation.
+        :type symbol_table: SymbolTable
+        """
+        fingerprint = symbol_table.signature_fingerprint(bound.service_name)
+        if fingerprint is None:
+            return
+        try:
+            payload = ASTSerializer.dumps(bound)
+        except ValueError:
+            return
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO calls VALUES (?, ?, ?, ?)",
+                (self._key(source), bound.service_name, fingerprint, payload),
+            )
+            self._connection.commit()
+
+    def _invalidate(self, key: str) -> None:
+        """Supprime une entrée périmée.
+
+        :param key: Clé de l'entrée.
+        :type key: str
+        """
+        self.misses += 1
+        self.invalidations += 1
+        with self._lock:
+            self._connection.execute("DELETE FROM calls WHERE source_hash = ?", (key,))
+            self._connection.commit()
+
+    def __len__(self) -> int:
+        """Retourne le nombre d'entrées du cache.
+
+        :return: Nombre d'entrées.
+        :rtype: int
+        """
+        with self._lock:
+            return int(self._connection.execute("SELECT COUNT(*) FROM calls").fetchone()[0])
+
+    def clear(self) -> None:
+        """Supprime toutes les entrées du cache."""
+        with self._lock:
+            self._connection.execute("DELETE FROM calls")
+            self._connection.commit()
+
+    def close(self) -> None:
+        """Ferme la connexion à la base de données."""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "DiskCallCache":
+        """Entre dans le contexte du cache.
+
+        :return: Le cache lui-même.
+        :rtype: DiskCallCache
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Ferme le cache en sortie de contexte.
+
+        :param exc_info: Informations sur l'exception éventuelle.
+        :type exc_info: object
+        """
+        self.close()
@@ -1,20 +1,24 @@
 """Module des exceptions personnalisées du projet Baobab Geek Interpreter."""
 
-from baobab_geek_interpreter.exceptions.base_exception import (
-    BaobabGeekInterpreterException,
-)
-from baobab_geek_interpreter.exceptions.execution_exception import (
-    BaobabExecutionException,
-)
-from baobab_geek_interpreter.exceptions.lexical_exception import (
-    BaobabLexicalAnalyserException,
-)
-from baobab_geek_interpreter.exceptions.semantic_exception import (
-    BaobabSemanticAnalyserException,
-)
-from baobab_geek_interpreter.exceptions.syntax_exception import (
-    BaobabSyntaxAnalyserException,
-)
+from baobab_geek_interpreter.lazy_exports import lazy_exports
+
+TYPE_CHECKING = False  # typing.TYPE_CHECKING, sans importer typing au démarrage
+if TYPE_CHECKING:
+    from baobab_geek_interpreter.exceptions.base_exception import (
+        BaobabGeekInterpreterException,
+    )
+    from baobab_geek_interpreter.exceptions.execution_exception import (
+        BaobabExecutionException,
+    )
+    from baobab_geek_interpreter.exceptions.lexical_exception import (
+        BaobabLexicalAnalyserException,
+    )
+    from baobab_geek_interpreter.exceptions.semantic_exception import (
+        BaobabSemanticAnalyserException,
+    )
+    from baobab_geek_interpreter.exceptions.syntax_exception import (
+        BaobabSyntaxAnalyserException,
+    )
 
 __all__ = [
     "BaobabGeekInterpreterException",
@@ -23,3 +27,14 @@ __all__ = [
     "BaobabSemanticAnalyserException",
     "BaobabExecutionException",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BaobabGeekInterpreterException": "baobab_geek_interpreter.exceptions.base_exception",
+        "BaobabExecutionException": "baobab_geek_interpreter.exceptions.execution_exception",
+        "BaobabLexicalAnalyserException": "baobab_geek_interpreter.exceptions.lexical_exception",
+        "BaobabSemanticAnalyserException": "baobab_geek_interpreter.exceptions.semantic_exception",
+        "BaobabSyntaxAnalyserException": "baobab_geek_interpreter.exceptions.syntax_exception",
+    },
+)
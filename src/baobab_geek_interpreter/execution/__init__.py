@@ -1,6 +1,51 @@
 """Module pour l'exécution des services."""
 
-from baobab_geek_interpreter.execution.executor import Executor
-from baobab_geek_interpreter.execution.service_decorator import service
+from baobab_geek_interpreter.lazy_exports import lazy_exports
 
-__all__ = ["service", "Executor"]
+TYPE_CHECKING = False  # typing.TYPE_CHECKING, sans importer typing au démarrage
+if TYPE_CHECKING:
+    from baobab_geek_interpreter.execution.async_single_flight import AsyncSingleFlight
+    from baobab_geek_interpreter.execution.call_memoizer import CallMemoizer
+    from baobab_geek_interpreter.execution.executor import Executor
+    from baobab_geek_interpreter.execution.micro_batcher import MicroBatcher
+    from baobab_geek_interpreter.execution.result_cache import ResultCache
+    from baobab_geek_interpreter.execution.result_stream import ResultStream
+    from baobab_geek_interpreter.execution.service_decorator import service
+    from baobab_geek_interpreter.execution.service_dispatcher import ServiceDispatcher
+    from baobab_geek_interpreter.execution.service_options import ServiceOptions
+    from baobab_geek_interpreter.execution.service_process_pool import ServiceProcessPool
+    from baobab_geek_interpreter.execution.shared_array import SharedArray
+    from baobab_geek_interpreter.execution.single_flight import SingleFlight
+
+__all__ = [
+    "service",
+    "Executor",
+    "ServiceOptions",
+    "ResultCache",
+    "ResultStream",
+    "SingleFlight",
+    "AsyncSingleFlight",
+    "MicroBatcher",
+    "CallMemoizer",
+    "ServiceDispatcher",
+    "ServiceProcessPool",
+    "SharedArray",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AsyncSingleFlight": "baobab_geek_interpreter.execution.async_single_flight",
+        "CallMemoizer": "baobab_geek_interpreter.execution.call_memoizer",
+        "Executor": "baobab_geek_interpreter.execution.executor",
+        "MicroBatcher": "baobab_geek_interpreter.execution.micro_batcher",
+        "ResultCache": "baobab_geek_interpreter.execution.result_cache",
+        "ResultStream": "baobab_geek_interpreter.execution.result_stream",
+        "service": "baobab_geek_interpreter.execution.service_decorator",
+        "ServiceDispatcher": "baobab_geek_interpreter.execution.service_dispatcher",
+        "ServiceOptions": "baobab_geek_interpreter.execution.service_options",
+        "ServiceProcessPool": "baobab_geek_interpreter.execution.service_process_pool",
+        "SharedArray": "baobab_geek_interpreter.execution.shared_array",
+        "SingleFlight": "baobab_geek_interpreter.execution.single_flight",
+    },
+)
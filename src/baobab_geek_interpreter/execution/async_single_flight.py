@@ -0,0 +1,89 @@
+"""Module contenant la fusion des appels identiques en cours (asyncio)."""
+
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+if TYPE_CHECKING:
+    import asyncio
+
+
+class AsyncSingleFlight:
+    """Fusionne les appels identiques exécutés simultanément par des tâches asyncio.
+
+    Équivalent asynchrone de :class:`SingleFlight` : la première tâche d'une
+    clé attend la coroutine produite par ``factory`` ; les tâches suivantes
+    attendent le même résultat ou la même exception. Les appels sont isolés
+    par boucle d'événements.
+
+    L'annulation d'une tâche en attente n'interrompt pas l'exécution
+    partagée ; l'annulation de la tâche qui l'exécute est propagée aux
+    tâches en attente.
+
+    ``asyncio`` n'est importé qu'au premier appel de :meth:`do` : créer un
+    groupe ne coûte pas l'import d'``asyncio`` à un programme synchrone.
+
+    :ivar executions: Nombre d'exécutions effectives.
+    :type executions: int
+    :ivar coalesced: Nombre d'appels ayant partagé une exécution en cours.
+    :type coalesced: int
+
+    :Example:
+        >>> async def compute() -> int:
+        ...     return 3
+        >>> flight = AsyncSingleFlight()
+        >>> asyncio.run(flight.do("key", compute))
+        3
+    """
+
+    def __init__(self) -> None:
+        """Initialise un groupe sans appel en cours."""
+        self._flights: "Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future[Any]]" = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Attend ``factory()`` ou l'exécution en cours pour la même clé.
+
+        :param key: Clé identifiant l'appel.
+        :type key: Hashable
+        :param factory: Fabrique de l'objet attendable à exécuter si aucun
+            appel identique n'est en cours.
+        :type factory: Callable[[], Awaitable[Any]]
+        :return: Résultat de l'exécution partagée.
+        :rtype: Any
+        :raises Exception: L'exception levée par l'exécution partagée.
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        pending = self._flights.get(flight_key)
+        if pending is not None:
+            self.coalesced += 1
+            return await asyncio.shield(pending)
+
+        future: "asyncio.Future[Any]" = loop.create_future()
+        self._flights[flight_key] = future
+        self.executions += 1
+        try:
+            result = await factory()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Marque l'exception comme consultée s'il n'y a aucune tâche en attente.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._flights[flight_key]
+
+    def in_flight(self) -> int:
+        """Retourne le nombre d'exécutions en cours.
+
+        :return: Nombre de clés en cours d'exécution.
+        :rtype: int
+        """
+        return len(self._flights)
@@ -0,0 +1,351 @@
+"""Module contenant la mémorisation et la fusion des appels de services."""
+
+import inspect
+import threading
+import weakref
+from collections.abc import AsyncIterator, Iterator
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from baobab_geek_interpreter.execution.async_single_flight import AsyncSingleFlight
+from baobab_geek_interpreter.execution.result_cache import ResultCache
+from baobab_geek_interpreter.execution.service_options import ServiceOptions
+from baobab_geek_interpreter.semantic.type_checker import TypeChecker
+
+if TYPE_CHECKING:
+    from baobab_geek_interpreter.execution.single_flight import SingleFlight
+
+
+class CallMemoizer:
+    """Mémorise les résultats des services purs et fusionne les appels identiques.
+
+    Les résultats des services déclarés purs (``@service(pure=True)``) sont
+    mémorisés dans un :class:`ResultCache` par service, indexé par une forme
+    canonique hachable des arguments (tuples pour les tableaux). Lorsque le
+    code source est connu, un tableau est représenté par le texte de son
+    littéral plutôt que par ses éléments, ce qui évite de les hacher un à un.
+
+    En mode fusion (``coalesce=True``), un appel identique (même service,
+    mêmes arguments) à un appel déjà en cours n'exécute pas le service :
+    il attend et partage le résultat ou l'exception de l'appel en cours
+    (:class:`SingleFlight` pour les threads, :class:`AsyncSingleFlight`
+    pour :meth:`call_async`).
+
+    Un appel qui consomme ou produit un flux (voir :meth:`streams`), ou dont
+    un argument n'est pas hachable (dictionnaire, ensemble...), n'est ni
+    mémorisé ni fusionné. Les exceptions ne sont pas mémorisées. Le service
+    n'est jamais haché, une instance appelable pouvant ne pas l'être : les
+    appels en cours sont identifiés par son ``id``.
+
+    :param coalesce: Fusionner les appels identiques en cours.
+    :type coalesce: bool
+
+    :ivar coalesce: True si les appels identiques en cours sont fusionnés.
+    :type coalesce: bool
+
+    :Example:
+        >>> from baobab_geek_interpreter.execution.service_decorator import service
+        >>> @service(pure=True)
+        ... def double(x: int) -> int:
+        ...     return x * 2
+        >>> memoizer = CallMemoizer()
+        >>> invoke = lambda name, func, args: func(*args)
+        >>> memoizer.call("double", double, (21,), invoke)
+        42
+        >>> memoizer.stats()["double"]["size"]
+        1
+    """
+
+    _SPAN_KEY = object()
+    """Marqueur des éléments de clé issus du texte source d'un tableau."""
+
+    _STREAM_RETURNS: "weakref.WeakKeyDictionary[Callable[..., Any], bool]" = (
+        weakref.WeakKeyDictionary()
+    )
+    """Services déclarant retourner un flux, sans les maintenir en vie."""
+
+    def __init__(self, coalesce: bool = False) -> None:
+        """Initialise la mémorisation.
+
+        :param coalesce: Fusionner les appels identiques en cours.
+        :type coalesce: bool
+        """
+        self.coalesce = coalesce
+        self._single_flight = self._new_single_flight() if coalesce else None
+        self._async_single_flight = AsyncSingleFlight() if coalesce else None
+        self._result_caches: Dict[str, Tuple[Callable[..., Any], ResultCache]] = {}
+        self._result_caches_lock = threading.Lock()
+
+    def call(
+        self,
+        service_name: str,
+        service_func: Callable[..., Any],
+        args: Sequence[Any],
+        invoke: Callable[[str, Callable[..., Any], Sequence[Any]], Any],
+        spans: Optional[Tuple[Optional[Tuple[int, int]], ...]] = None,
+        source: Optional[str] = None,
+    ) -> Any:
+        """Appelle un service par ``invoke``, en mémorisant ou fusionnant l'appel.
+
+        :param service_name: Nom du service.
+        :type service_name: str
+        :param service_func: Fonction du service.
+        :type service_func: Callable[..., Any]
+        :param args: Valeurs des arguments.
+        :type args: Sequence[Any]
+        :param invoke: Exécution effective, appelée avec le nom, la fonction
+            et les arguments du service.
+        :type invoke: Callable[[str, Callable[..., Any], Sequence[Any]], Any]
+        :param spans: Positions des arguments tableaux dans le code source.
+        :type spans: Optional[Tuple[Optional[Tuple[int, int]], ...]]
+        :param source: Code source de l'appel.
+        :type source: Optional[str]
+        :return: Résultat de l'exécution du service.
+        :rtype: Any
+        """
+        cache = self.result_cache(service_name, service_func)
+        key = None
+        if (cache is not None or self._single_flight is not None) and not self.streams(
+            service_func, args
+        ):
+            key = self.memo_key(args, spans, source)
+        if key is None:
+            return invoke(service_name, service_func, args)
+
+        if cache is not None:
+            found, result = cache.get(key)
+            if found:
+                return result
+        if self._single_flight is not None:
+            result = self._single_flight.do(
+                (id(service_func), key), lambda: invoke(service_name, service_func, args)
+            )
+        else:
+            result = invoke(service_name, service_func, args)
+        if cache is not None and not isinstance(result, (Iterator, AsyncIterator)):
+            cache.put(key, result)
+        return result
+
+    async def call_async(
+        self,
+        service_name: str,
+        service_func: Callable[..., Any],
+        args: Sequence[Any],
+        invoke: Callable[[str, Callable[..., Any], Sequence[Any]], Awaitable[Any]],
+        spans: Optional[Tuple[Optional[Tuple[int, int]], ...]] = None,
+        source: Optional[str] = None,
+    ) -> Any:
+        """Attend un service par ``invoke``, en mémorisant ou fusionnant l'appel.
+
+        :param service_name: Nom du service.
+        :type service_name: str
+        :param service_func: Fonction du service.
+        :type service_func: Callable[..., Any]
+        :param args: Valeurs des arguments.
+        :type args: Sequence[Any]
+        :param invoke: Exécution effective, retournant un objet attendable.
+        :type invoke: Callable[[str, Callable[..., Any], Sequence[Any]], Awaitable[Any]]
+        :param spans: Positions des arguments tableaux dans le code source.
+        :type spans: Optional[Tuple[Optional[Tuple[int, int]], ...]]
+        :param source: Code source de l'appel.
+        :type source: Optional[str]
+        :return: Résultat de l'exécution du service.
+        :rtype: Any
+        """
+        cache = self.result_cache(service_name, service_func)
+        key = None
+        if (cache is not None or self._async_single_flight is not None) and not self.streams(
+            service_func, args
+        ):
+            key = self.memo_key(args, spans, source)
+        if key is None:
+            return await invoke(service_name, service_func, args)
+
+        if cache is not None:
+            found, result = cache.get(key)
+            if found:
+                return result
+        if self._async_single_flight is not None:
+            result = await self._async_single_flight.do(
+                (id(service_func), key), lambda: invoke(service_name, service_func, args)
+            )
+        else:
+            result = await invoke(service_name, service_func, args)
+        if cache is not None and not isinstance(result, (Iterator, AsyncIterator)):
+            cache.put(key, result)
+        return result
+
+    def coalescing_stats(self) -> Dict[str, int]:
+        """Retourne les statistiques de fusion des appels identiques.
+
+        :return: Nombre d'exécutions effectives et d'appels fusionnés (threads
+            et asyncio cumulés) ; vide si la fusion est désactivée.
+        :rtype: Dict[str, int]
+        """
+        if self._single_flight is None or self._async_single_flight is None:
+            return {}
+        return {
+            "executions": self._single_flight.executions + self._async_single_flight.executions,
+            "coalesced": self._single_flight.coalesced + self._async_single_flight.coalesced,
+        }
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """Retourne les statistiques des caches de résultats des services purs.
+
+        :return: Statistiques (succès, échecs, évictions, expirations, taille)
+            indexées par nom de service.
+        :rtype: Dict[str, Dict[str, int]]
+        """
+        with self._result_caches_lock:
+            caches = list(self._result_caches.items())
+        return {name: cache.stats() for name, (_, cache) in caches}
+
+    def result_cache(
+        self, service_name: str, service_func: Callable[..., Any]
+    ) -> Optional[ResultCache]:
+        """Retourne le cache de résultats d'un service pur, créé à la demande.
+
+        Un nouveau cache remplace l'ancien si le service a été ré-enregistré
+        avec une autre fonction.
+
+        :param service_name: Nom du service.
+        :type service_name: str
+        :param service_func: Fonction du service.
+        :type service_func: Callable[..., Any]
+        :return: Cache de résultats du service, ou None s'il n'est pas déclaré pur.
+        :rtype: Optional[ResultCache]
+        """
+        options: Optional[ServiceOptions] = getattr(service_func, "_service_options", None)
+        if options is None or not options.pure:
+            return None
+        entry = self._result_caches.get(service_name)
+        if entry is not None and entry[0] is service_func:
+            return entry[1]
+        with self._result_caches_lock:
+            entry = self._result_caches.get(service_name)
+            if entry is None or entry[0] is not service_func:
+                entry = (service_func, ResultCache(options.cache_size, options.ttl))
+                self._result_caches[service_name] = entry
+            return entry[1]
+
+    @staticmethod
+    def _new_single_flight() -> "SingleFlight":
+        """Crée le groupe de fusion des appels synchrones.
+
+        :return: Groupe de fusion.
+        :rtype: SingleFlight
+        """
+        # pylint: disable-next=import-outside-toplevel,redefined-outer-name
+        from baobab_geek_interpreter.execution.single_flight import SingleFlight
+
+        return SingleFlight()
+
+    @staticmethod
+    def memo_key(
+        args: Sequence[Any],
+        spans: Optional[Tuple[Optional[Tuple[int, int]], ...]],
+        source: Optional[str],
+    ) -> Optional[Hashable]:
+        """Construit la clé de mémorisation d'une liste d'arguments.
+
+        :param args: Valeurs des arguments.
+        :type args: Sequence[Any]
+        :param spans: Positions des arguments tableaux dans le code source.
+        :type spans: Optional[Tuple[Optional[Tuple[int, int]], ...]]
+        :param source: Code source de l'appel.
+        :type source: Optional[str]
+        :return: Clé hachable, ou None si un argument n'est pas hachable.
+        :rtype: Optional[Hashable]
+
+        :Example:
+            >>> CallMemoizer.memo_key((1, [2, 3]), None, None)
+            (1, (2, 3))
+        """
+        if spans is None or source is None:
+            key = tuple(CallMemoizer.canonical(value) for value in args)
+        else:
+            key = tuple(
+                (
+                    (CallMemoizer._SPAN_KEY, source[span[0] : span[1]])
+                    if span is not None
+                    else CallMemoizer.canonical(value)
+                )
+                for value, span in zip(args, spans)
+            )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    @staticmethod
+    def canonical(value: Any) -> Any:
+        """Retourne une forme canonique hachable d'une valeur d'argument.
+
+        Les tableaux deviennent des tuples ; les flottants sont représentés en
+        hexadécimal et étiquetés, afin que ``1`` et ``1.0``, ou ``0.0`` et
+        ``-0.0``, ne partagent pas la même entrée.
+
+        :param value: Valeur d'argument.
+        :type value: Any
+        :return: Forme canonique hachable.
+        :rtype: Hashable
+        """
+        if isinstance(value, list):
+            return tuple(CallMemoizer.canonical(item) for item in value)
+        if isinstance(value, float):
+            return (float, value.hex())
+        return value
+
+    @staticmethod
+    def streams(service_func: Callable[..., Any], args: Sequence[Any]) -> bool:
+        """Indique si un appel consomme ou produit un flux consommable une seule fois.
+
+        :param service_func: Fonction du service.
+        :type service_func: Callable[..., Any]
+        :param args: Valeurs des arguments.
+        :type args: Sequence[Any]
+        :return: True si un argument est un itérateur ou si le service déclare
+            retourner un flux.
+        :rtype: bool
+        """
+        return CallMemoizer._returns_stream(service_func) or any(
+            isinstance(value, Iterator) for value in args
+        )
+
+    @staticmethod
+    def _returns_stream(service_func: Callable[..., Any]) -> bool:
+        """Indique si l'annotation de retour d'un service désigne un flux.
+
+        Le résultat est mémorisé par service, sauf si le service n'est pas
+        hachable ou ne supporte pas les références faibles.
+
+        :param service_func: Fonction du service.
+        :type service_func: Callable[..., Any]
+        :return: True si le service déclare retourner un flux.
+        :rtype: bool
+        """
+        try:
+            return CallMemoizer._STREAM_RETURNS[service_func]
+        except (KeyError, TypeError):
+            pass
+        try:
+            annotation = inspect.signature(service_func).return_annotation
+        except (TypeError, ValueError):
+            returns_stream = False
+        else:
+            returns_stream = TypeChecker.is_stream_type(annotation)
+        try:
+            CallMemoizer._STREAM_RETURNS[service_func] = returns_stream
+        except TypeError:
+            pass
+        return returns_stream
@@ -1,10 +1,19 @@
 """Module pour l'exécution de l'AST."""
 
-from typing import Any
+# Les sous-systèmes optionnels sont importés à la première utilisation, dans les méthodes.
+
+import inspect
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from baobab_geek_interpreter.exceptions.execution_exception import (
     BaobabExecutionException,
 )
+from baobab_geek_interpreter.execution.call_memoizer import CallMemoizer
+from baobab_geek_interpreter.execution.service_dispatcher import ServiceDispatcher
+from baobab_geek_interpreter.execution.service_options import ServiceOptions
+from baobab_geek_interpreter.semantic.bound_call import BoundCall
 from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
 from baobab_geek_interpreter.syntax.ast_node import (
     ASTVisitor,
@@ -14,6 +23,15 @@ from baobab_geek_interpreter.syntax.ast_node import (
     ServiceCallNode,
     StringNode,
 )
+from baobab_geek_interpreter.syntax.columnar_ast import ColumnarAST
+from baobab_geek_interpreter.vm.program import Program
+from baobab_geek_interpreter.vm.virtual_machine import VirtualMachine
+
+if TYPE_CHECKING:
+    import asyncio  # importé par les seules méthodes asynchrones
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    from baobab_geek_interpreter.execution.service_process_pool import ServiceProcessPool
 
 
 class Executor(ASTVisitor):
@@ -22,10 +40,37 @@ class Executor(ASTVisitor):
     Implémente le pattern Visitor pour parcourir l'AST et exécuter
     les services enregistrés dans la table des symboles.
 
+    Les résultats des services déclarés purs (``@service(pure=True)``) sont
+    mémorisés et, en mode fusion (``coalesce=True``), un appel identique à
+    un appel déjà en cours partage son résultat ou son exception (voir
+    :class:`CallMemoizer`).
+
+    Les appels des services de lot (``@service(batch=True)``) sont regroupés
+    par un :class:`MicroBatcher` par service, et les services déclarés
+    ``@service(executor="process")`` sont exécutés dans un
+    :class:`ServiceProcessPool`, créé au premier appel à défaut de pool
+    fourni (voir :class:`ServiceDispatcher`).
+
+    Les arguments issus d'appels imbriqués (:attr:`BoundCall.nested`) sont
+    évalués avant l'appel parent ; les appels imbriqués indépendants d'un
+    même appel sont exécutés simultanément, dans un pool de threads (ou
+    attendus simultanément par :meth:`execute_bound_async`). Un appel imbriqué
+    partagé par plusieurs appels parents (voir
+    :class:`CommonSubexpressionEliminator`) est exécuté une seule fois.
+
+    Le pipeline ``a() | b()`` est analysé en ``b(a())`` : si ``a`` retourne
+    un générateur, celui-ci est transmis tel quel à ``b``, qui consomme les
+    éléments à mesure de leur production, sans liste intermédiaire.
+
     :param symbol_table: Table des symboles contenant les services enregistrés.
     :type symbol_table: SymbolTable
+    :param coalesce: Fusionner les appels identiques en cours.
+    :type coalesce: bool
+    :param process_pool: Pool de processus des services ``executor="process"``.
+    :type process_pool: Optional[ServiceProcessPool]
 
     :Example:
+        >>> from baobab_geek_interpreter.semantic.bound_call import BoundCall
         >>> from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
         >>> table = SymbolTable()
         >>> def add(a: int, b: int) -> int:
@@ -34,13 +79,30 @@ class Executor(ASTVisitor):
         >>> executor = Executor(table)
     """
 
-    def __init__(self, symbol_table: SymbolTable) -> None:
+    def __init__(
+        self,
+        symbol_table: SymbolTable,
+        coalesce: bool = False,
+        process_pool: Optional["ServiceProcessPool"] = None,
+    ) -> None:
         """Initialise l'exécuteur.
 
         :param symbol_table: Table des symboles.
         :type symbol_table: SymbolTable
+        :param coalesce: Fusionner les appels identiques en cours.
+        :type coalesce: bool
+        :param process_pool: Pool de processus des services ``executor="process"``
+            (créé à la demande si absent).
+        :type process_pool: Optional[ServiceProcessPool]
         """
         self._symbol_table = symbol_table
+        self._memoizer = CallMemoizer(coalesce)
+        self._services = ServiceDispatcher(symbol_table, process_pool)
+        self._nested_pool: Optional["ThreadPoolExecutor"] = None
+        self._nested_pool_lock = threading.Lock()
+        self._linked: "weakref.WeakKeyDictionary[Program, List[Callable[..., Any]]]" = (
+            weakref.WeakKeyDictionary()
+        )
 
     def execute(self, ast: ServiceCallNode) -> Any:
         """Exécute un AST et retourne le résultat.
@@ -58,6 +120,191 @@ class Executor(ASTVisitor):
         """
         return ast.accept(self)
 
+    def execute_bound(self, bound: BoundCall, source: Optional[str] = None) -> Any:
+        """Exécute un appel lié produit par l'analyse sémantique.
+
+        Le service et les arguments ont déjà été résolus et validés : aucune
+        recherche dans la table des symboles ni parcours de l'AST n'est effectué.
+        Les appels imbriqués sont exécutés d'abord, simultanément s'ils sont
+        plusieurs.
+
+        :param bound: Appel lié à exécuter.
+        :type bound: BoundCall
+        :param source: Code source de l'appel ; permet d'indexer le cache des
+            services purs par le texte des tableaux littéraux.
+        :type source: Optional[str]
+        :return: Résultat de l'exécution du service.
+        :rtype: Any
+        :raises BaobabExecutionException: Si le service lève une exception.
+
+        :Example:
+            >>> # bound = semantic_analyzer.analyze(ast)
+            >>> # result = executor.execute_bound(bound)
+        """
+        if bound.nested:
+            return self._execute_tree(bound, source, {})
+        return self._call(bound.service_name, bound.func, bound.arguments, bound.spans, source)
+
+    async def execute_bound_async(self, bound: BoundCall, source: Optional[str] = None) -> Any:
+        """Exécute un appel lié sans bloquer la boucle d'événements.
+
+        Un service synchrone est exécuté dans un thread (``asyncio.to_thread``),
+        ou dans le pool de processus s'il est déclaré ``executor="process"`` ;
+        un service qui retourne un objet attendable (coroutine) est attendu.
+        Les appels imbriqués sont attendus simultanément avant l'appel parent.
+
+        :param bound: Appel lié à exécuter.
+        :type bound: BoundCall
+        :param source: Code source de l'appel.
+        :type source: Optional[str]
+        :return: Résultat de l'exécution du service.
+        :rtype: Any
+        :raises BaobabExecutionException: Si le service lève une exception.
+        """
+        return await self._execute_tree_async(bound, source, {})
+
+    async def _execute_tree_async(
+        self, bound: BoundCall, source: Optional[str], evaluations: Dict[int, "asyncio.Task[Any]"]
+    ) -> Any:
+        """Exécute un appel lié et ses appels imbriqués sans bloquer la boucle.
+
+        :param bound: Appel lié à exécuter.
+        :type bound: BoundCall
+        :param source: Code source de l'appel.
+        :type source: Optional[str]
+        :param evaluations: Tâches des appels imbriqués de l'exécution en cours.
+        :type evaluations: Dict[int, asyncio.Task]
+        :return: Résultat de l'exécution du service.
+        :rtype: Any
+        :raises BaobabExecutionException: Si le service lève une exception.
+        """
+        service_name, service_func, args = bound.service_name, bound.func, bound.arguments
+        if bound.nested:
+            args = await self._evaluate_nested_async(bound, source, evaluations)
+        return await self._memoizer.call_async(
+            service_name, service_func, args, self._invoke_async, bound.spans, source
+        )
+
+    def execute_script(
+        self, bounds: Sequence[BoundCall], source: Optional[str] = None, concurrent: bool = False
+    ) -> List[Any]:
+        """Exécute les appels liés indépendants d'un script.
+
+        Les appels sont exécutés dans l'ordre, ou simultanément dans le pool de
+        threads des appels imbriqués si ``concurrent`` est vrai. Dans les deux
+        cas, l'exception du premier appel en échec, dans l'ordre du script, est
+        propagée ; en mode séquentiel, les appels suivants ne sont pas exécutés.
+
+        :param bounds: Appels liés du script.
+        :type bounds: Sequence[BoundCall]
+        :param source: Code source du script.
+        :type source: Optional[str]
+        :param concurrent: Exécuter les appels simultanément.
+        :type concurrent: bool
+        :return: Résultats des appels, dans l'ordre du script.
+        :rtype: List[Any]
+        :raises BaobabExecutionException: Si un appel échoue.
+        """
+        if not concurrent:
+            return [self.execute_bound(bound, source) for bound in bounds]
+        return self._run_concurrently(self._execute_tree, list(bounds), source, {})
+
+    async def execute_script_async(
+        self, bounds: Sequence[BoundCall], source: Optional[str] = None, concurrent: bool = False
+    ) -> List[Any]:
+        """Exécute les appels liés d'un script sans bloquer la boucle d'événements.
+
+        :param bounds: Appels liés du script.
+        :type bounds: Sequence[BoundCall]
+        :param source: Code source du script.
+        :type source: Optional[str]
+        :param concurrent: Attendre les appels simultanément.
+        :type concurrent: bool
+        :return: Résultats des appels, dans l'ordre du script.
+        :rtype: List[Any]
+        :raises BaobabExecutionException: Si un appel échoue.
+        """
+        if concurrent:
+            import asyncio  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+            return list(
+                await asyncio.gather(*(self.execute_bound_async(bound, source) for bound in bounds))
+            )
+        return [await self.execute_bound_async(bound, source) for bound in bounds]
+
+    def execute_columnar(self, ast: ColumnarAST) -> Any:
+        """Exécute un AST colonnaire sans le parcourir nœud par nœud.
+
+        Les arguments sont matérialisés directement depuis les pools de valeurs.
+
+        :param ast: AST colonnaire à exécuter.
+        :type ast: ColumnarAST
+        :return: Résultat de l'exécution du service.
+        :rtype: Any
+        :raises BaobabExecutionException: Si le service est introuvable ou lève une exception.
+        """
+        service_name = ast.name
+        service_func = self._symbol_table.lookup(service_name, ast.slot, ast.generation)
+
+        if service_func is None:
+            raise self._service_not_found(service_name)
+
+        return self._call(service_name, service_func, ast.argument_values())
+
+    def execute_program(self, program: Program) -> Any:
+        """Exécute un programme compilé par la machine virtuelle.
+
+        Les services sont appelés par les exécutables de :meth:`link` ; les
+        appels imbriqués sont exécutés l'un après l'autre.
+
+        :param program: Programme compilé (voir :class:`Compiler`).
+        :type program: Program
+        :return: Résultat de l'exécution du service racine.
+        :rtype: Any
+        :raises BaobabExecutionException: Si un service lève une exception.
+        """
+        return VirtualMachine.run(program, self.link(program))
+
+    def link(self, program: Program) -> List[Callable[..., Any]]:
+        """Retourne l'exécutable de chaque service d'un programme, lié une fois.
+
+        Hors mode fusion, un service sans option d'exécution (ni pur, ni de
+        lot, ni exécuté dans un processus) est appelé directement ; les autres
+        passent par le chemin de :meth:`execute_bound`.
+
+        :param program: Programme compilé.
+        :type program: Program
+        :return: Exécutables, dans l'ordre de la table des services du programme.
+        :rtype: List[Callable[..., Any]]
+        """
+        callees = self._linked.get(program)
+        if callees is None:
+            callees = []
+            for name, func, _, _ in program.services:
+                options: Optional[ServiceOptions] = getattr(func, "_service_options", None)
+                direct = not self._memoizer.coalesce and (options is None or options.plain)
+                callees.append(func if direct else self._dispatcher(name, func))
+            self._linked[program] = callees
+        return callees
+
+    def _dispatcher(
+        self, service_name: str, service_func: Callable[..., Any]
+    ) -> Callable[..., Any]:
+        """Construit l'exécutable d'un service passant par :meth:`_call`.
+
+        :param service_name: Nom du service.
+        :type service_name: str
+        :param service_func: Fonction du service.
+        :type service_func: Callable[..., Any]
+        :return: Exécutable recevant les arguments du service.
+        :rtype: Callable[..., Any]
+        """
+
+        def dispatch(*args: Any) -> Any:
+            return self._call(service_name, service_func, args)
+
+        return dispatch
+
     def visit_service_call(self, node: ServiceCallNode) -> Any:
         """Visite un nœud d'appel de service et exécute le service.
 
@@ -68,35 +315,368 @@ class Executor(ASTVisitor):
         :raises BaobabExecutionException: Si le service lève une exception.
         """
         service_name = node.name
-        service_func = self._symbol_table.get(service_name)
+        service_func = self._symbol_table.lookup(service_name, node.slot, node.generation)
 
         if service_func is None:
-            raise BaobabExecutionException(
-                f"Service '{service_name}' non trouvé",
-                source="",
-                position=0,
-                line=0,
-                column=0,
-                service_name=service_name,
-                original_exception=None,
-            )
+            raise self._service_not_found(service_name)
 
         # Évaluer les arguments
         args = [arg.accept(self) for arg in node.arguments]
 
         # Exécuter le service
+        return self._call(service_name, service_func, args)
+
+    def get_coalescing_stats(self) -> Dict[str, int]:
+        """Retourne les statistiques de fusion des appels identiques.
+
+        :return: Nombre d'exécutions effectives et d'appels fusionnés (threads
+            et asyncio cumulés) ; vide si la fusion est désactivée.
+        :rtype: Dict[str, int]
+        """
+        return self._memoizer.coalescing_stats()
+
+    def get_batch_stats(self) -> Dict[str, Dict[str, int]]:
+        """Retourne les statistiques de regroupement des services de lot.
+
+        :return: Nombre de lots et d'appels traités, indexés par nom de service.
+        :rtype: Dict[str, Dict[str, int]]
+        """
+        return self._services.batch_stats()
+
+    def get_process_stats(self) -> Dict[str, int]:
+        """Retourne les statistiques du pool de processus.
+
+        :return: Nombre d'appels, de recyclages et de processus ; vide si aucun
+            service n'a été exécuté dans un processus.
+        :rtype: Dict[str, int]
+        """
+        return self._services.process_stats()
+
+    def close(self) -> None:
+        """Libère les ressources de l'exécuteur.
+
+        Exécute les appels en attente des services de lot, arrête le pool de
+        threads des appels imbriqués, puis le pool de processus s'il a été
+        créé par l'exécuteur.
+        """
+        with self._nested_pool_lock:
+            nested_pool, self._nested_pool = self._nested_pool, None
+        self._services.close()
+        if nested_pool is not None:
+            nested_pool.shutdown()
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Retourne les statistiques des caches de résultats des services purs.
+
+        :return: Statistiques (succès, échecs, évictions, expirations, taille)
+            indexées par nom de service.
+        :rtype: Dict[str, Dict[str, int]]
+        """
+        return self._memoizer.stats()
+
+    def _execute_tree(
+        self, bound: BoundCall, source: Optional[str], evaluations: Dict[int, "Future[Any]"]
+    ) -> Any:
+        """Exécute un appel lié après ses appels imbriqués.
+
+        :param bound: Appel lié à exécuter.
+        :type bound: BoundCall
+        :param source: Code source de l'appel.
+        :type source: Optional[str]
+        :param evaluations: Résultats des appels imbriqués de l'exécution en cours.
+        :type evaluations: Dict[int, Future]
+        :return: Résultat de l'exécution du service.
+        :rtype: Any
+        :raises BaobabExecutionException: Si le service lève une exception.
+        """
+        args = (
+            self._evaluate_nested(bound, source, evaluations) if bound.nested else bound.arguments
+        )
+        return self._call(bound.service_name, bound.func, args, bound.spans, source)
+
+    def _evaluate_once(
+        self, bound: BoundCall, source: Optional[str], evaluations: Dict[int, "Future[Any]"]
+    ) -> Any:
+        """Exécute un appel imbriqué, une seule fois par exécution.
+
+        Un appel lié partagé par plusieurs appels parents (voir
+        :class:`CommonSubexpressionEliminator`) est exécuté par le premier
+        thread qui l'atteint ; les autres attendent son résultat.
+
+        :param bound: Appel imbriqué.
+        :type bound: BoundCall
+        :param source: Code source de l'appel.
+        :type source: Optional[str]
+        :param evaluations: Résultats des appels imbriqués de l'exécution en cours.
+        :type evaluations: Dict[int, Future]
+        :return: Résultat de l'appel.
+        :rtype: Any
+        :raises BaobabExecutionException: Si l'appel échoue.
+        """
+        # pylint: disable-next=import-outside-toplevel,redefined-outer-name
+        from concurrent.futures import Future
+
+        future: "Future[Any]" = Future()
+        # setdefault est atomique : un seul thread devient propriétaire de l'appel.
+        owner = evaluations.setdefault(id(bound), future)
+        if owner is not future:
+            return owner.result()
+        try:
+            result = self._execute_tree(bound, source, evaluations)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        future.set_result(result)
+        return result
+
+    def _evaluate_nested(
+        self, bound: BoundCall, source: Optional[str], evaluations: Dict[int, "Future[Any]"]
+    ) -> Tuple[Any, ...]:
+        """Exécute les appels imbriqués d'un appel lié et retourne ses arguments.
+
+        Les appels imbriqués sont exécutés simultanément (voir
+        :meth:`_run_concurrently`).
+
+        :param bound: Appel lié contenant des appels imbriqués.
+        :type bound: BoundCall
+        :param source: Code source de l'appel.
+        :type source: Optional[str]
+        :param evaluations: Résultats des appels imbriqués de l'exécution en cours.
+        :type evaluations: Dict[int, Future]
+        :return: Valeurs des arguments.
+        :rtype: Tuple[Any, ...]
+        :raises BaobabExecutionException: Si un appel imbriqué échoue.
+        """
+        args = list(bound.arguments)
+        nested = [index for index, arg in enumerate(args) if isinstance(arg, BoundCall)]
+        results = self._run_concurrently(
+            self._evaluate_once, [args[index] for index in nested], source, evaluations
+        )
+        for index, result in zip(nested, results):
+            args[index] = result
+        return tuple(args)
+
+    def _run_concurrently(
+        self,
+        run: Callable[[BoundCall, Optional[str], Dict[int, "Future[Any]"]], Any],
+        calls: List[BoundCall],
+        source: Optional[str],
+        evaluations: Dict[int, "Future[Any]"],
+    ) -> List[Any]:
+        """Exécute simultanément des appels liés indépendants.
+
+        Le premier appel est exécuté par le thread courant et les suivants dans
+        le pool de threads. Un appel du pool qui n'a pas encore démarré lorsque
+        son résultat est attendu est retiré du pool et exécuté par le thread
+        courant : les appels imbriqués sur plusieurs niveaux ne peuvent donc
+        pas épuiser le pool. Si un appel échoue, les appels non démarrés sont
+        annulés et l'exception du premier appel en échec, dans l'ordre, est
+        propagée.
+
+        :param run: Fonction d'exécution d'un appel.
+        :type run: Callable[[BoundCall, Optional[str], Dict[int, Future]], Any]
+        :param calls: Appels à exécuter.
+        :type calls: List[BoundCall]
+        :param source: Code source des appels.
+        :type source: Optional[str]
+        :param evaluations: Résultats des appels imbriqués de l'exécution en cours.
+        :type evaluations: Dict[int, Future]
+        :return: Résultats des appels, dans l'ordre.
+        :rtype: List[Any]
+        :raises BaobabExecutionException: Si un appel échoue.
+        """
+        if not calls:
+            return []
+        futures: List["Future[Any]"] = []
+        if len(calls) > 1:
+            pool = self._nested_thread_pool()
+            futures = [pool.submit(run, call, source, evaluations) for call in calls[1:]]
+        results: List[Any] = []
+        try:
+            results.append(run(calls[0], source, evaluations))
+            for call, future in zip(calls[1:], futures):
+                if future.cancel():
+                    results.append(run(call, source, evaluations))
+                else:
+                    results.append(future.result())
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        return results
+
+    async def _evaluate_nested_async(
+        self, bound: BoundCall, source: Optional[str], evaluations: Dict[int, "asyncio.Task[Any]"]
+    ) -> Tuple[Any, ...]:
+        """Attend simultanément les appels imbriqués d'un appel lié.
+
+        Un appel lié partagé par plusieurs appels parents est exécuté par une
+        seule tâche, attendue par chacun d'eux.
+
+        :param bound: Appel lié contenant des appels imbriqués.
+        :type bound: BoundCall
+        :param source: Code source de l'appel.
+        :type source: Optional[str]
+        :param evaluations: Tâches des appels imbriqués de l'exécution en cours.
+        :type evaluations: Dict[int, asyncio.Task]
+        :return: Valeurs des arguments.
+        :rtype: Tuple[Any, ...]
+        :raises BaobabExecutionException: Si un appel imbriqué échoue.
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+        args = list(bound.arguments)
+        nested = [index for index, arg in enumerate(args) if isinstance(arg, BoundCall)]
+        for index in nested:
+            if id(args[index]) not in evaluations:
+                evaluations[id(args[index])] = asyncio.ensure_future(
+                    self._execute_tree_async(args[index], source, evaluations)
+                )
+        results = await asyncio.gather(*(evaluations[id(args[index])] for index in nested))
+        for index, result in zip(nested, results):
+            args[index] = result
+        return tuple(args)
+
+    def _nested_thread_pool(self) -> "ThreadPoolExecutor":
+        """Retourne le pool de threads des appels imbriqués, créé à la demande.
+
+        :return: Pool de threads.
+        :rtype: ThreadPoolExecutor
+        """
+        with self._nested_pool_lock:
+            if self._nested_pool is None:
+                # pylint: disable-next=import-outside-toplevel,redefined-outer-name
+                from concurrent.futures import ThreadPoolExecutor
+
+                self._nested_pool = ThreadPoolExecutor(thread_name_prefix="baobab-nested")
+            return self._nested_pool
+
+    def _call(
+        self,
+        service_name: str,
+        service_func: Callable[..., Any],
+        args: Sequence[Any],
+        spans: Optional[Tuple[Optional[Tuple[int, int]], ...]] = None,
+        source: Optional[str] = None,
+    ) -> Any:
+        """Appelle un service, en mémorisant son résultat s'il est déclaré pur.
+
+        La mémorisation et la fusion des appels identiques sont confiées au
+        :class:`CallMemoizer` de l'exécuteur.
+
+        :param service_name: Nom du service.
+        :type service_name: str
+        :param service_func: Fonction du service.
+        :type service_func: Callable[..., Any]
+        :param args: Valeurs des arguments.
+        :type args: Sequence[Any]
+        :param spans: Positions des arguments tableaux dans le code source.
+        :type spans: Optional[Tuple[Optional[Tuple[int, int]], ...]]
+        :param source: Code source de l'appel.
+        :type source: Optional[str]
+        :return: Résultat de l'exécution du service.
+        :rtype: Any
+        :raises BaobabExecutionException: Si le service lève une exception.
+        """
+        return self._memoizer.call(service_name, service_func, args, self._invoke, spans, source)
+
+    @staticmethod
+    def _service_not_found(service_name: str) -> BaobabExecutionException:
+        """Construit l'exception levée pour un service introuvable.
+
+        :param service_name: Nom du service.
+        :type service_name: str
+        :return: Exception d'exécution.
+        :rtype: BaobabExecutionException
+        """
+        return BaobabExecutionException(
+            f"Service '{service_name}' non trouvé",
+            source="",
+            position=0,
+            line=0,
+            column=0,
+            service_name=service_name,
+            original_exception=None,
+        )
+
+    def _invoke(
+        self, service_name: str, service_func: Callable[..., Any], args: Sequence[Any]
+    ) -> Any:
+        """Appelle un service en encapsulant ses exceptions.
+
+        :param service_name: Nom du service.
+        :type service_name: str
+        :param service_func: Fonction du service.
+        :type service_func: Callable[..., Any]
+        :param args: Valeurs des arguments.
+        :type args: Sequence[Any]
+        :return: Résultat de l'exécution du service.
+        :rtype: Any
+        :raises BaobabExecutionException: Si le service lève une exception.
+        """
+        batcher = self._services.batcher(service_name, service_func)
         try:
+            if batcher is not None:
+                return batcher.submit(tuple(args))
+            if self._services.runs_in_process(service_func):
+                return self._services.service_pool().call(service_func, args)
             return service_func(*args)
         except Exception as exc:
-            raise BaobabExecutionException(
-                f"Erreur lors de l'exécution du service '{service_name}': {str(exc)}",
-                source="",
-                position=0,
-                line=0,
-                column=0,
-                service_name=service_name,
-                original_exception=exc,
-            ) from exc
+            raise self._execution_error(service_name, exc) from exc
+
+    async def _invoke_async(
+        self, service_name: str, service_func: Callable[..., Any], args: Sequence[Any]
+    ) -> Any:
+        """Appelle un service depuis une coroutine en encapsulant ses exceptions.
+
+        :param service_name: Nom du service.
+        :type service_name: str
+        :param service_func: Fonction du service.
+        :type service_func: Callable[..., Any]
+        :param args: Valeurs des arguments.
+        :type args: Sequence[Any]
+        :return: Résultat de l'exécution du service.
+        :rtype: Any
+        :raises BaobabExecutionException: Si le service lève une exception.
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+        services = self._services
+        batcher = services.batcher(service_name, service_func)
+        try:
+            if batcher is not None:
+                return await asyncio.wrap_future(batcher.submit_future(tuple(args)))
+            if services.runs_in_process(service_func):
+                return await asyncio.wrap_future(services.service_pool().submit(service_func, args))
+            if inspect.iscoroutinefunction(service_func):
+                return await service_func(*args)
+            result = await asyncio.to_thread(service_func, *args)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+        except Exception as exc:
+            raise self._execution_error(service_name, exc) from exc
+
+    @staticmethod
+    def _execution_error(service_name: str, exc: Exception) -> BaobabExecutionException:
+        """Construit l'exception levée lorsqu'un service échoue.
+
+        :param service_name: Nom du service.
+        :type service_name: str
+        :param exc: Exception levée par le service.
+        :type exc: Exception
+        :return: Exception d'exécution.
+        :rtype: BaobabExecutionException
+        """
+        return BaobabExecutionException(
+            f"Erreur lors de l'exécution du service '{service_name}': {str(exc)}",
+            source="",
+            position=0,
+            line=0,
+            column=0,
+            service_name=service_name,
+            original_exception=exc,
+        )
 
     def visit_argument(self, node: Any) -> Any:
         """Visite un nœud d'argument et retourne sa valeur.
@@ -0,0 +1,154 @@
+"""Module contenant le regroupement en lots des appels d'un service."""
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+class MicroBatcher:  # pylint: disable=too-many-instance-attributes
+    """Regroupe les appels individuels simultanés d'un service en lots.
+
+    Les appels soumis sont mis en attente ; un thread de répartition exécute
+    la fonction de lot dès que ``max_batch`` appels sont en attente, ou lorsque
+    le plus ancien appel attend depuis ``max_wait`` secondes. La fonction de
+    lot reçoit une liste de valeurs par paramètre (``f([a1, a2], [b1, b2])``
+    pour les appels ``f(a1, b1)`` et ``f(a2, b2)``) et doit retourner une
+    séquence contenant un résultat par appel, dans le même ordre.
+
+    Si la fonction de lot lève une exception ou retourne un nombre de
+    résultats incorrect, tous les appels du lot échouent avec cette exception.
+
+    Le thread de répartition est démarré au premier appel.
+
+    :param batch_func: Fonction de lot.
+    :type batch_func: Callable[..., Sequence[Any]]
+    :param max_batch: Taille maximale d'un lot.
+    :type max_batch: int
+    :param max_wait: Délai maximal d'attente d'un lot incomplet, en secondes.
+    :type max_wait: float
+
+    :ivar batches: Nombre de lots exécutés.
+    :type batches: int
+    :ivar items: Nombre d'appels traités.
+    :type items: int
+
+    :Example:
+        >>> batcher = MicroBatcher(lambda xs: [x * 2 for x in xs], max_batch=8, max_wait=0.001)
+        >>> batcher.submit((21,))
+        42
+        >>> batcher.close()
+    """
+
+    def __init__(
+        self, batch_func: Callable[..., Sequence[Any]], max_batch: int, max_wait: float
+    ) -> None:
+        """Initialise le regroupement.
+
+        :param batch_func: Fonction de lot.
+        :type batch_func: Callable[..., Sequence[Any]]
+        :param max_batch: Taille maximale d'un lot.
+        :type max_batch: int
+        :param max_wait: Délai maximal d'attente d'un lot incomplet, en secondes.
+        :type max_wait: float
+        """
+        self._batch_func = batch_func
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        self._condition = threading.Condition()
+        self._pending: List[Tuple[float, Tuple[Any, ...], "Future[Any]"]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.batches = 0
+        self.items = 0
+
+    def submit(self, args: Tuple[Any, ...]) -> Any:
+        """Soumet un appel et attend son résultat.
+
+        :param args: Arguments de l'appel individuel.
+        :type args: Tuple[Any, ...]
+        :return: Résultat de l'appel.
+        :rtype: Any
+        :raises Exception: L'exception levée par la fonction de lot.
+        """
+        return self.submit_future(args).result()
+
+    def submit_future(self, args: Tuple[Any, ...]) -> "Future[Any]":
+        """Soumet un appel sans attendre son résultat.
+
+        :param args: Arguments de l'appel individuel.
+        :type args: Tuple[Any, ...]
+        :return: Future résolue avec le résultat de l'appel.
+        :rtype: concurrent.futures.Future
+        :raises RuntimeError: Si le regroupement a été fermé.
+        """
+        future: "Future[Any]" = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("MicroBatcher is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._dispatch, name="baobab-micro-batcher", daemon=True
+                )
+                self._thread.start()
+            self._pending.append((time.monotonic(), args, future))
+            if len(self._pending) == 1 or len(self._pending) >= self._max_batch:
+                self._condition.notify()
+        return future
+
+    def close(self) -> None:
+        """Exécute les appels en attente puis arrête le thread de répartition."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def stats(self) -> Dict[str, int]:
+        """Retourne les statistiques du regroupement.
+
+        :return: Nombre de lots et nombre d'appels traités.
+        :rtype: Dict[str, int]
+        """
+        return {"batches": self.batches, "items": self.items}
+
+    def _dispatch(self) -> None:
+        """Boucle du thread de répartition."""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                deadline = self._pending[0][0] + self._max_wait
+                while len(self._pending) < self._max_batch and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch = self._pending[: self._max_batch]
+                del self._pending[: self._max_batch]
+            self._run(batch)
+
+    def _run(self, batch: List[Tuple[float, Tuple[Any, ...], "Future[Any]"]]) -> None:
+        """Exécute la fonction de lot et répartit les résultats.
+
+        :param batch: Appels du lot (horodatage, arguments, future).
+        :type batch: List[Tuple[float, Tuple[Any, ...], Future]]
+        """
+        columns = [list(column) for column in zip(*(args for _, args, _ in batch))]
+        try:
+            results = list(self._batch_func(*columns))
+            if len(results) != len(batch):
+                raise ValueError(
+                    f"Batch function returned {len(results)} results for {len(batch)} calls"
+                )
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            for _, _, future in batch:
+                future.set_exception(exc)
+        else:
+            for (_, _, future), result in zip(batch, results):
+                future.set_result(result)
+        self.batches += 1
+        self.items += len(batch)
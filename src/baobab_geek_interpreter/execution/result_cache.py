@@ -0,0 +1,133 @@
+"""Module contenant le cache de résultats des services purs."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class ResultCache:  # pylint: disable=too-many-instance-attributes
+    """Cache LRU à durée de validité optionnelle des résultats d'un service.
+
+    Les entrées les moins récemment utilisées sont évincées lorsque la
+    capacité est atteinte ; une entrée plus ancienne que ``ttl`` est
+    considérée comme absente et supprimée. Les accès sont protégés par un
+    verrou.
+
+    :param max_size: Nombre maximal d'entrées.
+    :type max_size: int
+    :param ttl: Durée de validité d'une entrée en secondes (None : illimitée).
+    :type ttl: Optional[float]
+    :param clock: Horloge monotone utilisée pour la durée de validité.
+    :type clock: Callable[[], float]
+
+    :ivar hits: Nombre de résultats trouvés.
+    :type hits: int
+    :ivar misses: Nombre de résultats absents ou expirés.
+    :type misses: int
+    :ivar evictions: Nombre d'entrées évincées faute de place.
+    :type evictions: int
+    :ivar expirations: Nombre d'entrées supprimées car expirées.
+    :type expirations: int
+
+    :Example:
+        >>> cache = ResultCache(max_size=2)
+        >>> cache.put(("add", (1, 2)), 3)
+        >>> cache.get(("add", (1, 2)))
+        (True, 3)
+        >>> cache.get(("add", (2, 2)))
+        (False, None)
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialise un cache vide.
+
+        :param max_size: Nombre maximal d'entrées.
+        :type max_size: int
+        :param ttl: Durée de validité d'une entrée en secondes.
+        :type ttl: Optional[float]
+        :param clock: Horloge monotone.
+        :type clock: Callable[[], float]
+        """
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Recherche un résultat.
+
+        :param key: Clé du résultat.
+        :type key: Hashable
+        :return: Couple (trouvé, résultat) ; le résultat vaut None si absent.
+        :rtype: Tuple[bool, Any]
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            if self._ttl is not None and self._clock() - entry[0] >= self._ttl:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Mémorise un résultat, en évinçant l'entrée la plus ancienne si nécessaire.
+
+        :param key: Clé du résultat.
+        :type key: Hashable
+        :param value: Résultat à mémoriser.
+        :type value: Any
+        """
+        with self._lock:
+            self._entries[key] = (self._clock(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self) -> int:
+        """Retourne le nombre d'entrées.
+
+        :return: Nombre d'entrées.
+        :rtype: int
+        """
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Supprime toutes les entrées (les statistiques sont conservées)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Retourne les statistiques du cache.
+
+        :return: Succès, échecs, évictions, expirations et taille courante.
+        :rtype: Dict[str, int]
+
+        :Example:
+            >>> ResultCache(max_size=4).stats()["size"]
+            0
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._entries),
+        }
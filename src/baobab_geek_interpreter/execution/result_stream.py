@@ -0,0 +1,343 @@
+"""Module contenant la diffusion élément par élément du résultat d'un service."""
+
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Iterator
+from itertools import islice
+from typing import Any, AsyncGenerator, Generator, List, Optional, Tuple
+
+from baobab_geek_interpreter.exceptions.execution_exception import BaobabExecutionException
+
+# Élément de la file du producteur asynchrone : lot d'éléments, ou None et
+# l'exception levée par la source ; (None, None) marque la fin du flux.
+_Entry = Tuple[Optional[List[Any]], Optional[BaseException]]
+
+
+class ResultStream:
+    """Diffusion élément par élément du résultat d'un service.
+
+    Un résultat itérateur (générateur compris) ou générateur asynchrone est
+    consommé au fur et à mesure qu'il est produit ; une liste ou un tuple est
+    diffusé élément par élément ; tout autre résultat est diffusé comme un
+    élément unique. Avec ``chunk_size``, les éléments sont regroupés en listes
+    d'au plus ``chunk_size`` éléments.
+
+    Une exception levée par la source pendant l'itération est encapsulée dans
+    une :class:`BaobabExecutionException`. Si le consommateur s'arrête avant
+    la fin, la source est fermée (``close`` ou ``aclose``).
+
+    L'itération asynchrone (``async for``) lit la source dans une tâche
+    productrice qui devance le consommateur d'au plus ``buffer`` lots : un
+    consommateur lent suspend le producteur (contre-pression), et la mémoire
+    reste bornée. Un itérateur synchrone y est lu dans un thread
+    (``asyncio.to_thread``) afin de ne pas bloquer la boucle d'événements.
+
+    Un flux ne peut être parcouru qu'une seule fois.
+
+    :param result: Résultat du service.
+    :type result: Any
+    :param service_name: Nom du service, pour les messages d'erreur.
+    :type service_name: str
+    :param chunk_size: Nombre d'éléments par lot, ou None pour diffuser les
+        éléments un à un.
+    :type chunk_size: Optional[int]
+    :param buffer: Nombre de lots lus d'avance en itération asynchrone.
+    :type buffer: int
+    :raises ValueError: Si ``chunk_size`` ou ``buffer`` est inférieur à 1.
+
+    :Example:
+        >>> list(ResultStream(iter(range(5)), chunk_size=2))
+        [[0, 1], [2, 3], [4]]
+        >>> list(ResultStream(42))
+        [42]
+    """
+
+    def __init__(
+        self,
+        result: Any,
+        service_name: str = "",
+        chunk_size: Optional[int] = None,
+        buffer: int = 1,
+    ) -> None:
+        """Initialise la diffusion d'un résultat.
+
+        :param result: Résultat du service.
+        :type result: Any
+        :param service_name: Nom du service.
+        :type service_name: str
+        :param chunk_size: Nombre d'éléments par lot, ou None.
+        :type chunk_size: Optional[int]
+        :param buffer: Nombre de lots lus d'avance en itération asynchrone.
+        :type buffer: int
+        :raises ValueError: Si ``chunk_size`` ou ``buffer`` est inférieur à 1.
+        """
+        self.validate(chunk_size, buffer)
+        self._result = result
+        self._service_name = service_name
+        self._chunk_size = chunk_size
+        self._buffer = buffer
+
+    @staticmethod
+    def validate(chunk_size: Optional[int] = None, buffer: int = 1) -> None:
+        """Vérifie les paramètres d'une diffusion.
+
+        :param chunk_size: Nombre d'éléments par lot, ou None.
+        :type chunk_size: Optional[int]
+        :param buffer: Nombre de lots lus d'avance en itération asynchrone.
+        :type buffer: int
+        :raises ValueError: Si ``chunk_size`` ou ``buffer`` est inférieur à 1.
+        """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"chunk_size doit être supérieur ou égal à 1 (reçu {chunk_size})")
+        if buffer < 1:
+            raise ValueError(f"buffer doit être supérieur ou égal à 1 (reçu {buffer})")
+
+    def __iter__(self) -> Generator[Any, None, None]:
+        """Parcourt le résultat de manière synchrone.
+
+        Un générateur asynchrone est piloté par une boucle d'événements
+        privée : depuis une coroutine, utiliser ``async for``.
+
+        :return: Éléments, ou lots d'éléments avec ``chunk_size``.
+        :rtype: Generator[Any, None, None]
+        """
+        if isinstance(self._result, AsyncIterator):
+            items = self._drain_async(self._result)
+        else:
+            items = self._drain(self._source())
+        if self._chunk_size is None:
+            return items
+        return self._chunks(items, self._chunk_size)
+
+    def __aiter__(self) -> AsyncGenerator[Any, None]:
+        """Parcourt le résultat depuis une coroutine, avec contre-pression.
+
+        :return: Éléments, ou lots d'éléments avec ``chunk_size``.
+        :rtype: AsyncGenerator[Any, None]
+        """
+        return self._consume()
+
+    def _source(self) -> Iterator:
+        """Retourne l'itérateur synchrone des éléments du résultat.
+
+        :return: Itérateur des éléments.
+        :rtype: Iterator
+        """
+        if isinstance(self._result, Iterator):
+            return self._result
+        if isinstance(self._result, (list, tuple)):
+            return iter(self._result)
+        return iter((self._result,))
+
+    def _drain(self, iterator: Iterator) -> Generator[Any, None, None]:
+        """Parcourt un itérateur en encapsulant ses exceptions, puis le ferme.
+
+        :param iterator: Itérateur source.
+        :type iterator: Iterator
+        :return: Éléments de l'itérateur.
+        :rtype: Generator[Any, None, None]
+        :raises BaobabExecutionException: Si la source lève une exception.
+        """
+        try:
+            while True:
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                except Exception as exc:
+                    raise self._error(exc) from exc
+                yield item
+        finally:
+            self._close(iterator)
+
+    def _drain_async(self, source: Any) -> Generator[Any, None, None]:
+        """Parcourt un itérateur asynchrone depuis une boucle d'événements privée.
+
+        :param source: Itérateur asynchrone source.
+        :type source: Any
+        :return: Éléments de l'itérateur.
+        :rtype: Generator[Any, None, None]
+        :raises BaobabExecutionException: Si la source lève une exception.
+        """
+        loop = asyncio.new_event_loop()
+        try:
+            while True:
+                try:
+                    # anext() n'existe qu'à partir de Python 3.10.
+                    # pylint: disable-next=unnecessary-dunder-call
+                    item = loop.run_until_complete(source.__anext__())
+                except StopAsyncIteration:
+                    return
+                except Exception as exc:
+                    raise self._error(exc) from exc
+                yield item
+        finally:
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                loop.run_until_complete(aclose())
+            loop.close()
+
+    @staticmethod
+    def _chunks(items: Iterator, size: int) -> Generator[List[Any], None, None]:
+        """Regroupe des éléments en lots, puis ferme leur générateur.
+
+        :param items: Générateur des éléments.
+        :type items: Iterator
+        :param size: Nombre d'éléments par lot.
+        :type size: int
+        :return: Lots d'au plus ``size`` éléments.
+        :rtype: Generator[List[Any], None, None]
+        """
+        try:
+            while True:
+                chunk = list(islice(items, size))
+                if not chunk:
+                    return
+                yield chunk
+        finally:
+            ResultStream._close(items)
+
+    async def _consume(self) -> AsyncGenerator[Any, None]:
+        """Consomme les lots produits par la tâche productrice.
+
+        :return: Éléments, ou lots d'éléments avec ``chunk_size``.
+        :rtype: AsyncGenerator[Any, None]
+        :raises BaobabExecutionException: Si la source lève une exception.
+        """
+        queue: "asyncio.Queue[_Entry]" = asyncio.Queue(maxsize=self._buffer)
+        producer = asyncio.ensure_future(self._produce(queue))
+        try:
+            while True:
+                chunk, error = await queue.get()
+                if error is not None:
+                    raise error
+                if chunk is None:
+                    return
+                if self._chunk_size is None:
+                    for item in chunk:
+                        yield item
+                else:
+                    yield chunk
+        finally:
+            producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await producer
+
+    async def _produce(self, queue: "asyncio.Queue[_Entry]") -> None:
+        """Lit la source par lots et les dépose dans la file bornée.
+
+        :param queue: File des lots, de taille ``buffer``.
+        :type queue: asyncio.Queue
+        """
+        size = self._chunk_size or 1
+        try:
+            if isinstance(self._result, AsyncIterator):
+                await self._produce_async(self._result, queue, size)
+            else:
+                await self._produce_sync(self._source(), queue, size)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            await queue.put((None, exc))
+        else:
+            await queue.put((None, None))
+
+    async def _produce_sync(
+        self, iterator: Iterator, queue: "asyncio.Queue[_Entry]", size: int
+    ) -> None:
+        """Lit un itérateur synchrone par lots dans un thread.
+
+        :param iterator: Itérateur source.
+        :type iterator: Iterator
+        :param queue: File des lots.
+        :type queue: asyncio.Queue
+        :param size: Nombre d'éléments par lot.
+        :type size: int
+        :raises BaobabExecutionException: Si la source lève une exception.
+        """
+        try:
+            while True:
+                read = asyncio.ensure_future(asyncio.to_thread(self._take, iterator, size))
+                try:
+                    chunk = await asyncio.shield(read)
+                except asyncio.CancelledError:
+                    # La source ne peut être fermée pendant une lecture en cours.
+                    with contextlib.suppress(Exception):
+                        await read
+                    raise
+                if not chunk:
+                    return
+                await queue.put((chunk, None))
+        finally:
+            self._close(iterator)
+
+    async def _produce_async(self, source: Any, queue: "asyncio.Queue[_Entry]", size: int) -> None:
+        """Lit un itérateur asynchrone par lots.
+
+        :param source: Itérateur asynchrone source.
+        :type source: Any
+        :param queue: File des lots.
+        :type queue: asyncio.Queue
+        :param size: Nombre d'éléments par lot.
+        :type size: int
+        :raises BaobabExecutionException: Si la source lève une exception.
+        """
+        chunk: List[Any] = []
+        try:
+            try:
+                async for item in source:
+                    chunk.append(item)
+                    if len(chunk) == size:
+                        await queue.put((chunk, None))
+                        chunk = []
+            except Exception as exc:
+                raise self._error(exc) from exc
+            if chunk:
+                await queue.put((chunk, None))
+        finally:
+            aclose = getattr(source, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+    def _take(self, iterator: Iterator, size: int) -> List[Any]:
+        """Lit au plus ``size`` éléments d'un itérateur.
+
+        :param iterator: Itérateur source.
+        :type iterator: Iterator
+        :param size: Nombre maximal d'éléments.
+        :type size: int
+        :return: Éléments lus (liste vide en fin de flux).
+        :rtype: List[Any]
+        :raises BaobabExecutionException: Si la source lève une exception.
+        """
+        try:
+            return list(islice(iterator, size))
+        except Exception as exc:
+            raise self._error(exc) from exc
+
+    def _error(self, exc: Exception) -> BaobabExecutionException:
+        """Construit l'exception levée lorsque la source échoue en cours d'itération.
+
+        :param exc: Exception levée par la source.
+        :type exc: Exception
+        :return: Exception d'exécution.
+        :rtype: BaobabExecutionException
+        """
+        return BaobabExecutionException(
+            f"Erreur lors de l'exécution du service '{self._service_name}': {str(exc)}",
+            source="",
+            position=0,
+            line=0,
+            column=0,
+            service_name=self._service_name,
+            original_exception=exc,
+        )
+
+    @staticmethod
+    def _close(iterator: Any) -> None:
+        """Ferme un itérateur qui le permet (générateur).
+
+        :param iterator: Itérateur.
+        :type iterator: Any
+        """
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
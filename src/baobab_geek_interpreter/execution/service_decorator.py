@@ -1,23 +1,93 @@
 """Module contenant le décorateur @service pour marquer les services."""
 
+import inspect
 from functools import wraps
-from typing import Any, Callable, TypeVar, cast
+from typing import Any, Callable, Optional, TypeVar, Union, cast, get_args, get_origin, overload
+
+from baobab_geek_interpreter.execution.service_options import ServiceOptions
 
 # TypeVar pour préserver le type de la fonction décorée
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+@overload
 def service(func: F) -> F:
+    ...
+
+
+@overload
+def service(
+    *,
+    pure: bool = False,
+    cache_size: int = ServiceOptions.DEFAULT_CACHE_SIZE,
+    ttl: Optional[float] = None,
+    batch: bool = False,
+    max_batch: int = ServiceOptions.DEFAULT_MAX_BATCH,
+    max_wait_ms: float = ServiceOptions.DEFAULT_MAX_WAIT_MS,
+    executor: str = "inline",
+) -> Callable[[F], F]:
+    ...
+
+
+def service(
+    func: Optional[F] = None,
+    *,
+    pure: bool = False,
+    cache_size: int = ServiceOptions.DEFAULT_CACHE_SIZE,
+    ttl: Optional[float] = None,
+    batch: bool = False,
+    max_batch: int = ServiceOptions.DEFAULT_MAX_BATCH,
+    max_wait_ms: float = ServiceOptions.DEFAULT_MAX_WAIT_MS,
+    executor: str = "inline",
+) -> Union[F, Callable[[F], F]]:
     """Décorateur pour marquer une fonction comme service.
 
+    S'utilise sans argument (``@service``) ou avec des options d'exécution
+    (``@service(pure=True, cache_size=256, ttl=30.0)``).
+
     Ajoute les métadonnées suivantes à la fonction :
     - `_is_service` : True
     - `_service_name` : nom de la fonction
+    - `_service_options` : options d'exécution (:class:`ServiceOptions`)
 
-    :param func: La fonction à décorer.
-    :type func: Callable[..., Any]
-    :return: La fonction décorée avec les métadonnées.
-    :rtype: Callable[..., Any]
+    Le résultat d'un service déclaré pur est mémorisé par l'exécuteur
+    (cache LRU de ``cache_size`` entrées, valides ``ttl`` secondes) : le même
+    objet est retourné aux appels identiques.
+
+    Un service de lot (``batch=True``) est écrit comme une fonction recevant
+    une liste de valeurs par paramètre (annotations ``list[T]``) et retournant
+    une liste de résultats (``list[R]``). Le service exposé est individuel :
+    sa signature (``__signature__``) utilise ``T`` et ``R``, ce qui permet la
+    vérification des types de chaque appel, et l'exécuteur regroupe les appels
+    simultanés (au plus ``max_batch``, après au plus ``max_wait_ms``
+    millisecondes d'attente) en un seul appel de la fonction de lot.
+
+    Un service déclaré ``executor="process"`` est exécuté par l'exécuteur dans
+    un processus de travail (voir :class:`ServiceProcessPool`) : il doit être
+    défini au niveau d'un module importable, et ses arguments et son résultat
+    doivent être sérialisables par ``pickle``. Un appel direct reste local.
+
+    :param func: La fonction à décorer (absente si le décorateur est appelé
+        avec des options).
+    :type func: Optional[Callable[..., Any]]
+    :param pure: Le service est une fonction pure de ses arguments.
+    :type pure: bool
+    :param cache_size: Nombre maximal de résultats mémorisés.
+    :type cache_size: int
+    :param ttl: Durée de validité d'un résultat mémorisé, en secondes.
+    :type ttl: Optional[float]
+    :param batch: La fonction décorée est une fonction de lot.
+    :type batch: bool
+    :param max_batch: Taille maximale d'un lot.
+    :type max_batch: int
+    :param max_wait_ms: Délai maximal d'attente d'un lot incomplet, en millisecondes.
+    :type max_wait_ms: float
+    :param executor: Lieu d'exécution du service (``"inline"`` ou ``"process"``).
+    :type executor: str
+    :return: La fonction décorée avec les métadonnées, ou le décorateur
+        configuré si ``func`` est absente.
+    :rtype: Union[Callable[..., Any], Callable[[Callable[..., Any]], Callable[..., Any]]]
+    :raises ValueError: Si une taille, une durée ou un lieu d'exécution est invalide.
 
     :Example:
         >>> @service
@@ -29,20 +99,93 @@ def service(func: F) -> F:
         True
         >>> add._service_name
         'add'
+        >>> @service(pure=True, cache_size=64)
+        ... def square(x: int) -> int:
+        ...     return x * x
+        >>> square._service_options.pure
+        True
+        >>> @service(batch=True)
+        ... def scale(values: list[float]) -> list[float]:
+        ...     return [value * 2 for value in values]
+        >>> scale(1.5)
+        3.0
     """
+    options = ServiceOptions(
+        pure=pure,
+        cache_size=cache_size,
+        ttl=ttl,
+        batch=batch,
+        max_batch=max_batch,
+        max_wait_ms=max_wait_ms,
+        executor=executor,
+    )
 
-    @wraps(func)
-    def wrapper(*args: Any, **kwargs: Any) -> Any:
-        """Wrapper qui appelle la fonction originale.
+    def decorate(target: F) -> F:
+        """Décore la fonction avec les options configurées.
 
-        :param args: Arguments positionnels.
-        :param kwargs: Arguments nommés.
-        :return: Résultat de la fonction originale.
+        :param target: La fonction à décorer.
+        :type target: Callable[..., Any]
+        :return: La fonction décorée.
+        :rtype: Callable[..., Any]
         """
-        return func(*args, **kwargs)
 
-    # Ajouter les métadonnées
-    setattr(wrapper, "_is_service", True)
-    setattr(wrapper, "_service_name", func.__name__)
+        @wraps(target)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            """Wrapper qui appelle la fonction originale.
+
+            :param args: Arguments positionnels.
+            :param kwargs: Arguments nommés.
+            :return: Résultat de la fonction originale.
+            """
+            if options.batch:
+                # Appel direct d'un service de lot : lot d'un seul appel
+                batch_args = [[arg] for arg in args]
+                batch_kwargs = {key: [value] for key, value in kwargs.items()}
+                return target(*batch_args, **batch_kwargs)[0]
+            return target(*args, **kwargs)
 
-    return cast(F, wrapper)
+        # Ajouter les métadonnées
+        setattr(wrapper, "_is_service", True)
+        setattr(wrapper, "_service_name", target.__name__)
+        setattr(wrapper, "_service_options", options)
+        if options.batch:
+            setattr(wrapper, "_batch_function", target)
+            setattr(wrapper, "__signature__", _item_signature(target))
+
+        return cast(F, wrapper)
+
+    if func is None:
+        return decorate
+    return decorate(func)
+
+
+def _item_annotation(annotation: Any) -> Any:
+    """Retourne l'annotation d'un élément à partir de celle d'une liste.
+
+    :param annotation: Annotation d'un paramètre ou du retour d'une fonction de lot.
+    :type annotation: Any
+    :return: ``T`` pour ``list[T]``, sinon aucune annotation.
+    :rtype: Any
+    """
+    if get_origin(annotation) is list and get_args(annotation):
+        return get_args(annotation)[0]
+    return inspect.Parameter.empty
+
+
+def _item_signature(batch_func: Callable[..., Any]) -> inspect.Signature:
+    """Calcule la signature d'un appel individuel d'une fonction de lot.
+
+    :param batch_func: Fonction de lot.
+    :type batch_func: Callable[..., Any]
+    :return: Signature où chaque ``list[T]`` est remplacé par ``T``.
+    :rtype: inspect.Signature
+    """
+    signature = inspect.signature(batch_func)
+    parameters = [
+        parameter.replace(annotation=_item_annotation(parameter.annotation))
+        for parameter in signature.parameters.values()
+    ]
+    return signature.replace(
+        parameters=parameters,
+        return_annotation=_item_annotation(signature.return_annotation),
+    )
@@ -0,0 +1,204 @@
+"""Module contenant la répartition des services de lot et des services en processus."""
+
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from baobab_geek_interpreter.execution.service_options import ServiceOptions
+from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+
+if TYPE_CHECKING:
+    from baobab_geek_interpreter.execution.micro_batcher import MicroBatcher
+    from baobab_geek_interpreter.execution.service_process_pool import ServiceProcessPool
+
+
+class ServiceDispatcher:
+    """Répartit les appels des services de lot et des services exécutés en processus.
+
+    Les appels des services de lot (``@service(batch=True)``) sont confiés à
+    un :class:`MicroBatcher` par service, qui regroupe les appels simultanés
+    en un seul appel de la fonction de lot.
+
+    Les services déclarés ``@service(executor="process")`` sont exécutés
+    dans un :class:`ServiceProcessPool`. À défaut de pool fourni, un pool
+    est créé au premier appel ; ses processus importent au démarrage les
+    modules des services de ce type enregistrés dans la table des symboles.
+
+    :param symbol_table: Table des symboles contenant les services enregistrés.
+    :type symbol_table: SymbolTable
+    :param process_pool: Pool de processus des services ``executor="process"``
+        (créé à la demande si absent).
+    :type process_pool: Optional[ServiceProcessPool]
+
+    :Example:
+        >>> def double(x: int) -> int:
+        ...     return x * 2
+        >>> dispatcher = ServiceDispatcher(SymbolTable())
+        >>> dispatcher.batcher("double", double) is None
+        True
+    """
+
+    def __init__(
+        self, symbol_table: SymbolTable, process_pool: Optional["ServiceProcessPool"] = None
+    ) -> None:
+        """Initialise la répartition.
+
+        :param symbol_table: Table des symboles.
+        :type symbol_table: SymbolTable
+        :param process_pool: Pool de processus des services ``executor="process"``
+            (créé à la demande si absent).
+        :type process_pool: Optional[ServiceProcessPool]
+        """
+        self._symbol_table = symbol_table
+        self._batchers: Dict[str, Tuple[Callable[..., Any], "MicroBatcher"]] = {}
+        self._batchers_lock = threading.Lock()
+        self._process_pool = process_pool
+        self._owns_process_pool = process_pool is None
+        self._process_pool_ready = False
+        self._process_pool_lock = threading.Lock()
+
+    def batch_stats(self) -> Dict[str, Dict[str, int]]:
+        """Retourne les statistiques de regroupement des services de lot.
+
+        :return: Nombre de lots et d'appels traités, indexés par nom de service.
+        :rtype: Dict[str, Dict[str, int]]
+        """
+        with self._batchers_lock:
+            batchers = list(self._batchers.items())
+        return {name: batcher.stats() for name, (_, batcher) in batchers}
+
+    def process_stats(self) -> Dict[str, int]:
+        """Retourne les statistiques du pool de processus.
+
+        :return: Nombre d'appels, de recyclages et de processus ; vide si aucun
+            service n'a été exécuté dans un processus.
+        :rtype: Dict[str, int]
+        """
+        if not self._process_pool_ready or self._process_pool is None:
+            return {}
+        return self._process_pool.stats()
+
+    def close(self) -> None:
+        """Libère les regroupements et le pool de processus.
+
+        Exécute les appels en attente des services de lot, puis arrête le pool
+        de processus s'il a été créé par la répartition.
+        """
+        with self._batchers_lock:
+            batchers = [batcher for _, batcher in self._batchers.values()]
+            self._batchers.clear()
+        for batcher in batchers:
+            batcher.close()
+        with self._process_pool_lock:
+            pool = self._process_pool if self._owns_process_pool else None
+            if self._owns_process_pool:
+                self._process_pool = None
+            self._process_pool_ready = False
+        if pool is not None:
+            pool.close()
+
+    def batcher(
+        self, service_name: str, service_func: Callable[..., Any]
+    ) -> Optional["MicroBatcher"]:
+        """Retourne le regroupement d'un service de lot, créé à la demande.
+
+        Le regroupement précédent est fermé si le service a été ré-enregistré
+        avec une autre fonction.
+
+        :param service_name: Nom du service.
+        :type service_name: str
+        :param service_func: Fonction du service.
+        :type service_func: Callable[..., Any]
+        :return: Regroupement du service, ou None s'il n'est pas un service de lot.
+        :rtype: Optional[MicroBatcher]
+        """
+        options: Optional[ServiceOptions] = getattr(service_func, "_service_options", None)
+        if options is None or not options.batch:
+            return None
+        entry = self._batchers.get(service_name)
+        if entry is not None and entry[0] is service_func:
+            return entry[1]
+        with self._batchers_lock:
+            entry = self._batchers.get(service_name)
+            if entry is None or entry[0] is not service_func:
+                if entry is not None:
+                    entry[1].close()
+                batch_func: Callable[..., Any] = getattr(service_func, "_batch_function")
+                if options.executor == "process":
+                    batch_func = self._process_batch_function(service_func)
+                # pylint: disable-next=import-outside-toplevel,redefined-outer-name
+                from baobab_geek_interpreter.execution.micro_batcher import MicroBatcher
+
+                batcher = MicroBatcher(
+                    batch_func,
+                    options.max_batch,
+                    options.max_wait_ms / 1000,
+                )
+                entry = (service_func, batcher)
+                self._batchers[service_name] = entry
+            return entry[1]
+
+    def service_pool(self) -> "ServiceProcessPool":
+        """Retourne le pool de processus, créé à la demande.
+
+        Au premier appel, les modules des services ``executor="process"``
+        enregistrés sont ajoutés aux modules préchargés par les processus.
+
+        :return: Pool de processus.
+        :rtype: ServiceProcessPool
+        """
+        pool = self._process_pool
+        if pool is not None and self._process_pool_ready:
+            return pool
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                # pylint: disable-next=import-outside-toplevel,redefined-outer-name
+                from baobab_geek_interpreter.execution.service_process_pool import (
+                    ServiceProcessPool,
+                )
+
+                self._process_pool = ServiceProcessPool()
+            if not self._process_pool_ready:
+                self._process_pool.preload(self._process_modules())
+                self._process_pool_ready = True
+            return self._process_pool
+
+    @staticmethod
+    def runs_in_process(service_func: Any) -> bool:
+        """Indique si un service est déclaré ``executor="process"``.
+
+        :param service_func: Fonction du service.
+        :type service_func: Any
+        :return: True si le service s'exécute dans un processus de travail.
+        :rtype: bool
+        """
+        options: Optional[ServiceOptions] = getattr(service_func, "_service_options", None)
+        return options is not None and options.executor == "process"
+
+    def _process_batch_function(self, service_func: Callable[..., Any]) -> Callable[..., Any]:
+        """Construit une fonction de lot exécutée dans le pool de processus.
+
+        :param service_func: Service de lot.
+        :type service_func: Callable[..., Any]
+        :return: Fonction recevant une liste de valeurs par paramètre.
+        :rtype: Callable[..., Any]
+        """
+
+        def run_batch(*columns: List[Any]) -> Any:
+            return self.service_pool().call(service_func, columns, batch=True)
+
+        return run_batch
+
+    def _process_modules(self) -> List[str]:
+        """Liste les modules des services enregistrés ``executor="process"``.
+
+        :return: Noms des modules, triés.
+        :rtype: List[str]
+        """
+        modules = set()
+        for name in self._symbol_table.list_services():
+            func = self._symbol_table.get(name, resolve=False)  # sans import paresseux
+            if self.runs_in_process(func):
+                module = getattr(func, "__module__", None)
+                if module and module != "__main__":
+                    modules.add(module)
+        return sorted(modules)
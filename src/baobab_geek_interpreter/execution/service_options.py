@@ -0,0 +1,131 @@
+"""Module contenant les options d'exécution d'un service."""
+
+from typing import Optional
+
+
+class ServiceOptions:
+    """Options d'exécution déclarées par le décorateur ``@service``.
+
+    :param pure: Le service est une fonction pure de ses arguments : son
+        résultat peut être mémorisé par l'exécuteur.
+    :type pure: bool
+    :param cache_size: Nombre maximal de résultats mémorisés (LRU).
+    :type cache_size: int
+    :param ttl: Durée de validité d'un résultat mémorisé, en secondes
+        (None pour une durée illimitée).
+    :type ttl: Optional[float]
+    :param batch: Le service est une fonction de lot : elle reçoit une liste
+        de valeurs par paramètre et retourne une liste de résultats ; les appels
+        individuels simultanés sont regroupés par l'exécuteur.
+    :type batch: bool
+    :param max_batch: Taille maximale d'un lot.
+    :type max_batch: int
+    :param max_wait_ms: Délai maximal d'attente, en millisecondes, avant
+        l'exécution d'un lot incomplet.
+    :type max_wait_ms: float
+    :param executor: Lieu d'exécution du service : ``"inline"`` (thread
+        appelant) ou ``"process"`` (processus du pool de l'exécuteur, pour
+        les services limités par le processeur).
+    :type executor: str
+    :raises ValueError: Si une taille, une durée ou un lieu d'exécution est invalide.
+
+    :ivar pure: Le service est pur.
+    :type pure: bool
+    :ivar cache_size: Nombre maximal de résultats mémorisés.
+    :type cache_size: int
+    :ivar ttl: Durée de validité d'un résultat mémorisé.
+    :type ttl: Optional[float]
+    :ivar batch: Le service est une fonction de lot.
+    :type batch: bool
+    :ivar max_batch: Taille maximale d'un lot.
+    :type max_batch: int
+    :ivar max_wait_ms: Délai maximal d'attente d'un lot incomplet.
+    :type max_wait_ms: float
+    :ivar executor: Lieu d'exécution du service.
+    :type executor: str
+
+    :Example:
+        >>> options = ServiceOptions(pure=True, cache_size=16, ttl=60.0)
+        >>> options.pure
+        True
+    """
+
+    DEFAULT_CACHE_SIZE = 128
+    """Nombre de résultats mémorisés par défaut."""
+
+    DEFAULT_MAX_BATCH = 64
+    """Taille maximale d'un lot par défaut."""
+
+    DEFAULT_MAX_WAIT_MS = 2.0
+    """Délai d'attente d'un lot incomplet par défaut, en millisecondes."""
+
+    EXECUTORS = ("inline", "process")
+    """Lieux d'exécution reconnus."""
+
+    def __init__(
+        self,
+        pure: bool = False,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        ttl: Optional[float] = None,
+        batch: bool = False,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        executor: str = "inline",
+    ) -> None:
+        """Initialise les options d'un service.
+
+        :param pure: Le service est pur.
+        :type pure: bool
+        :param cache_size: Nombre maximal de résultats mémorisés.
+        :type cache_size: int
+        :param ttl: Durée de validité d'un résultat mémorisé, en secondes.
+        :type ttl: Optional[float]
+        :param batch: Le service est une fonction de lot.
+        :type batch: bool
+        :param max_batch: Taille maximale d'un lot.
+        :type max_batch: int
+        :param max_wait_ms: Délai maximal d'attente d'un lot incomplet.
+        :type max_wait_ms: float
+        :param executor: Lieu d'exécution du service.
+        :type executor: str
+        :raises ValueError: Si une taille, une durée ou un lieu d'exécution est invalide.
+        """
+        if cache_size < 1:
+            raise ValueError(f"cache_size must be positive, got {cache_size}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"ttl must be positive, got {ttl}")
+        if max_batch < 1:
+            raise ValueError(f"max_batch must be positive, got {max_batch}")
+        if max_wait_ms < 0:
+            raise ValueError(f"max_wait_ms must not be negative, got {max_wait_ms}")
+        if executor not in self.EXECUTORS:
+            raise ValueError(f"executor must be one of {self.EXECUTORS}, got {executor!r}")
+        self.pure: bool = pure
+        self.cache_size: int = cache_size
+        self.ttl: Optional[float] = ttl
+        self.batch: bool = batch
+        self.max_batch: int = max_batch
+        self.max_wait_ms: float = max_wait_ms
+        self.executor: str = executor
+
+    @property
+    def plain(self) -> bool:
+        """Indique qu'aucune option ne modifie l'appel du service.
+
+        :return: True si le service n'est ni pur, ni de lot, ni exécuté dans
+            un processus.
+        :rtype: bool
+        """
+        return not (self.pure or self.batch or self.executor == "process")
+
+    def __repr__(self) -> str:
+        """Retourne une représentation technique des options.
+
+        :return: Représentation des options.
+        :rtype: str
+        """
+        return (
+            f"ServiceOptions(pure={self.pure}, cache_size={self.cache_size}, ttl={self.ttl}, "
+            f"batch={self.batch}, max_batch={self.max_batch}, max_wait_ms={self.max_wait_ms}, "
+            f"executor={self.executor!r})"
+        )
@@ -0,0 +1,358 @@
+"""Module contenant le pool de processus d'exécution des services."""
+
+import importlib
+import os
+import pickle  # nosec B403
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from types import TracebackType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Type, cast
+
+from baobab_geek_interpreter.execution.shared_array import SharedArray
+
+
+def _preload(modules: Tuple[str, ...]) -> None:
+    """Importe les modules de services au démarrage d'un processus de travail.
+
+    :param modules: Noms des modules à importer.
+    :type modules: Tuple[str, ...]
+    """
+    for module in modules:
+        importlib.import_module(module)
+
+
+def _run(payload: bytes) -> bytes:
+    """Exécute un appel de service dans un processus de travail.
+
+    Les arguments placés en mémoire partagée sont remplacés par une vue sur
+    leur segment, libérée après l'appel.
+
+    :param payload: Service, arguments et indicateur de lot sérialisés.
+    :type payload: bytes
+    :return: Résultat sérialisé.
+    :rtype: bytes
+    """
+    # pickle ne circule qu'entre le processus parent et les processus de son pool :
+    # la charge utile vient du parent (voir ServiceProcessPool.submit).
+    func, args, batch = pickle.loads(payload)  # nosec B301
+    target: Callable[..., Any] = getattr(func, "_batch_function") if batch else func
+    shared = [arg for arg in args if isinstance(arg, SharedArray)]
+    try:
+        values = [arg.attach() if isinstance(arg, SharedArray) else arg for arg in args]
+        return pickle.dumps(target(*values), protocol=pickle.HIGHEST_PROTOCOL)
+    finally:
+        for arg in shared:
+            arg.detach()
+
+
+class ServiceProcessPool:  # pylint: disable=too-many-instance-attributes
+    """Pool de processus exécutant les services limités par le processeur.
+
+    Encapsule un ``ProcessPoolExecutor`` démarré au premier appel. Chaque
+    processus importe les modules de ``preload`` à son démarrage, ce qui évite
+    de payer l'import des services lors du premier appel. Les services sont
+    transmis par référence (module et nom qualifié) ; les arguments et les
+    résultats sont sérialisés avec le protocole ``pickle`` le plus récent.
+
+    Lorsque ``max_calls_per_worker`` est défini, les processus sont recyclés
+    dès que le pool a reçu ``max_calls_per_worker * max_workers`` appels (soit
+    en moyenne ``max_calls_per_worker`` appels par processus) : un nouveau pool
+    est démarré et l'ancien s'arrête après avoir terminé ses appels en cours.
+    Cela borne la mémoire accumulée par des services qui fuient.
+
+    Un pool interrompu (processus tué) est remplacé au prochain appel.
+
+    Lorsque ``shared_memory_threshold`` est défini, les arguments d'un appel
+    individuel qui sont des listes homogènes d'entiers 64 bits ou de flottants
+    d'au moins ``shared_memory_threshold`` éléments sont copiés dans un segment
+    de mémoire partagée (:class:`SharedArray`) au lieu d'être sérialisés : le
+    service reçoit alors une ``memoryview`` typée (``"q"`` ou ``"d"``) sur le
+    segment, sans copie, valide pendant l'appel. Les segments sont libérés dès
+    la fin de l'appel.
+
+    :param max_workers: Nombre de processus (nombre de processeurs par défaut).
+    :type max_workers: Optional[int]
+    :param max_calls_per_worker: Nombre moyen d'appels avant recyclage des
+        processus (None : jamais).
+    :type max_calls_per_worker: Optional[int]
+    :param preload: Modules importés au démarrage de chaque processus.
+    :type preload: Iterable[str]
+    :param shared_memory_threshold: Nombre minimal d'éléments d'un tableau
+        transmis en mémoire partagée (None : jamais).
+    :type shared_memory_threshold: Optional[int]
+    :raises ValueError: Si un nombre est invalide.
+
+    :ivar calls: Nombre d'appels soumis.
+    :type calls: int
+    :ivar recycles: Nombre de recyclages des processus.
+    :type recycles: int
+    :ivar shared_arrays: Nombre de tableaux transmis en mémoire partagée.
+    :type shared_arrays: int
+
+    :Example:
+        >>> import math
+        >>> with ServiceProcessPool(max_workers=1) as pool:
+        ...     pool.call(math.factorial, (5,))
+        120
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_calls_per_worker: Optional[int] = None,
+        preload: Iterable[str] = (),
+        shared_memory_threshold: Optional[int] = None,
+    ) -> None:
+        """Initialise le pool sans démarrer de processus.
+
+        :param max_workers: Nombre de processus.
+        :type max_workers: Optional[int]
+        :param max_calls_per_worker: Nombre moyen d'appels avant recyclage.
+        :type max_calls_per_worker: Optional[int]
+        :param preload: Modules importés au démarrage de chaque processus.
+        :type preload: Iterable[str]
+        :param shared_memory_threshold: Nombre minimal d'éléments d'un tableau
+            transmis en mémoire partagée.
+        :type shared_memory_threshold: Optional[int]
+        :raises ValueError: Si un nombre est invalide.
+        """
+        if max_workers is not None and max_workers < 1:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+        if max_calls_per_worker is not None and max_calls_per_worker < 1:
+            raise ValueError(f"max_calls_per_worker must be positive, got {max_calls_per_worker}")
+        if shared_memory_threshold is not None and shared_memory_threshold < 1:
+            raise ValueError(
+                f"shared_memory_threshold must be positive, got {shared_memory_threshold}"
+            )
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._max_calls_per_worker = max_calls_per_worker
+        self._shared_memory_threshold = shared_memory_threshold
+        self._preload: List[str] = []
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pool_calls = 0
+        self._closed = False
+        self.calls = 0
+        self.recycles = 0
+        self.shared_arrays = 0
+        self.preload(preload)
+
+    @property
+    def max_workers(self) -> int:
+        """Retourne le nombre de processus.
+
+        :return: Nombre de processus.
+        :rtype: int
+        """
+        return self._max_workers
+
+    def preload(self, modules: Iterable[str]) -> None:
+        """Ajoute des modules à importer au démarrage des processus.
+
+        Les modules sont pris en compte par les processus démarrés ensuite
+        (premier appel ou recyclage).
+
+        :param modules: Noms des modules.
+        :type modules: Iterable[str]
+        """
+        with self._lock:
+            for module in modules:
+                if module not in self._preload:
+                    self._preload.append(module)
+
+    def submit(
+        self, func: Callable[..., Any], args: Sequence[Any], batch: bool = False
+    ) -> "Future[Any]":
+        """Soumet un appel de service sans attendre son résultat.
+
+        :param func: Service à appeler, défini au niveau d'un module.
+        :type func: Callable[..., Any]
+        :param args: Valeurs des arguments.
+        :type args: Sequence[Any]
+        :param batch: Appeler la fonction de lot d'un service de lot ; ``args``
+            contient alors une liste de valeurs par paramètre.
+        :type batch: bool
+        :return: Future résolue avec le résultat du service.
+        :rtype: concurrent.futures.Future
+        :raises RuntimeError: Si le pool a été fermé.
+        :raises pickle.PicklingError: Si le service ou les arguments ne sont
+            pas sérialisables.
+        """
+        shared: List[SharedArray] = []
+        try:
+            if self._shared_memory_threshold is not None and not batch:
+                args = [self._share(arg, shared) for arg in args]
+            payload = pickle.dumps((func, tuple(args), batch), protocol=pickle.HIGHEST_PROTOCOL)
+            with self._lock:
+                pool = self._acquire()
+                try:
+                    raw = pool.submit(_run, payload)
+                except BrokenProcessPool:
+                    self._release(pool)
+                    pool = self._acquire()
+                    raw = pool.submit(_run, payload)
+                self.shared_arrays += len(shared)
+        except BaseException:
+            for segment in shared:
+                segment.unlink()
+            raise
+        result: "Future[Any]" = Future()
+        raw.add_done_callback(lambda done: self._settle(pool, done, result, shared))
+        return result
+
+    def call(self, func: Callable[..., Any], args: Sequence[Any], batch: bool = False) -> Any:
+        """Exécute un appel de service et attend son résultat.
+
+        :param func: Service à appeler, défini au niveau d'un module.
+        :type func: Callable[..., Any]
+        :param args: Valeurs des arguments.
+        :type args: Sequence[Any]
+        :param batch: Appeler la fonction de lot d'un service de lot.
+        :type batch: bool
+        :return: Résultat du service.
+        :rtype: Any
+        :raises Exception: L'exception levée par le service.
+        """
+        return self.submit(func, args, batch).result()
+
+    def close(self) -> None:
+        """Arrête les processus après la fin des appels en cours."""
+        with self._lock:
+            self._closed = True
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def stats(self) -> Dict[str, int]:
+        """Retourne les statistiques du pool.
+
+        :return: Nombre d'appels, de recyclages, de processus et de tableaux
+            transmis en mémoire partagée.
+        :rtype: Dict[str, int]
+        """
+        return {
+            "calls": self.calls,
+            "recycles": self.recycles,
+            "workers": self._max_workers,
+            "shared_arrays": self.shared_arrays,
+        }
+
+    def __enter__(self) -> "ServiceProcessPool":
+        """Retourne le pool pour un bloc ``with``.
+
+        :return: Le pool lui-même.
+        :rtype: ServiceProcessPool
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Ferme le pool à la sortie d'un bloc ``with``.
+
+        :param exc_type: Type de l'exception éventuelle.
+        :type exc_type: Optional[Type[BaseException]]
+        :param exc: Exception éventuelle.
+        :type exc: Optional[BaseException]
+        :param traceback: Trace de l'exception éventuelle.
+        :type traceback: Optional[TracebackType]
+        """
+        self.close()
+
+    def _acquire(self) -> ProcessPoolExecutor:
+        """Retourne le pool courant, démarré ou recyclé si nécessaire.
+
+        Doit être appelée avec le verrou acquis.
+
+        :return: Pool de processus.
+        :rtype: ProcessPoolExecutor
+        :raises RuntimeError: Si le pool a été fermé.
+        """
+        if self._closed:
+            raise RuntimeError("ServiceProcessPool is closed")
+        if (
+            self._pool is not None
+            and self._max_calls_per_worker is not None
+            and self._pool_calls >= self._max_calls_per_worker * self._max_workers
+        ):
+            self._pool.shutdown(wait=False)
+            self._pool = None
+            self.recycles += 1
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                self._max_workers, initializer=_preload, initargs=(tuple(self._preload),)
+            )
+            self._pool_calls = 0
+        self._pool_calls += 1
+        self.calls += 1
+        return self._pool
+
+    def _release(self, pool: ProcessPoolExecutor) -> None:
+        """Abandonne un pool interrompu s'il est toujours le pool courant.
+
+        Doit être appelée avec le verrou acquis.
+
+        :param pool: Pool interrompu.
+        :type pool: ProcessPoolExecutor
+        """
+        if self._pool is pool:
+            self._pool = None
+        pool.shutdown(wait=False)
+
+    def _share(self, value: Any, shared: List[SharedArray]) -> Any:
+        """Place un argument en mémoire partagée s'il est assez grand et homogène.
+
+        :param value: Valeur d'argument.
+        :type value: Any
+        :param shared: Segments créés pour l'appel, complétée si besoin.
+        :type shared: List[SharedArray]
+        :return: Référence au segment, ou la valeur inchangée.
+        :rtype: Any
+        """
+        if not isinstance(value, list) or len(value) < cast(int, self._shared_memory_threshold):
+            return value
+        segment = SharedArray.share(value)
+        if segment is None:
+            return value
+        shared.append(segment)
+        return segment
+
+    def _settle(
+        self,
+        pool: ProcessPoolExecutor,
+        done: "Future[bytes]",
+        result: "Future[Any]",
+        shared: List[SharedArray],
+    ) -> None:
+        """Libère les segments d'un appel terminé et désérialise son résultat.
+
+        :param pool: Pool ayant exécuté l'appel.
+        :type pool: ProcessPoolExecutor
+        :param done: Future de l'appel, résolue avec le résultat sérialisé.
+        :type done: concurrent.futures.Future
+        :param result: Future à résoudre avec le résultat désérialisé.
+        :type result: concurrent.futures.Future
+        :param shared: Segments de mémoire partagée de l'appel.
+        :type shared: List[SharedArray]
+        """
+        for segment in shared:
+            segment.unlink()
+        if done.cancelled():
+            result.cancel()
+            return
+        exc = done.exception()
+        if exc is None:
+            try:
+                # Résultat sérialisé par un processus de travail du pool (voir _run).
+                result.set_result(pickle.loads(done.result()))  # nosec B301
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                result.set_exception(error)
+            return
+        if isinstance(exc, BrokenProcessPool):
+            with self._lock:
+                self._release(pool)
+        result.set_exception(exc)
@@ -0,0 +1,147 @@
+"""Module contenant les tableaux numériques transmis en mémoire partagée."""
+
+from array import array
+from multiprocessing import shared_memory
+from typing import Any, List, Optional
+
+# Segments encore référencés par une vue conservée par un service : ils restent
+# projetés jusqu'à la fin du processus.
+_RETAINED: List[shared_memory.SharedMemory] = []
+
+
+class SharedArray:
+    """Référence sérialisable à un tableau numérique placé en mémoire partagée.
+
+    :meth:`share` copie une liste homogène d'entiers 64 bits ou de flottants
+    dans un segment ``multiprocessing.shared_memory`` ; seule la référence
+    (nom du segment, type et longueur) est sérialisée vers un processus de
+    travail, qui obtient avec :meth:`attach` une vue ``memoryview`` sur le
+    segment, sans copie.
+
+    Le processus qui a créé le segment en est propriétaire et le libère avec
+    :meth:`unlink` ; un processus qui s'y est attaché s'en détache avec
+    :meth:`detach`.
+
+    :param name: Nom du segment de mémoire partagée.
+    :type name: str
+    :param typecode: Code de type ``array`` des éléments (``"q"`` ou ``"d"``).
+    :type typecode: str
+    :param length: Nombre d'éléments.
+    :type length: int
+
+    :ivar name: Nom du segment de mémoire partagée.
+    :type name: str
+    :ivar typecode: Code de type des éléments.
+    :type typecode: str
+    :ivar length: Nombre d'éléments.
+    :type length: int
+
+    :Example:
+        >>> shared = SharedArray.share([1.5, 2.5, 3.0])
+        >>> shared.typecode, shared.length
+        ('d', 3)
+        >>> view = SharedArray(shared.name, shared.typecode, shared.length)
+        >>> sum(view.attach())
+        7.0
+        >>> view.detach()
+        >>> shared.unlink()
+    """
+
+    def __init__(self, name: str, typecode: str, length: int) -> None:
+        """Initialise une référence à un segment existant.
+
+        :param name: Nom du segment.
+        :type name: str
+        :param typecode: Code de type des éléments.
+        :type typecode: str
+        :param length: Nombre d'éléments.
+        :type length: int
+        """
+        self.name = name
+        self.typecode = typecode
+        self.length = length
+        self._segment: Optional[shared_memory.SharedMemory] = None
+        self._view: Optional[memoryview] = None
+
+    @classmethod
+    def share(cls, values: Any) -> Optional["SharedArray"]:
+        """Copie une liste numérique homogène dans un nouveau segment.
+
+        :param values: Valeur d'argument.
+        :type values: Any
+        :return: Référence au segment créé, ou None si la valeur n'est pas une
+            liste non vide d'entiers 64 bits ou de flottants.
+        :rtype: Optional[SharedArray]
+        """
+        if not isinstance(values, list) or not values:
+            return None
+        kinds = set(map(type, values))
+        if kinds == {float}:
+            typecode = "d"
+        elif kinds == {int}:
+            typecode = "q"
+        else:
+            return None
+        try:
+            data = array(typecode, values)
+        except OverflowError:
+            return None
+        raw = memoryview(data).cast("B")
+        segment = shared_memory.SharedMemory(create=True, size=raw.nbytes)
+        buffer: Any = segment.buf
+        buffer[: raw.nbytes] = raw
+        shared = cls(segment.name, typecode, len(values))
+        shared._segment = segment
+        return shared
+
+    def attach(self) -> memoryview:
+        """S'attache au segment et retourne une vue typée sur ses éléments.
+
+        :return: Vue en lecture et écriture sur les éléments, sans copie.
+        :rtype: memoryview
+        """
+        if self._segment is None:
+            self._segment = shared_memory.SharedMemory(name=self.name)
+        nbytes = self.length * array(self.typecode).itemsize
+        buffer: Any = self._segment.buf
+        self._view = buffer[:nbytes].cast(self.typecode)
+        return self._view
+
+    def detach(self) -> None:
+        """Libère la vue et se détache du segment.
+
+        Si le service a conservé une vue dérivée, le segment reste projeté
+        jusqu'à la fin du processus.
+        """
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._segment is not None:
+            try:
+                self._segment.close()
+            except BufferError:
+                _RETAINED.append(self._segment)
+            self._segment = None
+
+    def unlink(self) -> None:
+        """Libère le segment (réservé au processus qui l'a créé)."""
+        segment = self._segment
+        self.detach()
+        if segment is not None:
+            segment.unlink()
+
+    def __reduce__(self) -> Any:
+        """Sérialise la seule référence au segment.
+
+        :return: Constructeur et arguments de la référence.
+        :rtype: Any
+        """
+        return (SharedArray, (self.name, self.typecode, self.length))
+
+    def __repr__(self) -> str:
+        """Retourne une représentation technique de la référence.
+
+        :return: Représentation de la référence.
+        :rtype: str
+        """
+        return f"SharedArray(name={self.name!r}, typecode={self.typecode!r}, length={self.length})"
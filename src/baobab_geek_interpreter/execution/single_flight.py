@@ -0,0 +1,77 @@
+"""Module contenant la fusion des appels identiques en cours (threads)."""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Fusionne les appels identiques exécutés simultanément par plusieurs threads.
+
+    Le premier appelant d'une clé exécute la fonction ; les appelants suivants
+    qui arrivent pendant cette exécution attendent et reçoivent le même
+    résultat, ou la même exception. Une fois l'exécution terminée, la clé est
+    libérée : un appel ultérieur provoque une nouvelle exécution.
+
+    :ivar executions: Nombre d'exécutions effectives.
+    :type executions: int
+    :ivar coalesced: Nombre d'appels ayant partagé une exécution en cours.
+    :type coalesced: int
+
+    :Example:
+        >>> flight = SingleFlight()
+        >>> flight.do(("add", (1, 2)), lambda: 3)
+        3
+        >>> flight.executions
+        1
+    """
+
+    def __init__(self) -> None:
+        """Initialise un groupe sans appel en cours."""
+        self._lock = threading.Lock()
+        self._flights: Dict[Hashable, "Future[Any]"] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Exécute ``func`` ou attend l'exécution en cours pour la même clé.
+
+        :param key: Clé identifiant l'appel.
+        :type key: Hashable
+        :param func: Fonction à exécuter si aucun appel identique n'est en cours.
+        :type func: Callable[[], Any]
+        :return: Résultat de l'exécution partagée.
+        :rtype: Any
+        :raises Exception: L'exception levée par l'exécution partagée.
+        """
+        with self._lock:
+            pending = self._flights.get(key)
+            if pending is None:
+                future: "Future[Any]" = Future()
+                self._flights[key] = future
+                self.executions += 1
+            else:
+                self.coalesced += 1
+        if pending is not None:
+            return pending.result()
+
+        try:
+            result = func()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._flights[key]
+
+    def in_flight(self) -> int:
+        """Retourne le nombre d'exécutions en cours.
+
+        :return: Nombre de clés en cours d'exécution.
+        :rtype: int
+        """
+        with self._lock:
+            return len(self._flights)
@@ -1,15 +1,51 @@
 """Module principal de l'interpréteur Baobab Geek."""
 
-from typing import Any
+import inspect
+from functools import partial
+from itertools import islice
+from types import ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Callable,
+    ContextManager,
+    Dict,
+    Generator,
+    List,
+    Mapping,
+    Optional,
+    Union,
+    cast,
+)
 
 from baobab_geek_interpreter.execution.executor import Executor
+from baobab_geek_interpreter.execution.result_cache import ResultCache
 from baobab_geek_interpreter.lexical.lexical_analyzer import LexicalAnalyzer
+from baobab_geek_interpreter.lexical.token import Token
+from baobab_geek_interpreter.lexical.token_type import TokenType
+from baobab_geek_interpreter.semantic.bound_call import BoundCall
+from baobab_geek_interpreter.semantic.common_subexpression_eliminator import (
+    CommonSubexpressionEliminator,
+)
 from baobab_geek_interpreter.semantic.semantic_analyzer import SemanticAnalyzer
 from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+from baobab_geek_interpreter.semantic.validation_level import ValidationLevel
 from baobab_geek_interpreter.syntax.syntax_analyzer import SyntaxAnalyzer
 
+if TYPE_CHECKING:
+    from pathlib import Path  # annotations seulement
 
-class Interpreter:
+    # Sous-systèmes optionnels : importés à la première utilisation.
+    from baobab_geek_interpreter.cache.disk_call_cache import DiskCallCache
+    from baobab_geek_interpreter.execution.service_process_pool import ServiceProcessPool
+    from baobab_geek_interpreter.semantic.service_manifest import ServiceManifest
+    from baobab_geek_interpreter.vm.code_generator import CodeGenerator
+    from baobab_geek_interpreter.vm.compiler import Compiler
+    from baobab_geek_interpreter.vm.program import Program
+
+
+class Interpreter:  # pylint: disable=too-many-instance-attributes
     """Interpréteur principal pour le langage Geek.
 
     Assemble tous les composants (lexer, parser, semantic analyzer, executor)
@@ -27,25 +63,90 @@ class Interpreter:
         30
     """
 
-    def __init__(self) -> None:
-        """Initialise l'interpréteur avec tous ses composants."""
+    PROGRAM_CACHE_SIZE = 1024
+    """Nombre maximal de programmes compilés (mode ``compiled``) et de fonctions
+    générées par :meth:`prepare` conservés."""
+
+    def __init__(
+        self,
+        columnar: bool = False,
+        call_cache: Optional["DiskCallCache"] = None,
+        coalesce: bool = False,
+        process_pool: Optional["ServiceProcessPool"] = None,
+        compiled: bool = False,
+        validation: Union[ValidationLevel, str] = ValidationLevel.FULL,
+    ) -> None:
+        """Initialise l'interpréteur avec tous ses composants.
+
+        :param columnar: Utiliser l'AST colonnaire et ses chemins rapides,
+            adaptés aux appels contenant de très grands tableaux (les appels
+            imbriqués utilisent toujours l'AST objet).
+        :type columnar: bool
+        :param call_cache: Cache persistant des appels analysés ; permet de
+            sauter les phases 1 à 3 pour un code source déjà validé, y compris
+            après un redémarrage.
+        :type call_cache: Optional[DiskCallCache]
+        :param coalesce: Fusionner les appels identiques simultanés : un appel
+            identique à un appel en cours attend et partage son résultat.
+        :type coalesce: bool
+        :param process_pool: Pool de processus des services déclarés
+            ``@service(executor="process")`` ; un pool d'un processus par
+            processeur est créé au premier appel si absent.
+        :type process_pool: Optional[ServiceProcessPool]
+        :param compiled: Compiler les appels en programmes de la machine
+            virtuelle (:class:`Compiler`, :class:`VirtualMachine`), conservés
+            par code source : :meth:`interpret` saute alors les phases 1 à 3
+            et le parcours de l'AST pour un code source déjà compilé.
+        :type compiled: bool
+        :param validation: Niveau de validation des arguments par défaut :
+            ``"full"`` (trafic public), ``"shallow"`` (types de premier niveau
+            et échantillon des tableaux) ou ``"trusted"`` (nombre d'arguments
+            seulement, pour le trafic de services de confiance) ; voir
+            :class:`ValidationLevel`.
+        :type validation: Union[ValidationLevel, str]
+        :raises ValueError: Si le niveau de validation est inconnu.
+        """
+        self._columnar = columnar
+        self._validation = ValidationLevel(validation)
+        self._call_cache = call_cache
         self._symbol_table = SymbolTable()
         self._lexer = LexicalAnalyzer()
-        self._parser = SyntaxAnalyzer()
+        self._parser = SyntaxAnalyzer(self._symbol_table, compact_arguments=True)
+        self._eliminator = CommonSubexpressionEliminator(self._symbol_table)
         self._semantic_analyzer = SemanticAnalyzer(self._symbol_table)
-        self._executor = Executor(self._symbol_table)
+        self._executor = Executor(self._symbol_table, coalesce=coalesce, process_pool=process_pool)
+        self._compiler: Optional["Compiler"] = None
+        self._programs = ResultCache(self.PROGRAM_CACHE_SIZE) if compiled else None
+        self._generator: Optional["CodeGenerator"] = None
+        self._prepared = ResultCache(self.PROGRAM_CACHE_SIZE)
 
-    def interpret(self, source: str) -> Any:
+    def interpret(
+        self, source: str, validation: Optional[Union[ValidationLevel, str]] = None
+    ) -> Any:
         """Interprète une chaîne de code source et retourne le résultat.
 
         Pipeline complet :
         1. Analyse lexicale (source → tokens)
-        2. Analyse syntaxique (tokens → AST)
-        3. Analyse sémantique (validation AST)
-        4. Exécution (AST → résultat)
+        2. Analyse syntaxique (tokens → AST), puis fusion des appels imbriqués
+           identiques aux services purs (:class:`CommonSubexpressionEliminator`)
+        3. Analyse sémantique (validation AST → appel lié)
+        4. Exécution (appel lié → résultat)
+
+        Si un cache d'appels est configuré et contient la source avec une
+        signature de service inchangée, les phases 1 à 3 sont sautées. En mode
+        ``compiled``, l'appel est compilé une fois par code source puis exécuté
+        par la machine virtuelle (voir :meth:`Executor.execute_program`) ; les
+        appels imbriqués y sont exécutés l'un après l'autre.
+
+        Un appel validé à un niveau autre que ``"full"`` n'est pas enregistré
+        dans le cache d'appels, et ses programmes compilés ne servent qu'aux
+        appels de même niveau.
 
         :param source: Code source à interpréter.
         :type source: str
+        :param validation: Niveau de validation des arguments de cet appel
+            (par défaut, celui de l'interpréteur).
+        :type validation: Optional[Union[ValidationLevel, str]]
         :return: Résultat de l'exécution du service.
         :rtype: Any
         :raises BaobabLexicalAnalyserException: Si erreur lexicale.
@@ -60,17 +161,449 @@ class Interpreter:
             >>> result
             30
         """
-        # Phase 1 : Analyse lexicale
-        tokens = self._lexer.analyze(source)
-
-        # Phase 2 : Analyse syntaxique
-        ast = self._parser.parse(tokens)
+        level = self._level(validation)
+        if self._programs is not None:
+            return self._executor.execute_program(self._program(self._programs, source, level))
 
-        # Phase 3 : Analyse sémantique
-        self._semantic_analyzer.analyze(ast)
+        # Phases 1 à 3 : analyses lexicale, syntaxique et sémantique
+        bound = self._bind(source, level)
 
         # Phase 4 : Exécution
-        return self._executor.execute(ast)
+        return self._executor.execute_bound(bound, source)
+
+    async def interpret_async(
+        self, source: str, validation: Optional[Union[ValidationLevel, str]] = None
+    ) -> Any:
+        """Interprète une chaîne de code source depuis une coroutine.
+
+        Les phases d'analyse sont identiques à :meth:`interpret` ; l'exécution
+        du service ne bloque pas la boucle d'événements (voir
+        :meth:`Executor.execute_bound_async`).
+
+        :param source: Code source à interpréter.
+        :type source: str
+        :param validation: Niveau de validation des arguments de cet appel
+            (par défaut, celui de l'interpréteur).
+        :type validation: Optional[Union[ValidationLevel, str]]
+        :return: Résultat de l'exécution du service.
+        :rtype: Any
+        :raises BaobabLexicalAnalyserException: Si erreur lexicale.
+        :raises BaobabSyntaxAnalyserException: Si erreur syntaxique.
+        :raises BaobabSemanticAnalyserException: Si erreur sémantique.
+        :raises BaobabExecutionException: Si erreur d'exécution.
+
+        :Example:
+            >>> # result = await interpreter.interpret_async("add(10, 20)")
+        """
+        bound = self._bind(source, self._level(validation))
+        return await self._executor.execute_bound_async(bound, source)
+
+    def interpret_stream(
+        self,
+        source: str,
+        chunk_size: Optional[int] = None,
+        validation: Optional[Union[ValidationLevel, str]] = None,
+    ) -> Generator[Any, None, None]:
+        """Interprète un appel et diffuse les éléments de son résultat.
+
+        Le service est appelé immédiatement ; s'il retourne un itérateur, un
+        générateur ou un générateur asynchrone, ses éléments sont produits au
+        fur et à mesure de l'itération, sans matérialiser le résultat complet
+        (voir :class:`ResultStream`). Une liste est diffusée élément par
+        élément, toute autre valeur comme un élément unique.
+
+        Fermer le générateur retourné (``close``, ou sortie anticipée d'une
+        boucle ``for``) ferme le générateur du service.
+
+        :param source: Code source à interpréter.
+        :type source: str
+        :param chunk_size: Nombre d'éléments par lot, ou None pour diffuser les
+            éléments un à un.
+        :type chunk_size: Optional[int]
+        :param validation: Niveau de validation des arguments de cet appel
+            (par défaut, celui de l'interpréteur).
+        :type validation: Optional[Union[ValidationLevel, str]]
+        :return: Éléments du résultat, ou lots d'éléments avec ``chunk_size``.
+        :rtype: Generator[Any, None, None]
+        :raises ValueError: Si ``chunk_size`` est inférieur à 1.
+        :raises BaobabLexicalAnalyserException: Si erreur lexicale.
+        :raises BaobabSyntaxAnalyserException: Si erreur syntaxique.
+        :raises BaobabSemanticAnalyserException: Si erreur sémantique.
+        :raises BaobabExecutionException: Si erreur d'exécution, y compris
+            pendant l'itération.
+
+        :Example:
+            >>> for rows in interpreter.interpret_stream("export(1000000)", chunk_size=500):
+            ...     write(rows)
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from baobab_geek_interpreter.execution.result_stream import ResultStream
+
+        ResultStream.validate(chunk_size)
+        bound = self._bind(source, self._level(validation))
+        result = self._executor.execute_bound(bound, source)
+        return iter(ResultStream(result, bound.service_name, chunk_size))
+
+    async def interpret_stream_async(
+        self,
+        source: str,
+        chunk_size: Optional[int] = None,
+        buffer: int = 1,
+        validation: Optional[Union[ValidationLevel, str]] = None,
+    ) -> AsyncGenerator[Any, None]:
+        """Interprète un appel depuis une coroutine et diffuse son résultat.
+
+        Équivalent asynchrone de :meth:`interpret_stream`, avec
+        contre-pression : la source est lue d'au plus ``buffer`` lots en
+        avance sur le consommateur, et un consommateur lent suspend sa
+        lecture. Un générateur synchrone est lu dans un thread, un générateur
+        asynchrone directement sur la boucle d'événements.
+
+        :param source: Code source à interpréter.
+        :type source: str
+        :param chunk_size: Nombre d'éléments par lot, ou None.
+        :type chunk_size: Optional[int]
+        :param buffer: Nombre de lots lus d'avance.
+        :type buffer: int
+        :param validation: Niveau de validation des arguments de cet appel
+            (par défaut, celui de l'interpréteur).
+        :type validation: Optional[Union[ValidationLevel, str]]
+        :return: Éléments du résultat, ou lots d'éléments avec ``chunk_size``.
+        :rtype: AsyncGenerator[Any, None]
+        :raises ValueError: Si ``chunk_size`` ou ``buffer`` est inférieur à 1.
+        :raises BaobabLexicalAnalyserException: Si erreur lexicale.
+        :raises BaobabSyntaxAnalyserException: Si erreur syntaxique.
+        :raises BaobabSemanticAnalyserException: Si erreur sémantique.
+        :raises BaobabExecutionException: Si erreur d'exécution, y compris
+            pendant l'itération.
+
+        :Example:
+            >>> # async for row in interpreter.interpret_stream_async("export(1000000)"):
+            >>> #     await send(row)
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from baobab_geek_interpreter.execution.result_stream import ResultStream
+
+        ResultStream.validate(chunk_size, buffer)
+        bound = self._bind(source, self._level(validation))
+        result = await self._executor.execute_bound_async(bound, source)
+        stream = ResultStream(result, bound.service_name, chunk_size, buffer)
+        items = stream.__aiter__()  # pylint: disable=unnecessary-dunder-call
+        try:
+            async for item in items:
+                yield item
+        finally:
+            await items.aclose()
+
+    def prepare(self, source: str) -> Callable[..., Any]:
+        """Prépare un appel en une fonction Python spécialisée.
+
+        L'appel est validé puis compilé une fois (voir :class:`Compiler`),
+        puis traduit en une fonction Python générée (voir
+        :class:`CodeGenerator`) : son exécution se réduit à un seul cadre
+        Python en plus des appels de services. Si tous les arguments de
+        l'appel racine sont des constantes, la fonction accepte des arguments
+        de remplacement, nommés comme les paramètres du service, vérifiés par
+        des validations en ligne ; sans argument, les constantes du code
+        source sont utilisées.
+
+        Les fonctions générées sont conservées par code source. Une fonction
+        dont un service a été ré-enregistré est régénérée, y compris lors d'un
+        appel à une fonction déjà retournée. Comme en mode ``compiled``, les
+        appels imbriqués sont exécutés l'un après l'autre.
+
+        :param source: Code source de l'appel.
+        :type source: str
+        :return: Fonction exécutant l'appel.
+        :rtype: Callable[..., Any]
+        :raises BaobabLexicalAnalyserException: Si erreur lexicale.
+        :raises BaobabSyntaxAnalyserException: Si erreur syntaxique.
+        :raises BaobabSemanticAnalyserException: Si erreur sémantique.
+
+        :Example:
+            >>> add = interpreter.prepare("add(10, 20)")
+            >>> add()
+            30
+            >>> add(1, b=2)
+            3
+        """
+        found, cached = self._prepared.get(source)
+        with self._symbol_table.pinned():
+            if found and cached[0].is_current(self._symbol_table):
+                return cast(Callable[..., Any], cached[1])
+            program = self._compile(source)
+        if self._generator is None:
+            # pylint: disable-next=import-outside-toplevel
+            from baobab_geek_interpreter.vm.code_generator import CodeGenerator
+
+            self._generator = CodeGenerator(self._symbol_table)
+        prepared = self._generator.generate(
+            program, self._executor.link(program), partial(self._run_prepared, source)
+        )
+        self._prepared.put(source, (program, prepared))
+        return prepared
+
+    def _run_prepared(self, source: str, *args: Any) -> Any:
+        """Exécute un appel préparé après régénération de sa fonction.
+
+        :param source: Code source de l'appel.
+        :type source: str
+        :param args: Arguments positionnels de l'appel.
+        :type args: Any
+        :return: Résultat de l'exécution du service.
+        :rtype: Any
+        """
+        return self.prepare(source)(*args)
+
+    def interpret_script(
+        self,
+        source: str,
+        concurrent: bool = False,
+        validation: Optional[Union[ValidationLevel, str]] = None,
+    ) -> List[Any]:
+        """Interprète un script de plusieurs appels et retourne leurs résultats.
+
+        Les appels sont séparés par des points-virgules ou des fins de ligne.
+        Le script est analysé en une seule passe lexicale, et tous ses appels
+        sont validés avant l'exécution du premier. Les appels sont
+        indépendants : avec ``concurrent=True``, ils sont exécutés
+        simultanément (voir :meth:`Executor.execute_script`).
+
+        Le cache d'appels n'est pas utilisé pour les scripts, et l'AST
+        colonnaire non plus.
+
+        :param source: Code source du script.
+        :type source: str
+        :param concurrent: Exécuter les appels simultanément.
+        :type concurrent: bool
+        :param validation: Niveau de validation des arguments des appels
+            (par défaut, celui de l'interpréteur).
+        :type validation: Optional[Union[ValidationLevel, str]]
+        :return: Résultats des appels, dans l'ordre du script.
+        :rtype: List[Any]
+        :raises BaobabLexicalAnalyserException: Si erreur lexicale.
+        :raises BaobabSyntaxAnalyserException: Si erreur syntaxique.
+        :raises BaobabSemanticAnalyserException: Si erreur sémantique.
+        :raises BaobabExecutionException: Si erreur d'exécution.
+
+        :Example:
+            >>> interpreter.interpret_script("add(1, 2); add(3, 4)")
+            [3, 7]
+        """
+        bounds = self._bind_script(source, self._level(validation))
+        return self._executor.execute_script(bounds, source, concurrent)
+
+    async def interpret_script_async(
+        self,
+        source: str,
+        concurrent: bool = False,
+        validation: Optional[Union[ValidationLevel, str]] = None,
+    ) -> List[Any]:
+        """Interprète un script de plusieurs appels depuis une coroutine.
+
+        Équivalent asynchrone de :meth:`interpret_script` ; avec
+        ``concurrent=True``, les appels sont attendus simultanément.
+
+        :param source: Code source du script.
+        :type source: str
+        :param concurrent: Attendre les appels simultanément.
+        :type concurrent: bool
+        :param validation: Niveau de validation des arguments des appels
+            (par défaut, celui de l'interpréteur).
+        :type validation: Optional[Union[ValidationLevel, str]]
+        :return: Résultats des appels, dans l'ordre du script.
+        :rtype: List[Any]
+        :raises BaobabLexicalAnalyserException: Si erreur lexicale.
+        :raises BaobabSyntaxAnalyserException: Si erreur syntaxique.
+        :raises BaobabSemanticAnalyserException: Si erreur sémantique.
+        :raises BaobabExecutionException: Si erreur d'exécution.
+        """
+        bounds = self._bind_script(source, self._level(validation))
+        return await self._executor.execute_script_async(bounds, source, concurrent)
+
+    def _bind_script(self, source: str, validation: ValidationLevel) -> List[BoundCall]:
+        """Analyse un script et retourne les appels liés de ses appels.
+
+        :param source: Code source du script.
+        :type source: str
+        :param validation: Niveau de validation des arguments.
+        :type validation: ValidationLevel
+        :return: Appels liés validés, dans l'ordre du script.
+        :rtype: List[BoundCall]
+        """
+        bounds = []
+        with self._symbol_table.pinned():
+            for ast in self._parser.parse_script(self._lexer.analyze(source)):
+                self._eliminator.eliminate(ast)
+                bounds.append(self._semantic_analyzer.analyze(ast, validation))
+        return bounds
+
+    def _bind(self, source: str, validation: ValidationLevel) -> BoundCall:
+        """Analyse un code source et retourne l'appel lié (phases 1 à 3).
+
+        Consulte puis alimente le cache d'appels s'il est configuré ; seul un
+        appel validé complètement y est enregistré. Toutes les phases lisent
+        le même instantané de la table des symboles (voir
+        :meth:`SymbolTable.pinned`) ; l'exécution n'utilise ensuite que les
+        fonctions liées.
+
+        :param source: Code source à analyser.
+        :type source: str
+        :param validation: Niveau de validation des arguments.
+        :type validation: ValidationLevel
+        :return: Appel lié validé.
+        :rtype: BoundCall
+        """
+        with self._symbol_table.pinned():
+            if self._call_cache is not None:
+                cached = self._call_cache.load(source, self._symbol_table)
+                if cached is not None:
+                    return cached
+
+            # Phase 1 : Analyse lexicale
+            tokens = self._lexer.analyze(source)
+
+            # Phases 2 et 3 : Analyse syntaxique puis sémantique
+            if self._columnar and not self._has_nested_calls(tokens):
+                bound = self._semantic_analyzer.analyze_columnar(
+                    self._parser.parse_columnar(tokens), validation
+                )
+            else:
+                ast = self._parser.parse(tokens)
+                self._eliminator.eliminate(ast)
+                bound = self._semantic_analyzer.analyze(ast, validation)
+            if self._call_cache is not None and validation is ValidationLevel.FULL:
+                self._call_cache.store(source, bound, self._symbol_table)
+        return bound
+
+    def _program(
+        self, programs: ResultCache, source: str, validation: ValidationLevel
+    ) -> "Program":
+        """Retourne le programme compilé d'un code source, compilé à la demande.
+
+        Un programme dont un service a été ré-enregistré depuis sa compilation
+        est recompilé.
+
+        :param programs: Programmes compilés, indexés par code source.
+        :type programs: ResultCache
+        :param source: Code source à compiler.
+        :type source: str
+        :param validation: Niveau de validation des arguments ; un programme
+            validé à un autre niveau que complet est conservé à part.
+        :type validation: ValidationLevel
+        :return: Programme validé.
+        :rtype: Program
+        """
+        key = source if validation is ValidationLevel.FULL else (validation, source)
+        with self._symbol_table.pinned():
+            found, cached = programs.get(key)
+            if found and cached.is_current(self._symbol_table):
+                return cast("Program", cached)
+            program = self._compile(source, validation)
+        programs.put(key, program)
+        return program
+
+    def _compile(
+        self, source: str, validation: ValidationLevel = ValidationLevel.FULL
+    ) -> "Program":
+        """Analyse, valide et compile un code source.
+
+        :param source: Code source à compiler.
+        :type source: str
+        :param validation: Niveau de validation des arguments.
+        :type validation: ValidationLevel
+        :return: Programme validé.
+        :rtype: Program
+        """
+        ast = self._parser.parse(self._lexer.analyze(source))
+        self._eliminator.eliminate(ast)
+        self._semantic_analyzer.analyze(ast, validation)
+        if self._compiler is None:
+            # pylint: disable-next=import-outside-toplevel
+            from baobab_geek_interpreter.vm.compiler import Compiler
+
+            self._compiler = Compiler(self._symbol_table)
+        return self._compiler.compile(ast)
+
+    def _level(self, validation: Optional[Union[ValidationLevel, str]]) -> ValidationLevel:
+        """Retourne le niveau de validation d'un appel.
+
+        :param validation: Niveau demandé pour l'appel, ou None.
+        :type validation: Optional[Union[ValidationLevel, str]]
+        :return: Niveau demandé, ou celui de l'interpréteur.
+        :rtype: ValidationLevel
+        :raises ValueError: Si le niveau de validation est inconnu.
+        """
+        return self._validation if validation is None else ValidationLevel(validation)
+
+    @staticmethod
+    def _has_nested_calls(tokens: List[Token]) -> bool:
+        """Indique si un code source contient des appels imbriqués.
+
+        :param tokens: Tokens du code source.
+        :type tokens: List[Token]
+        :return: True si un identifiant suit l'identifiant du service racine.
+        :rtype: bool
+        """
+        return any(token.type == TokenType.IDENTIFIANT for token in islice(tokens, 1, None))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Retourne les statistiques des caches de l'interpréteur.
+
+        :return: Statistiques des caches de résultats des services purs
+            (``"results"``, par service) et, si configurés, du cache d'appels
+            (``"call_cache"``), de la fusion des appels (``"coalescing"``) et
+            des services de lot (``"batches"``, par service), du pool de
+            processus (``"processes"``) et de la fusion des appels imbriqués
+            identiques (``"cse"`` : appels imbriqués examinés et évaluations
+            économisées), des programmes compilés (``"programs"``), des
+            fonctions générées par :meth:`prepare` (``"prepared"``) et des
+            formes de types d'arguments validées (``"type_checks"``, par
+            service, avec le taux de succès ``hit_rate``) et de la découverte
+            des services (``"discovery"`` : modules, services et durée).
+        :rtype: Dict[str, Any]
+
+        :Example:
+            >>> interpreter = Interpreter()
+            >>> interpreter.get_stats()
+            {'results': {}}
+        """
+        stats: Dict[str, Any] = {"results": self._executor.get_stats()}
+        coalescing = self._executor.get_coalescing_stats()
+        if coalescing:
+            stats["coalescing"] = coalescing
+        batches = self._executor.get_batch_stats()
+        if batches:
+            stats["batches"] = batches
+        processes = self._executor.get_process_stats()
+        if processes:
+            stats["processes"] = processes
+        if self._eliminator.calls:
+            stats["cse"] = self._eliminator.stats()
+        if self._programs is not None:
+            stats["programs"] = self._programs.stats()
+        if self._prepared.misses:
+            stats["prepared"] = self._prepared.stats()
+        type_checks = self._semantic_analyzer.get_type_cache_stats()
+        if type_checks:
+            stats["type_checks"] = type_checks
+        discovery = self._symbol_table.discovery_stats()
+        if discovery["modules"]:
+            stats["discovery"] = discovery
+        if self._call_cache is not None:
+            stats["call_cache"] = {
+                "hits": self._call_cache.hits,
+                "misses": self._call_cache.misses,
+                "invalidations": self._call_cache.invalidations,
+            }
+        return stats
+
+    def close(self) -> None:
+        """Libère les ressources de l'exécution (voir :meth:`Executor.close`).
+
+        Le pool de processus fourni au constructeur n'est pas fermé.
+        """
+        self._executor.close()
 
     def register_service(self, name: str, func: Any) -> None:
         """Enregistre un service dans la table des symboles.
@@ -88,20 +621,116 @@ class Interpreter:
         """
         self._symbol_table.register(name, func)
 
-    def register_services(self, module: Any) -> None:
+    def register_lazy(
+        self, name: str, path: str, signature: Optional[inspect.Signature] = None
+    ) -> None:
+        """Enregistre un service par son chemin d'import, sans importer son module.
+
+        Le module est importé à la première interprétation appelant le
+        service (voir :class:`LazyService`) ; :meth:`has_service` et
+        :meth:`list_services` ne l'importent pas.
+
+        :param name: Nom du service.
+        :type name: str
+        :param path: Chemin d'import de la fonction (``"paquet.module:fonction"``).
+        :type path: str
+        :param signature: Signature du service, si connue sans import.
+        :type signature: Optional[inspect.Signature]
+        :raises ValueError: Si le chemin n'a pas la forme ``"module:attribut"``.
+
+        :Example:
+            >>> interpreter = Interpreter()
+            >>> interpreter.register_lazy("predict", "models.forest:predict")
+            >>> interpreter.has_service("predict")
+            True
+        """
+        self._symbol_table.register_lazy(name, path, signature)
+
+    def register_lazy_services(self, services: Mapping[str, str]) -> None:
+        """Enregistre plusieurs services par leur chemin d'import.
+
+        :param services: Chemin d'import de chaque service, par nom.
+        :type services: Mapping[str, str]
+        :raises ValueError: Si un chemin n'a pas la forme ``"module:attribut"``.
+
+        :Example:
+            >>> interpreter = Interpreter()
+            >>> interpreter.register_lazy_services(
+            ...     {"predict": "models.forest:predict", "save": "storage.db:save"}
+            ... )
+        """
+        self._symbol_table.register_lazy_services(services)
+
+    def load_manifest(self, manifest: Union["ServiceManifest", str, "Path"]) -> int:
+        """Enregistre les services d'un manifeste précalculé, sans import ni introspection.
+
+        Voir :class:`ServiceManifest` : chaque module de service est importé
+        à la première interprétation appelant l'un de ses services, et la
+        signature précalculée y est validée.
+
+        :param manifest: Manifeste, ou chemin d'un manifeste enregistré.
+        :type manifest: Union[ServiceManifest, str, Path]
+        :return: Nombre de services enregistrés.
+        :rtype: int
+        :raises ValueError: Si le fichier n'est pas un manifeste valide.
+
+        :Example:
+            >>> interpreter = Interpreter()
+            >>> interpreter.load_manifest("services.json")
+            500
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from baobab_geek_interpreter.semantic.service_manifest import ServiceManifest
+
+        if not isinstance(manifest, ServiceManifest):
+            manifest = ServiceManifest.load(manifest)
+        return self._symbol_table.load_manifest(manifest)
+
+    def register_services(self, module: Any) -> int:
         """Découvre et enregistre automatiquement tous les services d'un module.
 
         Les services sont identifiés par le décorateur @service.
 
         :param module: Module Python contenant des services décorés.
         :type module: Any
+        :return: Nombre de services enregistrés.
+        :rtype: int
 
         :Example:
             >>> import my_services
             >>> interpreter = Interpreter()
             >>> interpreter.register_services(my_services)
+            3
+        """
+        return self._symbol_table.discover_services(module)
+
+    def register_package(
+        self,
+        package: Union[ModuleType, str],
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, float]:
+        """Découvre et enregistre les services d'un paquet et de tous ses sous-modules.
+
+        Voir :meth:`SymbolTable.discover_package`.
+
+        :param package: Paquet à analyser, ou son nom.
+        :type package: Union[ModuleType, str]
+        :param parallel: True pour importer les sous-modules en parallèle.
+        :type parallel: bool
+        :param max_workers: Nombre maximal de threads d'import.
+        :type max_workers: Optional[int]
+        :return: Nombre de modules analysés (``modules``), de services
+            enregistrés (``services``) et durée de la découverte en secondes
+            (``seconds``).
+        :rtype: Dict[str, float]
+
+        :Example:
+            >>> interpreter = Interpreter()
+            >>> interpreter.register_package("my_services", parallel=True)
+            {'modules': 120, 'services': 640, 'seconds': 0.41}
         """
-        self._symbol_table.discover_services(module)
+        return self._symbol_table.discover_package(package, parallel, max_workers)
 
     def list_services(self) -> list[str]:
         """Liste tous les services enregistrés.
@@ -146,3 +775,23 @@ class Interpreter:
             []
         """
         self._symbol_table.clear()
+
+    def update_services(self) -> ContextManager[SymbolTable]:
+        """Regroupe des modifications de services en une seule publication atomique.
+
+        Les services enregistrés ou supprimés dans le bloc deviennent visibles
+        ensemble à sa sortie (voir :meth:`SymbolTable.transaction`) : une
+        interprétation en cours dans un autre thread voit les anciens services
+        ou les nouveaux, jamais un mélange. Aucun service n'est modifié si
+        une exception sort du bloc.
+
+        :return: Gestionnaire de contexte de la transaction.
+        :rtype: ContextManager[SymbolTable]
+
+        :Example:
+            >>> with interpreter.update_services():
+            ...     interpreter.clear_services()
+            ...     interpreter.register_services(importlib.reload(my_services))
+            3
+        """
+        return self._symbol_table.transaction()
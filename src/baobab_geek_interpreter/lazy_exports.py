@@ -0,0 +1,63 @@
+"""Module contenant les exports paresseux des paquets (PEP 562)."""
+
+# Annotations non évaluées : l'import d'un paquet n'importe pas typing.
+from __future__ import annotations
+
+import sys
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable, List, Mapping, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Construit les fonctions ``__getattr__`` et ``__dir__`` d'un paquet à exports paresseux.
+
+    Importer un paquet n'importe alors aucun de ses modules : le module
+    définissant un nom exporté n'est importé qu'au premier accès à ce nom
+    (``paquet.Nom`` ou ``from paquet import Nom``), puis la valeur est
+    conservée dans le paquet et les accès suivants ne passent plus par
+    ``__getattr__``.
+
+    :param package: Nom du paquet (``__name__``).
+    :type package: str
+    :param exports: Module définissant chaque nom exporté, par nom.
+    :type exports: Mapping[str, str]
+    :return: Fonctions ``__getattr__`` et ``__dir__`` du paquet.
+    :rtype: Tuple[Callable[[str], Any], Callable[[], List[str]]]
+
+    :Example:
+        >>> # Dans paquet/__init__.py :
+        >>> __getattr__, __dir__ = lazy_exports(
+        ...     __name__, {"Interpreter": "baobab_geek_interpreter.interpreter"}
+        ... )
+    """
+
+    def __getattr__(name: str) -> Any:
+        """Importe le module définissant un nom exporté et retourne sa valeur.
+
+        :param name: Nom demandé.
+        :type name: str
+        :return: Valeur exportée.
+        :rtype: Any
+        :raises AttributeError: Si le nom n'est pas exporté par le paquet.
+        """
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+        __import__(module)  # sans importlib, non chargé au démarrage
+        value = getattr(sys.modules[module], name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        """Liste les attributs du paquet, noms exportés compris.
+
+        :return: Noms triés.
+        :rtype: List[str]
+        """
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,7 +1,21 @@
 """Module pour l'analyse lexicale."""
 
-from baobab_geek_interpreter.lexical.lexical_analyzer import LexicalAnalyzer
-from baobab_geek_interpreter.lexical.token import Token
-from baobab_geek_interpreter.lexical.token_type import TokenType
+from baobab_geek_interpreter.lazy_exports import lazy_exports
+
+TYPE_CHECKING = False  # typing.TYPE_CHECKING, sans importer typing au démarrage
+if TYPE_CHECKING:
+    from baobab_geek_interpreter.lexical.lexical_analyzer import LexicalAnalyzer
+    from baobab_geek_interpreter.lexical.token import Token
+    from baobab_geek_interpreter.lexical.token_type import TokenType
 
 __all__ = ["LexicalAnalyzer", "Token", "TokenType"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "LexicalAnalyzer": "baobab_geek_interpreter.lexical.lexical_analyzer",
+        # Chemin de module, et non mot de passe (bandit B105).
+        "Token": "baobab_geek_interpreter.lexical.token",  # nosec B105
+        "TokenType": "baobab_geek_interpreter.lexical.token_type",
+    },
+)
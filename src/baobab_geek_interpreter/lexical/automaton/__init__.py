@@ -13,19 +13,23 @@ des automates finis déterministes (AFD) utilisés dans l'analyse lexicale.
     >>> automaton.set_final_state(digit)
 """
 
-from baobab_geek_interpreter.lexical.automaton.automaton import Automaton
-from baobab_geek_interpreter.lexical.automaton.state import State
-from baobab_geek_interpreter.lexical.automaton.transition import (
-    Transition,
-    is_alpha_numeric,
-    is_alpha_numeric_or_underscore,
-    is_digit,
-    is_in_set,
-    is_letter,
-    is_letter_or_underscore,
-    is_specific,
-    is_underscore,
-)
+from baobab_geek_interpreter.lazy_exports import lazy_exports
+
+TYPE_CHECKING = False  # typing.TYPE_CHECKING, sans importer typing au démarrage
+if TYPE_CHECKING:
+    from baobab_geek_interpreter.lexical.automaton.automaton import Automaton
+    from baobab_geek_interpreter.lexical.automaton.state import State
+    from baobab_geek_interpreter.lexical.automaton.transition import (
+        Transition,
+        is_alpha_numeric,
+        is_alpha_numeric_or_underscore,
+        is_digit,
+        is_in_set,
+        is_letter,
+        is_letter_or_underscore,
+        is_specific,
+        is_underscore,
+    )
 
 __all__ = [
     "Automaton",
@@ -40,3 +44,20 @@ __all__ = [
     "is_specific",
     "is_underscore",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "Automaton": "baobab_geek_interpreter.lexical.automaton.automaton",
+        "State": "baobab_geek_interpreter.lexical.automaton.state",
+        "Transition": "baobab_geek_interpreter.lexical.automaton.transition",
+        "is_alpha_numeric": "baobab_geek_interpreter.lexical.automaton.transition",
+        "is_alpha_numeric_or_underscore": "baobab_geek_interpreter.lexical.automaton.transition",
+        "is_digit": "baobab_geek_interpreter.lexical.automaton.transition",
+        "is_in_set": "baobab_geek_interpreter.lexical.automaton.transition",
+        "is_letter": "baobab_geek_interpreter.lexical.automaton.transition",
+        "is_letter_or_underscore": "baobab_geek_interpreter.lexical.automaton.transition",
+        "is_specific": "baobab_geek_interpreter.lexical.automaton.transition",
+        "is_underscore": "baobab_geek_interpreter.lexical.automaton.transition",
+    },
+)
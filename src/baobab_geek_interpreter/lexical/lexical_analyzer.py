@@ -1,5 +1,6 @@
 """Module contenant l'analyseur lexical pour le langage geek."""
 
+import sys
 from typing import List, Optional
 
 from baobab_geek_interpreter.exceptions.lexical_exception import (
@@ -50,7 +51,7 @@ class LexicalAnalyzer:
             >>> tokens[0].type
             <TokenType.INT: 1>
             >>> tokens[1].type
-            <TokenType.EOF: 10>
+            <TokenType.EOF: 12>
         """
         self._source = source
         self._position = 0
@@ -156,6 +157,12 @@ class LexicalAnalyzer:
         if char == ",":
             self._advance()
             return Token(TokenType.COMMA, ",", start_pos, start_line, start_column)
+        if char == ";":
+            self._advance()
+            return Token(TokenType.SEMICOLON, ";", start_pos, start_line, start_column)
+        if char == "|":
+            self._advance()
+            return Token(TokenType.PIPE, "|", start_pos, start_line, start_column)
 
         # Chaîne de caractères
         if char == '"':
@@ -286,6 +293,10 @@ class LexicalAnalyzer:
 
         Format : [a-zA-Z_][a-zA-Z0-9_]*
 
+        La valeur est internée (``sys.intern``) afin que les recherches dans la
+        table des symboles comparent des chaînes identiques dont le hash est déjà
+        calculé.
+
         :param start_pos: Position de départ du token.
         :type start_pos: int
         :param start_line: Ligne de départ du token.
@@ -312,4 +323,4 @@ class LexicalAnalyzer:
             else:
                 break
 
-        return Token(TokenType.IDENTIFIANT, value, start_pos, start_line, start_column)
+        return Token(TokenType.IDENTIFIANT, sys.intern(value), start_pos, start_line, start_column)
@@ -45,6 +45,12 @@ class TokenType(Enum):
     COMMA = auto()
     """Token représentant une virgule ','."""
 
+    SEMICOLON = auto()
+    """Token représentant un point-virgule ';' (séparateur d'appels d'un script)."""
+
+    PIPE = auto()
+    """Token représentant une barre verticale '|' (opérateur de pipeline)."""
+
     # Spécial
     EOF = auto()
     """Token représentant la fin du fichier."""
@@ -1,7 +1,49 @@
 """Module pour l'analyse sémantique."""
 
-from baobab_geek_interpreter.semantic.semantic_analyzer import SemanticAnalyzer
-from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
-from baobab_geek_interpreter.semantic.type_checker import TypeChecker
+from baobab_geek_interpreter.lazy_exports import lazy_exports
 
-__all__ = ["SymbolTable", "TypeChecker", "SemanticAnalyzer"]
+TYPE_CHECKING = False  # typing.TYPE_CHECKING, sans importer typing au démarrage
+if TYPE_CHECKING:
+    from baobab_geek_interpreter.semantic.bound_call import BoundCall
+    from baobab_geek_interpreter.semantic.common_subexpression_eliminator import (
+        CommonSubexpressionEliminator,
+    )
+    from baobab_geek_interpreter.semantic.lazy_service import LazyService
+    from baobab_geek_interpreter.semantic.semantic_analyzer import SemanticAnalyzer
+    from baobab_geek_interpreter.semantic.service_manifest import ServiceManifest
+    from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+    from baobab_geek_interpreter.semantic.symbol_table_snapshot import SymbolTableSnapshot
+    from baobab_geek_interpreter.semantic.type_checker import TypeChecker
+    from baobab_geek_interpreter.semantic.type_shape_cache import TypeShapeCache
+    from baobab_geek_interpreter.semantic.validation_level import ValidationLevel
+
+__all__ = [
+    "SymbolTable",
+    "TypeChecker",
+    "SemanticAnalyzer",
+    "BoundCall",
+    "CommonSubexpressionEliminator",
+    "TypeShapeCache",
+    "ValidationLevel",
+    "LazyService",
+    "ServiceManifest",
+    "SymbolTableSnapshot",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BoundCall": "baobab_geek_interpreter.semantic.bound_call",
+        "CommonSubexpressionEliminator": (
+            "baobab_geek_interpreter.semantic.common_subexpression_eliminator"
+        ),
+        "LazyService": "baobab_geek_interpreter.semantic.lazy_service",
+        "SemanticAnalyzer": "baobab_geek_interpreter.semantic.semantic_analyzer",
+        "ServiceManifest": "baobab_geek_interpreter.semantic.service_manifest",
+        "SymbolTable": "baobab_geek_interpreter.semantic.symbol_table",
+        "SymbolTableSnapshot": "baobab_geek_interpreter.semantic.symbol_table_snapshot",
+        "TypeChecker": "baobab_geek_interpreter.semantic.type_checker",
+        "TypeShapeCache": "baobab_geek_interpreter.semantic.type_shape_cache",
+        "ValidationLevel": "baobab_geek_interpreter.semantic.validation_level",
+    },
+)
@@ -0,0 +1,97 @@
+"""Module contenant la classe BoundCall, appel de service résolu et validé."""
+
+from typing import Any, Callable, Optional, Tuple
+
+
+class BoundCall:
+    """Appel de service résolu et validé par l'analyse sémantique.
+
+    Regroupe la fonction du service résolue une seule fois, le tuple des
+    arguments déjà matérialisés et validés, ainsi que les métadonnées de
+    résolution. L'exécuteur consomme directement cet objet : aucune nouvelle
+    recherche dans la table des symboles ni réévaluation de l'AST n'est
+    nécessaire, et le service exécuté est exactement celui qui a été validé.
+
+    Un argument issu d'un appel de service imbriqué est lui-même un
+    :class:`BoundCall`, évalué par l'exécuteur avant l'appel parent. Un même
+    appel imbriqué peut être partagé par plusieurs appels parents ; il est
+    alors évalué une seule fois.
+
+    :param service_name: Nom du service appelé.
+    :type service_name: str
+    :param func: Fonction du service résolue.
+    :type func: Callable[..., Any]
+    :param arguments: Valeurs des arguments validées.
+    :type arguments: Tuple[Any, ...]
+    :param slot: Slot du service dans la table des symboles (``-1`` si inconnu).
+    :type slot: int
+    :param generation: Génération du slot lors de la résolution.
+    :type generation: int
+    :param spans: Positions dans le code source de chaque argument tableau
+        (None pour les autres arguments), si connues.
+    :type spans: Optional[Tuple[Optional[Tuple[int, int]], ...]]
+
+    :ivar service_name: Nom du service appelé.
+    :type service_name: str
+    :ivar func: Fonction du service résolue.
+    :type func: Callable[..., Any]
+    :ivar arguments: Valeurs des arguments validées.
+    :type arguments: Tuple[Any, ...]
+    :ivar slot: Slot du service.
+    :type slot: int
+    :ivar generation: Génération du slot.
+    :type generation: int
+    :ivar spans: Positions des arguments tableaux dans le code source, ou None.
+    :type spans: Optional[Tuple[Optional[Tuple[int, int]], ...]]
+    :ivar nested: Au moins un argument est un appel imbriqué.
+    :type nested: bool
+
+    :Example:
+        >>> bound = BoundCall("add", lambda a, b: a + b, (1, 2))
+        >>> bound.func(*bound.arguments)
+        3
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        func: Callable[..., Any],
+        arguments: Tuple[Any, ...],
+        slot: int = -1,
+        generation: int = -1,
+        spans: Optional[Tuple[Optional[Tuple[int, int]], ...]] = None,
+    ) -> None:
+        """Initialise un appel lié.
+
+        :param service_name: Nom du service appelé.
+        :type service_name: str
+        :param func: Fonction du service résolue.
+        :type func: Callable[..., Any]
+        :param arguments: Valeurs des arguments validées.
+        :type arguments: Tuple[Any, ...]
+        :param slot: Slot du service (``-1`` si inconnu).
+        :type slot: int
+        :param generation: Génération du slot lors de la résolution.
+        :type generation: int
+        :param spans: Positions des arguments tableaux dans le code source.
+        :type spans: Optional[Tuple[Optional[Tuple[int, int]], ...]]
+        """
+        self.service_name: str = service_name
+        self.func: Callable[..., Any] = func
+        self.arguments: Tuple[Any, ...] = arguments
+        self.slot: int = slot
+        self.generation: int = generation
+        self.spans: Optional[Tuple[Optional[Tuple[int, int]], ...]] = spans
+        self.nested: bool = any(isinstance(argument, BoundCall) for argument in arguments)
+
+    def __repr__(self) -> str:
+        """Retourne une représentation technique de l'appel lié.
+
+        :return: Représentation de l'appel.
+        :rtype: str
+
+        :Example:
+            >>> BoundCall("add", lambda a, b: a + b, (1, 2))
+            BoundCall(add, (1, 2))
+        """
+        return f"BoundCall({self.service_name}, {self.arguments!r})"
@@ -0,0 +1,196 @@
+"""Module contenant l'élimination des appels imbriqués identiques."""
+
+import inspect
+from typing import Any, Dict, Hashable, Tuple
+
+from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+from baobab_geek_interpreter.semantic.type_checker import TypeChecker
+from baobab_geek_interpreter.syntax.ast_node import (
+    ArgumentValue,
+    ArrayNode,
+    FloatNode,
+    ServiceCallNode,
+)
+
+
+class CommonSubexpressionEliminator:
+    """Passe d'optimisation fusionnant les appels imbriqués identiques d'un AST.
+
+    Chaque sous-arbre d'appel est haché structurellement (nom du service et
+    valeurs des arguments, récursivement). Les appels imbriqués identiques à
+    un service déclaré pur (``@service(pure=True)``), dont les propres appels
+    imbriqués sont également purs, sont remplacés par un même nœud
+    :class:`ServiceCallNode` : l'arbre devient un graphe acyclique, que
+    l'analyse sémantique lie en un seul :class:`BoundCall` par nœud et que
+    l'exécuteur évalue une seule fois par exécution.
+
+    Les appels à un service impur ou inconnu, ou qui retourne un flux
+    consommable une seule fois (:meth:`TypeChecker.is_stream_type`), ne sont
+    jamais fusionnés.
+
+    :param symbol_table: Table des symboles contenant les services enregistrés.
+    :type symbol_table: SymbolTable
+
+    :ivar calls: Nombre d'appels imbriqués examinés.
+    :type calls: int
+    :ivar saved: Nombre d'évaluations économisées (appels imbriqués fusionnés).
+    :type saved: int
+
+    :Example:
+        >>> # @service(pure=True) def load(name: str) -> str: ...
+        >>> # ast : cmp(load("x"), load("x"))
+        >>> eliminator = CommonSubexpressionEliminator(table)
+        >>> eliminator.eliminate(ast)
+        1
+        >>> ast.values[0] is ast.values[1]
+        True
+    """
+
+    def __init__(self, symbol_table: SymbolTable) -> None:
+        """Initialise la passe.
+
+        :param symbol_table: Table des symboles.
+        :type symbol_table: SymbolTable
+        """
+        self._symbol_table = symbol_table
+        self.calls = 0
+        self.saved = 0
+
+    def eliminate(self, ast: ServiceCallNode) -> int:
+        """Fusionne en place les appels imbriqués identiques d'un AST.
+
+        :param ast: Nœud racine de l'AST.
+        :type ast: ServiceCallNode
+        :return: Nombre d'évaluations économisées pour cet AST.
+        :rtype: int
+        """
+        if not any(isinstance(value, ServiceCallNode) for value in ast.values):
+            return 0
+        shared: Dict[Hashable, ServiceCallNode] = {}
+        keys: Dict[int, Tuple[Hashable, bool]] = {}
+        saved = self._rewrite(ast, shared, keys)
+        self.calls += len(keys)
+        self.saved += saved
+        return saved
+
+    def stats(self) -> Dict[str, int]:
+        """Retourne les statistiques de la passe.
+
+        :return: Nombre d'appels imbriqués examinés et d'évaluations économisées.
+        :rtype: Dict[str, int]
+        """
+        return {"calls": self.calls, "saved": self.saved}
+
+    def _rewrite(
+        self,
+        node: ServiceCallNode,
+        shared: Dict[Hashable, ServiceCallNode],
+        keys: Dict[int, Tuple[Hashable, bool]],
+    ) -> int:
+        """Remplace les appels imbriqués d'un nœud par leur représentant commun.
+
+        Le parcours est postfixe : les appels les plus profonds sont fusionnés
+        avant leurs parents.
+
+        :param node: Nœud d'appel dont les arguments sont réécrits.
+        :type node: ServiceCallNode
+        :param shared: Représentant de chaque clé d'appel pur déjà rencontrée.
+        :type shared: Dict[Hashable, ServiceCallNode]
+        :param keys: Clé et pureté de chaque nœud d'appel déjà examiné.
+        :type keys: Dict[int, Tuple[Hashable, bool]]
+        :return: Nombre d'appels remplacés.
+        :rtype: int
+        """
+        saved = 0
+        for index, value in enumerate(node.values):
+            if not isinstance(value, ServiceCallNode) or id(value) in keys:
+                continue
+            saved += self._rewrite(value, shared, keys)
+            key, pure = self._call_key(value, keys)
+            keys[id(value)] = (key, pure)
+            if not pure:
+                continue
+            representative = shared.setdefault(key, value)
+            if representative is not value:
+                self._replace(node, index, representative)
+                saved += 1
+        return saved
+
+    def _call_key(
+        self, node: ServiceCallNode, keys: Dict[int, Tuple[Hashable, bool]]
+    ) -> Tuple[Hashable, bool]:
+        """Calcule la clé structurelle d'un appel dont les appels imbriqués sont examinés.
+
+        :param node: Nœud d'appel.
+        :type node: ServiceCallNode
+        :param keys: Clé et pureté des appels imbriqués du nœud.
+        :type keys: Dict[int, Tuple[Hashable, bool]]
+        :return: Clé hachable et pureté de l'appel.
+        :rtype: Tuple[Hashable, bool]
+        """
+        pure = self._is_pure(node)
+        parts = []
+        for value in node.values:
+            if isinstance(value, ServiceCallNode):
+                key, nested_pure = keys[id(value)]
+                pure = pure and nested_pure
+                parts.append(key)
+            else:
+                parts.append(self._constant_key(value))
+        if not pure:
+            # Deux appels impurs ne sont jamais identiques.
+            return (id(node),), False
+        return (node.name, tuple(parts)), True
+
+    def _is_pure(self, node: ServiceCallNode) -> bool:
+        """Indique si un appel désigne un service déclaré pur.
+
+        :param node: Nœud d'appel.
+        :type node: ServiceCallNode
+        :return: True si le service est enregistré, déclaré pur et ne retourne
+            pas de flux.
+        :rtype: bool
+        """
+        service_func = self._symbol_table.lookup(node.name, node.slot, node.generation)
+        options = getattr(service_func, "_service_options", None)
+        if not getattr(options, "pure", False) or service_func is None:
+            return False
+        return not TypeChecker.is_stream_type(inspect.signature(service_func).return_annotation)
+
+    @staticmethod
+    def _constant_key(node: ArgumentValue) -> Hashable:
+        """Calcule la clé d'une constante, distinguant son type.
+
+        Les flottants sont représentés en hexadécimal : ``0.0`` et ``-0.0``
+        ont des clés distinctes.
+
+        :param node: Nœud de constante.
+        :type node: ArgumentValue
+        :return: Clé hachable de la constante.
+        :rtype: Hashable
+        """
+        if isinstance(node, ArrayNode):
+            return (
+                ArrayNode,
+                tuple(CommonSubexpressionEliminator._constant_key(elem) for elem in node.elements),
+            )
+        if isinstance(node, FloatNode):
+            return (FloatNode, node.value.hex())
+        value: Any = getattr(node, "value")
+        return (type(node), value)
+
+    @staticmethod
+    def _replace(node: ServiceCallNode, index: int, value: ServiceCallNode) -> None:
+        """Remplace la valeur d'un argument d'un nœud d'appel.
+
+        :param node: Nœud d'appel.
+        :type node: ServiceCallNode
+        :param index: Position de l'argument.
+        :type index: int
+        :param value: Nouvelle valeur de l'argument.
+        :type value: ServiceCallNode
+        """
+        if node.is_compact:
+            node.values[index] = value
+        else:
+            node.arguments[index].value = value
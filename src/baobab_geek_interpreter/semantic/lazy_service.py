@@ -0,0 +1,216 @@
+"""Module contenant la classe LazyService, service importé au premier appel."""
+
+import importlib
+import inspect
+import threading
+from typing import Any, Callable, Optional, Union, cast
+
+SignatureSource = Union[inspect.Signature, Callable[[], Optional[inspect.Signature]]]
+"""Signature, ou fonction sans argument la construisant."""
+
+
+class LazyService:  # pylint: disable=too-many-instance-attributes
+    """Service enregistré par son chemin d'import, importé à sa première utilisation.
+
+    Le chemin a la forme ``"paquet.module:fonction"`` ; la partie après
+    ``:`` peut désigner un attribut imbriqué (``"paquet.module:Classe.methode"``).
+    Le module n'est importé qu'à la première résolution (:meth:`resolve`),
+    une seule fois même si plusieurs threads résolvent le service en même
+    temps. Un échec d'import n'est pas mémorisé : la résolution suivante
+    réessaie.
+
+    Avec l'empreinte du fichier source du module (``source_hash``, voir
+    :class:`ServiceManifest`), la signature fournie est validée à
+    l'import : si le fichier n'a pas changé, elle est installée comme
+    ``__signature__`` de la fonction, et ``inspect.signature`` la retourne
+    sans réinterpréter annotations et décorateurs ; sinon le service est
+    marqué périmé (:attr:`stale`) et sa signature réelle est utilisée.
+
+    La :class:`SymbolTable` résout un service paresseux lorsqu'il est
+    recherché pour un appel, puis le remplace par la fonction importée :
+    :meth:`SymbolTable.has` et :meth:`SymbolTable.list_services` n'importent
+    rien.
+
+    :param path: Chemin d'import de la fonction du service.
+    :type path: str
+    :param signature: Signature du service, si connue sans import (utilisée
+        par :meth:`SymbolTable.signature_fingerprint`), ou fonction sans
+        argument la construisant à la première utilisation.
+    :type signature: Optional[SignatureSource]
+    :param source_hash: Empreinte SHA-256 du fichier source du module pour
+        laquelle la signature a été calculée.
+    :type source_hash: Optional[str]
+    :raises ValueError: Si le chemin n'a pas la forme ``"module:attribut"``.
+
+    :ivar path: Chemin d'import de la fonction du service.
+    :type path: str
+    :ivar module: Nom du module à importer.
+    :type module: str
+    :ivar attribute: Chemin de l'attribut dans le module.
+    :type attribute: str
+    :ivar stale: True si le fichier source ne correspond plus à
+        ``source_hash`` lors de l'import.
+    :type stale: bool
+
+    :Example:
+        >>> lazy = LazyService("math:sqrt")
+        >>> lazy.loaded
+        False
+        >>> lazy.resolve()(9.0)
+        3.0
+        >>> lazy.loaded
+        True
+    """
+
+    def __init__(
+        self,
+        path: str,
+        signature: Optional[SignatureSource] = None,
+        source_hash: Optional[str] = None,
+    ) -> None:
+        """Initialise un service non importé.
+
+        :param path: Chemin d'import de la fonction du service.
+        :type path: str
+        :param signature: Signature du service, si connue sans import, ou
+            fonction la construisant.
+        :type signature: Optional[SignatureSource]
+        :param source_hash: Empreinte du fichier source du module.
+        :type source_hash: Optional[str]
+        :raises ValueError: Si le chemin n'a pas la forme ``"module:attribut"``.
+        """
+        module, separator, attribute = path.partition(":")
+        if not separator or not module or not attribute or ":" in attribute:
+            raise ValueError(
+                f"Chemin de service invalide : '{path}' (forme attendue 'module:attribut')"
+            )
+        self.path = path
+        self.module = module
+        self.attribute = attribute
+        self.stale = False
+        self._signature = signature
+        self._source_hash = source_hash
+        self._func: Optional[Callable[..., Any]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        """Indique si le module du service a été importé.
+
+        :return: True si le service a été résolu.
+        :rtype: bool
+        """
+        return self._func is not None
+
+    @property
+    def signature(self) -> inspect.Signature:
+        """Signature du service : celle fournie, sinon celle de la fonction importée.
+
+        :return: Signature du service.
+        :rtype: inspect.Signature
+        """
+        signature = self._known_signature()
+        if signature is not None and not self.stale:
+            return signature
+        return inspect.signature(self.resolve())
+
+    def _known_signature(self) -> Optional[inspect.Signature]:
+        """Retourne la signature fournie, construite au premier accès si nécessaire.
+
+        :return: Signature fournie, ou None.
+        :rtype: Optional[inspect.Signature]
+        """
+        if callable(self._signature):
+            self._signature = self._signature()
+        return self._signature
+
+    def resolve(self) -> Callable[..., Any]:
+        """Importe le module du service si nécessaire et retourne sa fonction.
+
+        :return: Fonction du service.
+        :rtype: Callable[..., Any]
+        :raises ImportError: Si le module ne peut pas être importé ou ne
+            définit pas l'attribut.
+        """
+        func = self._func
+        if func is not None:
+            return func
+        with self._lock:
+            if self._func is None:
+                self._func = self._load()
+            return self._func
+
+    def _load(self) -> Callable[..., Any]:
+        """Importe le module et lit l'attribut désigné par le chemin.
+
+        :return: Fonction du service.
+        :rtype: Callable[..., Any]
+        :raises ImportError: Si l'attribut n'existe pas ou n'est pas appelable.
+        """
+        module = importlib.import_module(self.module)
+        target: Any = module
+        try:
+            for name in self.attribute.split("."):
+                target = getattr(target, name)
+        except AttributeError as exc:
+            raise ImportError(
+                f"Le module '{self.module}' ne définit pas '{self.attribute}'"
+            ) from exc
+        if not callable(target):
+            raise ImportError(f"'{self.path}' n'est pas appelable")
+        if self._source_hash is not None:
+            self._validate(target, getattr(module, "__file__", None))
+        return cast(Callable[..., Any], target)
+
+    def _validate(self, func: Any, filename: Optional[str]) -> None:
+        """Compare le fichier source à son empreinte et installe la signature fournie.
+
+        :param func: Fonction importée.
+        :type func: Any
+        :param filename: Fichier source du module, s'il existe.
+        :type filename: Optional[str]
+        """
+        if filename is None or self.source_hash_of(filename) != self._source_hash:
+            self.stale = True
+            return
+        signature = self._known_signature()
+        if signature is not None and getattr(func, "__signature__", None) is None:
+            try:
+                func.__signature__ = signature
+            except (AttributeError, TypeError):
+                pass  # fonction native : signature lue normalement
+
+    @staticmethod
+    def source_hash_of(filename: str) -> Optional[str]:
+        """Calcule l'empreinte SHA-256 d'un fichier source.
+
+        :param filename: Chemin du fichier.
+        :type filename: str
+        :return: Empreinte hexadécimale, ou None si le fichier est illisible.
+        :rtype: Optional[str]
+        """
+        import hashlib  # pylint: disable=import-outside-toplevel
+
+        try:
+            with open(filename, "rb") as source:
+                return hashlib.sha256(source.read()).hexdigest()
+        except OSError:
+            return None
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        """Appelle la fonction du service, en l'important si nécessaire.
+
+        :param args: Arguments positionnels.
+        :param kwargs: Arguments nommés.
+        :return: Résultat du service.
+        """
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        """Retourne une représentation du service paresseux.
+
+        :return: Représentation avec le chemin et l'état d'import.
+        :rtype: str
+        """
+        state = "chargé" if self.loaded else "non chargé"
+        return f"LazyService({self.path!r}, {state})"
@@ -1,16 +1,22 @@
 """Module pour l'analyse sémantique de l'AST."""
 
-from typing import Any, List
+import inspect
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from baobab_geek_interpreter.exceptions.semantic_exception import (
     BaobabSemanticAnalyserException,
 )
+from baobab_geek_interpreter.semantic.bound_call import BoundCall
 from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
 from baobab_geek_interpreter.semantic.type_checker import TypeChecker
+from baobab_geek_interpreter.semantic.type_shape_cache import TypeShapeCache
+from baobab_geek_interpreter.semantic.validation_level import ValidationLevel
 from baobab_geek_interpreter.syntax.ast_node import (
     ArrayNode,
     ServiceCallNode,
 )
+from baobab_geek_interpreter.syntax.columnar_ast import ColumnarAST
+from baobab_geek_interpreter.syntax.node_kind import NodeKind
 
 
 class SemanticAnalyzer:
@@ -23,10 +29,22 @@ class SemanticAnalyzer:
     - Tableaux homogènes
     - Pas de tableaux imbriqués (v1.0)
 
+    Les appels de service imbriqués sont analysés récursivement ; leur type
+    est vérifié à partir de l'annotation de retour du service appelé, de
+    sorte qu'une erreur est détectée avant l'exécution de tout service.
+
+    Les formes de types d'arguments validées sont conservées par service
+    (:class:`TypeShapeCache`) : un appel de forme déjà validée saute la
+    vérification complète des tableaux et des types. Les niveaux de
+    validation :attr:`ValidationLevel.SHALLOW` et
+    :attr:`ValidationLevel.TRUSTED` allègent la vérification des arguments
+    pour le trafic de confiance.
+
     :param symbol_table: Table des symboles contenant les services enregistrés.
     :type symbol_table: SymbolTable
 
     :Example:
+        >>> from baobab_geek_interpreter.semantic.bound_call import BoundCall
         >>> from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
         >>> table = SymbolTable()
         >>> def add(a: int, b: int) -> int:
@@ -35,6 +53,9 @@ class SemanticAnalyzer:
         >>> analyzer = SemanticAnalyzer(table)
     """
 
+    SHALLOW_SAMPLE_SIZE = 16
+    """Nombre maximal d'éléments vérifiés par tableau en validation superficielle."""
+
     def __init__(self, symbol_table: SymbolTable) -> None:
         """Initialise l'analyseur sémantique.
 
@@ -43,21 +64,238 @@ class SemanticAnalyzer:
         """
         self._symbol_table = symbol_table
         self._type_checker = TypeChecker()
+        self._type_caches: Dict[str, TypeShapeCache] = {}
+
+    def analyze(
+        self, ast: ServiceCallNode, validation: ValidationLevel = ValidationLevel.FULL
+    ) -> BoundCall:
+        """Analyse un AST, valide les règles sémantiques et lie l'appel.
 
-    def analyze(self, ast: ServiceCallNode) -> None:
-        """Analyse un AST et valide les règles sémantiques.
+        Le service est recherché une seule fois et les arguments sont
+        matérialisés une seule fois : l'appel lié retourné peut être exécuté
+        directement par :meth:`Executor.execute_bound`.
 
         :param ast: Nœud racine de l'AST à analyser.
         :type ast: ServiceCallNode
+        :param validation: Niveau de validation des arguments (voir
+            :meth:`check_arguments`).
+        :type validation: ValidationLevel
+        :return: Appel lié contenant le service résolu et les arguments validés
+            (les appels imbriqués sont des :class:`BoundCall`).
+        :rtype: BoundCall
         :raises BaobabSemanticAnalyserException: Si une erreur sémantique est détectée.
 
         :Example:
             >>> # ast = ServiceCallNode("add", [IntNode(1), IntNode(2)])
-            >>> # analyzer.analyze(ast)
+            >>> # bound = analyzer.analyze(ast)
+            >>> # bound.arguments
+            >>> # (1, 2)
+        """
+        return self._analyze(ast, {}, validation)
+
+    def _analyze(
+        self,
+        ast: ServiceCallNode,
+        bound_nodes: Dict[int, BoundCall],
+        validation: ValidationLevel = ValidationLevel.FULL,
+    ) -> BoundCall:
+        """Analyse un nœud d'appel et lie l'appel.
+
+        :param ast: Nœud d'appel à analyser.
+        :type ast: ServiceCallNode
+        :param bound_nodes: Appels liés des nœuds d'appels imbriqués déjà analysés.
+        :type bound_nodes: Dict[int, BoundCall]
+        :param validation: Niveau de validation des arguments.
+        :type validation: ValidationLevel
+        :return: Appel lié.
+        :rtype: BoundCall
+        :raises BaobabSemanticAnalyserException: Si une erreur sémantique est détectée.
         """
         # Vérifier que le service existe
         service_name = ast.name
-        service_func = self._symbol_table.get(service_name)
+        service_func = self._resolve_service(service_name, ast.slot, ast.generation)
+
+        # Extraire les valeurs des arguments
+        arg_values = self._extract_argument_values(ast, bound_nodes, validation)
+
+        # Vérifier les tableaux puis les types avec la signature du service
+        self.check_arguments(service_name, service_func, arg_values, validation)
+
+        return BoundCall(
+            service_name,
+            service_func,
+            tuple(arg_values),
+            ast.slot,
+            ast.generation,
+            self._argument_spans(ast),
+        )
+
+    def analyze_columnar(
+        self, ast: ColumnarAST, validation: ValidationLevel = ValidationLevel.FULL
+    ) -> BoundCall:
+        """Analyse un AST colonnaire et lie l'appel (chemin rapide).
+
+        L'homogénéité des tableaux plats est vérifiée sur la colonne des types
+        de nœuds ; la signature est alors vérifiée sur un seul élément
+        représentatif par tableau, puis les arguments sont matérialisés par
+        tranches de pools. Les tableaux imbriqués ou mixtes repassent par la
+        validation élément par élément.
+
+        :param ast: AST colonnaire à analyser.
+        :type ast: ColumnarAST
+        :param validation: Niveau de validation des arguments ; hors validation
+            complète, les arguments sont matérialisés puis vérifiés par
+            :meth:`check_arguments`.
+        :type validation: ValidationLevel
+        :return: Appel lié contenant le service résolu et les arguments validés.
+        :rtype: BoundCall
+        :raises BaobabSemanticAnalyserException: Si une erreur sémantique est détectée.
+        """
+        service_name = ast.name
+        service_func = self._resolve_service(service_name, ast.slot, ast.generation)
+        if validation is not ValidationLevel.FULL:
+            arg_values = ast.argument_values()
+            self.check_arguments(service_name, service_func, arg_values, validation)
+            return BoundCall(
+                service_name, service_func, tuple(arg_values), ast.slot, ast.generation
+            )
+
+        probes: List[Any] = []
+        for index in ast.argument_indices():
+            if ast.kinds[index] != NodeKind.ARRAY:
+                probes.append(ast.value(index))
+            elif ast.offsets[index] == 0:
+                probes.append([])
+            elif ast.scalar_kind(index) in (NodeKind.INT, NodeKind.FLOAT, NodeKind.STRING):
+                probes.append([ast.value(index + 1)])
+            else:
+                probes = []
+                break
+        else:
+            self._check_types(service_name, service_func, probes)
+            arg_values = ast.argument_values()
+            return BoundCall(
+                service_name, service_func, tuple(arg_values), ast.slot, ast.generation
+            )
+
+        arg_values = ast.argument_values()
+        self.check_arguments(service_name, service_func, arg_values)
+        return BoundCall(service_name, service_func, tuple(arg_values), ast.slot, ast.generation)
+
+    def check_arguments(
+        self,
+        service_name: str,
+        service_func: Callable[..., Any],
+        arg_values: List[Any],
+        validation: ValidationLevel = ValidationLevel.FULL,
+    ) -> None:
+        """Vérifie des valeurs d'arguments pour un service.
+
+        Les tableaux doivent être homogènes et non imbriqués, et les types
+        compatibles avec la signature du service ; utilisé aussi par le code
+        généré (:class:`CodeGenerator`) pour valider les arguments d'un appel
+        préparé. Un appel dont la forme de types a déjà été validée pour ce
+        service ne passe pas par la vérification complète.
+
+        En validation superficielle, seuls :attr:`SHALLOW_SAMPLE_SIZE`
+        éléments régulièrement espacés de chaque tableau sont vérifiés, en
+        temps indépendant de sa taille ; en validation de confiance, seul le
+        nombre d'arguments est vérifié.
+
+        :param service_name: Nom du service.
+        :type service_name: str
+        :param service_func: Fonction du service.
+        :type service_func: Callable[..., Any]
+        :param arg_values: Valeurs des arguments.
+        :type arg_values: List[Any]
+        :param validation: Niveau de validation.
+        :type validation: ValidationLevel
+        :raises BaobabSemanticAnalyserException: Si un argument est invalide.
+
+        :Example:
+            >>> analyzer.check_arguments("add", add, [1, 2])
+            >>> analyzer.check_arguments("add", add, [1, "2"])
+            Traceback (most recent call last):
+            ...
+            BaobabSemanticAnalyserException: Types d'arguments incompatibles pour le service 'add'
+        """
+        cache = self._type_caches.get(service_name)
+        if cache is None or cache.func is not service_func:
+            cache = self._type_caches[service_name] = TypeShapeCache(service_func)
+        if validation is not ValidationLevel.FULL:
+            self._check_shallow(service_name, cache.parameters, arg_values, validation)
+            return
+        hit, shape = cache.lookup(arg_values)
+        if hit:
+            return
+        self._check_arrays(arg_values)
+        self._check_types(service_name, service_func, arg_values)
+        cache.record(shape)
+
+    def _check_shallow(
+        self,
+        service_name: str,
+        params: List[inspect.Parameter],
+        arg_values: List[Any],
+        validation: ValidationLevel,
+    ) -> None:
+        """Vérifie des arguments en validation superficielle ou de confiance.
+
+        :param service_name: Nom du service.
+        :type service_name: str
+        :param params: Paramètres du service.
+        :type params: List[inspect.Parameter]
+        :param arg_values: Valeurs des arguments.
+        :type arg_values: List[Any]
+        :param validation: Niveau de validation, autre que complet.
+        :type validation: ValidationLevel
+        :raises BaobabSemanticAnalyserException: Si un argument est invalide.
+        """
+        if validation is ValidationLevel.SHALLOW and len(arg_values) == len(params):
+            samples = [
+                (
+                    self._type_checker.sample(value, self.SHALLOW_SAMPLE_SIZE)
+                    if isinstance(value, list)
+                    else value
+                )
+                for value in arg_values
+            ]
+            self._check_arrays(samples)
+            if self._type_checker.check_parameters(params, samples):
+                return
+        elif validation is ValidationLevel.TRUSTED and len(arg_values) == len(params):
+            return
+        raise BaobabSemanticAnalyserException(
+            f"Types d'arguments incompatibles pour le service '{service_name}'",
+            source="",
+            position=0,
+            line=0,
+            column=0,
+        )
+
+    def get_type_cache_stats(self) -> Dict[str, Dict[str, float]]:
+        """Retourne les statistiques des caches de formes de types.
+
+        :return: Statistiques de chaque cache (voir :meth:`TypeShapeCache.stats`),
+            indexées par nom de service.
+        :rtype: Dict[str, Dict[str, float]]
+        """
+        return {name: cache.stats() for name, cache in list(self._type_caches.items())}
+
+    def _resolve_service(self, service_name: str, slot: int, generation: int) -> Callable[..., Any]:
+        """Résout un service dans la table des symboles.
+
+        :param service_name: Nom du service.
+        :type service_name: str
+        :param slot: Slot résolu lors de l'analyse syntaxique.
+        :type slot: int
+        :param generation: Génération du slot lors de la résolution.
+        :type generation: int
+        :return: Fonction du service.
+        :rtype: Callable[..., Any]
+        :raises BaobabSemanticAnalyserException: Si le service est inconnu.
+        """
+        service_func = self._symbol_table.lookup(service_name, slot, generation)
 
         if service_func is None:
             raise BaobabSemanticAnalyserException(
@@ -67,14 +305,21 @@ class SemanticAnalyzer:
                 line=0,
                 column=0,
             )
+        return service_func
 
-        # Extraire les valeurs des arguments
-        arg_values = self._extract_argument_values(ast)
-
-        # Vérifier les tableaux (homogénéité et imbrication)
-        self._check_arrays(arg_values)
+    def _check_types(
+        self, service_name: str, service_func: Callable[..., Any], arg_values: List[Any]
+    ) -> None:
+        """Vérifie les types des arguments avec la signature du service.
 
-        # Vérifier les types avec la signature du service
+        :param service_name: Nom du service.
+        :type service_name: str
+        :param service_func: Fonction du service.
+        :type service_func: Callable[..., Any]
+        :param arg_values: Valeurs des arguments.
+        :type arg_values: List[Any]
+        :raises BaobabSemanticAnalyserException: Si les types sont incompatibles.
+        """
         if not self._type_checker.check_types(service_func, arg_values):
             raise BaobabSemanticAnalyserException(
                 f"Types d'arguments incompatibles pour le service '{service_name}'",
@@ -84,18 +329,39 @@ class SemanticAnalyzer:
                 column=0,
             )
 
-    def _extract_argument_values(self, ast: ServiceCallNode) -> List[Any]:
+    def _extract_argument_values(
+        self,
+        ast: ServiceCallNode,
+        bound_nodes: Optional[Dict[int, BoundCall]] = None,
+        validation: ValidationLevel = ValidationLevel.FULL,
+    ) -> List[Any]:
         """Extrait les valeurs concrètes des arguments.
 
+        Un appel imbriqué est analysé récursivement et remplacé par son appel
+        lié ; un même nœud partagé par plusieurs appels (voir
+        :class:`CommonSubexpressionEliminator`) est lié une seule fois.
+
         :param ast: Nœud d'appel de service.
         :type ast: ServiceCallNode
+        :param bound_nodes: Appels liés des nœuds d'appels imbriqués déjà analysés.
+        :type bound_nodes: Optional[Dict[int, BoundCall]]
+        :param validation: Niveau de validation des appels imbriqués.
+        :type validation: ValidationLevel
         :return: Liste des valeurs des arguments.
         :rtype: List[Any]
         """
-        values = []
-        for arg_node in ast.arguments:
-            value_node = arg_node.value
-            if isinstance(value_node, ArrayNode):
+        if bound_nodes is None:
+            bound_nodes = {}
+        values: List[Any] = []
+        for value_node in ast.values:
+            if isinstance(value_node, ServiceCallNode):
+                bound = bound_nodes.get(id(value_node))
+                if bound is None:
+                    bound = bound_nodes[id(value_node)] = self._analyze(
+                        value_node, bound_nodes, validation
+                    )
+                values.append(bound)
+            elif isinstance(value_node, ArrayNode):
                 # Extraire les valeurs du tableau
                 array_values = []
                 for elem in value_node.elements:
@@ -115,6 +381,24 @@ class SemanticAnalyzer:
                 values.append(value_node.value)  # type: ignore[attr-defined]
         return values
 
+    @staticmethod
+    def _argument_spans(
+        ast: ServiceCallNode,
+    ) -> Optional[Tuple[Optional[Tuple[int, int]], ...]]:
+        """Relève les positions dans le code source des arguments tableaux.
+
+        :param ast: Nœud d'appel de service.
+        :type ast: ServiceCallNode
+        :return: Position de chaque argument tableau (None pour les autres), ou
+            None si aucun argument tableau n'a de position connue.
+        :rtype: Optional[Tuple[Optional[Tuple[int, int]], ...]]
+        """
+        spans = tuple(
+            value_node.span if isinstance(value_node, ArrayNode) else None
+            for value_node in ast.values
+        )
+        return spans if any(spans) else None
+
     def _check_arrays(self, arg_values: List[Any]) -> None:
         """Vérifie que tous les tableaux sont homogènes et non imbriqués.
 
@@ -0,0 +1,301 @@
+"""Module contenant le manifeste précalculé des services."""
+
+import ast
+import builtins
+import collections.abc
+import importlib
+import inspect
+import json
+import sys
+import typing
+from functools import partial
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from baobab_geek_interpreter.semantic.lazy_service import LazyService
+from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+
+Entry = Dict[str, Any]
+"""Entrée d'un service dans le manifeste (voir :class:`ServiceManifest`)."""
+
+
+class ServiceManifest:
+    """Manifeste précalculé des services : chemins d'import, signatures et empreintes.
+
+    Un manifeste est construit une fois (:meth:`build`, par exemple à la
+    construction de l'image d'un worker), enregistré en JSON (:meth:`save`)
+    puis chargé au démarrage (:meth:`load`, :meth:`SymbolTable.load_manifest`,
+    :meth:`Interpreter.load_manifest`) : les services sont enregistrés comme
+    :class:`LazyService`, sans import de module ni introspection de
+    signature. À la première utilisation d'un service, son module est
+    importé et l'empreinte de son fichier source comparée à celle du
+    manifeste, qui valide la signature précalculée.
+
+    Chaque entrée contient le nom du service (``name``), son chemin d'import
+    (``path``, ``"module:attribut"``), l'empreinte SHA-256 du fichier source
+    du module (``source_hash``) et sa signature (``signature`` :
+    ``parameters``, liste de ``name``, ``kind`` et, si présents,
+    ``annotation`` et ``default`` ; ``return``). Les annotations sont des
+    expressions de types natifs, de ``typing`` et de ``collections.abc`` ;
+    une signature non représentable (classe propre au service, valeur par
+    défaut non littérale) est omise et lue à l'import du service.
+
+    :param entries: Entrées des services.
+    :type entries: List[Entry]
+
+    :ivar entries: Entrées des services.
+    :type entries: List[Entry]
+
+    :Example:
+        >>> ServiceManifest.build(["my_services"], recursive=True).save("services.json")
+        >>> interpreter = Interpreter()
+        >>> interpreter.load_manifest("services.json")
+        500
+    """
+
+    FORMAT_VERSION = 1
+    """Version du format de fichier."""
+
+    _NAMESPACE: Dict[str, Any] = {
+        **{
+            name: value
+            for name, value in vars(builtins).items()
+            if isinstance(value, type) and not name.startswith("_")
+        },
+        "None": None,
+        "typing": typing,
+        "collections": collections,
+    }
+    """Noms résolus dans les expressions d'annotations."""
+
+    _MODULES = (typing, collections, collections.abc)
+    """Modules dont les attributs peuvent être lus par une expression d'annotation."""
+
+    _EVALUATED: Dict[str, Any] = {}
+    """Annotations déjà évaluées, par expression (partagées entre manifestes)."""
+
+    def __init__(self, entries: List[Entry]) -> None:
+        """Initialise un manifeste à partir de ses entrées.
+
+        :param entries: Entrées des services.
+        :type entries: List[Entry]
+        """
+        self.entries = entries
+
+    def __len__(self) -> int:
+        """Retourne le nombre de services du manifeste.
+
+        :return: Nombre d'entrées.
+        :rtype: int
+        """
+        return len(self.entries)
+
+    @classmethod
+    def build(
+        cls, modules: Iterable[Union[ModuleType, str]], recursive: bool = False
+    ) -> "ServiceManifest":
+        """Construit le manifeste des services d'un ensemble de modules.
+
+        :param modules: Modules (ou noms de modules) à analyser.
+        :type modules: Iterable[Union[ModuleType, str]]
+        :param recursive: True pour analyser aussi les sous-modules des paquets.
+        :type recursive: bool
+        :return: Manifeste des services trouvés.
+        :rtype: ServiceManifest
+        """
+        entries: List[Entry] = []
+        for module in modules:
+            if isinstance(module, str):
+                module = importlib.import_module(module)
+            scanned = SymbolTable.walk_package(module) if recursive else [module]
+            for current in scanned:
+                filename = getattr(current, "__file__", None)
+                source_hash = LazyService.source_hash_of(filename) if filename else None
+                for name, attribute, func in SymbolTable.module_services(current):
+                    entries.append(
+                        {
+                            "name": name,
+                            "path": f"{current.__name__}:{attribute}",
+                            "source_hash": source_hash,
+                            "signature": cls._encode_signature(func),
+                        }
+                    )
+        return cls(entries)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ServiceManifest":
+        """Lit un manifeste enregistré par :meth:`save`.
+
+        :param path: Chemin du fichier.
+        :type path: Union[str, Path]
+        :return: Manifeste lu.
+        :rtype: ServiceManifest
+        :raises ValueError: Si le fichier n'est pas un manifeste de version
+            :attr:`FORMAT_VERSION`.
+        """
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if not isinstance(data, dict) or data.get("version") != cls.FORMAT_VERSION:
+            raise ValueError(
+                f"Manifeste de services invalide : '{path}' "
+                f"(version attendue {cls.FORMAT_VERSION})"
+            )
+        return cls(data["services"])
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Enregistre le manifeste en JSON.
+
+        :param path: Chemin du fichier.
+        :type path: Union[str, Path]
+        """
+        data = {"version": self.FORMAT_VERSION, "services": self.entries}
+        Path(path).write_text(json.dumps(data, indent=1), encoding="utf-8")
+
+    def lazy_services(self) -> List[Tuple[str, LazyService]]:
+        """Crée les services paresseux décrits par le manifeste.
+
+        :return: Nom et service paresseux de chaque entrée.
+        :rtype: List[Tuple[str, LazyService]]
+        :raises ValueError: Si un chemin est invalide.
+        """
+        # Signatures construites à la première utilisation de chaque service.
+        return [
+            (
+                entry["name"],
+                LazyService(
+                    entry["path"],
+                    partial(self._decode_signature, entry.get("signature")),
+                    entry.get("source_hash"),
+                ),
+            )
+            for entry in self.entries
+        ]
+
+    @classmethod
+    def _encode_signature(cls, func: Any) -> Optional[Entry]:
+        """Encode la signature d'une fonction, si elle est représentable.
+
+        :param func: Fonction du service.
+        :type func: Any
+        :return: Paramètres et annotation de retour, ou None.
+        :rtype: Optional[Entry]
+        """
+        try:
+            signature = inspect.signature(func)
+            parameters = []
+            for param in signature.parameters.values():
+                encoded: Entry = {"name": param.name, "kind": param.kind.name}
+                if param.annotation is not inspect.Parameter.empty:
+                    encoded["annotation"] = cls._encode_annotation(param.annotation)
+                if param.default is not inspect.Parameter.empty:
+                    encoded["default"] = repr(param.default)
+                    if ast.literal_eval(encoded["default"]) != param.default:
+                        return None
+                parameters.append(encoded)
+        except (TypeError, ValueError, SyntaxError):
+            return None
+        result: Entry = {"parameters": parameters}
+        if signature.return_annotation is not inspect.Signature.empty:
+            try:
+                result["return"] = cls._encode_annotation(signature.return_annotation)
+            except ValueError:
+                return None
+        return result
+
+    @classmethod
+    def _encode_annotation(cls, annotation: Any) -> str:
+        """Encode une annotation en expression relue par :meth:`_evaluate`.
+
+        :param annotation: Annotation de type.
+        :type annotation: Any
+        :return: Expression de l'annotation.
+        :rtype: str
+        :raises ValueError: Si l'annotation n'est pas représentable.
+        """
+        expression = repr(annotation)
+        if isinstance(annotation, type):
+            name = annotation.__name__
+            if cls._NAMESPACE.get(name) is annotation:
+                expression = name
+        try:
+            valid = cls._evaluate(expression) == annotation
+        except (ValueError, TypeError, SyntaxError):
+            valid = False
+        if not valid:
+            raise ValueError(f"Annotation non représentable : {expression}")
+        return expression
+
+    @classmethod
+    def _decode_signature(cls, encoded: Optional[Entry]) -> Optional[inspect.Signature]:
+        """Reconstruit une signature encodée par :meth:`_encode_signature`.
+
+        :param encoded: Signature encodée, ou None.
+        :type encoded: Optional[Entry]
+        :return: Signature, ou None si elle n'est pas connue.
+        :rtype: Optional[inspect.Signature]
+        :raises ValueError: Si la signature encodée est invalide.
+        """
+        if encoded is None:
+            return None
+        empty = inspect.Parameter.empty
+        parameters = [
+            inspect.Parameter(
+                param["name"],
+                getattr(inspect.Parameter, param["kind"]),
+                default=ast.literal_eval(param["default"]) if "default" in param else empty,
+                annotation=(cls._evaluate(param["annotation"]) if "annotation" in param else empty),
+            )
+            for param in encoded["parameters"]
+        ]
+        returns = cls._evaluate(encoded["return"]) if "return" in encoded else empty
+        return inspect.Signature(parameters, return_annotation=returns)
+
+    @classmethod
+    def _evaluate(cls, expression: str) -> Any:
+        """Évalue une expression d'annotation sans ``eval``.
+
+        Seuls les noms de types natifs, ``None``, les attributs publics de
+        ``typing`` et ``collections.abc``, les indices (``list[int]``) et les
+        constantes sont acceptés.
+
+        :param expression: Expression d'annotation.
+        :type expression: str
+        :return: Annotation.
+        :rtype: Any
+        :raises ValueError: Si l'expression contient une autre construction.
+        """
+        if expression in cls._EVALUATED:
+            return cls._EVALUATED[expression]
+        annotation = cls._evaluate_node(ast.parse(expression, mode="eval").body)
+        cls._EVALUATED[expression] = annotation
+        return annotation
+
+    @classmethod
+    def _evaluate_node(cls, node: ast.AST) -> Any:
+        """Évalue un nœud d'expression d'annotation.
+
+        :param node: Nœud de l'expression.
+        :type node: ast.AST
+        :return: Valeur du nœud.
+        :rtype: Any
+        :raises ValueError: Si le nœud n'est pas accepté.
+        """
+        if isinstance(node, ast.Name) and node.id in cls._NAMESPACE:
+            return cls._NAMESPACE[node.id]
+        if isinstance(node, ast.Attribute) and not node.attr.startswith("_"):
+            owner = cls._evaluate_node(node.value)
+            if any(owner is module for module in cls._MODULES):
+                return getattr(owner, node.attr)
+        elif isinstance(node, ast.Subscript):
+            index = node.slice
+            if sys.version_info < (3, 9):  # indice encapsulé dans ast.Index
+                index = index.value
+            return cls._evaluate_node(node.value)[cls._evaluate_node(index)]
+        elif isinstance(node, (ast.Tuple, ast.List)):
+            items = [cls._evaluate_node(item) for item in node.elts]
+            return tuple(items) if isinstance(node, ast.Tuple) else items
+        elif isinstance(node, ast.Constant) and isinstance(node.value, (str, type(None))):
+            return node.value
+        elif isinstance(node, ast.Constant) and node.value is Ellipsis:
+            return Ellipsis
+        raise ValueError(f"Expression d'annotation non acceptée : {ast.dump(node)}")
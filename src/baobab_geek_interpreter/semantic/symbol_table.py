@@ -1,17 +1,92 @@
 """Module contenant la table des symboles pour gérer les services enregistrés."""
 
+import importlib
 import inspect
-from typing import Any, Callable, Dict, List, Optional
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
+from baobab_geek_interpreter.semantic.lazy_service import LazyService
+from baobab_geek_interpreter.semantic.symbol_table_snapshot import SymbolTableSnapshot
 
-class SymbolTable:
+if TYPE_CHECKING:
+    from baobab_geek_interpreter.semantic.service_manifest import ServiceManifest
+
+_PINNED: "ContextVar[Optional[Tuple[SymbolTable, SymbolTableSnapshot]]]" = ContextVar(
+    "baobab_pinned_snapshot", default=None
+)
+"""Table et instantané épinglés par :meth:`SymbolTable.pinned` dans le contexte courant."""
+
+_PINS = [0]
+"""Nombre d'épinglages en cours, toutes tables et tous contextes confondus : à
+zéro, une lecture n'a pas à consulter :data:`_PINNED`."""
+_PINS_LOCK = threading.Lock()
+
+
+class SymbolTable:  # pylint: disable=too-many-public-methods
     """Table des symboles pour gérer les services enregistrés.
 
     Permet d'enregistrer, rechercher et lister les services disponibles.
     Supporte également la découverte automatique des services dans un module.
 
-    :ivar _symbols: Dictionnaire associant les noms de services aux fonctions.
-    :type _symbols: Dict[str, Callable[..., Any]]
+    Chaque nom de service reçoit un emplacement (slot) entier stable, attribué
+    lors de son premier enregistrement et jamais réutilisé une fois publié :
+    seuls les slots attribués dans une :meth:`transaction` annulée, que
+    personne n'a pu observer, sont libérés puis réattribués. Les analyseurs
+    résolvent le nom une seule fois en slot puis indexent directement un tableau
+    plat. Un compteur de génération par slot, incrémenté à chaque
+    (ré)enregistrement, permet de détecter une référence périmée.
+
+    Un service peut être enregistré par son chemin d'import
+    (:meth:`register_lazy`) : son module n'est importé que lorsque le service
+    est recherché pour un appel (:meth:`get`, :meth:`get_slot`,
+    :meth:`lookup`), puis la fonction importée remplace l'entrée paresseuse
+    sans changer la génération du slot.
+
+    Les services sont conservés dans un instantané immuable
+    (:class:`SymbolTableSnapshot`). Une écriture (:meth:`register`,
+    :meth:`discover_services`, :meth:`clear`...) s'applique, sous un verrou
+    d'écriture, à l'instantané suivant, publié par une seule affectation à
+    la lecture suivante : des écritures successives sans lecture
+    intermédiaire ne construisent qu'un instantané. Les lectures ne
+    prennent aucun verrou, sauf pour publier des écritures en attente. Une
+    :meth:`transaction` publie plusieurs écritures en une fois, et
+    :meth:`pinned` fixe l'instantané lu par le contexte courant : un
+    rechargement de services pendant une interprétation ne modifie pas les
+    services qu'elle voit.
+
+    :ivar _snapshot: Dernier instantané publié.
+    :type _snapshot: SymbolTableSnapshot
+    :ivar _draft: Instantané suivant, non publié, s'il y a des écritures en
+        attente ou une transaction en cours.
+    :type _draft: Optional[SymbolTableSnapshot]
+    :ivar _depth: Profondeur d'imbrication de la transaction en cours.
+    :type _depth: int
+    :ivar _generations: Génération de chaque slot, mise à jour en place par
+        les écritures hors transaction et à la fin d'une transaction (voir
+        :attr:`generations`).
+    :type _generations: List[int]
+    :ivar _lock: Verrou des écritures et des publications, détenu pendant
+        une transaction.
+    :type _lock: threading.RLock
+    :ivar _discovery: Cumul des découvertes de services (voir
+        :meth:`discovery_stats`).
+    :type _discovery: Dict[str, float]
 
     :Example:
         >>> table = SymbolTable()
@@ -24,12 +99,146 @@ class SymbolTable:
 
     def __init__(self) -> None:
         """Initialise une table des symboles vide."""
-        self._symbols: Dict[str, Callable[..., Any]] = {}
+        self._snapshot = SymbolTableSnapshot(0, 0, 0, {}, [], [], [], {}, self._replace_stale)
+        self._draft: Optional[SymbolTableSnapshot] = None
+        self._depth = 0
+        self._generations: List[int] = []
+        self._lock = threading.RLock()
+        self._discovery: Dict[str, float] = {"modules": 0, "services": 0, "seconds": 0.0}
+
+    def snapshot(self) -> SymbolTableSnapshot:
+        """Retourne l'instantané lu par le contexte courant.
+
+        C'est l'instantané épinglé par :meth:`pinned` s'il y en a un, sinon
+        le dernier instantané publié, après publication des écritures en
+        attente.
+
+        :return: Instantané des services.
+        :rtype: SymbolTableSnapshot
+
+        :Example:
+            >>> table = SymbolTable()
+            >>> table.register("add", lambda a, b: a + b)
+            >>> table.snapshot().version
+            1
+        """
+        if _PINS[0]:
+            pinned = _PINNED.get()
+            if pinned is not None and pinned[0] is self:
+                return pinned[1]
+        if self._draft is not None and not self._depth:
+            self._flush()
+        return self._snapshot
+
+    @contextmanager
+    def pinned(self) -> Iterator[SymbolTableSnapshot]:
+        """Fixe l'instantané lu par le contexte courant (thread ou tâche asyncio).
+
+        Dans le bloc, toutes les lectures de la table par ce contexte
+        utilisent l'instantané publié à l'entrée, même si d'autres threads
+        publient de nouveaux services. Un bloc imbriqué conserve
+        l'instantané du bloc englobant.
+
+        :return: Gestionnaire de contexte fournissant l'instantané épinglé.
+        :rtype: Iterator[SymbolTableSnapshot]
+
+        :Example:
+            >>> table = SymbolTable()
+            >>> with table.pinned():
+            ...     table.register("add", lambda a, b: a + b)
+            ...     table.has("add")
+            False
+            >>> table.has("add")
+            True
+        """
+        pinned = _PINNED.get()
+        if pinned is not None and pinned[0] is self:
+            yield pinned[1]
+            return
+        snapshot = self.snapshot()
+        token = _PINNED.set((self, snapshot))
+        with _PINS_LOCK:
+            _PINS[0] += 1
+        try:
+            yield snapshot
+        finally:
+            with _PINS_LOCK:
+                _PINS[0] -= 1
+            _PINNED.reset(token)
+
+    @contextmanager
+    def transaction(self) -> Iterator["SymbolTable"]:
+        """Regroupe des écritures en une seule publication atomique.
+
+        Les enregistrements et suppressions du bloc ne sont visibles qu'à sa
+        sortie, tous ensemble ; un lecteur ne voit jamais une partie
+        seulement des services rechargés. Si une exception sort du bloc le
+        plus externe, aucune écriture n'est publiée. Les écritures des autres
+        threads attendent la fin du bloc ; une lecture ne l'attend que si
+        elle a trouvé des écritures antérieures au bloc à publier.
+
+        :return: Gestionnaire de contexte fournissant la table.
+        :rtype: Iterator[SymbolTable]
+
+        :Example:
+            >>> table = SymbolTable()
+            >>> with table.transaction():
+            ...     table.clear()
+            ...     table.register("add", lambda a, b: a + b)
+            ...     table.register("sub", lambda a, b: a - b)
+            >>> table.list_services()
+            ['add', 'sub']
+        """
+        with self._lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield self
+                finally:
+                    self._depth -= 1
+                return
+            if self._draft is not None:
+                self._snapshot = self._draft  # écritures antérieures au bloc
+                self._draft = None
+            self._depth = 1
+            try:
+                yield self
+            except BaseException:
+                if self._draft is not None:
+                    self._snapshot.trim()
+                    self._draft = None
+                raise
+            else:
+                draft = self._draft
+                if draft is not None:
+                    self._generations[:] = draft.generations
+                    self._snapshot = draft  # publication : une seule affectation
+                    self._draft = None
+            finally:
+                self._depth = 0
+
+    def _flush(self) -> None:
+        """Publie les écritures en attente, hors transaction."""
+        with self._lock:
+            if self._draft is not None and not self._depth:
+                self._snapshot = self._draft  # publication : une seule affectation
+                self._draft = None
+
+    def _next(self) -> SymbolTableSnapshot:
+        """Retourne l'instantané suivant, créé si besoin (verrou détenu).
+
+        :return: Instantané non publié recevant les écritures.
+        :rtype: SymbolTableSnapshot
+        """
+        if self._draft is None:
+            self._draft = self._snapshot.derive()
+        return self._draft
 
     def register(self, name: str, func: Callable[..., Any]) -> None:
         """Enregistre un service dans la table des symboles.
 
-        Si un service avec le même nom existe déjà, il est écrasé.
+        Si un service avec le même nom existe déjà, il est écrasé : il conserve
+        son slot mais la génération de ce slot est incrémentée.
 
         :param name: Nom du service à enregistrer.
         :type name: str
@@ -44,15 +253,95 @@ class SymbolTable:
             >>> table.has("add")
             True
         """
-        self._symbols[name] = func
+        name = sys.intern(name)
+        with self._lock:
+            slot = self._next().assign(name, func)
+            if not self._depth:
+                live = self._generations  # suit l'instantané suivant hors transaction
+                if slot < len(live):
+                    live[slot] += 1
+                else:
+                    live.append(0)
 
-    def get(self, name: str) -> Optional[Callable[..., Any]]:
+    def register_lazy(
+        self, name: str, path: str, signature: Optional[inspect.Signature] = None
+    ) -> None:
+        """Enregistre un service par son chemin d'import, sans importer son module.
+
+        :param name: Nom du service à enregistrer.
+        :type name: str
+        :param path: Chemin d'import de la fonction (``"paquet.module:fonction"``).
+        :type path: str
+        :param signature: Signature du service, si connue sans import.
+        :type signature: Optional[inspect.Signature]
+        :raises ValueError: Si le chemin n'a pas la forme ``"module:attribut"``.
+
+        :Example:
+            >>> table = SymbolTable()
+            >>> table.register_lazy("sqrt", "math:sqrt")
+            >>> table.has("sqrt")
+            True
+            >>> table.get("sqrt")(9.0)
+            3.0
+        """
+        self.register(name, LazyService(path, signature))
+
+    def register_lazy_services(self, services: Mapping[str, str]) -> None:
+        """Enregistre plusieurs services par leur chemin d'import.
+
+        Tous les chemins sont vérifiés avant le premier enregistrement.
+
+        :param services: Chemin d'import de chaque service, par nom.
+        :type services: Mapping[str, str]
+        :raises ValueError: Si un chemin n'a pas la forme ``"module:attribut"``.
+
+        :Example:
+            >>> table = SymbolTable()
+            >>> table.register_lazy_services({"sqrt": "math:sqrt", "floor": "math:floor"})
+            >>> table.list_services()
+            ['sqrt', 'floor']
+        """
+        lazy_services = [(name, LazyService(path)) for name, path in services.items()]
+        with self.transaction():
+            for name, lazy in lazy_services:
+                self.register(name, lazy)
+
+    def load_manifest(self, manifest: "ServiceManifest") -> int:
+        """Enregistre les services d'un manifeste, sans importer leurs modules.
+
+        Chaque service est enregistré comme :class:`LazyService` avec la
+        signature et l'empreinte du fichier source précalculées : aucune
+        introspection n'a lieu au chargement, et la signature est validée à
+        la première utilisation du service.
+
+        :param manifest: Manifeste des services.
+        :type manifest: ServiceManifest
+        :return: Nombre de services enregistrés.
+        :rtype: int
+
+        :Example:
+            >>> table = SymbolTable()
+            >>> table.load_manifest(ServiceManifest.load("services.json"))
+            500
+        """
+        services = manifest.lazy_services()
+        with self.transaction():
+            for name, lazy in services:
+                self.register(name, lazy)
+        return len(services)
+
+    def get(self, name: str, resolve: bool = True) -> Optional[Callable[..., Any]]:
         """Récupère un service par son nom.
 
         :param name: Nom du service à récupérer.
         :type name: str
+        :param resolve: False pour retourner un service paresseux sans
+            importer son module.
+        :type resolve: bool
         :return: La fonction du service, ou None si non trouvé.
         :rtype: Optional[Callable[..., Any]]
+        :raises ImportError: Si le module d'un service paresseux ne peut pas
+            être importé.
 
         :Example:
             >>> table = SymbolTable()
@@ -63,7 +352,131 @@ class SymbolTable:
             >>> func(3, 4)
             12
         """
-        return self._symbols.get(name)
+        return self.snapshot().get(name, resolve)
+
+    def slot_of(self, name: str) -> Optional[int]:
+        """Retourne le slot attribué à un nom de service.
+
+        Le slot reste valide après un ré-enregistrement ou un :meth:`clear` ;
+        seule sa génération change.
+
+        :param name: Nom du service.
+        :type name: str
+        :return: Slot du service, ou None si le nom n'a jamais été enregistré.
+        :rtype: Optional[int]
+
+        :Example:
+            >>> table = SymbolTable()
+            >>> table.register("add", lambda a, b: a + b)
+            >>> table.slot_of("add")
+            0
+        """
+        return self.snapshot().slot_of(name)
+
+    def generation(self, slot: int) -> int:
+        """Retourne la génération courante d'un slot.
+
+        :param slot: Slot du service.
+        :type slot: int
+        :return: Génération du slot.
+        :rtype: int
+        :raises IndexError: Si le slot n'existe pas.
+
+        :Example:
+            >>> table = SymbolTable()
+            >>> table.register("add", lambda a, b: a + b)
+            >>> table.generation(0)
+            0
+        """
+        return self.snapshot().generation(slot)
+
+    @property
+    def generations(self) -> List[int]:
+        """Génération de chaque slot, indexée par slot.
+
+        La liste est partagée et mise à jour en place à chaque écriture hors
+        transaction, avant même la publication de l'instantané suivant, et à
+        la fin d'une transaction validée : un code généré la conserve pour
+        vérifier ses slots sans appel de méthode. Elle ignore l'instantané
+        épinglé (voir :meth:`pinned`) et ne doit pas être modifiée.
+
+        :return: Générations des slots.
+        :rtype: List[int]
+
+        :Example:
+            >>> table = SymbolTable()
+            >>> table.register("add", lambda a, b: a + b)
+            >>> generations = table.generations
+            >>> table.register("add", lambda a, b: a - b)
+            >>> generations
+            [1]
+        """
+        return self._generations
+
+    def get_slot(self, slot: int, generation: int) -> Optional[Callable[..., Any]]:
+        """Récupère un service par son slot, si la génération correspond.
+
+        :param slot: Slot du service.
+        :type slot: int
+        :param generation: Génération observée lors de la résolution du slot.
+        :type generation: int
+        :return: La fonction du service, ou None si le slot est inconnu ou périmé.
+        :rtype: Optional[Callable[..., Any]]
+
+        :Example:
+            >>> table = SymbolTable()
+            >>> table.register("add", lambda a, b: a + b)
+            >>> table.get_slot(0, 0)(1, 2)
+            3
+            >>> table.register("add", lambda a, b: a - b)
+            >>> table.get_slot(0, 0) is None
+            True
+        """
+        snapshot = self._snapshot if not _PINS[0] and self._draft is None else self.snapshot()
+        return snapshot.get_slot(slot, generation)
+
+    def lookup(
+        self, name: str, slot: int = -1, generation: int = -1
+    ) -> Optional[Callable[..., Any]]:
+        """Récupère un service via son slot, avec repli sur la recherche par nom.
+
+        Le chemin rapide indexe le tableau plat ; si le slot n'a pas été résolu
+        (``-1``) ou si sa génération a changé depuis, le service est recherché
+        par son nom.
+
+        :param name: Nom du service.
+        :type name: str
+        :param slot: Slot résolu lors de l'analyse syntaxique (``-1`` si absent).
+        :type slot: int
+        :param generation: Génération observée lors de la résolution.
+        :type generation: int
+        :return: La fonction du service, ou None si non trouvé.
+        :rtype: Optional[Callable[..., Any]]
+        """
+        snapshot = self._snapshot if not _PINS[0] and self._draft is None else self.snapshot()
+        return snapshot.lookup(name, slot, generation)
+
+    def signature_fingerprint(self, name: str) -> Optional[str]:
+        """Retourne l'empreinte de la signature d'un service.
+
+        L'empreinte est un condensé SHA-256 du nom et de la signature
+        (paramètres, annotations et valeurs par défaut) du service. Elle est
+        calculée une fois par génération du slot : un ré-enregistrement
+        provoque un nouveau calcul.
+
+        :param name: Nom du service.
+        :type name: str
+        :return: Empreinte hexadécimale, ou None si le service est inconnu ou
+            si sa signature ne peut pas être inspectée.
+        :rtype: Optional[str]
+
+        :Example:
+            >>> table = SymbolTable()
+            >>> table.register("add", lambda a, b: a + b)
+            >>> len(table.signature_fingerprint("add"))
+            64
+        """
+        return self.snapshot().signature_fingerprint(name)
 
     def has(self, name: str) -> bool:
         """Vérifie si un service existe dans la table.
@@ -83,16 +496,23 @@ class SymbolTable:
             >>> table.has("test")
             True
         """
-        return name in self._symbols
+        return self.snapshot().has(name)
 
-    def discover_services(self, module: Any) -> None:
+    def discover_services(self, module: Any) -> int:
         """Découvre et enregistre automatiquement les services dans un module.
 
-        Parcourt tous les membres du module et enregistre ceux qui ont
-        l'attribut `_is_service` à True.
+        Parcourt le dictionnaire du module (``vars(module)``) et enregistre
+        les callables dont l'attribut `_is_service` vaut True. Contrairement à
+        ``inspect.getmembers``, les membres ne sont ni triés ni lus par
+        ``getattr`` sur le module : un ``__getattr__`` de module n'est pas
+        déclenché. Les services sont enregistrés dans l'ordre de définition.
+        Un objet qui n'est pas un module (classe, instance) est parcouru par
+        ``inspect.getmembers``, qui inclut les membres hérités.
 
         :param module: Module Python à analyser.
         :type module: Any
+        :return: Nombre de services enregistrés.
+        :rtype: int
 
         :Example:
             >>> # Dans un module example.py:
@@ -102,15 +522,189 @@ class SymbolTable:
             >>> import example
             >>> table = SymbolTable()
             >>> table.discover_services(example)
+            1
             >>> table.has("my_func")
             True
         """
-        for name, obj in inspect.getmembers(module):
-            # Vérifier si c'est un service
-            # pylint: disable=protected-access
-            if callable(obj) and hasattr(obj, "_is_service") and obj._is_service:
-                service_name = getattr(obj, "_service_name", name)
-                self.register(service_name, obj)
+        start = time.perf_counter()
+        count = self._register_module(module)
+        self._record_discovery(1, count, time.perf_counter() - start)
+        return count
+
+    def discover_package(
+        self,
+        package: Union[ModuleType, str],
+        parallel: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, float]:
+        """Découvre et enregistre les services d'un paquet et de tous ses sous-modules.
+
+        Les sous-modules sont énumérés récursivement par ``pkgutil``, niveau
+        par niveau, et importés ; avec ``parallel``, les modules d'un même
+        niveau sont importés par un pool de threads (utile lorsque les imports
+        attendent le disque ou libèrent le GIL). Les services sont toujours
+        enregistrés par le thread appelant, le paquet d'abord puis ses
+        sous-modules par niveau et par nom : le résultat ne dépend pas de
+        l'ordre de fin des imports.
+
+        Une erreur d'import d'un sous-module est propagée.
+
+        :param package: Paquet (ou module) à analyser, ou son nom.
+        :type package: Union[ModuleType, str]
+        :param parallel: True pour importer les sous-modules en parallèle.
+        :type parallel: bool
+        :param max_workers: Nombre maximal de threads d'import (défaut de
+            ``ThreadPoolExecutor``).
+        :type max_workers: Optional[int]
+        :return: Nombre de modules analysés (``modules``), de services
+            enregistrés (``services``) et durée de la découverte en secondes,
+            imports compris (``seconds``).
+        :rtype: Dict[str, float]
+
+        :Example:
+            >>> table = SymbolTable()
+            >>> report = table.discover_package("my_services", parallel=True)
+            >>> report["modules"], report["services"]
+            (120, 640)
+        """
+        start = time.perf_counter()
+        if isinstance(package, str):
+            package = importlib.import_module(package)
+        modules = self.walk_package(package, parallel, max_workers)
+        with self.transaction():
+            count = sum(self._register_module(module) for module in modules)
+        seconds = time.perf_counter() - start
+        self._record_discovery(len(modules), count, seconds)
+        return {"modules": len(modules), "services": count, "seconds": seconds}
+
+    def discovery_stats(self) -> Dict[str, float]:
+        """Retourne le cumul des découvertes de services.
+
+        :return: Nombre de modules analysés (``modules``), de services
+            enregistrés (``services``) et durée cumulée en secondes
+            (``seconds``) par :meth:`discover_services` et
+            :meth:`discover_package`.
+        :rtype: Dict[str, float]
+
+        :Example:
+            >>> SymbolTable().discovery_stats()
+            {'modules': 0, 'services': 0, 'seconds': 0.0}
+        """
+        return dict(self._discovery)
+
+    def _replace_stale(self, name: str, lazy: LazyService, func: Callable[..., Any]) -> None:
+        """Remplace un service paresseux périmé par sa fonction, dans une nouvelle génération.
+
+        Les empreintes et validations calculées avec les métadonnées du
+        manifeste sont ainsi écartées. Rien n'est fait si le service a été
+        ré-enregistré entre-temps.
+
+        :param name: Nom du service.
+        :type name: str
+        :param lazy: Service paresseux périmé.
+        :type lazy: LazyService
+        :param func: Fonction importée.
+        :type func: Callable[..., Any]
+        """
+        with self.transaction():
+            if self._snapshot.get(name, resolve=False) is lazy:
+                self.register(name, func)
+
+    def _register_module(self, module: Any) -> int:
+        """Enregistre les services définis dans le dictionnaire d'un module.
+
+        :param module: Module Python à analyser.
+        :type module: Any
+        :return: Nombre de services enregistrés.
+        :rtype: int
+        """
+        services = self.module_services(module)
+        with self.transaction():
+            for service_name, _, func in services:
+                self.register(service_name, func)
+        return len(services)
+
+    @staticmethod
+    def module_services(module: Any) -> List[Tuple[str, str, Callable[..., Any]]]:
+        """Liste les services (fonctions décorées par ``@service``) d'un module.
+
+        Le dictionnaire d'un module est parcouru directement, dans l'ordre de
+        définition ; un autre objet est parcouru par ``inspect.getmembers``.
+
+        :param module: Module Python à analyser.
+        :type module: Any
+        :return: Nom du service, nom de l'attribut du module et fonction de
+            chaque service.
+        :rtype: List[Tuple[str, str, Callable[..., Any]]]
+        """
+        if isinstance(module, ModuleType):
+            # Copie : un import concurrent peut modifier le dictionnaire du module.
+            members = list(vars(module).items())
+        else:
+            members = inspect.getmembers(module)
+        return [
+            (getattr(obj, "_service_name", name), name, obj)
+            for name, obj in members
+            if getattr(obj, "_is_service", False) is True and callable(obj)
+        ]
+
+    @staticmethod
+    def walk_package(
+        package: ModuleType, parallel: bool = False, max_workers: Optional[int] = None
+    ) -> List[ModuleType]:
+        """Importe un paquet et tous ses sous-modules, niveau par niveau.
+
+        :param package: Paquet racine.
+        :type package: ModuleType
+        :param parallel: True pour importer chaque niveau en parallèle.
+        :type parallel: bool
+        :param max_workers: Nombre maximal de threads d'import.
+        :type max_workers: Optional[int]
+        :return: Le paquet puis ses sous-modules, par niveau et par nom.
+        :rtype: List[ModuleType]
+        """
+        # pylint: disable=import-outside-toplevel
+        import pkgutil
+        from concurrent.futures import ThreadPoolExecutor
+
+        modules = [package]
+        level = [package]
+        pool = (
+            ThreadPoolExecutor(max_workers, thread_name_prefix="baobab-discovery")
+            if parallel
+            else None
+        )
+        try:
+            while level:
+                names = [
+                    info.name
+                    for current in level
+                    if hasattr(current, "__path__")
+                    for info in pkgutil.iter_modules(current.__path__, current.__name__ + ".")
+                ]
+                if pool is not None and len(names) > 1:
+                    level = list(pool.map(importlib.import_module, names))
+                else:
+                    level = [importlib.import_module(name) for name in names]
+                modules.extend(level)
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        return modules
+
+    def _record_discovery(self, modules: int, services: int, seconds: float) -> None:
+        """Cumule une découverte dans :meth:`discovery_stats`.
+
+        :param modules: Nombre de modules analysés.
+        :type modules: int
+        :param services: Nombre de services enregistrés.
+        :type services: int
+        :param seconds: Durée de la découverte en secondes.
+        :type seconds: float
+        """
+        self._discovery["modules"] += modules
+        self._discovery["services"] += services
+        self._discovery["seconds"] += seconds
 
     def list_services(self) -> List[str]:
         """Liste tous les noms de services enregistrés.
@@ -125,7 +719,7 @@ class SymbolTable:
             >>> sorted(table.list_services())
             ['service1', 'service2']
         """
-        return list(self._symbols.keys())
+        return self.snapshot().list_services()
 
     def clear(self) -> None:
         """Vide la table des symboles.
@@ -141,4 +735,8 @@ class SymbolTable:
             >>> len(table.list_services())
             0
         """
-        self._symbols.clear()
+        with self._lock:
+            draft = self._next()
+            draft.clear()
+            if not self._depth:
+                self._generations[:] = draft.generations
@@ -0,0 +1,383 @@
+"""Module contenant la classe SymbolTableSnapshot, état publié d'une table des symboles."""
+
+import inspect
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from baobab_geek_interpreter.semantic.lazy_service import LazyService
+
+StaleHandler = Callable[[str, LazyService, Callable[..., Any]], None]
+"""Fonction appelée avec le nom, le service paresseux et la fonction importée
+lorsqu'un service paresseux se révèle périmé."""
+
+
+class SymbolTableSnapshot:  # pylint: disable=too-many-instance-attributes
+    """Instantané immuable et versionné des services d'une :class:`SymbolTable`.
+
+    Une table ne modifie jamais un instantané publié : ses écritures
+    s'appliquent à l'instantané suivant (:meth:`derive`, :meth:`assign`,
+    :meth:`clear`), non encore publié, qu'elle publie ensuite par une seule
+    affectation. Un lecteur qui conserve un instantané voit donc un
+    ensemble de services cohérent, quelles que soient les écritures
+    concurrentes, sans verrou.
+
+    Les slots d'un instantané publié n'étant jamais réutilisés, les
+    instantanés successifs d'une table partagent le dictionnaire des slots,
+    la liste des noms et, tant qu'aucun slot existant n'est modifié, les
+    tableaux des services et des générations : un nouveau service y est
+    ajouté à la fin, hors de la taille (``size``) des instantanés
+    précédents. Seule la modification d'un slot existant copie ces deux
+    tableaux, une seule fois par instantané. Les slots ajoutés par un
+    instantané suivant abandonné (transaction annulée), jamais publiés, sont
+    en revanche retirés de ces tableaux par :meth:`trim`, puis réattribués
+    aux écritures suivantes.
+
+    Seule exception, sans effet visible : un service paresseux importé est
+    remplacé en place par sa fonction, à génération égale ; tout lecteur
+    obtient la même fonction avant et après le remplacement. Un service
+    paresseux périmé (voir :attr:`LazyService.stale`) n'est pas remplacé
+    mais signalé à la table, qui publie un nouvel instantané.
+
+    :param version: Numéro de l'instantané, incrémenté à chaque publication.
+    :type version: int
+    :param size: Nombre de slots de l'instantané.
+    :type size: int
+    :param count: Nombre de services de l'instantané.
+    :type count: int
+    :param slots: Slot de chaque nom de service (partagé, complété seulement).
+    :type slots: Dict[str, int]
+    :param names: Nom du service de chaque slot (partagé, complété seulement).
+    :type names: List[str]
+    :param entries: Fonction de chaque slot (None pour un service supprimé).
+    :type entries: List[Optional[Callable[..., Any]]]
+    :param generations: Génération de chaque slot.
+    :type generations: List[int]
+    :param fingerprints: Empreintes de signature calculées, partagées entre
+        les instantanés d'une table.
+    :type fingerprints: Dict[int, Tuple[int, Optional[str]]]
+    :param on_stale: Fonction appelée pour un service paresseux périmé.
+    :type on_stale: StaleHandler
+
+    :ivar version: Numéro de l'instantané.
+    :type version: int
+    :ivar size: Nombre de slots de l'instantané.
+    :type size: int
+
+    :Example:
+        >>> table = SymbolTable()
+        >>> table.register("add", lambda a, b: a + b)
+        >>> snapshot = table.snapshot()
+        >>> table.register("sub", lambda a, b: a - b)
+        >>> snapshot.has("sub"), table.has("sub")
+        (False, True)
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self,
+        version: int,
+        size: int,
+        count: int,
+        slots: Dict[str, int],
+        names: List[str],
+        entries: List[Optional[Callable[..., Any]]],
+        generations: List[int],
+        fingerprints: Dict[int, Tuple[int, Optional[str]]],
+        on_stale: StaleHandler,
+    ) -> None:
+        """Initialise un instantané sur des tableaux qui ne seront plus modifiés
+        en deçà de ``size``.
+
+        :param version: Numéro de l'instantané.
+        :type version: int
+        :param size: Nombre de slots de l'instantané.
+        :type size: int
+        :param count: Nombre de services de l'instantané.
+        :type count: int
+        :param slots: Slot de chaque nom de service.
+        :type slots: Dict[str, int]
+        :param names: Nom du service de chaque slot.
+        :type names: List[str]
+        :param entries: Fonction de chaque slot.
+        :type entries: List[Optional[Callable[..., Any]]]
+        :param generations: Génération de chaque slot.
+        :type generations: List[int]
+        :param fingerprints: Empreintes de signature calculées.
+        :type fingerprints: Dict[int, Tuple[int, Optional[str]]]
+        :param on_stale: Fonction appelée pour un service paresseux périmé.
+        :type on_stale: StaleHandler
+        """
+        self.version = version
+        self.size = size
+        self._count = count
+        self._slots = slots
+        self._names = names
+        self._entries = entries
+        self._generations = generations
+        self._fingerprints = fingerprints
+        self._on_stale = on_stale
+        self._copied = False
+
+    @property
+    def generations(self) -> Tuple[int, ...]:
+        """Génération de chaque slot, indexée par slot.
+
+        :return: Générations des slots.
+        :rtype: Tuple[int, ...]
+        """
+        return tuple(self._generations[: self.size])
+
+    def derive(
+        self, registrations: Sequence[Tuple[str, Callable[..., Any]]] = (), cleared: bool = False
+    ) -> "SymbolTableSnapshot":
+        """Construit l'instantané suivant, sans modifier ce que celui-ci voit.
+
+        Doit être appelé sur le dernier instantané publié d'une table, par
+        un seul écrivain à la fois. L'instantané retourné n'est pas publié :
+        l'écrivain peut encore lui appliquer d'autres écritures
+        (:meth:`assign`, :meth:`clear`).
+
+        :param registrations: Nom et fonction de chaque service enregistré,
+            dans l'ordre.
+        :type registrations: Sequence[Tuple[str, Callable[..., Any]]]
+        :param cleared: True pour supprimer tous les services avant les
+            enregistrements (voir :meth:`SymbolTable.clear`).
+        :type cleared: bool
+        :return: Nouvel instantané, de version suivante.
+        :rtype: SymbolTableSnapshot
+        """
+        successor = SymbolTableSnapshot(
+            self.version + 1,
+            self.size,
+            self._count,
+            self._slots,
+            self._names,
+            self._entries,
+            self._generations,
+            self._fingerprints,
+            self._on_stale,
+        )
+        if cleared:
+            successor.clear()
+        for name, func in registrations:
+            successor.assign(name, func)
+        return successor
+
+    def assign(self, name: str, func: Callable[..., Any]) -> int:
+        """Enregistre un service dans un instantané non encore publié.
+
+        Un nouveau nom reçoit le slot suivant, ajouté à la fin des tableaux
+        partagés, hors de la taille des instantanés publiés. Un slot existant
+        change de génération ; les tableaux sont alors copiés, au plus une
+        fois par instantané.
+
+        :param name: Nom du service.
+        :type name: str
+        :param func: Fonction du service.
+        :type func: Callable[..., Any]
+        :return: Slot du service.
+        :rtype: int
+        """
+        slot = self._slots.get(name)
+        if slot is None:
+            slot = self.size
+            self._slots[name] = slot
+            self._names.append(name)
+            self._entries.append(func)
+            self._generations.append(0)
+            self.size += 1
+            self._count += 1
+            return slot
+        if not self._copied:
+            self._entries = list(self._entries)
+            self._generations = list(self._generations)
+            self._copied = True
+        if self._entries[slot] is None:
+            self._count += 1
+        self._entries[slot] = func
+        self._generations[slot] += 1
+        return slot
+
+    def clear(self) -> None:
+        """Supprime tous les services d'un instantané non encore publié.
+
+        Chaque slot conserve son nom et change de génération.
+        """
+        self._entries = [None] * self.size
+        self._generations = [generation + 1 for generation in self._generations[: self.size]]
+        self._count = 0
+        self._copied = True
+
+    def trim(self) -> None:
+        """Retire des tableaux partagés les slots ajoutés par un instantané
+        suivant abandonné (voir :meth:`SymbolTable.transaction`).
+
+        Doit être appelé sur le dernier instantané publié d'une table.
+        """
+        for name in self._names[self.size :]:
+            del self._slots[name]
+        del self._names[self.size :]
+        del self._entries[self.size :]
+        del self._generations[self.size :]
+
+    def get(self, name: str, resolve: bool = True) -> Optional[Callable[..., Any]]:
+        """Récupère un service par son nom (voir :meth:`SymbolTable.get`).
+
+        :param name: Nom du service.
+        :type name: str
+        :param resolve: False pour retourner un service paresseux sans
+            importer son module.
+        :type resolve: bool
+        :return: La fonction du service, ou None si non trouvé.
+        :rtype: Optional[Callable[..., Any]]
+        :raises ImportError: Si le module d'un service paresseux ne peut pas
+            être importé.
+        """
+        slot = self._slots.get(name)
+        if slot is None or slot >= self.size:
+            return None
+        func = self._entries[slot]
+        if resolve and func.__class__ is LazyService:
+            return self._resolve(slot, func)
+        return func
+
+    def slot_of(self, name: str) -> Optional[int]:
+        """Retourne le slot attribué à un nom de service.
+
+        :param name: Nom du service.
+        :type name: str
+        :return: Slot du service, ou None si le nom n'a jamais été enregistré.
+        :rtype: Optional[int]
+        """
+        slot = self._slots.get(name)
+        return slot if slot is not None and slot < self.size else None
+
+    def generation(self, slot: int) -> int:
+        """Retourne la génération d'un slot.
+
+        :param slot: Slot du service.
+        :type slot: int
+        :return: Génération du slot.
+        :rtype: int
+        :raises IndexError: Si le slot n'existe pas.
+        """
+        if slot >= self.size:
+            raise IndexError(f"Slot inconnu : {slot}")
+        return self._generations[slot]
+
+    def get_slot(self, slot: int, generation: int) -> Optional[Callable[..., Any]]:
+        """Récupère un service par son slot, si la génération correspond.
+
+        :param slot: Slot du service.
+        :type slot: int
+        :param generation: Génération observée lors de la résolution du slot.
+        :type generation: int
+        :return: La fonction du service, ou None si le slot est inconnu ou périmé.
+        :rtype: Optional[Callable[..., Any]]
+        """
+        if 0 <= slot < self.size and self._generations[slot] == generation:
+            func = self._entries[slot]
+            if func.__class__ is LazyService:
+                return self._resolve(slot, func)
+            return func
+        return None
+
+    def lookup(
+        self, name: str, slot: int = -1, generation: int = -1
+    ) -> Optional[Callable[..., Any]]:
+        """Récupère un service via son slot, avec repli sur la recherche par nom.
+
+        :param name: Nom du service.
+        :type name: str
+        :param slot: Slot résolu lors de l'analyse syntaxique (``-1`` si absent).
+        :type slot: int
+        :param generation: Génération observée lors de la résolution.
+        :type generation: int
+        :return: La fonction du service, ou None si non trouvé.
+        :rtype: Optional[Callable[..., Any]]
+        """
+        func = self.get_slot(slot, generation)
+        if func is None:
+            func = self.get(name)
+        return func
+
+    def signature_fingerprint(self, name: str) -> Optional[str]:
+        """Retourne l'empreinte de la signature d'un service.
+
+        Voir :meth:`SymbolTable.signature_fingerprint`.
+
+        :param name: Nom du service.
+        :type name: str
+        :return: Empreinte hexadécimale, ou None si le service est inconnu ou
+            si sa signature ne peut pas être inspectée.
+        :rtype: Optional[str]
+        """
+        func = self.get(name, resolve=False)
+        if func is None:
+            return None
+        slot = self._slots[name]
+        generation = self._generations[slot]
+        cached = self._fingerprints.get(slot)
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+
+        try:
+            if isinstance(func, LazyService):
+                signature = str(func.signature)
+            else:
+                signature = str(inspect.signature(func))
+        except (TypeError, ValueError):
+            fingerprint = None
+        else:
+            import hashlib  # pylint: disable=import-outside-toplevel
+
+            fingerprint = hashlib.sha256(f"{name}{signature}".encode("utf-8")).hexdigest()
+        self._fingerprints[slot] = (generation, fingerprint)
+        return fingerprint
+
+    def has(self, name: str) -> bool:
+        """Vérifie si un service existe dans l'instantané.
+
+        :param name: Nom du service.
+        :type name: str
+        :return: True si le service existe, False sinon.
+        :rtype: bool
+        """
+        return self.get(name, resolve=False) is not None
+
+    def list_services(self) -> List[str]:
+        """Liste les noms de services de l'instantané, dans l'ordre des slots.
+
+        :return: Liste des noms de services.
+        :rtype: List[str]
+        """
+        entries = self._entries
+        return [
+            name for slot, name in enumerate(self._names[: self.size]) if entries[slot] is not None
+        ]
+
+    def __len__(self) -> int:
+        """Retourne le nombre de services de l'instantané.
+
+        :return: Nombre de services.
+        :rtype: int
+        """
+        return self._count
+
+    def _resolve(self, slot: int, lazy: LazyService) -> Callable[..., Any]:
+        """Importe un service paresseux et le remplace par sa fonction.
+
+        :param slot: Slot du service.
+        :type slot: int
+        :param lazy: Service paresseux du slot.
+        :type lazy: LazyService
+        :return: Fonction du service.
+        :rtype: Callable[..., Any]
+        """
+        func = lazy.resolve()
+        name = self._names[slot]
+        if lazy.stale:
+            # Métadonnées du manifeste périmées : la table publie une nouvelle
+            # génération ; cet instantané conserve l'entrée paresseuse.
+            self._on_stale(name, lazy, func)
+        elif self._entries[slot] is lazy:
+            self._entries[slot] = func
+        return func
@@ -1,14 +1,29 @@
 """Module pour la vérification des types."""
 
 import inspect
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Generator,
+    Iterable,
+    Iterator,
+)
 from typing import Any, Callable, List, get_args, get_origin
 
+from baobab_geek_interpreter.semantic.bound_call import BoundCall
+
 
 class TypeChecker:
     """Vérificateur de types pour la validation des arguments de service.
 
     Effectue une validation stricte des types sans conversion automatique.
-    Support des types: int, float, str, list[T].
+    Support des types: int, float, str, list[T], et les flux Iterable[T],
+    Iterator[T] et Generator[T, ...] (``typing`` ou ``collections.abc``).
+
+    Un paramètre ``Iterable[T]`` accepte un tableau ; un paramètre
+    ``Iterator[T]`` ou ``Generator[T, ...]`` n'accepte que le résultat d'un
+    service imbriqué qui retourne un flux.
 
     :Example:
         >>> checker = TypeChecker()
@@ -18,11 +33,19 @@ class TypeChecker:
         True
     """
 
+    STREAM_TYPES = (Iterable, Iterator, Generator)
+    """Types de flux reconnus (origines ``collections.abc``)."""
+
+    ASYNC_STREAM_TYPES = (AsyncIterable, AsyncIterator, AsyncGenerator)
+    """Types de flux asynchrones reconnus, en retour de service uniquement."""
+
     @staticmethod
     def check_types(func: Callable[..., Any], args: List[Any]) -> bool:
         """Vérifie que les types des arguments correspondent à la signature.
 
-        Validation stricte sans conversion automatique.
+        Validation stricte sans conversion automatique. Un argument issu d'un
+        appel imbriqué (:class:`BoundCall`) est vérifié à partir de l'annotation
+        de retour du service appelé (voir :meth:`is_assignable`).
 
         :param func: Fonction dont on vérifie la signature.
         :type func: Callable[..., Any]
@@ -39,9 +62,21 @@ class TypeChecker:
             >>> TypeChecker.check_types(add, [1, "2"])
             False
         """
-        signature = inspect.signature(func)
-        params = list(signature.parameters.values())
+        return TypeChecker.check_parameters(list(inspect.signature(func).parameters.values()), args)
+
+    @staticmethod
+    def check_parameters(params: List[inspect.Parameter], args: List[Any]) -> bool:
+        """Vérifie des arguments avec des paramètres déjà extraits d'une signature.
 
+        Équivalent de :meth:`check_types` sans lecture de la signature.
+
+        :param params: Paramètres de la fonction, dans l'ordre.
+        :type params: List[inspect.Parameter]
+        :param args: Arguments à valider.
+        :type args: List[Any]
+        :return: True si les types correspondent, False sinon.
+        :rtype: bool
+        """
         # Vérifier le nombre d'arguments
         if len(args) != len(params):
             return False
@@ -53,11 +88,58 @@ class TypeChecker:
                 continue
 
             expected_type = param.annotation
-            if not TypeChecker._check_single_type(arg, expected_type):
+            if isinstance(arg, BoundCall):
+                return_type = inspect.signature(arg.func).return_annotation
+                if not TypeChecker.is_assignable(return_type, expected_type):
+                    return False
+            elif not TypeChecker._check_single_type(arg, expected_type):
                 return False
 
         return True
 
+    @staticmethod
+    def is_assignable(declared_type: Any, expected_type: Any) -> bool:
+        """Vérifie qu'un type déclaré est compatible avec un type attendu.
+
+        Utilisé pour les appels imbriqués, dont la valeur n'est connue qu'à
+        l'exécution. Un type déclaré absent (service sans annotation de
+        retour) est accepté ; ``list`` sans paramètre est compatible avec tout
+        type ``list[T]`` et inversement. Un type de flux attendu accepte tout
+        type déclaré dont l'origine en dérive (``Generator`` pour ``Iterator``,
+        ``list`` ou ``Iterator`` pour ``Iterable``), d'éléments compatibles.
+
+        :param declared_type: Type de retour déclaré par le service imbriqué.
+        :type declared_type: Any
+        :param expected_type: Type attendu par le paramètre.
+        :type expected_type: Any
+        :return: True si toute valeur du type déclaré est acceptée.
+        :rtype: bool
+
+        :Example:
+            >>> TypeChecker.is_assignable(list[int], list[int])
+            True
+            >>> TypeChecker.is_assignable(int, float)
+            False
+            >>> TypeChecker.is_assignable(Iterator[int], Iterable[int])
+            True
+        """
+        if declared_type is inspect.Signature.empty or declared_type == expected_type:
+            return True
+        expected_origin = get_origin(expected_type) or expected_type
+        if expected_origin is list or expected_origin in TypeChecker.STREAM_TYPES:
+            declared_origin = get_origin(declared_type) or declared_type
+            if not isinstance(declared_origin, type) or not issubclass(
+                declared_origin, expected_origin
+            ):
+                return False
+            declared_args, expected_args = get_args(declared_type), get_args(expected_type)
+            if not declared_args or not expected_args:
+                return True
+            return TypeChecker.is_assignable(declared_args[0], expected_args[0])
+        if isinstance(declared_type, type) and isinstance(expected_type, type):
+            return issubclass(declared_type, expected_type)
+        return False
+
     @staticmethod
     def _check_single_type(value: Any, expected_type: Any) -> bool:
         """Vérifie qu'une valeur correspond à un type attendu.
@@ -69,15 +151,14 @@ class TypeChecker:
         :return: True si le type correspond.
         :rtype: bool
         """
-        # Gérer les types génériques (list[int], etc.)
+        # Gérer les types génériques (list[int], Iterable[int], etc.)
         origin = get_origin(expected_type)
-        if origin is list:
-            # C'est un type list[T]
-            if not isinstance(value, list):
+        if origin is list or origin in TypeChecker.STREAM_TYPES:
+            if not isinstance(value, origin):
                 return False
             # Vérifier l'homogénéité du tableau
             type_args = get_args(expected_type)
-            if type_args:
+            if type_args and isinstance(value, list):
                 element_type = type_args[0]
                 return all(TypeChecker._check_single_type(item, element_type) for item in value)
             return True
@@ -85,6 +166,28 @@ class TypeChecker:
         # Type simple
         return isinstance(value, expected_type)
 
+    @staticmethod
+    def is_stream_type(annotation: Any) -> bool:
+        """Indique si une annotation désigne un flux (itérable ou itérateur abstrait).
+
+        La valeur d'un tel type peut n'être consommable qu'une seule fois : un
+        service qui retourne un flux n'est ni mémorisé ni fusionné.
+
+        :param annotation: Annotation de type.
+        :type annotation: Any
+        :return: True pour ``Iterable[T]``, ``Iterator[T]``, ``Generator[T, ...]``
+            ou leurs équivalents asynchrones.
+        :rtype: bool
+
+        :Example:
+            >>> TypeChecker.is_stream_type(Iterator[int])
+            True
+            >>> TypeChecker.is_stream_type(list[int])
+            False
+        """
+        origin = get_origin(annotation) or annotation
+        return origin in TypeChecker.STREAM_TYPES or origin in TypeChecker.ASYNC_STREAM_TYPES
+
     @staticmethod
     def is_array_homogeneous(array: List[Any]) -> bool:
         """Vérifie qu'un tableau est homogène (tous les éléments du même type).
@@ -123,6 +226,29 @@ class TypeChecker:
         """
         return any(isinstance(item, list) for item in array)
 
+    @staticmethod
+    def sample(array: List[Any], size: int) -> List[Any]:
+        """Retourne un échantillon d'éléments régulièrement espacés d'un tableau.
+
+        Le premier et le dernier élément font toujours partie de l'échantillon ;
+        un tableau d'au plus ``size`` éléments est retourné tel quel.
+
+        :param array: Tableau à échantillonner.
+        :type array: List[Any]
+        :param size: Nombre maximal d'éléments de l'échantillon (au moins 2).
+        :type size: int
+        :return: Échantillon, en temps proportionnel à ``size``.
+        :rtype: List[Any]
+
+        :Example:
+            >>> TypeChecker.sample(list(range(100)), 3)
+            [0, 50, 99]
+        """
+        last = len(array) - 1
+        if last < size:
+            return array
+        return [array[round(index * last / (size - 1))] for index in range(size)]
+
     @staticmethod
     def get_array_element_type(array: List[Any]) -> type:
         """Retourne le type des éléments d'un tableau homogène.
@@ -0,0 +1,181 @@
+"""Module contenant le cache en ligne des formes de types d'arguments d'un service."""
+
+import inspect
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from baobab_geek_interpreter.semantic.bound_call import BoundCall
+
+Shape = Tuple[Any, ...]
+"""Forme de types d'une liste d'arguments (voir :meth:`TypeShapeCache.shape_of`)."""
+
+
+class TypeShapeCache:
+    """Cache en ligne des formes de types d'arguments validées pour un service.
+
+    Un service reçoit presque toujours des arguments de même forme : types
+    des valeurs, type des éléments des tableaux, service des appels
+    imbriqués (par exemple ``(int, (list, int))``). Une forme validée par le
+    vérificateur complet (tableaux et :meth:`TypeChecker.check_types`) est
+    enregistrée ; un appel de forme connue saute alors l'interprétation des
+    annotations et ne paie que le calcul de sa forme.
+
+    Le cache est monomorphe avec une forme, polymorphe jusqu'à
+    ``max_shapes`` formes ; au-delà, il devient mégamorphe : les formes sont
+    oubliées et chaque appel passe par le vérificateur complet sans calculer
+    sa forme. Un tableau hétérogène ou imbriqué n'a pas de forme et passe
+    toujours par le vérificateur complet.
+
+    Le cache conserve aussi les paramètres du service (:attr:`parameters`),
+    lus une seule fois, pour les validations superficielles.
+
+    Les compteurs ne sont pas protégés par un verrou : ils peuvent être
+    approximatifs en cas d'analyses simultanées, sans effet sur la validation.
+
+    :param func: Fonction du service.
+    :type func: Callable[..., Any]
+    :param max_shapes: Nombre maximal de formes conservées.
+    :type max_shapes: int
+
+    :ivar func: Fonction du service.
+    :type func: Callable[..., Any]
+    :ivar hits: Nombre d'appels de forme connue.
+    :type hits: int
+    :ivar misses: Nombre d'appels passés par le vérificateur complet.
+    :type misses: int
+    :ivar megamorphic: True si le service a reçu trop de formes différentes.
+    :type megamorphic: bool
+
+    :Example:
+        >>> cache = TypeShapeCache(add)
+        >>> hit, shape = cache.lookup([1, 2])
+        >>> hit, shape
+        (False, (<class 'int'>, <class 'int'>))
+        >>> cache.record(shape)  # après validation complète
+        >>> cache.lookup([3, 4])[0]
+        True
+    """
+
+    MAX_SHAPES = 4
+    """Nombre maximal de formes conservées par défaut."""
+
+    def __init__(self, func: Callable[..., Any], max_shapes: int = MAX_SHAPES) -> None:
+        """Initialise un cache vide.
+
+        :param func: Fonction du service.
+        :type func: Callable[..., Any]
+        :param max_shapes: Nombre maximal de formes conservées.
+        :type max_shapes: int
+        """
+        self.func = func
+        self._max_shapes = max_shapes
+        self._shapes: List[Shape] = []
+        self._parameters: Optional[List[inspect.Parameter]] = None
+        self.hits = 0
+        self.misses = 0
+        self.megamorphic = False
+
+    @property
+    def parameters(self) -> List[inspect.Parameter]:
+        """Paramètres du service, dans l'ordre, lus une seule fois.
+
+        :return: Paramètres de la signature du service.
+        :rtype: List[inspect.Parameter]
+        """
+        if self._parameters is None:
+            self._parameters = list(inspect.signature(self.func).parameters.values())
+        return self._parameters
+
+    @staticmethod
+    def shape_of(args: Sequence[Any]) -> Optional[Shape]:
+        """Calcule la forme de types d'une liste d'arguments.
+
+        La forme d'une valeur est son type ; celle d'un tableau, le couple de
+        son type et du type commun de ses éléments (type seul s'il est vide) ;
+        celle d'un appel imbriqué, le couple :class:`BoundCall` et fonction du
+        service appelé. Deux listes d'arguments de même forme sont acceptées
+        ou refusées ensemble par le vérificateur complet.
+
+        :param args: Valeurs des arguments.
+        :type args: Sequence[Any]
+        :return: Forme des arguments, ou None si un tableau est hétérogène
+            ou imbriqué.
+        :rtype: Optional[Shape]
+
+        :Example:
+            >>> TypeShapeCache.shape_of([1, [2.0, 3.0], []])
+            (<class 'int'>, (<class 'list'>, <class 'float'>), (<class 'list'>,))
+            >>> TypeShapeCache.shape_of([[1, "2"]]) is None
+            True
+        """
+        shape: List[Any] = []
+        for arg in args:
+            kind = type(arg)
+            if isinstance(arg, list):
+                kinds = set(map(type, arg))
+                if not kinds:
+                    shape.append((kind,))
+                    continue
+                if len(kinds) > 1 or issubclass(next(iter(kinds)), list):
+                    return None
+                shape.append((kind, kinds.pop()))
+            elif kind is BoundCall:
+                shape.append((kind, arg.func))
+            else:
+                shape.append(kind)
+        return tuple(shape)
+
+    def lookup(self, args: Sequence[Any]) -> Tuple[bool, Optional[Shape]]:
+        """Cherche la forme d'une liste d'arguments parmi les formes validées.
+
+        :param args: Valeurs des arguments.
+        :type args: Sequence[Any]
+        :return: True si la forme est connue, puis la forme calculée (None si
+            elle n'a pas de forme ou si le cache est mégamorphe), à passer à
+            :meth:`record` après une validation complète réussie.
+        :rtype: Tuple[bool, Optional[Shape]]
+        """
+        if self.megamorphic:
+            self.misses += 1
+            return False, None
+        shape = self.shape_of(args)
+        if shape is not None and shape in self._shapes:
+            self.hits += 1
+            return True, shape
+        self.misses += 1
+        return False, shape
+
+    def record(self, shape: Optional[Shape]) -> None:
+        """Enregistre une forme validée par le vérificateur complet.
+
+        :param shape: Forme retournée par :meth:`lookup`.
+        :type shape: Optional[Shape]
+        """
+        if shape is None or self.megamorphic or shape in self._shapes:
+            return
+        if len(self._shapes) < self._max_shapes:
+            self._shapes.append(shape)
+        else:
+            self.megamorphic = True
+            self._shapes = []
+
+    def stats(self) -> Dict[str, float]:
+        """Retourne les statistiques du cache.
+
+        :return: Appels de forme connue (``hits``), appels vérifiés
+            complètement (``misses``), taux de succès (``hit_rate``), nombre
+            de formes conservées (``shapes``) et état mégamorphe
+            (``megamorphic``, 0 ou 1).
+        :rtype: Dict[str, float]
+
+        :Example:
+            >>> TypeShapeCache(add).stats()
+            {'hits': 0, 'misses': 0, 'hit_rate': 0.0, 'shapes': 0, 'megamorphic': 0}
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "shapes": len(self._shapes),
+            "megamorphic": int(self.megamorphic),
+        }
@@ -0,0 +1,28 @@
+"""Module contenant l'énumération des niveaux de validation sémantique."""
+
+from enum import Enum
+
+
+class ValidationLevel(str, Enum):
+    """Niveau de validation des arguments lors de l'analyse sémantique.
+
+    La résolution des services est toujours effectuée ; seul le coût de la
+    vérification des arguments change. Les valeurs sont des chaînes :
+    ``ValidationLevel("trusted")`` retourne :attr:`TRUSTED`.
+
+    :Example:
+        >>> ValidationLevel("shallow")
+        <ValidationLevel.SHALLOW: 'shallow'>
+    """
+
+    FULL = "full"
+    """Validation complète : nombre d'arguments, types, et chaque élément des
+    tableaux (homogénéité, absence d'imbrication, type des éléments)."""
+
+    SHALLOW = "shallow"
+    """Validation superficielle : nombre d'arguments, types de premier niveau,
+    et un échantillon borné d'éléments de chaque tableau, en temps constant
+    quelle que soit sa taille."""
+
+    TRUSTED = "trusted"
+    """Trafic de confiance : seul le nombre d'arguments est vérifié."""
@@ -1,17 +1,25 @@
 """Module pour l'analyse syntaxique."""
 
-from baobab_geek_interpreter.syntax.ast_node import (
-    ASTNode,
-    ASTVisitor,
-    ArgumentNode,
-    ArrayNode,
-    ConstantNode,
-    FloatNode,
-    IntNode,
-    ServiceCallNode,
-    StringNode,
-)
-from baobab_geek_interpreter.syntax.syntax_analyzer import SyntaxAnalyzer
+from baobab_geek_interpreter.lazy_exports import lazy_exports
+
+TYPE_CHECKING = False  # typing.TYPE_CHECKING, sans importer typing au démarrage
+if TYPE_CHECKING:
+    from baobab_geek_interpreter.syntax.ast_node import (
+        ASTNode,
+        ASTVisitor,
+        ArgumentNode,
+        ArrayNode,
+        ConstantNode,
+        FloatNode,
+        IntNode,
+        ServiceCallNode,
+        StringNode,
+    )
+    from baobab_geek_interpreter.syntax.ast_serializer import ASTSerializer
+    from baobab_geek_interpreter.syntax.columnar_ast import ColumnarAST
+    from baobab_geek_interpreter.syntax.columnar_node_adapter import ColumnarNodeAdapter
+    from baobab_geek_interpreter.syntax.node_kind import NodeKind
+    from baobab_geek_interpreter.syntax.syntax_analyzer import SyntaxAnalyzer
 
 __all__ = [
     "ASTNode",
@@ -24,4 +32,28 @@ __all__ = [
     "StringNode",
     "ArrayNode",
     "SyntaxAnalyzer",
+    "ColumnarAST",
+    "ColumnarNodeAdapter",
+    "NodeKind",
+    "ASTSerializer",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ASTNode": "baobab_geek_interpreter.syntax.ast_node",
+        "ASTVisitor": "baobab_geek_interpreter.syntax.ast_node",
+        "ArgumentNode": "baobab_geek_interpreter.syntax.ast_node",
+        "ArrayNode": "baobab_geek_interpreter.syntax.ast_node",
+        "ConstantNode": "baobab_geek_interpreter.syntax.ast_node",
+        "FloatNode": "baobab_geek_interpreter.syntax.ast_node",
+        "IntNode": "baobab_geek_interpreter.syntax.ast_node",
+        "ServiceCallNode": "baobab_geek_interpreter.syntax.ast_node",
+        "StringNode": "baobab_geek_interpreter.syntax.ast_node",
+        "ASTSerializer": "baobab_geek_interpreter.syntax.ast_serializer",
+        "ColumnarAST": "baobab_geek_interpreter.syntax.columnar_ast",
+        "ColumnarNodeAdapter": "baobab_geek_interpreter.syntax.columnar_node_adapter",
+        "NodeKind": "baobab_geek_interpreter.syntax.node_kind",
+        "SyntaxAnalyzer": "baobab_geek_interpreter.syntax.syntax_analyzer",
+    },
+)
@@ -1,7 +1,7 @@
 """Module contenant les classes de l'arbre syntaxique abstrait (AST)."""
 
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, List, Optional, Tuple, Union
 
 
 class ASTVisitor(ABC):
@@ -82,8 +82,13 @@ class ASTNode(ABC):
 
     Chaque nœud représente une construction syntaxique du langage
     et implémente la méthode accept() pour le pattern Visitor.
+
+    Les nœuds déclarent ``__slots__`` : ils n'ont pas de ``__dict__``, ce qui
+    réduit fortement la mémoire occupée par les grands tableaux de constantes.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def accept(self, visitor: ASTVisitor) -> Any:
         """Accepte un visiteur (pattern Visitor).
@@ -102,11 +107,28 @@ class ServiceCallNode(ASTNode):
     :type name: str
     :param arguments: Liste des arguments de l'appel.
     :type arguments: List[ArgumentNode]
+    :param slot: Slot du service dans la table des symboles (``-1`` si non résolu).
+    :type slot: int
+    :param generation: Génération du slot lors de la résolution.
+    :type generation: int
 
     :ivar name: Nom du service.
     :type name: str
     :ivar arguments: Liste des arguments.
     :type arguments: List[ArgumentNode]
+    :ivar slot: Slot du service résolu lors de l'analyse syntaxique.
+    :type slot: int
+    :ivar generation: Génération du slot lors de la résolution.
+    :type generation: int
+
+    La valeur d'un argument est une constante ou un appel de service imbriqué
+    (voir :data:`ArgumentValue`).
+
+    Un nœud peut aussi être construit en mode compact via :meth:`from_values` :
+    il ne stocke alors que les nœuds de constantes, sans enveloppe
+    :class:`ArgumentNode`. La propriété :attr:`arguments` reconstruit dans ce
+    cas des enveloppes temporaires afin que les visiteurs continuent de
+    recevoir ``visit_argument``.
 
     :Example:
         >>> node = ServiceCallNode("add", [arg1, arg2])
@@ -114,16 +136,106 @@ class ServiceCallNode(ASTNode):
         'add'
     """
 
-    def __init__(self, name: str, arguments: List["ArgumentNode"]) -> None:
+    __slots__ = ("name", "slot", "generation", "_arguments", "_values")
+
+    def __init__(
+        self,
+        name: str,
+        arguments: List["ArgumentNode"],
+        slot: int = -1,
+        generation: int = -1,
+    ) -> None:
         """Initialise un nœud d'appel de service.
 
         :param name: Nom du service.
         :type name: str
         :param arguments: Liste des arguments.
         :type arguments: List[ArgumentNode]
+        :param slot: Slot du service (``-1`` si non résolu).
+        :type slot: int
+        :param generation: Génération du slot lors de la résolution.
+        :type generation: int
         """
         self.name: str = name
-        self.arguments: List[ArgumentNode] = arguments
+        self.slot: int = slot
+        self.generation: int = generation
+        self._arguments: Optional[List[ArgumentNode]] = arguments
+        self._values: Optional[List[ArgumentValue]] = None
+
+    @classmethod
+    def from_values(
+        cls,
+        name: str,
+        values: List["ArgumentValue"],
+        slot: int = -1,
+        generation: int = -1,
+    ) -> "ServiceCallNode":
+        """Construit un nœud compact, sans enveloppes :class:`ArgumentNode`.
+
+        :param name: Nom du service.
+        :type name: str
+        :param values: Nœuds de valeurs des arguments.
+        :type values: List[ArgumentValue]
+        :param slot: Slot du service (``-1`` si non résolu).
+        :type slot: int
+        :param generation: Génération du slot lors de la résolution.
+        :type generation: int
+        :return: Nœud d'appel de service compact.
+        :rtype: ServiceCallNode
+
+        :Example:
+            >>> node = ServiceCallNode.from_values("double", [IntNode(21)])
+            >>> node.arguments[0].value.value
+            21
+        """
+        node = cls(name, [], slot, generation)
+        node._arguments = None
+        node._values = values
+        return node
+
+    @property
+    def arguments(self) -> List["ArgumentNode"]:
+        """Liste des arguments de l'appel.
+
+        En mode compact, les enveloppes sont recréées à chaque accès : les
+        modifications de la liste retournée ne sont pas conservées.
+
+        :return: Liste des nœuds d'arguments.
+        :rtype: List[ArgumentNode]
+        """
+        if self._arguments is not None:
+            return self._arguments
+        return [ArgumentNode(value) for value in self._values or []]
+
+    @arguments.setter
+    def arguments(self, arguments: List["ArgumentNode"]) -> None:
+        """Remplace la liste des arguments.
+
+        :param arguments: Nouvelle liste d'arguments.
+        :type arguments: List[ArgumentNode]
+        """
+        self._arguments = arguments
+        self._values = None
+
+    @property
+    def values(self) -> List["ArgumentValue"]:
+        """Nœuds de valeurs des arguments, sans enveloppe.
+
+        :return: Liste des nœuds de valeurs.
+        :rtype: List[ArgumentValue]
+        """
+        if self._values is not None:
+            return self._values
+        return [argument.value for argument in self._arguments or []]
+
+    @property
+    def is_compact(self) -> bool:
+        """Indique si le nœud a été construit sans enveloppes d'arguments.
+
+        :return: True si le nœud est compact.
+        :rtype: bool
+        """
+        return self._values is not None
 
     def accept(self, visitor: ASTVisitor) -> Any:
         """Accepte un visiteur.
@@ -139,24 +251,26 @@ class ServiceCallNode(ASTNode):
 class ArgumentNode(ASTNode):
     """Nœud représentant un argument d'appel de service.
 
-    :param value: Valeur constante de l'argument.
-    :type value: ConstantNode
+    :param value: Valeur de l'argument : constante ou appel de service imbriqué.
+    :type value: ArgumentValue
 
     :ivar value: Valeur de l'argument.
-    :type value: ConstantNode
+    :type value: ArgumentValue
 
     :Example:
         >>> int_node = IntNode(42)
         >>> arg = ArgumentNode(int_node)
     """
 
-    def __init__(self, value: "ConstantNode") -> None:
+    __slots__ = ("value",)
+
+    def __init__(self, value: "ArgumentValue") -> None:
         """Initialise un nœud d'argument.
 
-        :param value: Valeur constante de l'argument.
-        :type value: ConstantNode
+        :param value: Valeur de l'argument.
+        :type value: ArgumentValue
         """
-        self.value: ConstantNode = value
+        self.value: ArgumentValue = value
 
     def accept(self, visitor: ASTVisitor) -> Any:
         """Accepte un visiteur.
@@ -176,6 +290,8 @@ class ConstantNode(ASTNode):
     flottants, chaînes, ou tableaux.
     """
 
+    __slots__ = ()
+
 
 class IntNode(ConstantNode):
     """Nœud représentant un entier.
@@ -192,6 +308,8 @@ class IntNode(ConstantNode):
         42
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: int) -> None:
         """Initialise un nœud d'entier.
 
@@ -226,6 +344,8 @@ class FloatNode(ConstantNode):
         3.14
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: float) -> None:
         """Initialise un nœud de flottant.
 
@@ -260,6 +380,8 @@ class StringNode(ConstantNode):
         'hello'
     """
 
+    __slots__ = ("value",)
+
     def __init__(self, value: str) -> None:
         """Initialise un nœud de chaîne.
 
@@ -284,9 +406,14 @@ class ArrayNode(ConstantNode):
 
     :param elements: Liste des éléments du tableau.
     :type elements: List[ConstantNode]
+    :param span: Positions de début (incluse) et de fin (exclue) du tableau
+        dans le code source, si connues.
+    :type span: Optional[Tuple[int, int]]
 
     :ivar elements: Liste des éléments.
     :type elements: List[ConstantNode]
+    :ivar span: Positions du tableau dans le code source, ou None.
+    :type span: Optional[Tuple[int, int]]
 
     :Example:
         >>> node = ArrayNode([IntNode(1), IntNode(2)])
@@ -294,13 +421,20 @@ class ArrayNode(ConstantNode):
         2
     """
 
-    def __init__(self, elements: List[ConstantNode]) -> None:
+    __slots__ = ("elements", "span")
+
+    def __init__(
+        self, elements: List[ConstantNode], span: Optional[Tuple[int, int]] = None
+    ) -> None:
         """Initialise un nœud de tableau.
 
         :param elements: Liste des éléments du tableau.
         :type elements: List[ConstantNode]
+        :param span: Positions du tableau dans le code source.
+        :type span: Optional[Tuple[int, int]]
         """
         self.elements: List[ConstantNode] = elements
+        self.span: Optional[Tuple[int, int]] = span
 
     def accept(self, visitor: ASTVisitor) -> Any:
         """Accepte un visiteur.
@@ -311,3 +445,7 @@ class ArrayNode(ConstantNode):
         :rtype: Any
         """
         return visitor.visit_array(self)
+
+
+ArgumentValue = Union[ConstantNode, ServiceCallNode]
+"""Valeur d'un argument : constante ou appel de service imbriqué."""
@@ -0,0 +1,397 @@
+"""Module contenant la sérialisation binaire compacte des appels analysés."""
+
+import struct
+import sys
+from array import array
+from typing import Any, Callable, List, Tuple, Union
+
+from baobab_geek_interpreter.semantic.bound_call import BoundCall
+from baobab_geek_interpreter.syntax.ast_node import (
+    ArrayNode,
+    ASTNode,
+    ConstantNode,
+    FloatNode,
+    IntNode,
+    ServiceCallNode,
+    StringNode,
+)
+
+_FLOAT = struct.Struct("<d")
+
+
+class ASTSerializer:
+    """Sérialiseur binaire compact et versionné des appels de service.
+
+    Format (petit-boutiste) :
+
+    - en-tête : ``MAGIC`` (3 octets) puis ``VERSION`` (1 octet) ;
+    - nom du service : longueur varint puis UTF-8 ;
+    - nombre d'arguments (varint) puis chaque valeur, préfixée d'une étiquette.
+
+    Les entiers scalaires sont encodés en varint zigzag (taille arbitraire),
+    les flottants en float64 brut et les chaînes en UTF-8 préfixé de sa
+    longueur. Les tableaux homogènes sont encodés en bloc : float64 ou int64
+    bruts (varints si un entier dépasse int64) et chaînes concaténées.
+
+    Le décodage produit un :class:`ServiceCallNode` compact ; un
+    :class:`BoundCall` est sérialisé sous la même forme (nom et valeurs) et
+    doit être relié à la table des symboles après chargement.
+
+    :Example:
+        >>> node = ServiceCallNode.from_values("add", [IntNode(1), IntNode(2)])
+        >>> data = ASTSerializer.dumps(node)
+        >>> [value.value for value in ASTSerializer.loads(data).values]
+        [1, 2]
+    """
+
+    MAGIC = b"BGA"
+    """Signature des données sérialisées."""
+
+    VERSION = 1
+    """Version du format binaire."""
+
+    TAG_INT = 1
+    TAG_FLOAT = 2
+    TAG_STRING = 3
+    TAG_ARRAY = 4
+    TAG_INT64_ARRAY = 5
+    TAG_FLOAT64_ARRAY = 6
+    TAG_STRING_ARRAY = 7
+    TAG_VARINT_ARRAY = 8
+
+    @staticmethod
+    def dumps(call: Union[ServiceCallNode, BoundCall]) -> bytes:
+        """Sérialise un appel de service.
+
+        :param call: AST d'appel de service ou appel lié.
+        :type call: Union[ServiceCallNode, BoundCall]
+        :return: Données binaires.
+        :rtype: bytes
+        :raises ValueError: Si l'appel contient une valeur non sérialisable.
+        """
+        out = bytearray(ASTSerializer.MAGIC)
+        out.append(ASTSerializer.VERSION)
+        if isinstance(call, BoundCall):
+            ASTSerializer._write_string(out, call.service_name)
+            ASTSerializer._write_varint(out, len(call.arguments))
+            for value in call.arguments:
+                ASTSerializer._write_value(out, value)
+        else:
+            values = call.values
+            ASTSerializer._write_string(out, call.name)
+            ASTSerializer._write_varint(out, len(values))
+            for node in values:
+                ASTSerializer._write_node(out, node)
+        return bytes(out)
+
+    @staticmethod
+    def loads(data: bytes) -> ServiceCallNode:
+        """Désérialise un appel de service.
+
+        :param data: Données produites par :meth:`dumps`.
+        :type data: bytes
+        :return: AST compact de l'appel de service.
+        :rtype: ServiceCallNode
+        :raises ValueError: Si les données sont invalides, tronquées ou d'une autre version.
+        """
+        name, values = ASTSerializer.loads_values(data)
+        return ServiceCallNode.from_values(
+            name, [ASTSerializer._to_node(value) for value in values]
+        )
+
+    @staticmethod
+    def loads_values(data: bytes) -> Tuple[str, List[Any]]:
+        """Désérialise un appel de service directement en valeurs Python.
+
+        Évite la construction des nœuds de l'AST lorsque seul l'appel lié
+        est nécessaire (par exemple pour un cache d'appels).
+
+        :param data: Données produites par :meth:`dumps`.
+        :type data: bytes
+        :return: Nom du service (internalisé) et valeurs des arguments.
+        :rtype: Tuple[str, List[Any]]
+        :raises ValueError: Si les données sont invalides, tronquées ou d'une autre version.
+        """
+        view = memoryview(data)
+        header = len(ASTSerializer.MAGIC)
+        if bytes(view[:header]) != ASTSerializer.MAGIC:
+            raise ValueError("Invalid serialized call: bad magic")
+        if len(view) <= header or view[header] != ASTSerializer.VERSION:
+            raise ValueError("Unsupported serialized call version")
+        try:
+            name, pos = ASTSerializer._read_string(view, header + 1)
+            count, pos = ASTSerializer._read_varint(view, pos)
+            values: List[Any] = []
+            for _ in range(count):
+                value, pos = ASTSerializer._read_value(view, pos)
+                values.append(value)
+        except (IndexError, struct.error) as exc:
+            raise ValueError("Truncated serialized call") from exc
+        if pos != len(view):
+            raise ValueError("Trailing data after serialized call")
+        return sys.intern(name), values
+
+    @staticmethod
+    def _to_node(value: Any) -> ConstantNode:
+        """Construit le nœud de constante d'une valeur décodée.
+
+        :param value: Valeur décodée (int, float, str ou list).
+        :type value: Any
+        :return: Nœud de constante.
+        :rtype: ConstantNode
+        """
+        if isinstance(value, list):
+            return ArrayNode([ASTSerializer._to_node(item) for item in value])
+        if isinstance(value, int):
+            return IntNode(value)
+        if isinstance(value, float):
+            return FloatNode(value)
+        return StringNode(value)
+
+    @staticmethod
+    def _write_varint(out: bytearray, value: int) -> None:
+        """Écrit un entier positif en varint (7 bits par octet).
+
+        :param out: Tampon de sortie.
+        :type out: bytearray
+        :param value: Entier positif ou nul.
+        :type value: int
+        """
+        while value > 0x7F:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+
+    @staticmethod
+    def _write_signed(out: bytearray, value: int) -> None:
+        """Écrit un entier signé en varint zigzag.
+
+        :param out: Tampon de sortie.
+        :type out: bytearray
+        :param value: Entier signé.
+        :type value: int
+        """
+        ASTSerializer._write_varint(out, value * 2 if value >= 0 else -value * 2 - 1)
+
+    @staticmethod
+    def _write_string(out: bytearray, value: str) -> None:
+        """Écrit une chaîne UTF-8 préfixée de sa longueur.
+
+        :param out: Tampon de sortie.
+        :type out: bytearray
+        :param value: Chaîne à écrire.
+        :type value: str
+        """
+        encoded = value.encode("utf-8")
+        ASTSerializer._write_varint(out, len(encoded))
+        out += encoded
+
+    @staticmethod
+    def _write_node(out: bytearray, node: ASTNode) -> None:
+        """Écrit un nœud de constante.
+
+        :param out: Tampon de sortie.
+        :type out: bytearray
+        :param node: Nœud à écrire.
+        :type node: ASTNode
+        :raises ValueError: Si le nœud n'est pas une constante.
+        """
+        if isinstance(node, ArrayNode):
+            elements = node.elements
+            kinds = {type(element) for element in elements}
+            if len(kinds) == 1 and kinds.pop() in (IntNode, FloatNode, StringNode):
+                ASTSerializer._write_array(
+                    out, [element.value for element in elements]  # type: ignore[attr-defined]
+                )
+                return
+            out.append(ASTSerializer.TAG_ARRAY)
+            ASTSerializer._write_varint(out, len(elements))
+            for element in elements:
+                ASTSerializer._write_node(out, element)
+        elif isinstance(node, (IntNode, FloatNode, StringNode)):
+            ASTSerializer._write_value(out, node.value)
+        else:
+            raise ValueError(f"Cannot serialize node of type {type(node).__name__}")
+
+    @staticmethod
+    def _write_value(out: bytearray, value: Any) -> None:
+        """Écrit une valeur Python (int, float, str ou list).
+
+        :param out: Tampon de sortie.
+        :type out: bytearray
+        :param value: Valeur à écrire.
+        :type value: Any
+        :raises ValueError: Si le type de la valeur n'est pas supporté.
+        """
+        if isinstance(value, bool):
+            raise ValueError("Cannot serialize value of type bool")
+        if isinstance(value, int):
+            out.append(ASTSerializer.TAG_INT)
+            ASTSerializer._write_signed(out, value)
+        elif isinstance(value, float):
+            out.append(ASTSerializer.TAG_FLOAT)
+            out += _FLOAT.pack(value)
+        elif isinstance(value, str):
+            out.append(ASTSerializer.TAG_STRING)
+            ASTSerializer._write_string(out, value)
+        elif isinstance(value, list):
+            kinds = {type(item) for item in value}
+            if len(kinds) == 1 and kinds.pop() in (int, float, str):
+                ASTSerializer._write_array(out, value)
+                return
+            out.append(ASTSerializer.TAG_ARRAY)
+            ASTSerializer._write_varint(out, len(value))
+            for item in value:
+                ASTSerializer._write_value(out, item)
+        else:
+            raise ValueError(f"Cannot serialize value of type {type(value).__name__}")
+
+    @staticmethod
+    def _write_array(out: bytearray, values: List[Any]) -> None:
+        """Écrit un tableau homogène non vide de scalaires en bloc.
+
+        :param out: Tampon de sortie.
+        :type out: bytearray
+        :param values: Valeurs du tableau, toutes du même type.
+        :type values: List[Any]
+        """
+        first = values[0]
+        if isinstance(first, str):
+            out.append(ASTSerializer.TAG_STRING_ARRAY)
+            ASTSerializer._write_varint(out, len(values))
+            for item in values:
+                ASTSerializer._write_string(out, item)
+            return
+
+        if isinstance(first, float):
+            tag, block = ASTSerializer.TAG_FLOAT64_ARRAY, array("d", values)
+        else:
+            try:
+                tag, block = ASTSerializer.TAG_INT64_ARRAY, array("q", values)
+            except OverflowError:
+                out.append(ASTSerializer.TAG_VARINT_ARRAY)
+                ASTSerializer._write_varint(out, len(values))
+                for item in values:
+                    ASTSerializer._write_signed(out, item)
+                return
+        if sys.byteorder == "big":  # pragma: no cover
+            block.byteswap()
+        out.append(tag)
+        ASTSerializer._write_varint(out, len(values))
+        out += block.tobytes()
+
+    @staticmethod
+    def _read_varint(view: memoryview, pos: int) -> Tuple[int, int]:
+        """Lit un entier positif encodé en varint.
+
+        :param view: Données.
+        :type view: memoryview
+        :param pos: Position de lecture.
+        :type pos: int
+        :return: Valeur lue et nouvelle position.
+        :rtype: Tuple[int, int]
+        """
+        result = 0
+        shift = 0
+        while True:
+            byte = view[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result, pos
+            shift += 7
+
+    @staticmethod
+    def _read_signed(view: memoryview, pos: int) -> Tuple[int, int]:
+        """Lit un entier signé encodé en varint zigzag.
+
+        :param view: Données.
+        :type view: memoryview
+        :param pos: Position de lecture.
+        :type pos: int
+        :return: Valeur lue et nouvelle position.
+        :rtype: Tuple[int, int]
+        """
+        raw, pos = ASTSerializer._read_varint(view, pos)
+        return (raw >> 1) if not raw & 1 else -((raw + 1) >> 1), pos
+
+    @staticmethod
+    def _read_string(view: memoryview, pos: int) -> Tuple[str, int]:
+        """Lit une chaîne UTF-8 préfixée de sa longueur.
+
+        :param view: Données.
+        :type view: memoryview
+        :param pos: Position de lecture.
+        :type pos: int
+        :return: Chaîne lue et nouvelle position.
+        :rtype: Tuple[str, int]
+        """
+        length, pos = ASTSerializer._read_varint(view, pos)
+        end = pos + length
+        if end > len(view):
+            raise IndexError("string out of range")
+        return str(view[pos:end], "utf-8"), end
+
+    @staticmethod
+    def _read_block(view: memoryview, pos: int, typecode: str) -> Tuple[List[Any], int]:
+        """Lit un bloc brut de nombres de 8 octets.
+
+        :param view: Données.
+        :type view: memoryview
+        :param pos: Position de lecture.
+        :type pos: int
+        :param typecode: Code de type ``array`` (``"q"`` ou ``"d"``).
+        :type typecode: str
+        :return: Valeurs lues et nouvelle position.
+        :rtype: Tuple[List[Any], int]
+        """
+        count, pos = ASTSerializer._read_varint(view, pos)
+        end = pos + count * 8
+        if end > len(view):
+            raise IndexError("block out of range")
+        block = array(typecode)
+        block.frombytes(view[pos:end])
+        if sys.byteorder == "big":  # pragma: no cover
+            block.byteswap()
+        return block.tolist(), end
+
+    @staticmethod
+    def _read_value(view: memoryview, pos: int) -> Tuple[Any, int]:
+        """Lit une valeur étiquetée.
+
+        :param view: Données.
+        :type view: memoryview
+        :param pos: Position de lecture.
+        :type pos: int
+        :return: Valeur lue et nouvelle position.
+        :rtype: Tuple[Any, int]
+        :raises ValueError: Si l'étiquette est inconnue.
+        """
+        tag = view[pos]
+        pos += 1
+        if tag == ASTSerializer.TAG_INT:
+            return ASTSerializer._read_signed(view, pos)
+        if tag == ASTSerializer.TAG_FLOAT:
+            return _FLOAT.unpack_from(view, pos)[0], pos + 8
+        if tag == ASTSerializer.TAG_STRING:
+            return ASTSerializer._read_string(view, pos)
+        if tag == ASTSerializer.TAG_INT64_ARRAY:
+            return ASTSerializer._read_block(view, pos, "q")
+        if tag == ASTSerializer.TAG_FLOAT64_ARRAY:
+            return ASTSerializer._read_block(view, pos, "d")
+
+        reader: Callable[[memoryview, int], Tuple[Any, int]]
+        if tag == ASTSerializer.TAG_STRING_ARRAY:
+            reader = ASTSerializer._read_string
+        elif tag == ASTSerializer.TAG_VARINT_ARRAY:
+            reader = ASTSerializer._read_signed
+        elif tag == ASTSerializer.TAG_ARRAY:
+            reader = ASTSerializer._read_value
+        else:
+            raise ValueError(f"Unknown tag {tag} in serialized call")
+        count, pos = ASTSerializer._read_varint(view, pos)
+        items: List[Any] = []
+        for _ in range(count):
+            item, pos = reader(view, pos)
+            items.append(item)
+        return items, pos
@@ -0,0 +1,361 @@
+"""Module contenant l'AST colonnaire (structure de tableaux)."""
+
+from array import array
+from typing import TYPE_CHECKING, Any, Iterator, List
+
+from baobab_geek_interpreter.syntax.ast_node import (
+    ArgumentNode,
+    ArrayNode,
+    ASTNode,
+    ASTVisitor,
+    FloatNode,
+    IntNode,
+    ServiceCallNode,
+    StringNode,
+)
+from baobab_geek_interpreter.syntax.node_kind import NodeKind
+
+if TYPE_CHECKING:
+    from baobab_geek_interpreter.syntax.columnar_node_adapter import ColumnarNodeAdapter
+
+
+class ColumnarAST:  # pylint: disable=too-many-instance-attributes
+    """Représentation colonnaire d'un appel de service.
+
+    Au lieu d'un objet par nœud, l'arbre est stocké dans des colonnes
+    parallèles ``array.array`` indexées par numéro de nœud, en ordre préfixe :
+
+    - ``kinds`` : type du nœud (:class:`NodeKind`) ;
+    - ``parents`` : index du nœud parent (``-1`` pour la racine) ;
+    - ``offsets`` : index de la valeur dans le pool correspondant au type
+      (nombre d'éléments pour un tableau, index du nom pour l'appel) ;
+    - ``spans`` : taille du sous-arbre enraciné en ce nœud (lui compris).
+
+    Les constantes sont stockées dans des pools typés : ``ints`` (int64),
+    ``floats`` (float64), ``strings`` (table des chaînes) et ``big_ints``
+    pour les entiers hors de l'intervalle int64.
+
+    Les éléments scalaires d'un tableau homogène occupent des positions
+    contiguës de leur pool, ce qui permet de les matérialiser par tranche.
+
+    :ivar kinds: Colonne des types de nœuds.
+    :type kinds: array
+    :ivar parents: Colonne des index des parents.
+    :type parents: array
+    :ivar offsets: Colonne des index de valeurs.
+    :type offsets: array
+    :ivar spans: Colonne des tailles de sous-arbres.
+    :type spans: array
+    :ivar ints: Pool des entiers int64.
+    :type ints: array
+    :ivar floats: Pool des flottants float64.
+    :type floats: array
+    :ivar strings: Table des chaînes.
+    :type strings: List[str]
+    :ivar big_ints: Pool des entiers hors int64.
+    :type big_ints: List[int]
+    :ivar slot: Slot du service résolu (``-1`` si non résolu).
+    :type slot: int
+    :ivar generation: Génération du slot lors de la résolution.
+    :type generation: int
+
+    :Example:
+        >>> ast = ColumnarAST()
+        >>> root = ast.open_service_call("sum")
+        >>> array_index = ast.open_array(root)
+        >>> ast.add_int(array_index, 1)
+        2
+        >>> ast.add_int(array_index, 2)
+        3
+        >>> ast.close(array_index, 2)
+        >>> ast.close(root, 1)
+        >>> ast.argument_values()
+        [[1, 2]]
+    """
+
+    def __init__(self) -> None:
+        """Initialise un AST colonnaire vide."""
+        self.kinds: "array[int]" = array("B")
+        self.parents: "array[int]" = array("q")
+        self.offsets: "array[int]" = array("q")
+        self.spans: "array[int]" = array("q")
+        self.ints: "array[int]" = array("q")
+        self.floats: "array[float]" = array("d")
+        self.strings: List[str] = []
+        self.big_ints: List[int] = []
+        self.slot: int = -1
+        self.generation: int = -1
+
+    def __len__(self) -> int:
+        """Retourne le nombre de nœuds.
+
+        :return: Nombre de nœuds.
+        :rtype: int
+        """
+        return len(self.kinds)
+
+    @property
+    def name(self) -> str:
+        """Nom du service appelé par la racine.
+
+        :return: Nom du service.
+        :rtype: str
+        """
+        return self.strings[self.offsets[0]]
+
+    def _add_node(self, kind: NodeKind, parent: int, offset: int) -> int:
+        """Ajoute un nœud feuille et retourne son index.
+
+        :param kind: Type du nœud.
+        :type kind: NodeKind
+        :param parent: Index du parent.
+        :type parent: int
+        :param offset: Index de la valeur.
+        :type offset: int
+        :return: Index du nœud.
+        :rtype: int
+        """
+        index = len(self.kinds)
+        self.kinds.append(kind)
+        self.parents.append(parent)
+        self.offsets.append(offset)
+        self.spans.append(1)
+        return index
+
+    def open_service_call(self, name: str) -> int:
+        """Ajoute le nœud racine d'appel de service.
+
+        :param name: Nom du service.
+        :type name: str
+        :return: Index du nœud (toujours 0).
+        :rtype: int
+        """
+        self.strings.append(name)
+        return self._add_node(NodeKind.SERVICE_CALL, -1, len(self.strings) - 1)
+
+    def open_array(self, parent: int) -> int:
+        """Ajoute un nœud de tableau, à fermer avec :meth:`close`.
+
+        :param parent: Index du parent.
+        :type parent: int
+        :return: Index du nœud.
+        :rtype: int
+        """
+        return self._add_node(NodeKind.ARRAY, parent, 0)
+
+    def close(self, index: int, count: int) -> None:
+        """Ferme un nœud composite après l'ajout de ses enfants.
+
+        :param index: Index du nœud à fermer.
+        :type index: int
+        :param count: Nombre d'enfants directs.
+        :type count: int
+        """
+        if self.kinds[index] == NodeKind.ARRAY:
+            self.offsets[index] = count
+        self.spans[index] = len(self.kinds) - index
+
+    def add_int(self, parent: int, value: int) -> int:
+        """Ajoute un entier.
+
+        :param parent: Index du parent.
+        :type parent: int
+        :param value: Valeur entière.
+        :type value: int
+        :return: Index du nœud.
+        :rtype: int
+        """
+        try:
+            self.ints.append(value)
+        except OverflowError:
+            self.big_ints.append(value)
+            return self._add_node(NodeKind.BIG_INT, parent, len(self.big_ints) - 1)
+        return self._add_node(NodeKind.INT, parent, len(self.ints) - 1)
+
+    def add_float(self, parent: int, value: float) -> int:
+        """Ajoute un flottant.
+
+        :param parent: Index du parent.
+        :type parent: int
+        :param value: Valeur flottante.
+        :type value: float
+        :return: Index du nœud.
+        :rtype: int
+        """
+        self.floats.append(value)
+        return self._add_node(NodeKind.FLOAT, parent, len(self.floats) - 1)
+
+    def add_string(self, parent: int, value: str) -> int:
+        """Ajoute une chaîne.
+
+        :param parent: Index du parent.
+        :type parent: int
+        :param value: Valeur de la chaîne.
+        :type value: str
+        :return: Index du nœud.
+        :rtype: int
+        """
+        self.strings.append(value)
+        return self._add_node(NodeKind.STRING, parent, len(self.strings) - 1)
+
+    def children(self, index: int) -> Iterator[int]:
+        """Itère sur les index des enfants directs d'un nœud.
+
+        :param index: Index du nœud.
+        :type index: int
+        :return: Itérateur sur les index des enfants.
+        :rtype: Iterator[int]
+        """
+        child = index + 1
+        end = index + self.spans[index]
+        while child < end:
+            yield child
+            child += self.spans[child]
+
+    def argument_indices(self) -> List[int]:
+        """Retourne les index des arguments de l'appel racine.
+
+        :return: Index des nœuds arguments.
+        :rtype: List[int]
+        """
+        return list(self.children(0))
+
+    def scalar_kind(self, index: int) -> int:
+        """Retourne le type commun des éléments d'un tableau plat et homogène.
+
+        La vérification s'effectue sur la colonne ``kinds`` en temps natif.
+
+        :param index: Index du nœud de tableau.
+        :type index: int
+        :return: Type commun des éléments, ou ``-1`` si le tableau est vide,
+            imbriqué ou hétérogène.
+        :rtype: int
+        """
+        count = self.offsets[index]
+        if count == 0 or self.spans[index] != count + 1:
+            return -1
+        kind = self.kinds[index + 1]
+        if kind == NodeKind.ARRAY:
+            return -1
+        if self.kinds[index + 1 : index + 1 + count].count(kind) != count:
+            return -1
+        return kind
+
+    def value(self, index: int) -> Any:
+        """Retourne la valeur d'une constante scalaire.
+
+        :param index: Index du nœud.
+        :type index: int
+        :return: Valeur de la constante.
+        :rtype: Any
+        :raises ValueError: Si le nœud n'est pas une constante scalaire.
+        """
+        kind = self.kinds[index]
+        offset = self.offsets[index]
+        if kind == NodeKind.INT:
+            return self.ints[offset]
+        if kind == NodeKind.FLOAT:
+            return self.floats[offset]
+        if kind == NodeKind.STRING:
+            return self.strings[offset]
+        if kind == NodeKind.BIG_INT:
+            return self.big_ints[offset]
+        raise ValueError(f"Node {index} is not a scalar constant")
+
+    def materialize(self, index: int) -> Any:
+        """Construit la valeur Python d'une constante (scalaire ou tableau).
+
+        Les tableaux plats et homogènes sont matérialisés par tranche de pool.
+
+        :param index: Index du nœud.
+        :type index: int
+        :return: Valeur Python de la constante.
+        :rtype: Any
+        """
+        if self.kinds[index] != NodeKind.ARRAY:
+            return self.value(index)
+        kind = self.scalar_kind(index)
+        if kind != -1:
+            first = self.offsets[index + 1]
+            last = first + self.offsets[index]
+            if kind == NodeKind.INT:
+                return self.ints[first:last].tolist()
+            if kind == NodeKind.FLOAT:
+                return self.floats[first:last].tolist()
+            if kind == NodeKind.STRING:
+                return self.strings[first:last]
+        return [self.materialize(child) for child in self.children(index)]
+
+    def argument_values(self) -> List[Any]:
+        """Matérialise les valeurs des arguments de l'appel racine.
+
+        :return: Valeurs des arguments.
+        :rtype: List[Any]
+        """
+        return [self.materialize(child) for child in self.children(0)]
+
+    def root(self) -> "ColumnarNodeAdapter":
+        """Retourne un adaptateur en lecture seule sur la racine.
+
+        :return: Adaptateur présentant l'interface des nœuds de l'AST.
+        :rtype: ColumnarNodeAdapter
+        """
+        from baobab_geek_interpreter.syntax.columnar_node_adapter import (
+            ColumnarNodeAdapter,
+        )
+
+        return ColumnarNodeAdapter(self, 0)
+
+    def accept(self, visitor: ASTVisitor) -> Any:
+        """Fait visiter l'arbre par un visiteur de l'AST objet.
+
+        :param visitor: Visiteur à accepter.
+        :type visitor: ASTVisitor
+        :return: Résultat de la visite.
+        :rtype: Any
+        """
+        return self.root().accept(visitor)
+
+    @classmethod
+    def from_node(cls, node: ServiceCallNode) -> "ColumnarAST":
+        """Convertit un AST objet en AST colonnaire.
+
+        :param node: Nœud racine de l'AST objet.
+        :type node: ServiceCallNode
+        :return: AST colonnaire équivalent.
+        :rtype: ColumnarAST
+        """
+        ast = cls()
+        root = ast.open_service_call(node.name)
+        ast.slot = node.slot
+        ast.generation = node.generation
+        values = node.values
+        for value in values:
+            ast._add_constant(root, value)
+        ast.close(root, len(values))
+        return ast
+
+    def _add_constant(self, parent: int, node: ASTNode) -> None:
+        """Ajoute récursivement un nœud de constante de l'AST objet.
+
+        :param parent: Index du parent.
+        :type parent: int
+        :param node: Nœud de constante à ajouter.
+        :type node: ASTNode
+        :raises ValueError: Si le nœud n'est pas une constante.
+        """
+        if isinstance(node, ArgumentNode):
+            self._add_constant(parent, node.value)
+        elif isinstance(node, IntNode):
+            self.add_int(parent, node.value)
+        elif isinstance(node, FloatNode):
+            self.add_float(parent, node.value)
+        elif isinstance(node, StringNode):
+            self.add_string(parent, node.value)
+        elif isinstance(node, ArrayNode):
+            index = self.open_array(parent)
+            for element in node.elements:
+                self._add_constant(index, element)
+            self.close(index, len(node.elements))
+        else:
+            raise ValueError(f"Unsupported node type: {type(node).__name__}")
@@ -0,0 +1,138 @@
+"""Module contenant l'adaptateur de nœud sur un AST colonnaire."""
+
+from typing import Any, List
+
+from baobab_geek_interpreter.syntax.ast_node import ArgumentNode, ASTNode, ASTVisitor
+from baobab_geek_interpreter.syntax.columnar_ast import ColumnarAST
+from baobab_geek_interpreter.syntax.node_kind import NodeKind
+
+
+class ColumnarNodeAdapter(ASTNode):
+    """Vue en lecture seule d'un nœud de :class:`ColumnarAST`.
+
+    Présente les attributs des nœuds de l'AST objet (``name``, ``arguments``,
+    ``values``, ``value``, ``elements``) calculés à partir des colonnes, et
+    répartit ``accept`` vers la méthode ``visit_*`` correspondant au type du
+    nœud. Les visiteurs existants (:class:`ASTVisitor`) fonctionnent ainsi sans
+    modification. Les adaptateurs des enfants ne sont créés qu'à la demande.
+
+    :param ast: AST colonnaire sous-jacent.
+    :type ast: ColumnarAST
+    :param index: Index du nœud dans les colonnes.
+    :type index: int
+
+    :Example:
+        >>> ast = ColumnarAST()
+        >>> root = ast.open_service_call("double")
+        >>> ast.add_int(root, 21)
+        1
+        >>> ast.close(root, 1)
+        >>> ast.root().arguments[0].value.value
+        21
+    """
+
+    __slots__ = ("_ast", "_index")
+
+    def __init__(self, ast: ColumnarAST, index: int) -> None:
+        """Initialise l'adaptateur.
+
+        :param ast: AST colonnaire sous-jacent.
+        :type ast: ColumnarAST
+        :param index: Index du nœud.
+        :type index: int
+        """
+        self._ast = ast
+        self._index = index
+
+    @property
+    def kind(self) -> NodeKind:
+        """Type du nœud.
+
+        :return: Type du nœud.
+        :rtype: NodeKind
+        """
+        return NodeKind(self._ast.kinds[self._index])
+
+    @property
+    def name(self) -> str:
+        """Nom du service (nœud d'appel uniquement).
+
+        :return: Nom du service.
+        :rtype: str
+        """
+        return self._ast.strings[self._ast.offsets[self._index]]
+
+    @property
+    def slot(self) -> int:
+        """Slot du service résolu (nœud d'appel uniquement).
+
+        :return: Slot du service.
+        :rtype: int
+        """
+        return self._ast.slot
+
+    @property
+    def generation(self) -> int:
+        """Génération du slot lors de la résolution (nœud d'appel uniquement).
+
+        :return: Génération du slot.
+        :rtype: int
+        """
+        return self._ast.generation
+
+    @property
+    def values(self) -> List["ColumnarNodeAdapter"]:
+        """Adaptateurs des valeurs des arguments (nœud d'appel uniquement).
+
+        :return: Adaptateurs des arguments.
+        :rtype: List[ColumnarNodeAdapter]
+        """
+        return [ColumnarNodeAdapter(self._ast, child) for child in self._ast.children(self._index)]
+
+    @property
+    def arguments(self) -> List[ArgumentNode]:
+        """Arguments enveloppés (nœud d'appel uniquement).
+
+        :return: Nœuds d'arguments.
+        :rtype: List[ArgumentNode]
+        """
+        values: List[Any] = self.values
+        return [ArgumentNode(value) for value in values]
+
+    @property
+    def elements(self) -> List["ColumnarNodeAdapter"]:
+        """Adaptateurs des éléments (nœud de tableau uniquement).
+
+        :return: Adaptateurs des éléments.
+        :rtype: List[ColumnarNodeAdapter]
+        """
+        return self.values
+
+    @property
+    def value(self) -> Any:
+        """Valeur de la constante scalaire.
+
+        :return: Valeur de la constante.
+        :rtype: Any
+        """
+        return self._ast.value(self._index)
+
+    def accept(self, visitor: ASTVisitor) -> Any:
+        """Accepte un visiteur selon le type du nœud.
+
+        :param visitor: Visiteur à accepter.
+        :type visitor: ASTVisitor
+        :return: Résultat de la visite.
+        :rtype: Any
+        """
+        kind = self._ast.kinds[self._index]
+        node: Any = self
+        if kind == NodeKind.SERVICE_CALL:
+            return visitor.visit_service_call(node)
+        if kind == NodeKind.ARRAY:
+            return visitor.visit_array(node)
+        if kind == NodeKind.FLOAT:
+            return visitor.visit_float(node)
+        if kind == NodeKind.STRING:
+            return visitor.visit_string(node)
+        return visitor.visit_int(node)
@@ -0,0 +1,33 @@
+"""Module contenant l'énumération des types de nœuds de l'AST colonnaire."""
+
+from enum import IntEnum
+
+
+class NodeKind(IntEnum):
+    """Énumération des types de nœuds stockés dans un :class:`ColumnarAST`.
+
+    Les valeurs sont des petits entiers afin d'être stockées dans une colonne
+    ``array.array("B")``.
+
+    :Example:
+        >>> NodeKind.INT
+        <NodeKind.INT: 1>
+    """
+
+    SERVICE_CALL = 0
+    """Appel de service (valeur : index du nom dans la table des chaînes)."""
+
+    INT = 1
+    """Entier tenant sur 64 bits (valeur : index dans le pool int64)."""
+
+    FLOAT = 2
+    """Flottant (valeur : index dans le pool float64)."""
+
+    STRING = 3
+    """Chaîne (valeur : index dans la table des chaînes)."""
+
+    ARRAY = 4
+    """Tableau (valeur : nombre d'éléments)."""
+
+    BIG_INT = 5
+    """Entier hors de l'intervalle int64 (valeur : index dans le pool d'objets)."""
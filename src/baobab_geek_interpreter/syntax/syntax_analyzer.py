@@ -1,6 +1,6 @@
 """Module contenant l'analyseur syntaxique pour le langage geek."""
 
-from typing import List
+from typing import TYPE_CHECKING, List, Optional, Tuple
 
 from baobab_geek_interpreter.exceptions.syntax_exception import (
     BaobabSyntaxAnalyserException,
@@ -9,6 +9,7 @@ from baobab_geek_interpreter.lexical.token import Token
 from baobab_geek_interpreter.lexical.token_type import TokenType
 from baobab_geek_interpreter.syntax.ast_node import (
     ArgumentNode,
+    ArgumentValue,
     ArrayNode,
     ConstantNode,
     FloatNode,
@@ -16,6 +17,10 @@ from baobab_geek_interpreter.syntax.ast_node import (
     ServiceCallNode,
     StringNode,
 )
+from baobab_geek_interpreter.syntax.columnar_ast import ColumnarAST
+
+if TYPE_CHECKING:
+    from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
 
 
 class SyntaxAnalyzer:
@@ -26,13 +31,42 @@ class SyntaxAnalyzer:
     correspond à une méthode.
 
     Grammaire:
+        script            → expression (séparateur expression)* séparateur?
+        séparateur        → ';'+ | fin de ligne
+        expression        → appel_service ('|' appel_service)*
         appel_service     → IDENTIFIANT '(' liste_arguments ')'
         liste_arguments   → ε | argument (',' argument)*
-        argument          → constante
+        argument          → constante | expression
         constante         → INT | FLOAT | STRING | tableau
         tableau           → '[' liste_valeurs ']'
         liste_valeurs     → ε | constante (',' constante)*
 
+    Un argument peut être un appel de service imbriqué
+    (``merge(fetch("a"), fetch("b"))``) ; les éléments d'un tableau restent
+    des constantes. L'AST colonnaire (:meth:`parse_columnar`) ne représente
+    que les appels dont les arguments sont des constantes.
+
+    Le pipeline ``a(1) | b(2)`` est une écriture de ``b(a(1), 2)`` : le
+    résultat de chaque appel devient le premier argument de l'appel suivant.
+    L'AST ne contient donc que des appels imbriqués.
+
+    :meth:`parse` analyse un appel unique ; :meth:`parse_script` analyse un
+    script de plusieurs appels séparés par des points-virgules ou des fins de
+    ligne.
+
+    Si une table des symboles est fournie, l'identifiant du service est résolu
+    une seule fois en slot lors de la construction du nœud d'appel, ce qui évite
+    les recherches par nom dans les phases suivantes.
+
+    En mode ``compact_arguments``, les nœuds d'appel sont construits sans
+    enveloppe :class:`ArgumentNode` autour de chaque argument (voir
+    :meth:`ServiceCallNode.from_values`).
+
+    :param symbol_table: Table des symboles utilisée pour résoudre les slots (optionnel).
+    :type symbol_table: Optional[SymbolTable]
+    :param compact_arguments: Construire des nœuds d'appel compacts.
+    :type compact_arguments: bool
+
     :Example:
         >>> from baobab_geek_interpreter.lexical.lexical_analyzer import LexicalAnalyzer
         >>> lexer = LexicalAnalyzer()
@@ -43,10 +77,22 @@ class SyntaxAnalyzer:
         'myService'
     """
 
-    def __init__(self) -> None:
-        """Initialise l'analyseur syntaxique."""
+    def __init__(
+        self,
+        symbol_table: Optional["SymbolTable"] = None,
+        compact_arguments: bool = False,
+    ) -> None:
+        """Initialise l'analyseur syntaxique.
+
+        :param symbol_table: Table des symboles utilisée pour résoudre les slots.
+        :type symbol_table: Optional[SymbolTable]
+        :param compact_arguments: Construire des nœuds d'appel compacts.
+        :type compact_arguments: bool
+        """
         self._tokens: List[Token] = []
         self._position: int = 0
+        self._symbol_table: Optional["SymbolTable"] = symbol_table
+        self._compact_arguments: bool = compact_arguments
 
     def parse(self, tokens: List[Token]) -> ServiceCallNode:
         """Parse une liste de tokens et retourne l'AST.
@@ -80,6 +126,151 @@ class SyntaxAnalyzer:
 
         return self._parse_appel_service()
 
+    def parse_script(self, tokens: List[Token]) -> List[ServiceCallNode]:
+        """Parse un script de plusieurs appels de service.
+
+        Deux appels sont séparés par un ou plusieurs points-virgules, ou par
+        une fin de ligne ; un séparateur final est accepté.
+
+        :param tokens: Liste de tokens à analyser.
+        :type tokens: List[Token]
+        :return: Nœuds des appels de service, dans l'ordre du script.
+        :rtype: List[ServiceCallNode]
+        :raises BaobabSyntaxAnalyserException: Si une erreur syntaxique est détectée.
+
+        :Example:
+            >>> from baobab_geek_interpreter.lexical.lexical_analyzer import LexicalAnalyzer
+            >>> tokens = LexicalAnalyzer().analyze('add(1, 2); add(3, 4)')
+            >>> [call.name for call in SyntaxAnalyzer().parse_script(tokens)]
+            ['add', 'add']
+        """
+        self._tokens = tokens
+        self._position = 0
+
+        if not self._tokens:
+            raise BaobabSyntaxAnalyserException(
+                "Liste de tokens vide",
+                source="",
+                position=0,
+                line=1,
+                column=1,
+            )
+
+        calls = [self._parse_expression()]
+        while self._current_token().type != TokenType.EOF:
+            if self._current_token().type == TokenType.SEMICOLON:
+                while self._current_token().type == TokenType.SEMICOLON:
+                    self._advance()
+                if self._current_token().type == TokenType.EOF:
+                    break
+            elif self._current_token().line == self._tokens[self._position - 1].line:
+                # Deux appels sur une même ligne doivent être séparés par ';'
+                self._expect_eof()
+            calls.append(self._parse_expression())
+        return calls
+
+    def parse_columnar(self, tokens: List[Token]) -> ColumnarAST:
+        """Parse une liste de tokens et retourne un AST colonnaire.
+
+        Suit la même grammaire que :meth:`parse` mais écrit les nœuds
+        directement dans les colonnes d'un :class:`ColumnarAST`, sans créer
+        d'objet par constante.
+
+        :param tokens: Liste de tokens à analyser.
+        :type tokens: List[Token]
+        :return: AST colonnaire de l'appel de service.
+        :rtype: ColumnarAST
+        :raises BaobabSyntaxAnalyserException: Si une erreur syntaxique est détectée.
+
+        :Example:
+            >>> from baobab_geek_interpreter.lexical.lexical_analyzer import LexicalAnalyzer
+            >>> tokens = LexicalAnalyzer().analyze('sum([1, 2, 3])')
+            >>> SyntaxAnalyzer().parse_columnar(tokens).argument_values()
+            [[1, 2, 3]]
+        """
+        self._tokens = tokens
+        self._position = 0
+
+        if not self._tokens:
+            raise BaobabSyntaxAnalyserException(
+                "Liste de tokens vide",
+                source="",
+                position=0,
+                line=1,
+                column=1,
+            )
+
+        ast = ColumnarAST()
+        service_name = str(self._expect(TokenType.IDENTIFIANT).value)
+        root = ast.open_service_call(service_name)
+        ast.slot, ast.generation = self._resolve_slot(service_name)
+
+        self._expect(TokenType.LPAREN)
+        count = self._parse_columnar_liste(ast, root, TokenType.RPAREN)
+        self._expect(TokenType.RPAREN)
+        self._expect_eof()
+
+        ast.close(root, count)
+        return ast
+
+    def _parse_columnar_liste(self, ast: ColumnarAST, parent: int, end: TokenType) -> int:
+        """Parse une liste de constantes dans un AST colonnaire.
+
+        :param ast: AST colonnaire en construction.
+        :type ast: ColumnarAST
+        :param parent: Index du nœud parent.
+        :type parent: int
+        :param end: Type du token fermant la liste.
+        :type end: TokenType
+        :return: Nombre d'éléments lus.
+        :rtype: int
+        """
+        if self._current_token().type == end:
+            return 0
+
+        self._parse_columnar_constante(ast, parent)
+        count = 1
+        while self._current_token().type == TokenType.COMMA:
+            self._advance()
+            self._parse_columnar_constante(ast, parent)
+            count += 1
+        return count
+
+    def _parse_columnar_constante(self, ast: ColumnarAST, parent: int) -> None:
+        """Parse une constante dans un AST colonnaire.
+
+        :param ast: AST colonnaire en construction.
+        :type ast: ColumnarAST
+        :param parent: Index du nœud parent.
+        :type parent: int
+        :raises BaobabSyntaxAnalyserException: Si le token n'est pas une constante valide.
+        """
+        token = self._current_token()
+
+        if token.type == TokenType.INT:
+            self._advance()
+            ast.add_int(parent, int(token.value))
+        elif token.type == TokenType.FLOAT:
+            self._advance()
+            ast.add_float(parent, float(token.value))
+        elif token.type == TokenType.STRING:
+            self._advance()
+            ast.add_string(parent, str(token.value))
+        elif token.type == TokenType.LBRACKET:
+            self._advance()
+            index = ast.open_array(parent)
+            count = self._parse_columnar_liste(ast, index, TokenType.RBRACKET)
+            self._expect(TokenType.RBRACKET)
+            ast.close(index, count)
+        else:
+            raise BaobabSyntaxAnalyserException(
+                f"Constante attendue, obtenu {token.type.name}",
+                source="",
+                position=token.position,
+                line=token.line,
+                column=token.column,
+            )
+
     def _current_token(self) -> Token:
         """Retourne le token courant.
 
@@ -148,8 +339,37 @@ class SyntaxAnalyzer:
         return token
 
     def _parse_appel_service(self) -> ServiceCallNode:
+        """Parse l'appel de service racine, suivi de la fin de l'entrée.
+
+        :return: Nœud d'appel de service.
+        :rtype: ServiceCallNode
+        :raises BaobabSyntaxAnalyserException: Si la syntaxe est incorrecte.
+        """
+        node = self._parse_expression()
+
+        # Vérifier EOF
+        self._expect_eof()
+
+        return node
+
+    def _parse_expression(self) -> ServiceCallNode:
+        """Parse une expression : appel_service ('|' appel_service)*.
+
+        :return: Nœud du dernier appel du pipeline.
+        :rtype: ServiceCallNode
+        :raises BaobabSyntaxAnalyserException: Si la syntaxe est incorrecte.
+        """
+        node = self._parse_appel()
+        while self._current_token().type == TokenType.PIPE:
+            self._advance()
+            node = self._parse_appel(node)
+        return node
+
+    def _parse_appel(self, piped: Optional[ServiceCallNode] = None) -> ServiceCallNode:
         """Parse un appel de service : IDENTIFIANT '(' liste_arguments ')'.
 
+        :param piped: Appel précédent d'un pipeline, ajouté en premier argument.
+        :type piped: Optional[ServiceCallNode]
         :return: Nœud d'appel de service.
         :rtype: ServiceCallNode
         :raises BaobabSyntaxAnalyserException: Si la syntaxe est incorrecte.
@@ -167,7 +387,15 @@ class SyntaxAnalyzer:
         # ')'
         self._expect(TokenType.RPAREN)
 
-        # Vérifier EOF
+        if piped is not None:
+            arguments.insert(0, piped)
+        return self._make_service_call(service_name, arguments)
+
+    def _expect_eof(self) -> None:
+        """Vérifie que l'appel de service est suivi de la fin de l'entrée.
+
+        :raises BaobabSyntaxAnalyserException: Si du contenu suit l'appel.
+        """
         if self._current_token().type != TokenType.EOF:
             token = self._current_token()
             raise BaobabSyntaxAnalyserException(
@@ -178,15 +406,42 @@ class SyntaxAnalyzer:
                 column=token.column,
             )
 
-        return ServiceCallNode(service_name, arguments)
+    def _resolve_slot(self, name: str) -> Tuple[int, int]:
+        """Résout le slot et la génération d'un service dans la table des symboles.
 
-    def _parse_liste_arguments(self) -> List[ArgumentNode]:
+        :param name: Nom du service.
+        :type name: str
+        :return: Couple (slot, génération), ou ``(-1, -1)`` si non résolu.
+        :rtype: Tuple[int, int]
+        """
+        if self._symbol_table is not None:
+            slot = self._symbol_table.slot_of(name)
+            if slot is not None:
+                return slot, self._symbol_table.generation(slot)
+        return -1, -1
+
+    def _make_service_call(self, name: str, values: List[ArgumentValue]) -> ServiceCallNode:
+        """Construit un nœud d'appel de service en résolvant son slot.
+
+        :param name: Nom du service.
+        :type name: str
+        :param values: Nœuds de valeurs des arguments.
+        :type values: List[ArgumentValue]
+        :return: Nœud d'appel de service.
+        :rtype: ServiceCallNode
+        """
+        slot, generation = self._resolve_slot(name)
+        if self._compact_arguments:
+            return ServiceCallNode.from_values(name, values, slot, generation)
+        return ServiceCallNode(name, [ArgumentNode(value) for value in values], slot, generation)
+
+    def _parse_liste_arguments(self) -> List[ArgumentValue]:
         """Parse une liste d'arguments : ε | argument (',' argument)*.
 
-        :return: Liste de nœuds d'arguments.
-        :rtype: List[ArgumentNode]
+        :return: Liste des nœuds de valeurs des arguments.
+        :rtype: List[ArgumentValue]
         """
-        arguments: List[ArgumentNode] = []
+        arguments: List[ArgumentValue] = []
 
         # Vérifier si liste vide (token suivant est ')')
         if self._current_token().type == TokenType.RPAREN:
@@ -202,14 +457,18 @@ class SyntaxAnalyzer:
 
         return arguments
 
-    def _parse_argument(self) -> ArgumentNode:
-        """Parse un argument : constante.
+    def _parse_argument(self) -> ArgumentValue:
+        """Parse un argument : constante | expression.
+
+        L'enveloppe :class:`ArgumentNode` est ajoutée par
+        :meth:`_make_service_call` selon le mode de construction.
 
-        :return: Nœud d'argument.
-        :rtype: ArgumentNode
+        :return: Nœud de valeur de l'argument.
+        :rtype: ArgumentValue
         """
-        constante = self._parse_constante()
-        return ArgumentNode(constante)
+        if self._current_token().type == TokenType.IDENTIFIANT:
+            return self._parse_expression()
+        return self._parse_constante()
 
     def _parse_constante(self) -> ConstantNode:
         """Parse une constante : INT | FLOAT | STRING | tableau.
@@ -250,15 +509,15 @@ class SyntaxAnalyzer:
         :rtype: ArrayNode
         """
         # '['
-        self._expect(TokenType.LBRACKET)
+        start = self._expect(TokenType.LBRACKET).position
 
         # liste_valeurs
         elements = self._parse_liste_valeurs()
 
         # ']'
-        self._expect(TokenType.RBRACKET)
+        end = self._expect(TokenType.RBRACKET).position + 1
 
-        return ArrayNode(elements)
+        return ArrayNode(elements, (start, end))
 
     def _parse_liste_valeurs(self) -> List[ConstantNode]:
         """Parse une liste de valeurs : ε | constante (',' constante)*.
@@ -0,0 +1,30 @@
+"""Module pour la compilation et l'exécution des appels en instructions."""
+
+from baobab_geek_interpreter.lazy_exports import lazy_exports
+
+TYPE_CHECKING = False  # typing.TYPE_CHECKING, sans importer typing au démarrage
+if TYPE_CHECKING:
+    from baobab_geek_interpreter.vm.code_generator import CodeGenerator
+    from baobab_geek_interpreter.vm.compiler import Compiler
+    from baobab_geek_interpreter.vm.opcode import OpCode
+    from baobab_geek_interpreter.vm.program import Program
+    from baobab_geek_interpreter.vm.virtual_machine import VirtualMachine
+
+__all__ = [
+    "OpCode",
+    "Program",
+    "Compiler",
+    "VirtualMachine",
+    "CodeGenerator",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "CodeGenerator": "baobab_geek_interpreter.vm.code_generator",
+        "Compiler": "baobab_geek_interpreter.vm.compiler",
+        "OpCode": "baobab_geek_interpreter.vm.opcode",
+        "Program": "baobab_geek_interpreter.vm.program",
+        "VirtualMachine": "baobab_geek_interpreter.vm.virtual_machine",
+    },
+)
@@ -0,0 +1,381 @@
+"""Module contenant la génération de fonctions Python spécialisées pour un appel."""
+
+import inspect
+import keyword
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, cast, get_args, get_origin
+
+from baobab_geek_interpreter.exceptions.execution_exception import BaobabExecutionException
+from baobab_geek_interpreter.semantic.semantic_analyzer import SemanticAnalyzer
+from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+from baobab_geek_interpreter.vm.opcode import OpCode
+from baobab_geek_interpreter.vm.program import Program
+
+FILENAME = "<baobab-prepared>"
+"""Nom de fichier du code généré, visible dans les traces d'exécution."""
+
+# Opérande de la pile symbolique : expression Python et, pour une constante,
+# nom de la cellule qui la contient.
+_Operand = Tuple[str, Optional[str]]
+
+
+class CodeGenerator:
+    """Générateur d'une fonction Python spécialisée pour un :class:`Program`.
+
+    Le programme est exécuté symboliquement : chaque appel imbriqué devient
+    une instruction ``_bg_rN = _bg_fI(...)``, dans l'ordre du programme, et
+    l'appel racine l'instruction ``return``. Le code source obtenu est
+    compilé (``compile``/``exec``) dans une fabrique dont les paramètres
+    deviennent les cellules de fermeture de la fonction générée : constantes,
+    exécutables des services (voir :meth:`Executor.link`) et générations des
+    slots. L'exécution se réduit à un seul cadre Python en plus des appels de
+    services, sans pile d'instructions ni répartition.
+
+    Si tous les arguments de l'appel racine sont des constantes et que le
+    service racine n'a que des paramètres positionnels nommés, ces arguments
+    deviennent des paramètres de la fonction générée, de même nom que ceux
+    du service, avec les constantes du code source en valeurs par défaut. Un
+    paramètre ``int``, ``float``, ``str`` (ou autre classe simple) est validé
+    par un ``isinstance`` en ligne, un paramètre ``list[T]`` par une boucle
+    en ligne ; les autres passent par :meth:`SemanticAnalyzer.check_arguments`,
+    qui lève aussi l'exception d'une validation en ligne échouée. Un tableau
+    par défaut est copié à chaque appel.
+
+    Avant tout, la fonction générée compare la génération de chaque slot à
+    celle de la compilation : si un service a été ré-enregistré, l'appel est
+    délégué à ``on_stale`` avec les mêmes arguments positionnels.
+
+    Tous les noms internes du code généré commencent par ``_bg_``.
+
+    :param symbol_table: Table des symboles contenant les services enregistrés.
+    :type symbol_table: SymbolTable
+
+    :Example:
+        >>> program = Compiler(table).compile(ast)  # add(1, 2)
+        >>> add_prepared = CodeGenerator(table).generate(program, [add], on_stale)
+        >>> add_prepared()
+        3
+        >>> add_prepared(10, b=20)
+        30
+    """
+
+    def __init__(self, symbol_table: SymbolTable) -> None:
+        """Initialise le générateur.
+
+        :param symbol_table: Table des symboles.
+        :type symbol_table: SymbolTable
+        """
+        self._symbol_table = symbol_table
+        self._semantic_analyzer = SemanticAnalyzer(symbol_table)
+
+    def generate(
+        self,
+        program: Program,
+        callees: Sequence[Callable[..., Any]],
+        on_stale: Callable[..., Any],
+    ) -> Callable[..., Any]:
+        """Génère la fonction spécialisée d'un programme.
+
+        :param program: Programme compilé et validé.
+        :type program: Program
+        :param callees: Exécutable de chaque service de la table du programme.
+        :type callees: Sequence[Callable[..., Any]]
+        :param on_stale: Fonction appelée, avec les arguments positionnels de
+            l'appel, lorsqu'un service du programme a été ré-enregistré.
+        :type on_stale: Callable[..., Any]
+        :return: Fonction exécutant l'appel ; ses paramètres éventuels
+            remplacent les arguments constants de l'appel racine.
+        :rtype: Callable[..., Any]
+        """
+        env: Dict[str, Any] = {
+            "_bg_gens": self._symbol_table.generations,
+            "_bg_stale": on_stale,
+            "_bg_error": BaobabExecutionException,
+            "_bg_isinstance": isinstance,
+            "_bg_list": list,
+            "_bg_type": type,
+        }
+        for index, callee in enumerate(callees):
+            env[f"_bg_f{index}"] = callee
+        source, root_name = self._render(program, env)
+        namespace: Dict[str, Any] = {}
+        # Code source construit uniquement à partir de noms générés et de noms
+        # de paramètres validés ; les valeurs passent par les cellules.
+        # pylint: disable-next=exec-used
+        exec(compile(source, FILENAME, "exec"), namespace)  # nosec B102
+        prepared = namespace["_bg_factory"](**env)
+        prepared.__name__ = prepared.__qualname__ = root_name
+        return cast(Callable[..., Any], prepared)
+
+    def _render(self, program: Program, env: Dict[str, Any]) -> Tuple[str, str]:
+        """Construit le code source de la fabrique de la fonction générée.
+
+        :param program: Programme compilé.
+        :type program: Program
+        :param env: Cellules de la fonction générée, complétées au passage.
+        :type env: Dict[str, Any]
+        :return: Code source et nom du service racine.
+        :rtype: Tuple[str, str]
+        """
+        calls, (root, args) = self._trace(program, env)
+        root_name, root_func = program.services[root][0], program.services[root][1]
+        params, body, args = self._prologue(program, (root_name, root_func), args, env)
+        services: Dict[int, str] = {}
+        body.append("        try:")
+        for statement, service_name in calls:
+            body.append(f"            {statement}")
+            services[len(body) + 2] = service_name
+        body.append(f"            return _bg_f{root}({', '.join(expr for expr, _ in args)})")
+        services[len(body) + 2] = root_name
+        body.extend(
+            [
+                "        except _bg_error:",
+                "            raise",
+                "        except Exception as _bg_exc:",
+                "            raise _bg_fail(_bg_exc) from _bg_exc",
+                "    return _bg_prepared",
+            ]
+        )
+        env["_bg_fail"] = self._failure(services, root_name)
+        header = [
+            f"def _bg_factory({', '.join(env)}):",
+            f"    def _bg_prepared({', '.join(params)}):",
+        ]
+        return "\n".join(header + body), root_name
+
+    def _prologue(
+        self,
+        program: Program,
+        root: Tuple[str, Callable[..., Any]],
+        args: List[_Operand],
+        env: Dict[str, Any],
+    ) -> Tuple[List[str], List[str], List[_Operand]]:
+        """Construit les paramètres, la garde de génération et la validation.
+
+        :param program: Programme compilé.
+        :type program: Program
+        :param root: Nom et fonction du service racine.
+        :type root: Tuple[str, Callable[..., Any]]
+        :param args: Opérandes des arguments de l'appel racine.
+        :type args: List[_Operand]
+        :param env: Cellules de la fonction générée, complétées au passage.
+        :type env: Dict[str, Any]
+        :return: Paramètres de la fonction générée, premières lignes de son
+            corps et opérandes des arguments de l'appel racine.
+        :rtype: Tuple[List[str], List[str], List[_Operand]]
+        """
+        guard = " or ".join(
+            f"_bg_gens[{slot}] != {generation}" for _, _, slot, generation in program.services
+        )
+        names = self._parameter_names(root[1], args)
+        if names is None:
+            return [], [f"        if {guard}:", "            return _bg_stale()"], args
+        env["_bg_check"] = self._checker(*root)
+        body = [f"        if {guard}:", f"            return _bg_stale({', '.join(names)})"]
+        body.extend(self._validation(root[1], names, args, env))
+        params = [f"{name}={cell}" for name, (_, cell) in zip(names, args)]
+        return params, body, [(name, None) for name in names]
+
+    @staticmethod
+    def _trace(
+        program: Program, env: Dict[str, Any]
+    ) -> Tuple[List[Tuple[str, str]], Tuple[int, List[_Operand]]]:
+        """Exécute symboliquement un programme.
+
+        :param program: Programme compilé.
+        :type program: Program
+        :param env: Cellules de la fonction générée, complétées par les constantes.
+        :type env: Dict[str, Any]
+        :return: Instructions des appels imbriqués avec le nom de leur service,
+            puis index du service racine et opérandes de ses arguments.
+        :rtype: Tuple[List[Tuple[str, str]], Tuple[int, List[_Operand]]]
+        """
+        stack: List[_Operand] = []
+        locals_: Dict[int, _Operand] = {}
+        calls: List[Tuple[str, str]] = []
+        root: Tuple[int, List[_Operand]] = (0, [])
+        constants = 0
+        for position, (opcode, operand, count) in enumerate(program.instructions):
+            if opcode is OpCode.PUSH_CONST or opcode is OpCode.BUILD_LIST:
+                if opcode is OpCode.BUILD_LIST:
+                    args = stack[len(stack) - count :]
+                    del stack[len(stack) - count :]
+                    operand = tuple(env[str(cell)] for _, cell in args)
+                cell = f"_bg_k{constants}"
+                env[cell] = operand
+                constants += 1
+                stack.append((f"_bg_list({cell})" if isinstance(operand, tuple) else cell, cell))
+            elif opcode is OpCode.CALL:
+                args = stack[len(stack) - count :]
+                del stack[len(stack) - count :]
+                if position == len(program.instructions) - 1:
+                    root = (operand, args)
+                else:
+                    result = f"_bg_r{len(calls)}"
+                    calls.append(
+                        (
+                            f"{result} = _bg_f{operand}({', '.join(expr for expr, _ in args)})",
+                            program.services[operand][0],
+                        )
+                    )
+                    stack.append((result, None))
+            elif opcode is OpCode.STORE:
+                locals_[operand] = stack[-1]
+            else:
+                stack.append(locals_[operand])
+        return calls, root
+
+    @staticmethod
+    def _parameter_names(func: Callable[..., Any], args: List[_Operand]) -> Optional[List[str]]:
+        """Retourne les noms des paramètres de la fonction générée.
+
+        :param func: Fonction du service racine.
+        :type func: Callable[..., Any]
+        :param args: Opérandes des arguments de l'appel racine.
+        :type args: List[_Operand]
+        :return: Noms des paramètres du service, ou None si un argument n'est
+            pas constant ou si la signature ne s'y prête pas.
+        :rtype: Optional[List[str]]
+        """
+        if any(cell is None for _, cell in args):
+            return None
+        try:
+            params = list(inspect.signature(func).parameters.values())
+        except (TypeError, ValueError):
+            return None
+        if len(params) != len(args):
+            return None
+        for param in params:
+            if (
+                param.kind is not inspect.Parameter.POSITIONAL_OR_KEYWORD
+                or not param.name.isidentifier()
+                or keyword.iskeyword(param.name)
+                or param.name.startswith("_bg_")
+            ):
+                return None
+        return [param.name for param in params]
+
+    @staticmethod
+    def _validation(
+        func: Callable[..., Any], names: List[str], args: List[_Operand], env: Dict[str, Any]
+    ) -> List[str]:
+        """Génère la copie des tableaux par défaut et la validation des paramètres.
+
+        :param func: Fonction du service racine.
+        :type func: Callable[..., Any]
+        :param names: Noms des paramètres.
+        :type names: List[str]
+        :param args: Opérandes des arguments constants de l'appel racine.
+        :type args: List[_Operand]
+        :param env: Cellules de la fonction générée, complétées par les types.
+        :type env: Dict[str, Any]
+        :return: Lignes de code générées.
+        :rtype: List[str]
+        """
+        check = f"_bg_check([{', '.join(names)}])"
+        lines: List[str] = []
+        fallback = False
+        for index, (name, (expr, cell), param) in enumerate(
+            zip(names, args, inspect.signature(func).parameters.values())
+        ):
+            annotation = param.annotation
+            element = get_args(annotation)[0] if get_origin(annotation) is list else None
+            copy = expr != cell
+            if CodeGenerator._is_simple(annotation):
+                env[f"_bg_t{index}"] = annotation
+                lines.extend(
+                    [
+                        f"        if not _bg_isinstance({name}, _bg_t{index}):",
+                        f"            {check}",
+                    ]
+                )
+            elif element is not None and CodeGenerator._is_simple(element):
+                env[f"_bg_t{index}"] = element
+                lines.extend(
+                    [
+                        f"        if {name} is {cell}:",
+                        f"            {name} = _bg_list({cell})",
+                        f"        elif not _bg_isinstance({name}, _bg_list):",
+                        f"            {check}",
+                        f"        elif {name}:",
+                        f"            if not _bg_isinstance({name}[0], _bg_t{index}):",
+                        f"                {check}",
+                        f"            _bg_first = _bg_type({name}[0])",
+                        f"            for _bg_item in {name}:",
+                        "                if not _bg_isinstance(_bg_item, _bg_first):",
+                        f"                    {check}",
+                    ]
+                )
+                copy = False
+            else:
+                fallback = True
+            if copy:
+                lines.extend([f"        if {name} is {cell}:", f"            {name} = {expr}"])
+        if fallback:
+            lines.append(f"        {check}")
+        return lines
+
+    @staticmethod
+    def _is_simple(annotation: Any) -> bool:
+        """Indique si une annotation se vérifie par un seul ``isinstance``.
+
+        Une classe simple n'accepte pas de tableau : la validation sémantique
+        se réduit alors à la vérification du type.
+
+        :param annotation: Annotation d'un paramètre.
+        :type annotation: Any
+        :return: True pour une classe non générique étrangère aux tableaux.
+        :rtype: bool
+        """
+        return (
+            isinstance(annotation, type)
+            and annotation not in (Any, inspect.Parameter.empty)
+            and get_origin(annotation) is None
+            and not issubclass(annotation, list)
+            and not issubclass(list, annotation)
+        )
+
+    def _checker(self, service_name: str, func: Callable[..., Any]) -> Callable[[List[Any]], None]:
+        """Construit la validation complète des arguments de l'appel racine.
+
+        :param service_name: Nom du service racine.
+        :type service_name: str
+        :param func: Fonction du service racine.
+        :type func: Callable[..., Any]
+        :return: Fonction levant l'exception de l'analyse sémantique.
+        :rtype: Callable[[List[Any]], None]
+        """
+        analyzer = self._semantic_analyzer
+
+        def check(values: List[Any]) -> None:
+            analyzer.check_arguments(service_name, func, values)
+
+        return check
+
+    @staticmethod
+    def _failure(
+        services: Dict[int, str], default: str
+    ) -> Callable[[Exception], BaobabExecutionException]:
+        """Construit l'encapsulation des exceptions levées par les services.
+
+        :param services: Nom du service appelé à chaque ligne du code généré.
+        :type services: Dict[int, str]
+        :param default: Nom du service racine.
+        :type default: str
+        :return: Fonction construisant l'exception d'exécution.
+        :rtype: Callable[[Exception], BaobabExecutionException]
+        """
+
+        def fail(exc: Exception) -> BaobabExecutionException:
+            traceback = exc.__traceback__
+            service_name = services.get(traceback.tb_lineno if traceback else 0, default)
+            return BaobabExecutionException(
+                f"Erreur lors de l'exécution du service '{service_name}': {str(exc)}",
+                source="",
+                position=0,
+                line=0,
+                column=0,
+                service_name=service_name,
+                original_exception=exc,
+            )
+
+        return fail
@@ -0,0 +1,168 @@
+"""Module contenant le compilateur d'appels vers la machine virtuelle."""
+
+from typing import Any, Callable, Dict, List, Tuple
+
+from baobab_geek_interpreter.exceptions.semantic_exception import (
+    BaobabSemanticAnalyserException,
+)
+from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+from baobab_geek_interpreter.syntax.ast_node import (
+    ArrayNode,
+    ConstantNode,
+    ServiceCallNode,
+)
+from baobab_geek_interpreter.vm.opcode import OpCode
+from baobab_geek_interpreter.vm.program import Instruction, Program
+
+
+class Compiler:
+    """Compilateur d'un AST d'appel en :class:`Program`.
+
+    L'AST est parcouru une seule fois, en ordre postfixe : une constante
+    devient ``PUSH_CONST``, un tableau ``BUILD_LIST n`` après ses éléments,
+    un appel ``CALL service argc`` après ses arguments, appels imbriqués
+    compris. Un nœud d'appel partagé par plusieurs appels parents (voir
+    :class:`CommonSubexpressionEliminator`) est compilé une seule fois : son
+    résultat est rangé dans une variable locale (``STORE``) puis relu
+    (``LOAD``).
+
+    L'AST doit avoir été validé par le :class:`SemanticAnalyzer` : le
+    compilateur résout les services mais ne vérifie pas les types.
+
+    :param symbol_table: Table des symboles contenant les services enregistrés.
+    :type symbol_table: SymbolTable
+
+    :Example:
+        >>> # ast : add(1, [2, 3]), validé
+        >>> program = Compiler(table).compile(ast)
+        >>> VirtualMachine.run(program, [add])
+        6
+    """
+
+    def __init__(self, symbol_table: SymbolTable) -> None:
+        """Initialise le compilateur.
+
+        :param symbol_table: Table des symboles.
+        :type symbol_table: SymbolTable
+        """
+        self._symbol_table = symbol_table
+
+    def compile(self, ast: ServiceCallNode) -> Program:
+        """Compile un AST d'appel validé.
+
+        :param ast: Nœud racine de l'AST.
+        :type ast: ServiceCallNode
+        :return: Programme exécutable par la :class:`VirtualMachine`.
+        :rtype: Program
+        :raises BaobabSemanticAnalyserException: Si un service est inconnu.
+        """
+        references: Dict[int, int] = {}
+        self._count_references(ast, references)
+        instructions: List[Instruction] = []
+        services: List[Tuple[str, Callable[..., Any], int, int]] = []
+        indices: Dict[str, int] = {}
+        locals_: Dict[int, int] = {}
+        self._compile_call(ast, instructions, services, indices, (references, locals_))
+        return Program(tuple(instructions), tuple(services), len(locals_))
+
+    def _count_references(self, node: ServiceCallNode, references: Dict[int, int]) -> None:
+        """Compte les références à chaque nœud d'appel imbriqué.
+
+        :param node: Nœud d'appel dont les arguments sont parcourus.
+        :type node: ServiceCallNode
+        :param references: Nombre de références par identité de nœud.
+        :type references: Dict[int, int]
+        """
+        for value in node.values:
+            if isinstance(value, ServiceCallNode):
+                references[id(value)] = references.get(id(value), 0) + 1
+                if references[id(value)] == 1:
+                    self._count_references(value, references)
+
+    def _compile_call(
+        self,
+        node: ServiceCallNode,
+        instructions: List[Instruction],
+        services: List[Tuple[str, Callable[..., Any], int, int]],
+        indices: Dict[str, int],
+        sharing: Tuple[Dict[int, int], Dict[int, int]],
+    ) -> None:
+        """Compile un appel et ses arguments.
+
+        :param node: Nœud d'appel.
+        :type node: ServiceCallNode
+        :param instructions: Instructions émises.
+        :type instructions: List[Instruction]
+        :param services: Table des services du programme.
+        :type services: List[Tuple[str, Callable[..., Any], int, int]]
+        :param indices: Index de chaque service dans la table, par nom.
+        :type indices: Dict[str, int]
+        :param sharing: Nombre de références de chaque nœud d'appel et variable
+            locale des nœuds partagés déjà compilés.
+        :type sharing: Tuple[Dict[int, int], Dict[int, int]]
+        :raises BaobabSemanticAnalyserException: Si un service est inconnu.
+        """
+        references, locals_ = sharing
+        for value in node.values:
+            if not isinstance(value, ServiceCallNode):
+                self._compile_constant(value, instructions)
+            elif id(value) in locals_:
+                instructions.append((OpCode.LOAD, locals_[id(value)], 0))
+            else:
+                self._compile_call(value, instructions, services, indices, sharing)
+                if references[id(value)] > 1:
+                    locals_[id(value)] = len(locals_)
+                    instructions.append((OpCode.STORE, locals_[id(value)], 0))
+        instructions.append(
+            (OpCode.CALL, self._service_index(node, services, indices), len(node.values))
+        )
+
+    def _compile_constant(self, node: ConstantNode, instructions: List[Instruction]) -> None:
+        """Compile une constante ou un tableau de constantes.
+
+        :param node: Nœud de constante ou de tableau.
+        :type node: ConstantNode
+        :param instructions: Instructions émises.
+        :type instructions: List[Instruction]
+        """
+        if isinstance(node, ArrayNode):
+            for element in node.elements:
+                self._compile_constant(element, instructions)
+            instructions.append((OpCode.BUILD_LIST, None, len(node.elements)))
+        else:
+            instructions.append((OpCode.PUSH_CONST, getattr(node, "value"), 0))
+
+    def _service_index(
+        self,
+        node: ServiceCallNode,
+        services: List[Tuple[str, Callable[..., Any], int, int]],
+        indices: Dict[str, int],
+    ) -> int:
+        """Résout un service et retourne son index dans la table du programme.
+
+        :param node: Nœud d'appel.
+        :type node: ServiceCallNode
+        :param services: Table des services du programme.
+        :type services: List[Tuple[str, Callable[..., Any], int, int]]
+        :param indices: Index de chaque service dans la table, par nom.
+        :type indices: Dict[str, int]
+        :return: Index du service.
+        :rtype: int
+        :raises BaobabSemanticAnalyserException: Si le service est inconnu.
+        """
+        index = indices.get(node.name)
+        if index is not None:
+            return index
+        slot = self._symbol_table.slot_of(node.name)
+        func = self._symbol_table.get(node.name)
+        if slot is None or func is None:
+            raise BaobabSemanticAnalyserException(
+                f"Service inconnu : '{node.name}'",
+                source="",
+                position=0,
+                line=0,
+                column=0,
+            )
+        index = indices[node.name] = len(services)
+        services.append((node.name, func, slot, self._symbol_table.generation(slot)))
+        return index
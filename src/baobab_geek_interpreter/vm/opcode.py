@@ -0,0 +1,32 @@
+"""Module contenant l'énumération des instructions de la machine virtuelle."""
+
+from enum import IntEnum
+
+
+class OpCode(IntEnum):
+    """Énumération des instructions d'un :class:`Program`.
+
+    Chaque instruction est un triplet ``(opcode, opérande, nombre)`` ; les
+    valeurs sont des petits entiers comparés directement par la boucle de la
+    :class:`VirtualMachine`.
+
+    :Example:
+        >>> OpCode.CALL
+        <OpCode.CALL: 2>
+    """
+
+    PUSH_CONST = 0
+    """Empile la constante de l'opérande."""
+
+    BUILD_LIST = 1
+    """Dépile ``nombre`` valeurs et empile la liste qu'elles forment."""
+
+    CALL = 2
+    """Dépile ``nombre`` arguments et empile le résultat du service d'index
+    ``opérande`` dans la table des services du programme."""
+
+    STORE = 3
+    """Copie le sommet de la pile dans la variable locale ``opérande``."""
+
+    LOAD = 4
+    """Empile la variable locale ``opérande``."""
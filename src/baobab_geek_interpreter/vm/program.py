@@ -0,0 +1,101 @@
+"""Module contenant les programmes compilés de la machine virtuelle."""
+
+from typing import Any, Callable, List, Tuple
+
+from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+from baobab_geek_interpreter.vm.opcode import OpCode
+
+Instruction = Tuple[OpCode, Any, int]
+"""Instruction : opcode, opérande et nombre de valeurs dépilées."""
+
+
+class Program:
+    """Appel de service compilé en une liste plate d'instructions.
+
+    Les services appelés sont résolus à la compilation et rangés dans la
+    table :attr:`services` ; l'instruction ``CALL`` désigne un service par
+    son index dans cette table. Chaque entrée conserve le slot et la
+    génération du service dans la table des symboles, ce qui permet de
+    détecter un programme périmé (:meth:`is_current`) après un
+    ré-enregistrement.
+
+    Un programme est immuable et peut être exécuté plusieurs fois,
+    simultanément.
+
+    :param instructions: Instructions du programme.
+    :type instructions: Tuple[Instruction, ...]
+    :param services: Nom, fonction, slot et génération de chaque service appelé.
+    :type services: Tuple[Tuple[str, Callable[..., Any], int, int], ...]
+    :param local_count: Nombre de variables locales (résultats d'appels partagés).
+    :type local_count: int
+
+    :ivar instructions: Instructions du programme.
+    :type instructions: Tuple[Instruction, ...]
+    :ivar services: Table des services appelés.
+    :type services: Tuple[Tuple[str, Callable[..., Any], int, int], ...]
+    :ivar local_count: Nombre de variables locales.
+    :type local_count: int
+
+    :Example:
+        >>> program = Compiler(table).compile(ast)  # add(1, [2, 3])
+        >>> program.disassemble()
+        ['PUSH_CONST 1', 'PUSH_CONST 2', 'PUSH_CONST 3', 'BUILD_LIST 2', 'CALL add 2']
+    """
+
+    def __init__(
+        self,
+        instructions: Tuple[Instruction, ...],
+        services: Tuple[Tuple[str, Callable[..., Any], int, int], ...],
+        local_count: int = 0,
+    ) -> None:
+        """Initialise un programme.
+
+        :param instructions: Instructions du programme.
+        :type instructions: Tuple[Instruction, ...]
+        :param services: Table des services appelés.
+        :type services: Tuple[Tuple[str, Callable[..., Any], int, int], ...]
+        :param local_count: Nombre de variables locales.
+        :type local_count: int
+        """
+        self.instructions = instructions
+        self.services = services
+        self.local_count = local_count
+
+    def is_current(self, symbol_table: SymbolTable) -> bool:
+        """Indique si les services du programme sont toujours ceux de la table.
+
+        :param symbol_table: Table des symboles.
+        :type symbol_table: SymbolTable
+        :return: False si un service appelé a été ré-enregistré ou supprimé.
+        :rtype: bool
+        """
+        return all(
+            symbol_table.get_slot(slot, generation) is func
+            for _, func, slot, generation in self.services
+        )
+
+    def disassemble(self) -> List[str]:
+        """Retourne une représentation lisible des instructions.
+
+        :return: Une ligne par instruction.
+        :rtype: List[str]
+        """
+        lines = []
+        for opcode, operand, count in self.instructions:
+            if opcode == OpCode.PUSH_CONST:
+                lines.append(f"PUSH_CONST {operand!r}")
+            elif opcode == OpCode.BUILD_LIST:
+                lines.append(f"BUILD_LIST {count}")
+            elif opcode == OpCode.CALL:
+                lines.append(f"CALL {self.services[operand][0]} {count}")
+            else:
+                lines.append(f"{opcode.name} {operand}")
+        return lines
+
+    def __repr__(self) -> str:
+        """Retourne une représentation technique du programme.
+
+        :return: Représentation du programme.
+        :rtype: str
+        """
+        return f"Program(instructions={len(self.instructions)}, services={len(self.services)})"
@@ -0,0 +1,91 @@
+"""Module contenant la machine virtuelle exécutant les programmes compilés."""
+
+from typing import Any, Callable, List, Sequence
+
+from baobab_geek_interpreter.exceptions.execution_exception import BaobabExecutionException
+from baobab_geek_interpreter.vm.opcode import OpCode
+from baobab_geek_interpreter.vm.program import Program
+
+# Instructions liées en constantes du module : l'accès à un membre d'énumération
+# est coûteux dans la boucle.
+_PUSH_CONST = OpCode.PUSH_CONST
+_BUILD_LIST = OpCode.BUILD_LIST
+_CALL = OpCode.CALL
+_STORE = OpCode.STORE
+
+
+class VirtualMachine:
+    """Machine virtuelle à pile exécutant un :class:`Program`.
+
+    Les instructions sont exécutées par une seule boucle, sans récursion ni
+    répartition par visiteur : la profondeur et la largeur d'un appel ne
+    coûtent qu'une instruction par nœud. Les appels imbriqués sont exécutés
+    dans l'ordre du programme, par le thread appelant.
+
+    Chaque service est appelé par l'exécutable de même index dans
+    ``callees`` (la fonction du service elle-même, ou une enveloppe de
+    l'exécuteur gérant cache et regroupement) ; une exception autre qu'une
+    :class:`BaobabExecutionException` est encapsulée dans une
+    :class:`BaobabExecutionException`.
+
+    :Example:
+        >>> program = Program(
+        ...     ((OpCode.PUSH_CONST, 1, 0), (OpCode.PUSH_CONST, 2, 0), (OpCode.CALL, 0, 2)),
+        ...     (("add", add, 0, 0),),
+        ... )
+        >>> VirtualMachine.run(program, [add])
+        3
+    """
+
+    @staticmethod
+    def run(program: Program, callees: Sequence[Callable[..., Any]]) -> Any:
+        """Exécute un programme et retourne le résultat de son dernier appel.
+
+        :param program: Programme compilé.
+        :type program: Program
+        :param callees: Exécutable de chaque service de la table du programme.
+        :type callees: Sequence[Callable[..., Any]]
+        :return: Résultat de l'appel racine.
+        :rtype: Any
+        :raises BaobabExecutionException: Si un service lève une exception.
+        """
+        stack: List[Any] = []
+        push = stack.append
+        locals_: List[Any] = [None] * program.local_count
+        operand: Any = None
+        try:
+            for opcode, operand, count in program.instructions:
+                if opcode is _PUSH_CONST:
+                    push(operand)
+                elif opcode is _CALL:
+                    if count:
+                        args = stack[-count:]
+                        del stack[-count:]
+                        push(callees[operand](*args))
+                    else:
+                        push(callees[operand]())
+                elif opcode is _BUILD_LIST:
+                    if count:
+                        items = stack[-count:]
+                        del stack[-count:]
+                        push(items)
+                    else:
+                        push([])
+                elif opcode is _STORE:
+                    locals_[operand] = stack[-1]
+                else:
+                    push(locals_[operand])
+        except BaobabExecutionException:
+            raise
+        except Exception as exc:
+            service_name = program.services[operand][0]
+            raise BaobabExecutionException(
+                f"Erreur lors de l'exécution du service '{service_name}': {str(exc)}",
+                source="",
+                position=0,
+                line=0,
+                column=0,
+                service_name=service_name,
+                original_exception=exc,
+            ) from exc
+        return stack.pop()
@@ -0,0 +1,176 @@
+"""Tests unitaires pour la classe DiskCallCache."""
+
+import sqlite3
+import threading
+from pathlib import Path
+
+from baobab_geek_interpreter.cache.disk_call_cache import DiskCallCache
+from baobab_geek_interpreter.semantic.bound_call import BoundCall
+from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+
+
+def add(a: int, b: int) -> int:
+    """Service d'addition."""
+    return a + b
+
+
+def add_floats(a: float, b: float) -> float:
+    """Service d'addition de flottants."""
+    return a + b
+
+
+def make_table() -> SymbolTable:
+    """Construit une table contenant le service ``add``."""
+    table = SymbolTable()
+    table.register("add", add)
+    return table
+
+
+def bound_add(table: SymbolTable, *arguments: object) -> BoundCall:
+    """Construit l'appel lié de ``add``."""
+    return BoundCall("add", add, tuple(arguments), table.slot_of("add") or 0, 0)
+
+
+class TestDiskCallCache:
+    """Tests pour DiskCallCache."""
+
+    def test_miss(self) -> None:
+        """Vérifie qu'une source inconnue n'est pas trouvée."""
+        cache = DiskCallCache(":memory:")
+
+        assert cache.load("add(1, 2)", make_table()) is None
+        assert cache.misses == 1
+        assert cache.hits == 0
+
+    def test_store_then_load(self) -> None:
+        """Vérifie la relecture d'un appel enregistré."""
+        table = make_table()
+        cache = DiskCallCache(":memory:")
+        cache.store("add(1, 2)", bound_add(table, 1, 2), table)
+
+        bound = cache.load("add(1, 2)", table)
+
+        assert bound is not None
+        assert bound.service_name == "add"
+        assert bound.func is add
+        assert bound.arguments == (1, 2)
+        assert bound.slot == table.slot_of("add")
+        assert bound.generation == table.generation(bound.slot)
+        assert cache.hits == 1
+        assert len(cache) == 1
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        """Vérifie que le cache survit à la fermeture (redémarrage)."""
+        path = tmp_path / "calls.sqlite"
+        with DiskCallCache(path) as cache:
+            table = make_table()
+            cache.store("add(1, 2)", bound_add(table, 1, 2), table)
+
+        with DiskCallCache(path) as cache:
+            bound = cache.load("add(1, 2)", make_table())
+
+        assert bound is not None
+        assert bound.arguments == (1, 2)
+
+    def test_uses_current_function(self) -> None:
+        """Vérifie que la fonction relue est celle actuellement enregistrée."""
+        table = make_table()
+        cache = DiskCallCache(":memory:")
+        cache.store("add(1, 2)", bound_add(table, 1, 2), table)
+
+        def other(a: int, b: int) -> int:
+            return a * b
+
+        table.register("add", other)
+        bound = cache.load("add(1, 2)", table)
+
+        assert bound is not None
+        assert bound.func is other
+
+    def test_invalidated_on_signature_change(self) -> None:
+        """Vérifie l'invalidation lorsque la signature du service change."""
+        table = make_table()
+        cache = DiskCallCache(":memory:")
+        cache.store("add(1, 2)", bound_add(table, 1, 2), table)
+
+        table.register("add", add_floats)
+
+        assert cache.load("add(1, 2)", table) is None
+        assert cache.invalidations == 1
+        assert len(cache) == 0
+
+    def test_invalidated_when_service_removed(self) -> None:
+        """Vérifie l'invalidation lorsque le service n'existe plus."""
+        table = make_table()
+        cache = DiskCallCache(":memory:")
+        cache.store("add(1, 2)", bound_add(table, 1, 2), table)
+
+        assert cache.load("add(1, 2)", SymbolTable()) is None
+        assert cache.invalidations == 1
+
+    def test_invalidated_on_corrupt_payload(self, tmp_path: Path) -> None:
+        """Vérifie qu'une entrée corrompue est traitée comme absente."""
+        path = tmp_path / "calls.sqlite"
+        table = make_table()
+        with DiskCallCache(path) as cache:
+            cache.store("add(1, 2)", bound_add(table, 1, 2), table)
+        with sqlite3.connect(path) as connection:
+            connection.execute("UPDATE calls SET payload = ?", (b"garbage",))
+
+        with DiskCallCache(path) as cache:
+            assert cache.load("add(1, 2)", table) is None
+            assert cache.invalidations == 1
+
+    def test_uninspectable_service_not_stored(self) -> None:
+        """Vérifie qu'un service sans signature inspectable n'est pas mis en cache."""
+        table = SymbolTable()
+        table.register("kind", type)
+        cache = DiskCallCache(":memory:")
+
+        cache.store("kind(1)", BoundCall("kind", type, (1,)), table)
+
+        assert len(cache) == 0
+
+    def test_unserializable_arguments_not_stored(self) -> None:
+        """Vérifie qu'un appel non sérialisable n'est pas mis en cache."""
+        table = make_table()
+        cache = DiskCallCache(":memory:")
+
+        cache.store("add(x)", bound_add(table, {}, 1), table)
+
+        assert len(cache) == 0
+
+    def test_clear(self) -> None:
+        """Vérifie la suppression de toutes les entrées."""
+        table = make_table()
+        cache = DiskCallCache(":memory:")
+        cache.store("add(1, 2)", bound_add(table, 1, 2), table)
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_concurrent_access(self) -> None:
+        """Vérifie l'utilisation concurrente depuis plusieurs threads."""
+        table = make_table()
+        cache = DiskCallCache(":memory:")
+        errors: list[BaseException] = []
+
+        def worker(index: int) -> None:
+            try:
+                for i in range(20):
+                    source = f"add({index}, {i})"
+                    cache.store(source, bound_add(table, index, i), table)
+                    bound = cache.load(source, table)
+                    assert bound is not None and bound.arguments == (index, i)
+            except BaseException as exc:  # pylint: disable=broad-except
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        assert len(cache) == 80
@@ -0,0 +1,112 @@
+"""Tests unitaires pour la classe AsyncSingleFlight."""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from baobab_geek_interpreter.execution.async_single_flight import AsyncSingleFlight
+
+
+class TestAsyncSingleFlight:
+    """Tests pour AsyncSingleFlight."""
+
+    def test_single_caller(self) -> None:
+        """Vérifie l'exécution d'un appel isolé."""
+        flight = AsyncSingleFlight()
+
+        async def compute() -> int:
+            return 42
+
+        assert asyncio.run(flight.do("k", compute)) == 42
+        assert flight.executions == 1
+        assert flight.in_flight() == 0
+
+    def test_concurrent_identical_calls_share_result(self) -> None:
+        """Vérifie que des tâches identiques simultanées partagent une exécution."""
+        flight = AsyncSingleFlight()
+        calls: List[int] = []
+
+        async def slow() -> object:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return object()
+
+        async def main() -> List[object]:
+            return await asyncio.gather(*(flight.do("k", slow) for _ in range(10)))
+
+        results = asyncio.run(main())
+
+        assert len(calls) == 1
+        assert all(result is results[0] for result in results)
+        assert flight.coalesced == 9
+
+    def test_exception_is_shared(self) -> None:
+        """Vérifie que l'exception est propagée à toutes les tâches."""
+        flight = AsyncSingleFlight()
+
+        async def failing() -> None:
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        async def main() -> List[object]:
+            return await asyncio.gather(
+                *(flight.do("k", failing) for _ in range(3)), return_exceptions=True
+            )
+
+        results = asyncio.run(main())
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert flight.executions == 1
+
+    def test_exception_without_waiters(self) -> None:
+        """Vérifie la propagation de l'exception à l'appelant unique."""
+        flight = AsyncSingleFlight()
+
+        async def failing() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            asyncio.run(flight.do("k", failing))
+        assert flight.in_flight() == 0
+
+    def test_waiter_cancellation_does_not_cancel_leader(self) -> None:
+        """Vérifie que l'annulation d'une tâche en attente n'interrompt pas l'exécution."""
+        flight = AsyncSingleFlight()
+
+        async def slow() -> str:
+            await asyncio.sleep(0.02)
+            return "done"
+
+        async def main() -> str:
+            leader = asyncio.ensure_future(flight.do("k", slow))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(flight.do("k", slow))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            return await leader
+
+        assert asyncio.run(main()) == "done"
+
+    def test_leader_cancellation_propagates(self) -> None:
+        """Vérifie que l'annulation de l'exécution partagée atteint les tâches en attente."""
+        flight = AsyncSingleFlight()
+
+        async def slow() -> str:
+            await asyncio.sleep(1)
+            return "done"
+
+        async def main() -> bool:
+            leader = asyncio.ensure_future(flight.do("k", slow))
+            await asyncio.sleep(0)
+            waiter = asyncio.ensure_future(flight.do("k", slow))
+            await asyncio.sleep(0)
+            leader.cancel()
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                return True
+            return False
+
+        assert asyncio.run(main())
+        assert flight.in_flight() == 0
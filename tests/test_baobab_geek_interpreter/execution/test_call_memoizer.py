@@ -0,0 +1,129 @@
+"""Tests unitaires pour la classe CallMemoizer."""
+
+import asyncio
+import gc
+import weakref
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, List, Sequence
+
+from baobab_geek_interpreter.execution.call_memoizer import CallMemoizer
+from baobab_geek_interpreter.execution.service_decorator import service
+
+
+def invoke(name: str, func: Callable[..., Any], args: Sequence[Any]) -> Any:
+    """Exécute un service sans autre traitement."""
+    return func(*args)
+
+
+class TestCallMemoizer:
+    """Tests pour CallMemoizer."""
+
+    def test_pure_call_is_memoized(self) -> None:
+        """Vérifie qu'un service pur n'est exécuté qu'une fois par arguments."""
+        calls: List[int] = []
+
+        @service(pure=True)
+        def double(x: int) -> int:
+            calls.append(x)
+            return x * 2
+
+        memoizer = CallMemoizer()
+
+        assert memoizer.call("double", double, (2,), invoke) == 4
+        assert memoizer.call("double", double, (2,), invoke) == 4
+        assert calls == [2]
+        assert memoizer.stats()["double"]["hits"] == 1
+
+    def test_plain_call_is_not_memoized(self) -> None:
+        """Vérifie qu'un service sans option n'a pas de cache."""
+
+        def double(x: int) -> int:
+            return x * 2
+
+        memoizer = CallMemoizer()
+
+        assert memoizer.call("double", double, (2,), invoke) == 4
+        assert memoizer.result_cache("double", double) is None
+        assert memoizer.stats() == {}
+
+    def test_async_pure_call_is_memoized(self) -> None:
+        """Vérifie la mémorisation des appels asynchrones."""
+        calls: List[int] = []
+
+        @service(pure=True)
+        def double(x: int) -> int:
+            calls.append(x)
+            return x * 2
+
+        async def invoke_async(name: str, func: Callable[..., Any], args: Sequence[Any]) -> Any:
+            return func(*args)
+
+        memoizer = CallMemoizer(coalesce=True)
+
+        async def run() -> List[int]:
+            return [await memoizer.call_async("double", double, (3,), invoke_async)]
+
+        assert asyncio.run(run()) == [6]
+        assert asyncio.run(run()) == [6]
+        assert calls == [3]
+        assert memoizer.coalescing_stats() == {"executions": 1, "coalesced": 0}
+
+    def test_coalescing_stats_empty_without_coalescing(self) -> None:
+        """Vérifie que les statistiques de fusion sont vides hors mode fusion."""
+        assert CallMemoizer().coalescing_stats() == {}
+        assert not CallMemoizer().coalesce
+        assert CallMemoizer(coalesce=True).coalesce
+
+    def test_memo_key_canonical_forms(self) -> None:
+        """Vérifie la forme canonique des arguments."""
+        assert CallMemoizer.memo_key((1, [2, [3]]), None, None) == (1, (2, (3,)))
+        assert CallMemoizer.memo_key((1,), None, None) != CallMemoizer.memo_key((1.0,), None, None)
+        assert CallMemoizer.memo_key((0.0,), None, None) != CallMemoizer.memo_key(
+            (-0.0,), None, None
+        )
+        assert CallMemoizer.memo_key(({"a": 1},), None, None) is None
+
+    def test_streams(self) -> None:
+        """Vérifie la détection des appels consommant ou produisant un flux."""
+
+        def produce(n: int) -> Iterator[int]:
+            return iter(range(n))
+
+        def total(values: List[int]) -> int:
+            return sum(values)
+
+        assert CallMemoizer.streams(produce, (1,))
+        assert not CallMemoizer.streams(total, ([1],))
+        assert CallMemoizer.streams(total, (iter([1]),))
+
+    def test_unhashable_callable_service(self) -> None:
+        """Vérifie qu'une instance appelable non hachable est appelée et fusionnée."""
+
+        @dataclass
+        class Offset:
+            """Service appelable, non hachable (``__eq__`` sans ``__hash__``)."""
+
+            delta: int
+
+            def __call__(self, value: int) -> int:
+                return value + self.delta
+
+        memoizer = CallMemoizer(coalesce=True)
+
+        assert not CallMemoizer.streams(Offset(1), (1,))
+        assert memoizer.call("offset", Offset(1), (1,), invoke) == 2
+        assert memoizer.coalescing_stats() == {"executions": 1, "coalesced": 0}
+
+    def test_stream_detection_does_not_keep_services_alive(self) -> None:
+        """Vérifie que la détection des flux ne retient pas les services remplacés."""
+
+        def produce(n: int) -> Iterator[int]:
+            return iter(range(n))
+
+        assert CallMemoizer.streams(produce, (1,))
+        assert CallMemoizer.streams(produce, (1,))
+        ref = weakref.ref(produce)
+        del produce
+        gc.collect()
+
+        assert ref() is None
@@ -1,12 +1,30 @@
 """Tests unitaires pour la classe Executor."""
 
+import asyncio
+import json
+import math
+import os
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, List, cast
+
 import pytest
 
+import baobab_geek_interpreter
 from baobab_geek_interpreter.exceptions.execution_exception import (
     BaobabExecutionException,
 )
+from baobab_geek_interpreter.execution.call_memoizer import CallMemoizer
 from baobab_geek_interpreter.execution.executor import Executor
 from baobab_geek_interpreter.execution.service_decorator import service
+from baobab_geek_interpreter.execution.service_process_pool import ServiceProcessPool
+from baobab_geek_interpreter.lexical.lexical_analyzer import LexicalAnalyzer
+from baobab_geek_interpreter.semantic.bound_call import BoundCall
+from baobab_geek_interpreter.semantic.semantic_analyzer import SemanticAnalyzer
 from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
 from baobab_geek_interpreter.syntax.ast_node import (
     ArgumentNode,
@@ -16,6 +34,27 @@ from baobab_geek_interpreter.syntax.ast_node import (
     ServiceCallNode,
     StringNode,
 )
+from baobab_geek_interpreter.syntax.syntax_analyzer import SyntaxAnalyzer
+from baobab_geek_interpreter.vm.compiler import Compiler
+from baobab_geek_interpreter.vm.program import Program
+
+
+@service(executor="process")
+def process_pid(offset: int) -> int:
+    """Service exécuté dans un processus de travail."""
+    return os.getpid() + offset
+
+
+@service(executor="process")
+def process_fail(message: str) -> None:
+    """Service de processus qui échoue."""
+    raise ValueError(message)
+
+
+@service(batch=True, executor="process", max_batch=4, max_wait_ms=1000)
+def process_pids(offsets: list[int]) -> list[int]:
+    """Service de lot exécuté dans un processus de travail."""
+    return [os.getpid() + offset for offset in offsets]
 
 
 class TestExecutorBasics:
@@ -472,3 +511,1021 @@ class TestExecutorComplexScenarios:
         )
         result = executor.execute(ast)
         assert result == 15.0
+
+
+class TestExecutorSlots:
+    """Tests pour la résolution des services par slot."""
+
+    def test_execute_uses_resolved_slot(self) -> None:
+        """Test l'exécution via un slot résolu."""
+        table = SymbolTable()
+        table.register("double", lambda x: x * 2)
+        slot = table.slot_of("double")
+        assert slot is not None
+
+        ast = ServiceCallNode("double", [ArgumentNode(IntNode(21))], slot, table.generation(slot))
+        assert Executor(table).execute(ast) == 42
+
+    def test_execute_stale_slot_uses_current_service(self) -> None:
+        """Test qu'un slot périmé se replie sur le service courant."""
+        table = SymbolTable()
+        table.register("svc", lambda: "old")
+        ast = ServiceCallNode("svc", [], 0, 0)
+
+        table.register("svc", lambda: "new")
+
+        assert Executor(table).execute(ast) == "new"
+
+
+class TestExecutorBoundCall:
+    """Tests pour l'exécution d'appels liés."""
+
+    def test_execute_bound(self) -> None:
+        """Test l'exécution directe d'un appel lié."""
+        executor = Executor(SymbolTable())
+        bound = BoundCall("add", lambda a, b: a + b, (1, 2))
+
+        assert executor.execute_bound(bound) == 3
+
+    def test_execute_bound_ignores_symbol_table(self) -> None:
+        """Test que l'appel lié n'est pas re-résolu dans la table."""
+        table = SymbolTable()
+        table.register("svc", lambda: "new")
+        bound = BoundCall("svc", lambda: "validated", ())
+
+        assert Executor(table).execute_bound(bound) == "validated"
+
+    def test_execute_bound_wraps_exceptions(self) -> None:
+        """Test que les exceptions du service sont encapsulées."""
+        executor = Executor(SymbolTable())
+        bound = BoundCall("divide", lambda a, b: a / b, (1, 0))
+
+        with pytest.raises(BaobabExecutionException) as exc_info:
+            executor.execute_bound(bound)
+
+        assert exc_info.value.service_name == "divide"
+        assert isinstance(exc_info.value.original_exception, ZeroDivisionError)
+
+
+class TestExecutorColumnar:
+    """Tests pour l'exécution directe d'un AST colonnaire."""
+
+    def test_execute_columnar(self) -> None:
+        """Test l'exécution depuis les colonnes."""
+        table = SymbolTable()
+        table.register("total", lambda values, extra: sum(values) + extra)
+        tokens = LexicalAnalyzer().analyze("total([1.5, 2.5], 1)")
+
+        result = Executor(table).execute_columnar(SyntaxAnalyzer(table).parse_columnar(tokens))
+
+        assert result == 5.0
+
+    def test_execute_columnar_unknown_service(self) -> None:
+        """Test qu'un service introuvable lève une exception."""
+        tokens = LexicalAnalyzer().analyze("unknown()")
+        ast = SyntaxAnalyzer().parse_columnar(tokens)
+
+        with pytest.raises(BaobabExecutionException, match="non trouvé"):
+            Executor(SymbolTable()).execute_columnar(ast)
+
+
+class TestExecutorMemoization:
+    """Tests pour la mémorisation des résultats des services purs."""
+
+    @staticmethod
+    def analyze(table: SymbolTable, source: str) -> BoundCall:
+        """Analyse une source en appel lié."""
+        parser = SyntaxAnalyzer(table, compact_arguments=True)
+        ast = parser.parse(LexicalAnalyzer().analyze(source))
+        return SemanticAnalyzer(table).analyze(ast)
+
+    def test_pure_service_is_memoized(self) -> None:
+        """Test qu'un service pur n'est exécuté qu'une fois par arguments."""
+        calls: list[int] = []
+
+        @service(pure=True)
+        def square(x: int) -> int:
+            calls.append(x)
+            return x * x
+
+        table = SymbolTable()
+        table.register("square", square)
+        executor = Executor(table)
+        bound = BoundCall("square", square, (4,))
+
+        assert executor.execute_bound(bound) == 16
+        assert executor.execute_bound(bound) == 16
+        assert executor.execute_bound(BoundCall("square", square, (5,))) == 25
+        assert calls == [4, 5]
+        assert executor.get_stats()["square"]["hits"] == 1
+        assert executor.get_stats()["square"]["misses"] == 2
+
+    def test_impure_service_is_not_memoized(self) -> None:
+        """Test qu'un service non pur est exécuté à chaque appel."""
+        calls: list[int] = []
+
+        @service
+        def tick(x: int) -> int:
+            calls.append(x)
+            return x
+
+        executor = Executor(SymbolTable())
+        executor.execute_bound(BoundCall("tick", tick, (1,)))
+        executor.execute_bound(BoundCall("tick", tick, (1,)))
+
+        assert calls == [1, 1]
+        assert executor.get_stats() == {}
+
+    def test_int_and_float_are_distinct(self) -> None:
+        """Test que 1 et 1.0 ne partagent pas la même entrée."""
+
+        @service(pure=True)
+        def identity(x: float) -> float:
+            return x
+
+        executor = Executor(SymbolTable())
+
+        assert executor.execute_bound(BoundCall("identity", identity, (1,))) == 1
+        result = executor.execute_bound(BoundCall("identity", identity, (1.0,)))
+        assert isinstance(result, float)
+
+    def test_signed_zeros_are_distinct(self) -> None:
+        """Test que 0.0 et -0.0 ne partagent pas la même entrée."""
+
+        @service(pure=True)
+        def angle(a: float) -> float:
+            return math.atan2(a, -1.0)
+
+        executor = Executor(SymbolTable())
+
+        assert executor.execute_bound(BoundCall("angle", angle, (0.0,))) == math.pi
+        assert executor.execute_bound(BoundCall("angle", angle, (-0.0,))) == -math.pi
+
+    def test_arrays_keyed_by_value(self) -> None:
+        """Test que les tableaux sont indexés par leur forme canonique."""
+        calls: list[list[int]] = []
+
+        @service(pure=True)
+        def total(values: list[int]) -> int:
+            calls.append(values)
+            return sum(values)
+
+        executor = Executor(SymbolTable())
+        executor.execute_bound(BoundCall("total", total, ([1, 2],)))
+        executor.execute_bound(BoundCall("total", total, ([1, 2],)))
+
+        assert len(calls) == 1
+
+    def test_arrays_keyed_by_source_span(self) -> None:
+        """Test que les tableaux littéraux sont indexés par leur texte source."""
+        calls: list[list[int]] = []
+
+        @service(pure=True)
+        def total(values: list[int]) -> int:
+            calls.append(values)
+            return sum(values)
+
+        table = SymbolTable()
+        table.register("total", total)
+        executor = Executor(table)
+        source = "total([1, 2, 3])"
+        bound = self.analyze(table, source)
+
+        assert bound.spans == ((6, 15),)
+        key = CallMemoizer.memo_key(bound.arguments, bound.spans, source)
+        assert key == ((CallMemoizer._SPAN_KEY, "[1, 2, 3]"),)
+
+        executor.execute_bound(bound, source)
+        executor.execute_bound(self.analyze(table, source), source)
+        executor.execute_bound(self.analyze(table, "total([1, 2, 4])"), "total([1, 2, 4])")
+        assert len(calls) == 2
+
+    def test_exceptions_are_not_memoized(self) -> None:
+        """Test qu'une exception n'est pas mémorisée."""
+        calls: list[int] = []
+
+        @service(pure=True)
+        def fragile(x: int) -> int:
+            calls.append(x)
+            raise RuntimeError("boom")
+
+        executor = Executor(SymbolTable())
+        for _ in range(2):
+            with pytest.raises(BaobabExecutionException):
+                executor.execute_bound(BoundCall("fragile", fragile, (1,)))
+
+        assert calls == [1, 1]
+
+    def test_reregistration_resets_cache(self) -> None:
+        """Test qu'une nouvelle fonction pour le même service repart d'un cache vide."""
+
+        @service(pure=True)
+        def first(x: int) -> int:
+            return x
+
+        @service(pure=True)
+        def second(x: int) -> int:
+            return -x
+
+        executor = Executor(SymbolTable())
+        assert executor.execute_bound(BoundCall("f", first, (1,))) == 1
+        assert executor.execute_bound(BoundCall("f", second, (1,))) == -1
+
+    def test_lru_eviction_stats(self) -> None:
+        """Test les évictions lorsque la capacité est atteinte."""
+
+        @service(pure=True, cache_size=2)
+        def identity(x: int) -> int:
+            return x
+
+        executor = Executor(SymbolTable())
+        for value in (1, 2, 3, 1):
+            executor.execute_bound(BoundCall("identity", identity, (value,)))
+
+        stats = executor.get_stats()["identity"]
+        assert stats["evictions"] == 2
+        assert stats["hits"] == 0
+        assert stats["size"] == 2
+
+    def test_visit_service_call_is_memoized(self) -> None:
+        """Test la mémorisation via le parcours de l'AST."""
+        calls: list[int] = []
+
+        @service(pure=True)
+        def square(x: int) -> int:
+            calls.append(x)
+            return x * x
+
+        table = SymbolTable()
+        table.register("square", square)
+        executor = Executor(table)
+        ast = ServiceCallNode("square", [ArgumentNode(IntNode(3))])
+
+        assert executor.execute(ast) == 9
+        assert executor.execute(ast) == 9
+        assert calls == [3]
+
+
+class TestExecutorCoalescing:
+    """Tests pour la fusion des appels identiques en cours."""
+
+    def test_concurrent_identical_calls_execute_once(self) -> None:
+        """Test que des appels identiques simultanés n'exécutent le service qu'une fois."""
+        release = threading.Event()
+        calls: list[int] = []
+
+        @service
+        def slow(x: int) -> int:
+            calls.append(x)
+            release.wait(5)
+            return x * 2
+
+        executor = Executor(SymbolTable(), coalesce=True)
+        results: list[int] = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(executor.execute_bound(BoundCall("slow", slow, (3,))))
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while executor.get_coalescing_stats()["coalesced"] < 4:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert calls == [3]
+        assert results == [6] * 5
+        assert executor.get_coalescing_stats() == {"executions": 1, "coalesced": 4}
+
+    def test_coalescing_disabled_by_default(self) -> None:
+        """Test que la fusion est désactivée par défaut."""
+        assert Executor(SymbolTable()).get_coalescing_stats() == {}
+
+    def test_unhashable_callable_service_is_coalesced(self) -> None:
+        """Test qu'une instance appelable non hachable est exécutée en mode fusion."""
+
+        @dataclass
+        class Offset:
+            """Service appelable, non hachable (``__eq__`` sans ``__hash__``)."""
+
+            delta: int
+
+            def __call__(self, value: int) -> int:
+                return value + self.delta
+
+        table = SymbolTable()
+        table.register("offset", Offset(1))
+        executor = Executor(table, coalesce=True)
+        bound = TestExecutorMemoization.analyze(table, "offset(1)")
+
+        assert executor.execute_bound(bound) == 2
+        assert asyncio.run(executor.execute_bound_async(bound)) == 2
+        assert executor.get_coalescing_stats() == {"executions": 2, "coalesced": 0}
+
+    def test_signed_zeros_are_not_coalesced(self) -> None:
+        """Test que des appels simultanés avec 0.0 et -0.0 ne sont pas fusionnés."""
+        release = threading.Event()
+
+        @service
+        def angle(a: float) -> float:
+            release.wait(5)
+            return math.atan2(a, -1.0)
+
+        executor = Executor(SymbolTable(), coalesce=True)
+        results: list[float] = []
+        threads = [
+            threading.Thread(
+                target=lambda value=value: results.append(
+                    executor.execute_bound(BoundCall("angle", angle, (value,)))
+                )
+            )
+            for value in (0.0, -0.0)
+        ]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5
+        while sum(executor.get_coalescing_stats().values()) < 2:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(results) == [-math.pi, math.pi]
+        assert executor.get_coalescing_stats() == {"executions": 2, "coalesced": 0}
+
+    def test_unhashable_argument_is_not_memoized(self) -> None:
+        """Test qu'un service pur appelé avec un dictionnaire est exécuté sans mémorisation."""
+        calls: list[dict[str, int]] = []
+
+        @service(pure=True)
+        def size(value: dict[str, int]) -> int:
+            calls.append(value)
+            return len(value)
+
+        executor = Executor(SymbolTable())
+        bound = BoundCall("size", size, ({"a": 1},))
+
+        assert executor.execute_bound(bound) == 1
+        assert executor.execute_bound(bound) == 1
+        assert len(calls) == 2
+        assert executor.get_stats()["size"]["size"] == 0
+
+    def test_unhashable_argument_is_not_coalesced(self) -> None:
+        """Test qu'un appel avec un ensemble est exécuté directement en mode fusion."""
+
+        @service
+        def size(value: set[int]) -> int:
+            return len(value)
+
+        executor = Executor(SymbolTable(), coalesce=True)
+
+        assert executor.execute_bound(BoundCall("size", size, ({1, 2},))) == 2
+        assert executor.get_coalescing_stats() == {"executions": 0, "coalesced": 0}
+
+    def test_async_unhashable_argument_is_not_coalesced(self) -> None:
+        """Test qu'un appel asynchrone pur avec un dictionnaire est exécuté directement."""
+
+        @service(pure=True)
+        def size(value: dict[str, int]) -> int:
+            return len(value)
+
+        executor = Executor(SymbolTable(), coalesce=True)
+        bound = BoundCall("size", size, ({"a": 1, "b": 2},))
+
+        assert asyncio.run(executor.execute_bound_async(bound)) == 2
+        assert executor.get_coalescing_stats() == {"executions": 0, "coalesced": 0}
+
+    def test_async_identical_calls_execute_once(self) -> None:
+        """Test la fusion des appels identiques depuis asyncio."""
+        calls: list[int] = []
+
+        @service
+        def slow(x: int) -> int:
+            calls.append(x)
+            time.sleep(0.02)
+            return x * 2
+
+        executor = Executor(SymbolTable(), coalesce=True)
+
+        async def main() -> list[int]:
+            bound = BoundCall("slow", slow, (4,))
+            return await asyncio.gather(*(executor.execute_bound_async(bound) for _ in range(6)))
+
+        assert asyncio.run(main()) == [8] * 6
+        assert calls == [4]
+
+    def test_async_exception_is_wrapped(self) -> None:
+        """Test que l'exception d'un service est encapsulée en mode asynchrone."""
+
+        @service
+        def failing(x: int) -> int:
+            raise RuntimeError("boom")
+
+        executor = Executor(SymbolTable(), coalesce=True)
+
+        with pytest.raises(BaobabExecutionException, match="boom"):
+            asyncio.run(executor.execute_bound_async(BoundCall("failing", failing, (1,))))
+
+    def test_async_coroutine_service(self) -> None:
+        """Test l'exécution d'un service coroutine."""
+
+        async def double(x: int) -> int:
+            await asyncio.sleep(0)
+            return x * 2
+
+        executor = Executor(SymbolTable())
+
+        assert asyncio.run(executor.execute_bound_async(BoundCall("double", double, (5,)))) == 10
+
+    def test_async_decorated_coroutine_service(self) -> None:
+        """Test l'exécution d'un service coroutine décoré par @service."""
+
+        @service
+        async def double(x: int) -> int:
+            return x * 2
+
+        executor = Executor(SymbolTable())
+
+        assert asyncio.run(executor.execute_bound_async(BoundCall("double", double, (5,)))) == 10
+
+    def test_async_pure_service_is_memoized(self) -> None:
+        """Test la mémorisation des services purs en mode asynchrone."""
+        calls: list[int] = []
+
+        @service(pure=True)
+        def square(x: int) -> int:
+            calls.append(x)
+            return x * x
+
+        executor = Executor(SymbolTable())
+        bound = BoundCall("square", square, (3,))
+
+        async def main() -> list[int]:
+            return [await executor.execute_bound_async(bound) for _ in range(3)]
+
+        assert asyncio.run(main()) == [9, 9, 9]
+        assert calls == [3]
+
+
+class TestExecutorBatching:
+    """Tests pour le regroupement des appels des services de lot."""
+
+    def test_concurrent_calls_are_batched(self) -> None:
+        """Test que des appels simultanés sont exécutés en un seul lot."""
+        batches: list[list[int]] = []
+
+        @service(batch=True, max_batch=8, max_wait_ms=1000)
+        def double(values: list[int]) -> list[int]:
+            batches.append(values)
+            return [value * 2 for value in values]
+
+        executor = Executor(SymbolTable())
+        results: dict[int, int] = {}
+
+        def call(value: int) -> None:
+            results[value] = executor.execute_bound(BoundCall("double", double, (value,)))
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == {i: i * 2 for i in range(8)}
+        assert len(batches) == 1
+        assert sorted(batches[0]) == list(range(8))
+        assert executor.get_batch_stats() == {"double": {"batches": 1, "items": 8}}
+
+    def test_batch_exception_is_wrapped(self) -> None:
+        """Test que l'exception de la fonction de lot est encapsulée."""
+
+        @service(batch=True, max_wait_ms=0)
+        def failing(values: list[int]) -> list[int]:
+            raise RuntimeError("boom")
+
+        executor = Executor(SymbolTable())
+
+        with pytest.raises(BaobabExecutionException, match="boom"):
+            executor.execute_bound(BoundCall("failing", failing, (1,)))
+
+    def test_async_calls_are_batched(self) -> None:
+        """Test le regroupement des appels depuis asyncio."""
+        batches: list[list[int]] = []
+
+        @service(batch=True, max_batch=5, max_wait_ms=1000)
+        def negate(values: list[int]) -> list[int]:
+            batches.append(values)
+            return [-value for value in values]
+
+        executor = Executor(SymbolTable())
+
+        async def main() -> list[int]:
+            return await asyncio.gather(
+                *(executor.execute_bound_async(BoundCall("negate", negate, (i,))) for i in range(5))
+            )
+
+        assert asyncio.run(main()) == [0, -1, -2, -3, -4]
+        assert len(batches) == 1
+
+    def test_reregistration_replaces_batcher(self) -> None:
+        """Test qu'un service ré-enregistré utilise un nouveau regroupement."""
+
+        @service(batch=True, max_wait_ms=0)
+        def first(values: list[int]) -> list[int]:
+            return values
+
+        @service(batch=True, max_wait_ms=0)
+        def second(values: list[int]) -> list[int]:
+            return [-value for value in values]
+
+        executor = Executor(SymbolTable())
+
+        assert executor.execute_bound(BoundCall("f", first, (1,))) == 1
+        assert executor.execute_bound(BoundCall("f", second, (1,))) == -1
+
+
+class TestExecutorProcess:
+    """Tests pour les services exécutés dans un processus de travail."""
+
+    def test_service_runs_in_pool(self) -> None:
+        """Test qu'un service ``executor="process"`` s'exécute hors du processus."""
+        with ServiceProcessPool(max_workers=1) as pool:
+            executor = Executor(SymbolTable(), process_pool=pool)
+
+            result = executor.execute_bound(BoundCall("process_pid", process_pid, (0,)))
+
+            assert result != os.getpid()
+            assert executor.get_process_stats()["calls"] == 1
+
+    def test_exception_is_wrapped(self) -> None:
+        """Test que l'exception du service est encapsulée."""
+        with ServiceProcessPool(max_workers=1) as pool:
+            executor = Executor(SymbolTable(), process_pool=pool)
+
+            with pytest.raises(BaobabExecutionException, match="bad input") as info:
+                executor.execute_bound(BoundCall("process_fail", process_fail, ("bad input",)))
+
+            assert isinstance(info.value.original_exception, ValueError)
+
+    def test_async_call(self) -> None:
+        """Test l'exécution depuis asyncio."""
+        with ServiceProcessPool(max_workers=2) as pool:
+            executor = Executor(SymbolTable(), process_pool=pool)
+
+            async def main() -> list[int]:
+                return await asyncio.gather(
+                    *(
+                        executor.execute_bound_async(BoundCall("process_pid", process_pid, (0,)))
+                        for _ in range(4)
+                    )
+                )
+
+            assert os.getpid() not in asyncio.run(main())
+
+    def test_batch_service_runs_in_pool(self) -> None:
+        """Test qu'un service de lot ``executor="process"`` s'exécute dans le pool."""
+        with ServiceProcessPool(max_workers=1) as pool:
+            executor = Executor(SymbolTable(), process_pool=pool)
+            results: list[int] = []
+
+            def call() -> None:
+                results.append(executor.execute_bound(BoundCall("p", process_pids, (0,))))
+
+            threads = [threading.Thread(target=call) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert len(set(results)) == 1
+            assert results[0] != os.getpid()
+            assert pool.calls == 1
+            executor.close()
+
+    def test_default_pool_preloads_registered_modules(self) -> None:
+        """Test la création du pool par défaut et le préchargement des modules."""
+        table = SymbolTable()
+        table.register("process_pid", process_pid)
+        executor = Executor(table)
+
+        assert executor.get_process_stats() == {}
+        assert executor.execute_bound(BoundCall("process_pid", process_pid, (0,))) != os.getpid()
+        assert executor._services._process_modules() == [__name__]
+        executor.close()
+        assert executor.get_process_stats() == {}
+
+    def test_close_keeps_provided_pool(self) -> None:
+        """Test que la fermeture de l'exécuteur ne ferme pas le pool fourni."""
+        with ServiceProcessPool(max_workers=1) as pool:
+            executor = Executor(SymbolTable(), process_pool=pool)
+            executor.execute_bound(BoundCall("process_pid", process_pid, (0,)))
+            executor.close()
+
+            assert pool.call(os.getpid, ()) != os.getpid()
+
+
+class TestExecutorNestedCalls:
+    """Tests pour l'exécution des appels imbriqués."""
+
+    def test_nested_calls_are_evaluated_first(self) -> None:
+        """Test que les appels imbriqués fournissent les arguments du parent."""
+
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        inner = BoundCall("add", add, (1, 2))
+        bound = BoundCall("add", add, (inner, BoundCall("add", add, (inner, 4))))
+
+        assert Executor(SymbolTable()).execute_bound(bound) == 10
+
+    def test_independent_calls_run_concurrently(self) -> None:
+        """Test que les appels imbriqués indépendants s'exécutent simultanément."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fetch(key: str) -> str:
+            barrier.wait()
+            return key
+
+        def merge(a: str, b: str, c: str) -> str:
+            return a + b + c
+
+        bound = BoundCall("merge", merge, tuple(BoundCall("fetch", fetch, (key,)) for key in "abc"))
+
+        executor = Executor(SymbolTable())
+        assert executor.execute_bound(bound) == "abc"
+        executor.close()
+
+    def test_deep_nesting_does_not_exhaust_pool(self) -> None:
+        """Test qu'une imbrication large et profonde se termine."""
+
+        def total(*values: int) -> int:
+            return sum(values)
+
+        def tree(depth: int) -> BoundCall:
+            if depth == 0:
+                return BoundCall("total", total, (1,))
+            return BoundCall("total", total, tuple(tree(depth - 1) for _ in range(4)))
+
+        executor = Executor(SymbolTable())
+        assert executor.execute_bound(tree(5)) == 4**5
+        executor.close()
+
+    def test_failing_nested_call_skips_parent(self) -> None:
+        """Test qu'un appel imbriqué en échec empêche l'appel parent."""
+        calls: list[str] = []
+
+        def fail() -> int:
+            raise RuntimeError("inner failure")
+
+        def parent(a: int, b: int) -> int:
+            calls.append("parent")
+            return a + b
+
+        bound = BoundCall(
+            "parent", parent, (BoundCall("fail", fail, ()), BoundCall("fail", fail, ()))
+        )
+
+        with pytest.raises(BaobabExecutionException, match="inner failure"):
+            Executor(SymbolTable()).execute_bound(bound)
+        assert not calls
+
+    def test_async_nested_calls_are_awaited_concurrently(self) -> None:
+        """Test l'attente simultanée des appels imbriqués en mode asyncio."""
+        running: list[int] = []
+        peak: list[int] = [0]
+
+        async def fetch(key: str) -> str:
+            running.append(1)
+            peak[0] = max(peak[0], len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+            return key
+
+        def merge(a: str, b: str) -> str:
+            return a + b
+
+        bound = BoundCall(
+            "merge", merge, (BoundCall("fetch", fetch, ("x",)), BoundCall("fetch", fetch, ("y",)))
+        )
+
+        assert asyncio.run(Executor(SymbolTable()).execute_bound_async(bound)) == "xy"
+        assert peak[0] == 2
+
+    def test_nested_pure_calls_are_memoized(self) -> None:
+        """Test que les appels imbriqués purs utilisent le cache de résultats."""
+        calls: list[int] = []
+
+        @service(pure=True)
+        def square(x: int) -> int:
+            calls.append(x)
+            return x * x
+
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        executor = Executor(SymbolTable())
+        bound = BoundCall("add", add, (BoundCall("square", square, (3,)), 1))
+
+        assert executor.execute_bound(bound) == 10
+        assert executor.execute_bound(bound) == 10
+        assert calls == [3]
+
+    def test_shared_nested_call_is_executed_once(self) -> None:
+        """Test qu'un appel imbriqué partagé est exécuté une seule fois."""
+        calls: list[str] = []
+
+        def load(key: str) -> int:
+            calls.append(key)
+            return len(key)
+
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        shared = BoundCall("load", load, ("ab",))
+        bound = BoundCall(
+            "add",
+            add,
+            (shared, BoundCall("add", add, (shared, BoundCall("add", add, (shared, 1))))),
+        )
+
+        executor = Executor(SymbolTable())
+        assert executor.execute_bound(bound) == 7
+        assert calls == ["ab"]
+        assert asyncio.run(executor.execute_bound_async(bound)) == 7
+        assert calls == ["ab", "ab"]
+        executor.close()
+
+    def test_shared_failing_call_fails_every_parent(self) -> None:
+        """Test qu'un appel partagé en échec fait échouer tous ses parents."""
+        calls: list[str] = []
+
+        def fail() -> int:
+            calls.append("fail")
+            raise RuntimeError("shared failure")
+
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        shared = BoundCall("fail", fail, ())
+        bound = BoundCall("add", add, (BoundCall("add", add, (shared, 1)), shared))
+
+        executor = Executor(SymbolTable())
+        with pytest.raises(BaobabExecutionException, match="shared failure"):
+            executor.execute_bound(bound)
+        executor.close()
+        assert calls == ["fail"]
+
+
+class TestExecutorScripts:
+    """Tests pour l'exécution des scripts de plusieurs appels."""
+
+    def test_sequential_script(self) -> None:
+        """Test l'exécution séquentielle dans l'ordre du script."""
+        calls: list[int] = []
+
+        def record(x: int) -> int:
+            calls.append(x)
+            return x * 10
+
+        bounds = [BoundCall("record", record, (x,)) for x in (1, 2, 3)]
+
+        assert Executor(SymbolTable()).execute_script(bounds) == [10, 20, 30]
+        assert calls == [1, 2, 3]
+
+    def test_concurrent_script(self) -> None:
+        """Test l'exécution simultanée des appels d'un script."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fetch(key: str) -> str:
+            barrier.wait()
+            return key
+
+        def upper(key: str) -> str:
+            return key.upper()
+
+        bounds = [BoundCall("fetch", fetch, (key,)) for key in "abc"]
+        bounds.append(BoundCall("upper", upper, (BoundCall("upper", upper, ("d",)),)))
+
+        executor = Executor(SymbolTable())
+        assert executor.execute_script(bounds, concurrent=True) == ["a", "b", "c", "D"]
+        assert executor.execute_script([], concurrent=True) == []
+        executor.close()
+
+    @pytest.mark.parametrize("concurrent", [False, True])
+    def test_failing_call_stops_script(self, concurrent: bool) -> None:
+        """Test que l'échec d'un appel fait échouer le script."""
+
+        def fail() -> int:
+            raise RuntimeError("script failure")
+
+        def one() -> int:
+            return 1
+
+        bounds = [BoundCall("one", one, ()), BoundCall("fail", fail, ())]
+
+        executor = Executor(SymbolTable())
+        with pytest.raises(BaobabExecutionException, match="script failure"):
+            executor.execute_script(bounds, concurrent=concurrent)
+        executor.close()
+
+    @pytest.mark.parametrize("concurrent", [False, True])
+    def test_async_script(self, concurrent: bool) -> None:
+        """Test l'exécution d'un script en mode asyncio."""
+
+        async def double(x: int) -> int:
+            await asyncio.sleep(0)
+            return x * 2
+
+        bounds = [BoundCall("double", double, (x,)) for x in (1, 2)]
+
+        result = asyncio.run(Executor(SymbolTable()).execute_script_async(bounds, None, concurrent))
+        assert result == [2, 4]
+
+
+class TestExecutorStreams:
+    """Tests pour les services qui produisent ou consomment des flux."""
+
+    def test_generator_is_streamed_to_consumer(self) -> None:
+        """Test que le générateur est transmis sans être matérialisé."""
+        events: list[str] = []
+
+        def produce(count: int) -> Iterator[int]:
+            for value in range(count):
+                events.append(f"produce {value}")
+                yield value
+
+        def consume(values: Iterable[int]) -> int:
+            total = 0
+            for value in values:
+                events.append(f"consume {value}")
+                total += value
+            return total
+
+        bound = BoundCall("consume", consume, (BoundCall("produce", produce, (2,)),))
+
+        assert Executor(SymbolTable()).execute_bound(bound) == 1
+        assert events == ["produce 0", "consume 0", "produce 1", "consume 1"]
+
+    def test_pure_stream_results_are_not_memoized(self) -> None:
+        """Test qu'un flux retourné par un service pur n'est pas mémorisé."""
+
+        @service(pure=True)
+        def produce(count: int) -> Iterator[int]:
+            return iter(range(count))
+
+        @service(pure=True)
+        def untyped(count: int):  # type: ignore[no-untyped-def]
+            return iter(range(count))
+
+        executor = Executor(SymbolTable(), coalesce=True)
+        for func in (produce, untyped):
+            bound = BoundCall(func.__name__, func, (3,))
+            assert list(executor.execute_bound(bound)) == [0, 1, 2]
+            assert list(executor.execute_bound(bound)) == [0, 1, 2]
+            assert list(asyncio.run(executor.execute_bound_async(bound))) == [0, 1, 2]
+        assert executor.get_stats()["untyped"]["size"] == 0
+
+    def test_pure_consumer_of_stream_is_not_memoized(self) -> None:
+        """Test qu'un service pur recevant un flux est exécuté à chaque appel."""
+        calls: list[int] = []
+
+        @service(pure=True)
+        def total(values: Iterable[int]) -> int:
+            calls.append(1)
+            return sum(values)
+
+        def produce(count: int) -> Iterator[int]:
+            return iter(range(count))
+
+        executor = Executor(SymbolTable())
+        bound = BoundCall("total", total, (BoundCall("produce", produce, (3,)),))
+
+        assert executor.execute_bound(bound) == 3
+        assert executor.execute_bound(bound) == 3
+        assert len(calls) == 2
+
+
+class TestExecutorPrograms:
+    """Tests pour l'exécution des programmes compilés."""
+
+    @staticmethod
+    def _compile(table: SymbolTable, source: str) -> Program:
+        """Compile un code source validé."""
+        ast = SyntaxAnalyzer(table).parse(LexicalAnalyzer().analyze(source))
+        SemanticAnalyzer(table).analyze(ast)
+        return Compiler(table).compile(ast)
+
+    def test_program_matches_visitor(self) -> None:
+        """Test qu'un programme produit le même résultat que le visiteur."""
+
+        def total(values: list[int]) -> int:
+            return sum(values)
+
+        table = SymbolTable()
+        table.register("add", lambda a, b: a + b)
+        table.register("total", total)
+        source = "add(add(1, 2), total([3, 4]))"
+        executor = Executor(table)
+        program = self._compile(table, source)
+
+        assert executor.execute_program(program) == 10
+        assert executor.execute_program(program) == 10
+        assert (
+            executor.execute(SyntaxAnalyzer(table).parse(LexicalAnalyzer().analyze(source))) == 10
+        )
+
+    def test_pure_service_is_memoized(self) -> None:
+        """Test qu'un service pur appelé par un programme est mémorisé."""
+        calls: list[int] = []
+
+        @service(pure=True)
+        def square(value: int) -> int:
+            calls.append(value)
+            return value * value
+
+        table = SymbolTable()
+        table.register("square", square)
+        executor = Executor(table)
+        program = self._compile(table, "square(4)")
+
+        assert executor.execute_program(program) == 16
+        assert executor.execute_program(program) == 16
+        assert calls == [4]
+
+    def test_coalescing_executor_dispatches_every_call(self) -> None:
+        """Test qu'en mode fusion, les appels passent par l'exécuteur."""
+        table = SymbolTable()
+        table.register("add", lambda a, b: a + b)
+        executor = Executor(table, coalesce=True)
+
+        assert executor.execute_program(self._compile(table, "add(1, 2)")) == 3
+        assert executor.get_coalescing_stats() == {"executions": 1, "coalesced": 0}
+
+    def test_link_is_cached_per_program(self) -> None:
+        """Test que les exécutables d'un programme sont liés une seule fois."""
+        add = service(lambda a, b: a + b)
+        table = SymbolTable()
+        table.register("add", add)
+        table.register("square", service(pure=True)(lambda value: value * value))
+        executor = Executor(table)
+        program = self._compile(table, "add(square(2), 1)")
+
+        callees = executor.link(program)
+        assert callees is executor.link(program)
+        assert callees[0] is not add
+        assert callees[1] is add
+
+    def test_service_error_is_wrapped(self) -> None:
+        """Test l'encapsulation de l'exception d'un service, direct ou non."""
+
+        def fail(value: int) -> int:
+            raise ValueError("boom")
+
+        table = SymbolTable()
+        table.register("fail", fail)
+        table.register("pure_fail", service(pure=True)(fail))
+
+        for source in ("fail(1)", "pure_fail(1)"):
+            with pytest.raises(BaobabExecutionException, match="boom") as exc_info:
+                Executor(table).execute_program(self._compile(table, source))
+            assert isinstance(exc_info.value.original_exception, ValueError)
+
+
+class TestExecutorImports:
+    """Tests pour les modules importés avec l'exécuteur."""
+
+    @staticmethod
+    def _loaded(modules: List[str]) -> List[str]:
+        """Importe l'exécuteur dans un nouveau processus et liste les modules chargés."""
+        source = Path(baobab_geek_interpreter.__file__).parent.parent
+        code = (
+            "import json, sys; import baobab_geek_interpreter.execution.executor; "
+            f"print(json.dumps([m for m in {modules!r} if m in sys.modules]))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=dict(os.environ, PYTHONPATH=str(source)),
+        ).stdout.strip()
+        return cast(List[str], json.loads(output))
+
+    def test_asyncio_is_not_imported(self) -> None:
+        """Test que l'import de l'exécuteur n'importe pas asyncio."""
+        assert self._loaded(["asyncio"]) == []
+
+    def test_process_pool_is_not_imported(self) -> None:
+        """Test que l'import de l'exécuteur n'importe pas le pool de processus."""
+        modules = [
+            "baobab_geek_interpreter.execution.service_process_pool",
+            "baobab_geek_interpreter.execution.shared_array",
+            "multiprocessing.shared_memory",
+        ]
+        assert self._loaded(modules) == []
@@ -0,0 +1,117 @@
+"""Tests unitaires pour la classe MicroBatcher."""
+
+import threading
+from typing import Any, List
+
+import pytest
+
+from baobab_geek_interpreter.execution.micro_batcher import MicroBatcher
+
+
+class TestMicroBatcher:
+    """Tests pour MicroBatcher."""
+
+    def test_single_call(self) -> None:
+        """Vérifie qu'un appel isolé est exécuté après le délai d'attente."""
+        batcher = MicroBatcher(lambda xs: [x + 1 for x in xs], max_batch=8, max_wait=0.001)
+
+        assert batcher.submit((1,)) == 2
+        assert batcher.stats() == {"batches": 1, "items": 1}
+        batcher.close()
+
+    def test_arguments_are_transposed(self) -> None:
+        """Vérifie que la fonction de lot reçoit une liste par paramètre."""
+        received: List[Any] = []
+
+        def batch(names: List[str], counts: List[int]) -> List[str]:
+            received.append((names, counts))
+            return [name * count for name, count in zip(names, counts)]
+
+        batcher = MicroBatcher(batch, max_batch=2, max_wait=5.0)
+        futures = [batcher.submit_future(("a", 2)), batcher.submit_future(("b", 3))]
+
+        assert [future.result(5) for future in futures] == ["aa", "bbb"]
+        assert received == [(["a", "b"], [2, 3])]
+        batcher.close()
+
+    def test_full_batch_is_dispatched_immediately(self) -> None:
+        """Vérifie qu'un lot complet n'attend pas la fin du délai."""
+        batcher = MicroBatcher(lambda xs: xs, max_batch=3, max_wait=60.0)
+        futures = [batcher.submit_future((i,)) for i in range(3)]
+
+        assert [future.result(5) for future in futures] == [0, 1, 2]
+        batcher.close()
+
+    def test_splits_into_max_batch(self) -> None:
+        """Vérifie que les lots ne dépassent pas la taille maximale."""
+        sizes: List[int] = []
+
+        def batch(xs: List[int]) -> List[int]:
+            sizes.append(len(xs))
+            return xs
+
+        batcher = MicroBatcher(batch, max_batch=4, max_wait=0.05)
+        futures = [batcher.submit_future((i,)) for i in range(10)]
+
+        assert [future.result(5) for future in futures] == list(range(10))
+        assert max(sizes) <= 4
+        assert sum(sizes) == 10
+        batcher.close()
+
+    def test_concurrent_callers_share_batches(self) -> None:
+        """Vérifie le regroupement des appels de plusieurs threads."""
+        batcher = MicroBatcher(lambda xs: [x * x for x in xs], max_batch=16, max_wait=0.05)
+        results: List[int] = [0] * 16
+
+        def call(index: int) -> None:
+            results[index] = batcher.submit((index,))
+
+        threads = [threading.Thread(target=call, args=(i,)) for i in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [i * i for i in range(16)]
+        assert batcher.batches < 16
+        batcher.close()
+
+    def test_exception_fails_whole_batch(self) -> None:
+        """Vérifie que l'exception de la fonction de lot atteint chaque appel."""
+
+        def batch(xs: List[int]) -> List[int]:
+            raise RuntimeError("backend down")
+
+        batcher = MicroBatcher(batch, max_batch=2, max_wait=5.0)
+        futures = [batcher.submit_future((1,)), batcher.submit_future((2,))]
+
+        for future in futures:
+            with pytest.raises(RuntimeError, match="backend down"):
+                future.result(5)
+        batcher.close()
+
+    def test_wrong_result_count(self) -> None:
+        """Vérifie le refus d'un nombre de résultats incorrect."""
+        batcher = MicroBatcher(lambda xs: [0], max_batch=2, max_wait=5.0)
+        futures = [batcher.submit_future((1,)), batcher.submit_future((2,))]
+
+        with pytest.raises(ValueError, match="1 results for 2 calls"):
+            futures[0].result(5)
+        batcher.close()
+
+    def test_close_flushes_pending_calls(self) -> None:
+        """Vérifie que la fermeture exécute les appels en attente."""
+        batcher = MicroBatcher(lambda xs: xs, max_batch=8, max_wait=60.0)
+        future = batcher.submit_future((7,))
+
+        batcher.close()
+
+        assert future.result(0) == 7
+
+    def test_submit_after_close(self) -> None:
+        """Vérifie le refus d'un appel après fermeture."""
+        batcher = MicroBatcher(lambda xs: xs, max_batch=8, max_wait=0.001)
+        batcher.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            batcher.submit((1,))
@@ -0,0 +1,90 @@
+"""Tests unitaires pour la classe ResultCache."""
+
+from baobab_geek_interpreter.execution.result_cache import ResultCache
+
+
+class FakeClock:
+    """Horloge contrôlée par les tests."""
+
+    def __init__(self) -> None:
+        """Initialise l'horloge à zéro."""
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Retourne l'instant courant."""
+        return self.now
+
+
+class TestResultCache:
+    """Tests pour ResultCache."""
+
+    def test_miss_then_hit(self) -> None:
+        """Vérifie un échec puis un succès."""
+        cache = ResultCache(max_size=4)
+
+        assert cache.get("k") == (False, None)
+        cache.put("k", 42)
+
+        assert cache.get("k") == (True, 42)
+        assert cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+            "expirations": 0,
+            "size": 1,
+        }
+
+    def test_none_result_is_cached(self) -> None:
+        """Vérifie qu'un résultat None est distingué d'une absence."""
+        cache = ResultCache(max_size=4)
+        cache.put("k", None)
+
+        assert cache.get("k") == (True, None)
+
+    def test_lru_eviction(self) -> None:
+        """Vérifie l'éviction de l'entrée la moins récemment utilisée."""
+        cache = ResultCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, 1)
+        assert cache.get("c") == (True, 3)
+        assert cache.evictions == 1
+        assert len(cache) == 2
+
+    def test_ttl_expiration(self) -> None:
+        """Vérifie l'expiration des entrées trop anciennes."""
+        clock = FakeClock()
+        cache = ResultCache(max_size=4, ttl=10.0, clock=clock)
+        cache.put("k", 1)
+
+        clock.now = 9.9
+        assert cache.get("k") == (True, 1)
+        clock.now = 10.0
+        assert cache.get("k") == (False, None)
+        assert cache.expirations == 1
+        assert len(cache) == 0
+
+    def test_put_refreshes_timestamp(self) -> None:
+        """Vérifie qu'une nouvelle mémorisation renouvelle la validité."""
+        clock = FakeClock()
+        cache = ResultCache(max_size=4, ttl=10.0, clock=clock)
+        cache.put("k", 1)
+        clock.now = 8.0
+        cache.put("k", 2)
+        clock.now = 15.0
+
+        assert cache.get("k") == (True, 2)
+
+    def test_clear_keeps_stats(self) -> None:
+        """Vérifie que clear vide le cache sans remettre les compteurs à zéro."""
+        cache = ResultCache(max_size=4)
+        cache.put("k", 1)
+        cache.get("k")
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.hits == 1
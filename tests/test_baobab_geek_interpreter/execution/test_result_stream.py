@@ -0,0 +1,154 @@
+"""Tests unitaires pour la classe ResultStream."""
+
+import asyncio
+from typing import Any, AsyncIterator, Iterator, List
+
+import pytest
+
+from baobab_geek_interpreter.exceptions.execution_exception import (
+    BaobabExecutionException,
+)
+from baobab_geek_interpreter.execution.result_stream import ResultStream
+
+
+class _Source:
+    """Générateur instrumenté : éléments produits et fermeture."""
+
+    def __init__(self, count: int, fail_at: int = -1) -> None:
+        """Initialise la source."""
+        self.count = count
+        self.fail_at = fail_at
+        self.produced = 0
+        self.closed = False
+
+    def items(self) -> Iterator[int]:
+        """Produit les entiers de 0 à ``count`` exclu."""
+        try:
+            for value in range(self.count):
+                if value == self.fail_at:
+                    raise RuntimeError("source en échec")
+                self.produced += 1
+                yield value
+        finally:
+            self.closed = True
+
+    async def aitems(self) -> AsyncIterator[int]:
+        """Produit les mêmes entiers de manière asynchrone."""
+        for value in self.items():
+            await asyncio.sleep(0)
+            yield value
+
+
+async def _collect(stream: ResultStream) -> List[Any]:
+    """Parcourt un flux de manière asynchrone."""
+    return [item async for item in stream]
+
+
+class TestResultStream:
+    """Tests pour la diffusion synchrone."""
+
+    def test_iterator_is_streamed(self) -> None:
+        """Test qu'un générateur est consommé au fur et à mesure."""
+        source = _Source(5)
+        items = iter(ResultStream(source.items()))
+
+        assert next(items) == 0
+        assert source.produced == 1
+        assert list(items) == [1, 2, 3, 4]
+        assert source.closed
+
+    def test_chunks(self) -> None:
+        """Test le regroupement en lots."""
+        assert list(ResultStream(iter(range(5)), chunk_size=2)) == [[0, 1], [2, 3], [4]]
+        assert not list(ResultStream(iter([]), chunk_size=2))
+
+    def test_non_iterator_results(self) -> None:
+        """Test qu'une liste est diffusée et qu'une autre valeur est un élément unique."""
+        assert list(ResultStream([1, 2, 3])) == [1, 2, 3]
+        assert list(ResultStream((1, 2), chunk_size=5)) == [[1, 2]]
+        assert list(ResultStream("abc")) == ["abc"]
+        assert list(ResultStream({"a": 1})) == [{"a": 1}]
+
+    def test_async_generator(self) -> None:
+        """Test qu'un générateur asynchrone est parcouru de manière synchrone."""
+        source = _Source(3)
+
+        assert list(ResultStream(source.aitems(), chunk_size=2)) == [[0, 1], [2]]
+
+    def test_early_close_closes_source(self) -> None:
+        """Test que la sortie anticipée ferme le générateur du service."""
+        source = _Source(100)
+        items = iter(ResultStream(source.items(), chunk_size=10))
+
+        assert next(items) == list(range(10))
+        items.close()
+        assert source.closed
+        assert source.produced == 10
+
+    def test_source_error_is_wrapped(self) -> None:
+        """Test qu'une exception de la source est encapsulée."""
+        with pytest.raises(BaobabExecutionException, match="export") as exc_info:
+            list(ResultStream(_Source(5, fail_at=2).items(), "export"))
+
+        assert isinstance(exc_info.value.original_exception, RuntimeError)
+        with pytest.raises(BaobabExecutionException, match="source en échec"):
+            list(ResultStream(_Source(5, fail_at=2).aitems()))
+
+    @pytest.mark.parametrize("options", [{"chunk_size": 0}, {"buffer": 0}])
+    def test_invalid_options(self, options: Any) -> None:
+        """Test le rejet d'une taille de lot ou de tampon nulle."""
+        with pytest.raises(ValueError):
+            ResultStream([], **options)
+
+
+class TestResultStreamAsync:
+    """Tests pour la diffusion asynchrone avec contre-pression."""
+
+    def test_iterator_and_async_generator(self) -> None:
+        """Test la diffusion d'un générateur synchrone et asynchrone."""
+        assert asyncio.run(_collect(ResultStream(_Source(4).items()))) == [0, 1, 2, 3]
+        assert asyncio.run(_collect(ResultStream(_Source(5).aitems(), chunk_size=2))) == [
+            [0, 1],
+            [2, 3],
+            [4],
+        ]
+        assert asyncio.run(_collect(ResultStream(7))) == [7]
+
+    def test_backpressure_bounds_read_ahead(self) -> None:
+        """Test que le producteur ne devance le consommateur que de quelques lots."""
+        source = _Source(1000)
+
+        async def slow_consumer() -> int:
+            stream = ResultStream(source.aitems(), chunk_size=10, buffer=2)
+            async for _ in stream:
+                for _ in range(20):
+                    await asyncio.sleep(0)
+                return source.produced
+            return -1
+
+        produced = asyncio.run(slow_consumer())
+
+        # Un lot consommé, deux en file, un en attente de place.
+        assert produced <= 40
+        assert source.closed
+
+    def test_early_exit_closes_thread_source(self) -> None:
+        """Test que l'arrêt du consommateur ferme un générateur lu dans un thread."""
+        source = _Source(1000)
+
+        async def first_chunk() -> List[int]:
+            stream = ResultStream(source.items(), chunk_size=10).__aiter__()
+            chunk = await stream.__anext__()
+            await stream.aclose()
+            return chunk
+
+        assert asyncio.run(first_chunk()) == list(range(10))
+        assert source.closed
+        assert source.produced < 1000
+
+    def test_source_error_is_wrapped(self) -> None:
+        """Test qu'une exception de la source est propagée au consommateur."""
+        with pytest.raises(BaobabExecutionException, match="source en échec"):
+            asyncio.run(_collect(ResultStream(_Source(5, fail_at=3).items())))
+        with pytest.raises(BaobabExecutionException, match="source en échec"):
+            asyncio.run(_collect(ResultStream(_Source(5, fail_at=3).aitems(), chunk_size=2)))
@@ -1,5 +1,7 @@
 """Tests unitaires pour le décorateur @service."""
 
+import inspect
+
 import pytest
 
 from baobab_geek_interpreter.execution.service_decorator import service
@@ -170,3 +172,97 @@ class TestServiceDecorator:
         assert mixed(1, 2) == 3
         assert mixed(1, 2, 3, 4) == 10
         assert mixed(1, 2, 3, x=10, y=20) == 36
+
+
+class TestServiceDecoratorOptions:
+    """Tests pour les options du décorateur @service."""
+
+    def test_default_options(self) -> None:
+        """Test que les options par défaut déclarent un service non pur."""
+
+        @service
+        def my_function() -> int:
+            return 1
+
+        options = my_function._service_options  # type: ignore[attr-defined]
+        assert options.pure is False
+        assert options.ttl is None
+
+    def test_options_with_arguments(self) -> None:
+        """Test du décorateur appelé avec des options."""
+
+        @service(pure=True, cache_size=8, ttl=5.0)
+        def square(x: int) -> int:
+            return x * x
+
+        options = square._service_options  # type: ignore[attr-defined]
+        assert square(3) == 9
+        assert square._is_service is True  # type: ignore[attr-defined]
+        assert square._service_name == "square"  # type: ignore[attr-defined]
+        assert (options.pure, options.cache_size, options.ttl) == (True, 8, 5.0)
+
+    def test_empty_call(self) -> None:
+        """Test du décorateur appelé sans option (``@service()``)."""
+
+        @service()
+        def my_function() -> int:
+            return 1
+
+        assert my_function._is_service is True  # type: ignore[attr-defined]
+
+    def test_invalid_options(self) -> None:
+        """Test du refus d'options invalides."""
+        with pytest.raises(ValueError):
+            service(pure=True, cache_size=0)
+        with pytest.raises(ValueError):
+            service(pure=True, ttl=0)
+
+
+class TestServiceDecoratorBatch:
+    """Tests pour les services de lot."""
+
+    def test_item_signature(self) -> None:
+        """Test que la signature exposée est celle d'un appel individuel."""
+
+        @service(batch=True, max_batch=8, max_wait_ms=1)
+        def score(features: list[float], labels: list[str]) -> list[float]:
+            return features
+
+        signature = inspect.signature(score)
+
+        assert [p.annotation for p in signature.parameters.values()] == [float, str]
+        assert signature.return_annotation is float
+        assert score._service_options.max_batch == 8  # type: ignore[attr-defined]
+
+    def test_unannotated_parameters(self) -> None:
+        """Test qu'un paramètre sans annotation ``list[T]`` accepte toute valeur."""
+
+        @service(batch=True)
+        def echo(values):  # type: ignore[no-untyped-def]
+            return values
+
+        parameter = next(iter(inspect.signature(echo).parameters.values()))
+        assert parameter.annotation is inspect.Parameter.empty
+
+    def test_direct_call_is_single_item_batch(self) -> None:
+        """Test qu'un appel direct exécute un lot d'un seul appel."""
+        received: list[object] = []
+
+        @service(batch=True)
+        def add(a: list[int], b: list[int]) -> list[int]:
+            received.append((a, b))
+            return [x + y for x, y in zip(a, b)]
+
+        assert add(1, 2) == 3
+        assert add(a=1, b=2) == 3
+        assert received[0] == ([1], [2])
+
+    def test_batch_function_is_exposed(self) -> None:
+        """Test que la fonction de lot d'origine est accessible."""
+
+        def raw(values: list[int]) -> list[int]:
+            return values
+
+        decorated = service(batch=True)(raw)
+
+        assert decorated._batch_function is raw  # type: ignore[attr-defined]
@@ -0,0 +1,56 @@
+"""Tests unitaires pour la classe ServiceDispatcher."""
+
+from typing import List
+
+from baobab_geek_interpreter.execution.service_decorator import service
+from baobab_geek_interpreter.execution.service_dispatcher import ServiceDispatcher
+from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+
+
+class TestServiceDispatcher:
+    """Tests pour ServiceDispatcher."""
+
+    def test_plain_service_has_no_batcher(self) -> None:
+        """Vérifie qu'un service sans option n'est ni regroupé ni exécuté en processus."""
+
+        def double(x: int) -> int:
+            return x * 2
+
+        dispatcher = ServiceDispatcher(SymbolTable())
+
+        assert dispatcher.batcher("double", double) is None
+        assert not dispatcher.runs_in_process(double)
+        assert dispatcher.batch_stats() == {}
+        assert dispatcher.process_stats() == {}
+
+    def test_batcher_is_reused_then_replaced(self) -> None:
+        """Vérifie qu'un regroupement est créé une fois par fonction de service."""
+
+        @service(batch=True, max_wait_ms=1)
+        def double(values: List[int]) -> List[int]:
+            return [value * 2 for value in values]
+
+        @service(batch=True, max_wait_ms=1)
+        def triple(values: List[int]) -> List[int]:
+            return [value * 3 for value in values]
+
+        dispatcher = ServiceDispatcher(SymbolTable())
+        batcher = dispatcher.batcher("f", double)
+
+        assert batcher is not None
+        assert dispatcher.batcher("f", double) is batcher
+        assert batcher.submit((21,)) == 42
+        replaced = dispatcher.batcher("f", triple)
+        assert replaced is not None and replaced is not batcher
+        assert replaced.submit((2,)) == 6
+        dispatcher.close()
+        assert dispatcher.batch_stats() == {}
+
+    def test_runs_in_process(self) -> None:
+        """Vérifie la détection des services exécutés en processus."""
+
+        @service(executor="process")
+        def remote(x: int) -> int:
+            return x
+
+        assert ServiceDispatcher.runs_in_process(remote)
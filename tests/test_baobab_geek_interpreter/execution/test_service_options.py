@@ -0,0 +1,72 @@
+"""Tests unitaires pour la classe ServiceOptions."""
+
+import pytest
+
+from baobab_geek_interpreter.execution.service_options import ServiceOptions
+
+
+class TestServiceOptions:
+    """Tests pour ServiceOptions."""
+
+    def test_defaults(self) -> None:
+        """Vérifie les valeurs par défaut."""
+        options = ServiceOptions()
+
+        assert options.pure is False
+        assert options.cache_size == ServiceOptions.DEFAULT_CACHE_SIZE
+        assert options.ttl is None
+
+    def test_custom_values(self) -> None:
+        """Vérifie les valeurs personnalisées."""
+        options = ServiceOptions(pure=True, cache_size=4, ttl=1.5)
+
+        assert (options.pure, options.cache_size, options.ttl) == (True, 4, 1.5)
+
+    @pytest.mark.parametrize("cache_size", [0, -1])
+    def test_invalid_cache_size(self, cache_size: int) -> None:
+        """Vérifie le refus d'une taille de cache non positive."""
+        with pytest.raises(ValueError, match="cache_size"):
+            ServiceOptions(cache_size=cache_size)
+
+    @pytest.mark.parametrize("ttl", [0, -2.0])
+    def test_invalid_ttl(self, ttl: float) -> None:
+        """Vérifie le refus d'une durée de validité non positive."""
+        with pytest.raises(ValueError, match="ttl"):
+            ServiceOptions(ttl=ttl)
+
+    def test_repr(self) -> None:
+        """Vérifie la représentation technique."""
+        assert repr(ServiceOptions(pure=True)) == (
+            "ServiceOptions(pure=True, cache_size=128, ttl=None, "
+            "batch=False, max_batch=64, max_wait_ms=2.0, executor='inline')"
+        )
+
+    def test_batch_options(self) -> None:
+        """Vérifie les options de regroupement en lots."""
+        options = ServiceOptions(batch=True, max_batch=8, max_wait_ms=0)
+
+        assert (options.batch, options.max_batch, options.max_wait_ms) == (True, 8, 0)
+
+    def test_invalid_batch_options(self) -> None:
+        """Vérifie le refus d'options de lot invalides."""
+        with pytest.raises(ValueError, match="max_batch"):
+            ServiceOptions(batch=True, max_batch=0)
+        with pytest.raises(ValueError, match="max_wait_ms"):
+            ServiceOptions(batch=True, max_wait_ms=-1)
+
+    def test_executor_option(self) -> None:
+        """Vérifie le lieu d'exécution."""
+        assert ServiceOptions().executor == "inline"
+        assert ServiceOptions(executor="process").executor == "process"
+
+    def test_invalid_executor(self) -> None:
+        """Vérifie le refus d'un lieu d'exécution inconnu."""
+        with pytest.raises(ValueError, match="executor"):
+            ServiceOptions(executor="gpu")
+
+    def test_plain(self) -> None:
+        """Vérifie la détection d'un service sans option d'exécution."""
+        assert ServiceOptions(ttl=10.0).plain
+        assert not ServiceOptions(pure=True).plain
+        assert not ServiceOptions(batch=True).plain
+        assert not ServiceOptions(executor="process").plain
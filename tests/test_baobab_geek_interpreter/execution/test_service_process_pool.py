@@ -0,0 +1,172 @@
+"""Tests unitaires pour la classe ServiceProcessPool."""
+
+import os
+import signal
+import sys
+from typing import Any, List, Tuple
+
+import pytest
+
+from baobab_geek_interpreter.execution.service_decorator import service
+from baobab_geek_interpreter.execution.service_process_pool import ServiceProcessPool
+from baobab_geek_interpreter.execution.shared_array import SharedArray
+
+
+def worker_pid() -> int:
+    """Retourne l'identifiant du processus courant."""
+    return os.getpid()
+
+
+def loaded_modules() -> List[str]:
+    """Retourne les modules chargés par le processus courant."""
+    return sorted(sys.modules)
+
+
+def fail(message: str) -> None:
+    """Lève une exception."""
+    raise KeyError(message)
+
+
+def describe(values: Any, scale: float) -> Tuple[str, float]:
+    """Retourne le type de l'argument reçu et la somme de ses éléments."""
+    return type(values).__name__, sum(values) * scale
+
+
+@service(batch=True)
+def lengths(words: List[str]) -> List[int]:
+    """Service de lot retournant la longueur de chaque mot."""
+    return [len(word) for word in words]
+
+
+class TestServiceProcessPool:
+    """Tests pour ServiceProcessPool."""
+
+    def test_runs_in_another_process(self) -> None:
+        """Vérifie que l'appel est exécuté hors du processus courant."""
+        with ServiceProcessPool(max_workers=1) as pool:
+            assert pool.call(worker_pid, ()) != os.getpid()
+
+    def test_arguments_and_result(self) -> None:
+        """Vérifie le transfert des arguments et du résultat."""
+        with ServiceProcessPool(max_workers=1) as pool:
+            assert pool.call(sorted, ([3, 1, 2],)) == [1, 2, 3]
+            assert pool.submit(divmod, (17, 5)).result() == (3, 2)
+
+    def test_exception_is_propagated(self) -> None:
+        """Vérifie la propagation de l'exception du service."""
+        with ServiceProcessPool(max_workers=1) as pool:
+            with pytest.raises(KeyError, match="missing"):
+                pool.call(fail, ("missing",))
+
+    def test_unpicklable_service(self) -> None:
+        """Vérifie le refus d'un service non sérialisable."""
+        with ServiceProcessPool(max_workers=1) as pool:
+            with pytest.raises(Exception):
+                pool.call(lambda: 1, ())
+
+    def test_batch_function(self) -> None:
+        """Vérifie l'appel de la fonction de lot d'un service de lot."""
+        with ServiceProcessPool(max_workers=1) as pool:
+            assert pool.call(lengths, (["a", "abc"],), batch=True) == [1, 3]
+
+    def test_preload(self) -> None:
+        """Vérifie l'import des modules préchargés au démarrage des processus."""
+        with ServiceProcessPool(max_workers=1, preload=["wave"]) as pool:
+            assert "wave" in pool.call(loaded_modules, ())
+
+    def test_recycling(self) -> None:
+        """Vérifie le recyclage des processus après le nombre d'appels configuré."""
+        with ServiceProcessPool(max_workers=1, max_calls_per_worker=2) as pool:
+            pids = [pool.call(worker_pid, ()) for _ in range(5)]
+
+            assert pids[0] == pids[1]
+            assert pids[1] != pids[2]
+            assert pool.stats() == {"calls": 5, "recycles": 2, "workers": 1, "shared_arrays": 0}
+
+    def test_broken_pool_is_replaced(self) -> None:
+        """Vérifie le remplacement d'un pool dont un processus a été tué."""
+        with ServiceProcessPool(max_workers=1) as pool:
+            pid = pool.call(worker_pid, ())
+            os.kill(pid, signal.SIGKILL)
+            with pytest.raises(Exception):
+                for _ in range(10):
+                    pool.call(worker_pid, ())
+
+            assert pool.call(worker_pid, ()) != pid
+
+    def test_closed_pool(self) -> None:
+        """Vérifie le refus d'un appel après fermeture."""
+        pool = ServiceProcessPool(max_workers=1)
+        pool.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.call(worker_pid, ())
+
+    def test_invalid_arguments(self) -> None:
+        """Vérifie le refus de nombres invalides."""
+        with pytest.raises(ValueError, match="max_workers"):
+            ServiceProcessPool(max_workers=0)
+        with pytest.raises(ValueError, match="max_calls_per_worker"):
+            ServiceProcessPool(max_calls_per_worker=0)
+
+    def test_default_workers(self) -> None:
+        """Vérifie le nombre de processus par défaut."""
+        assert ServiceProcessPool().max_workers == (os.cpu_count() or 1)
+
+
+class TestServiceProcessPoolSharedMemory:
+    """Tests pour la transmission des tableaux en mémoire partagée."""
+
+    def test_large_arrays_are_shared(self) -> None:
+        """Vérifie qu'un grand tableau homogène est reçu comme une vue."""
+        with ServiceProcessPool(max_workers=1, shared_memory_threshold=4) as pool:
+            assert pool.call(describe, ([1.0, 2.0, 3.0, 4.0], 2.0)) == ("memoryview", 20.0)
+            assert pool.call(describe, ([1, 2, 3, 4], 1.0)) == ("memoryview", 10.0)
+            assert pool.stats()["shared_arrays"] == 2
+
+    def test_small_or_mixed_arrays_are_pickled(self) -> None:
+        """Vérifie que les petits tableaux et les tableaux mixtes restent des listes."""
+        with ServiceProcessPool(max_workers=1, shared_memory_threshold=4) as pool:
+            assert pool.call(describe, ([1.0, 2.0], 1.0)) == ("list", 3.0)
+            assert pool.call(describe, ([1, 2.0, 3, 4], 1.0)) == ("list", 10.0)
+            assert pool.stats()["shared_arrays"] == 0
+
+    def test_disabled_by_default(self) -> None:
+        """Vérifie que la mémoire partagée n'est pas utilisée par défaut."""
+        with ServiceProcessPool(max_workers=1) as pool:
+            assert pool.call(describe, ([1.0] * 100, 1.0)) == ("list", 100.0)
+
+    def test_segments_are_released(self) -> None:
+        """Vérifie la libération des segments après l'appel, y compris en cas d'échec."""
+        created: List[SharedArray] = []
+        original = SharedArray.share
+
+        def recording_share(values: Any) -> Any:
+            segment = original(values)
+            created.append(segment)
+            return segment
+
+        with ServiceProcessPool(max_workers=1, shared_memory_threshold=2) as pool:
+            SharedArray.share = recording_share  # type: ignore[method-assign]
+            try:
+                pool.call(describe, ([1.0, 2.0], 1.0))
+                with pytest.raises(TypeError):
+                    pool.call(describe, ([1.0, 2.0], "x"))
+            finally:
+                SharedArray.share = original  # type: ignore[method-assign]
+
+        assert len(created) == 2
+        for segment in created:
+            with pytest.raises(FileNotFoundError):
+                SharedArray(segment.name, "d", 2).attach()
+
+    def test_batch_calls_are_not_shared(self) -> None:
+        """Vérifie que les colonnes d'un lot restent des listes."""
+        with ServiceProcessPool(max_workers=1, shared_memory_threshold=1) as pool:
+            assert pool.call(lengths, (["a", "abc"],), batch=True) == [1, 3]
+            assert pool.stats()["shared_arrays"] == 0
+
+    def test_invalid_threshold(self) -> None:
+        """Vérifie le refus d'un seuil invalide."""
+        with pytest.raises(ValueError, match="shared_memory_threshold"):
+            ServiceProcessPool(shared_memory_threshold=0)
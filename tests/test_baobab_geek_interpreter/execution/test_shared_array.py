@@ -0,0 +1,91 @@
+"""Tests unitaires pour la classe SharedArray."""
+
+import pickle
+
+import pytest
+
+from baobab_geek_interpreter.execution.shared_array import SharedArray
+
+
+class TestSharedArray:
+    """Tests pour SharedArray."""
+
+    def test_share_floats(self) -> None:
+        """Vérifie le partage d'une liste de flottants."""
+        shared = SharedArray.share([0.5, 1.5, 2.5])
+        assert shared is not None
+
+        view = shared.attach()
+
+        assert (view.format, view.tolist()) == ("d", [0.5, 1.5, 2.5])
+        shared.unlink()
+
+    def test_share_ints(self) -> None:
+        """Vérifie le partage d'une liste d'entiers."""
+        shared = SharedArray.share([1, -2, 2**62])
+        assert shared is not None
+
+        assert shared.typecode == "q"
+        assert shared.attach().tolist() == [1, -2, 2**62]
+        shared.unlink()
+
+    @pytest.mark.parametrize(
+        "values",
+        [[], [1, 2.0], ["a", "b"], [True, False], [2**64], [[1], [2]], (1.0, 2.0), 3.0],
+    )
+    def test_not_shareable(self, values: object) -> None:
+        """Vérifie le refus des valeurs non homogènes ou hors limites."""
+        assert SharedArray.share(values) is None
+
+    def test_pickle_transfers_reference_only(self) -> None:
+        """Vérifie que la sérialisation ne contient que la référence au segment."""
+        shared = SharedArray.share([float(i) for i in range(10_000)])
+        assert shared is not None
+
+        data = pickle.dumps(shared, protocol=pickle.HIGHEST_PROTOCOL)
+        copy = pickle.loads(data)
+
+        assert len(data) < 200
+        assert copy.attach()[9_999] == 9_999.0
+        copy.detach()
+        shared.unlink()
+
+    def test_attached_view_is_not_a_copy(self) -> None:
+        """Vérifie que les vues de deux références partagent la même mémoire."""
+        shared = SharedArray.share([1.0, 2.0])
+        assert shared is not None
+        other = SharedArray(shared.name, shared.typecode, shared.length)
+
+        other.attach()[0] = 42.0
+
+        assert shared.attach()[0] == 42.0
+        other.detach()
+        shared.unlink()
+
+    def test_unlink_removes_segment(self) -> None:
+        """Vérifie la suppression du segment."""
+        shared = SharedArray.share([1, 2, 3])
+        assert shared is not None
+        shared.unlink()
+
+        with pytest.raises(FileNotFoundError):
+            SharedArray(shared.name, "q", 3).attach()
+
+    def test_detach_with_derived_view(self) -> None:
+        """Vérifie le détachement lorsqu'une vue dérivée a été conservée."""
+        shared = SharedArray.share([1, 2, 3])
+        assert shared is not None
+        other = SharedArray(shared.name, "q", 3)
+        kept = other.attach()[1:]
+
+        other.detach()
+
+        assert kept.tolist() == [2, 3]
+        kept.release()
+        shared.unlink()
+
+    def test_repr(self) -> None:
+        """Vérifie la représentation technique."""
+        assert repr(SharedArray("seg", "d", 4)) == (
+            "SharedArray(name='seg', typecode='d', length=4)"
+        )
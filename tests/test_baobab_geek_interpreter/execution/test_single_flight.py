@@ -0,0 +1,113 @@
+"""Tests unitaires pour la classe SingleFlight."""
+
+import threading
+import time
+from typing import Any, List
+
+import pytest
+
+from baobab_geek_interpreter.execution.single_flight import SingleFlight
+
+
+def wait_for(condition: Any, timeout: float = 5.0) -> None:
+    """Attend qu'une condition devienne vraie."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.001)
+
+
+class TestSingleFlight:
+    """Tests pour SingleFlight."""
+
+    def test_single_caller(self) -> None:
+        """Vérifie l'exécution d'un appel isolé."""
+        flight = SingleFlight()
+
+        assert flight.do("k", lambda: 42) == 42
+        assert flight.executions == 1
+        assert flight.coalesced == 0
+        assert flight.in_flight() == 0
+
+    def test_sequential_calls_execute_again(self) -> None:
+        """Vérifie qu'une clé libérée provoque une nouvelle exécution."""
+        flight = SingleFlight()
+        flight.do("k", lambda: 1)
+
+        assert flight.do("k", lambda: 2) == 2
+        assert flight.executions == 2
+
+    def test_concurrent_identical_calls_share_result(self) -> None:
+        """Vérifie que des appels identiques simultanés partagent une exécution."""
+        flight = SingleFlight()
+        release = threading.Event()
+        calls: List[int] = []
+        results: List[Any] = []
+
+        def slow() -> object:
+            calls.append(1)
+            release.wait(5)
+            return object()
+
+        threads = [
+            threading.Thread(target=lambda: results.append(flight.do("k", slow))) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        wait_for(lambda: flight.coalesced == 7)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert len(results) == 8
+        assert all(result is results[0] for result in results)
+
+    def test_distinct_keys_run_independently(self) -> None:
+        """Vérifie que des clés différentes ne sont pas fusionnées."""
+        flight = SingleFlight()
+        release = threading.Event()
+        outer = threading.Thread(target=flight.do, args=("a", lambda: release.wait(5)))
+        outer.start()
+        wait_for(lambda: flight.in_flight() == 1)
+
+        assert flight.do("b", lambda: "b") == "b"
+        release.set()
+        outer.join()
+        assert flight.coalesced == 0
+
+    def test_exception_is_shared(self) -> None:
+        """Vérifie que l'exception de l'exécution partagée est propagée à tous."""
+        flight = SingleFlight()
+        release = threading.Event()
+        errors: List[BaseException] = []
+
+        def failing() -> None:
+            release.wait(5)
+            raise ValueError("boom")
+
+        def call() -> None:
+            try:
+                flight.do("k", failing)
+            except ValueError as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=call) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        wait_for(lambda: flight.coalesced == 3)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(errors) == 4
+        assert flight.in_flight() == 0
+
+    def test_exception_releases_key(self) -> None:
+        """Vérifie qu'une exécution en échec libère la clé."""
+        flight = SingleFlight()
+
+        with pytest.raises(RuntimeError):
+            flight.do("k", lambda: (_ for _ in ()).throw(RuntimeError("x")))
+
+        assert flight.do("k", lambda: 1) == 1
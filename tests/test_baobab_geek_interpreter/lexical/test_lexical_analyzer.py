@@ -302,6 +302,24 @@ class TestLexicalAnalyzerDelimiters:
         assert tokens[0].type == TokenType.COMMA
         assert tokens[0].value == ","
 
+    def test_semicolon(self) -> None:
+        """Test le point-virgule."""
+        analyzer = LexicalAnalyzer()
+        tokens = analyzer.analyze(";")
+
+        assert len(tokens) == 2
+        assert tokens[0].type == TokenType.SEMICOLON
+        assert tokens[0].value == ";"
+
+    def test_pipe(self) -> None:
+        """Test la barre verticale."""
+        analyzer = LexicalAnalyzer()
+        tokens = analyzer.analyze("|")
+
+        assert len(tokens) == 2
+        assert tokens[0].type == TokenType.PIPE
+        assert tokens[0].value == "|"
+
 
 class TestLexicalAnalyzerErrors:
     """Tests pour la gestion des erreurs."""
@@ -355,3 +373,12 @@ class TestLexicalAnalyzerPositioning:
         assert tokens[1].position == 4
         assert tokens[1].line == 2
         assert tokens[1].column == 1
+
+    def test_identifiers_are_interned(self) -> None:
+        """Test que les identifiants sont internés."""
+        analyzer = LexicalAnalyzer()
+        first = analyzer.analyze("".join(["my", "Service()"]))[0].value
+        second = analyzer.analyze("".join(["my", "Service", "()"]))[0].value
+
+        assert first == "myService"
+        assert first is second
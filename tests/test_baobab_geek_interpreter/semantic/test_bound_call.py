@@ -0,0 +1,40 @@
+"""Tests unitaires pour la classe BoundCall."""
+
+from baobab_geek_interpreter.semantic.bound_call import BoundCall
+
+
+class TestBoundCall:
+    """Tests pour BoundCall."""
+
+    def test_bound_call_init(self) -> None:
+        """Vérifie l'initialisation."""
+
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        bound = BoundCall("add", add, (1, 2), 3, 4)
+
+        assert bound.service_name == "add"
+        assert bound.func is add
+        assert bound.arguments == (1, 2)
+        assert bound.slot == 3
+        assert bound.generation == 4
+
+    def test_bound_call_default_slot(self) -> None:
+        """Vérifie les valeurs par défaut du slot."""
+        bound = BoundCall("noop", lambda: None, ())
+
+        assert bound.slot == -1
+        assert bound.generation == -1
+
+    def test_bound_call_repr(self) -> None:
+        """Vérifie la représentation technique."""
+        bound = BoundCall("add", lambda a, b: a + b, (1, [2, 3]))
+        assert repr(bound) == "BoundCall(add, (1, [2, 3]))"
+
+    def test_nested(self) -> None:
+        """Vérifie la détection des arguments issus d'appels imbriqués."""
+        inner = BoundCall("one", lambda: 1, ())
+
+        assert not inner.nested
+        assert BoundCall("add", lambda a, b: a + b, (inner, 2)).nested
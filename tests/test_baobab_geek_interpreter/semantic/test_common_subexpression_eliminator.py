@@ -0,0 +1,149 @@
+"""Tests unitaires pour la classe CommonSubexpressionEliminator."""
+
+from typing import Iterator
+
+from baobab_geek_interpreter.execution.service_decorator import service
+from baobab_geek_interpreter.lexical.lexical_analyzer import LexicalAnalyzer
+from baobab_geek_interpreter.semantic.common_subexpression_eliminator import (
+    CommonSubexpressionEliminator,
+)
+from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+from baobab_geek_interpreter.syntax.ast_node import (
+    ArgumentNode,
+    IntNode,
+    ServiceCallNode,
+)
+from baobab_geek_interpreter.syntax.syntax_analyzer import SyntaxAnalyzer
+
+
+@service(pure=True)
+def load(name: str) -> list[float]:
+    """Service pur de chargement."""
+    return [float(len(name))]
+
+
+@service(pure=True)
+def stats(values: list[float]) -> list[float]:
+    """Service pur de statistiques."""
+    return [sum(values)]
+
+
+@service
+def cmp(a: list[float], b: list[float]) -> bool:
+    """Service impur de comparaison."""
+    return a == b
+
+
+@service
+def now() -> list[float]:
+    """Service impur."""
+    return [0.0]
+
+
+@service(pure=True)
+def stream(name: str) -> Iterator[float]:
+    """Service pur retournant un flux."""
+    return iter([float(len(name))])
+
+
+def _table() -> SymbolTable:
+    """Construit une table des symboles avec des services purs et impurs."""
+    table = SymbolTable()
+    for func in (load, stats, cmp, now, stream):
+        table.register(func.__name__, func)
+    return table
+
+
+def _parse(table: SymbolTable, source: str) -> ServiceCallNode:
+    """Analyse un code source en AST compact."""
+    parser = SyntaxAnalyzer(table, compact_arguments=True)
+    return parser.parse(LexicalAnalyzer().analyze(source))
+
+
+class TestCommonSubexpressionEliminator:
+    """Tests pour la fusion des appels imbriqués identiques."""
+
+    def test_identical_pure_calls_are_shared(self) -> None:
+        """Test que deux appels purs identiques deviennent un même nœud."""
+        table = _table()
+        ast = _parse(table, 'cmp(load("x"), stats(load("x")))')
+        eliminator = CommonSubexpressionEliminator(table)
+
+        assert eliminator.eliminate(ast) == 1
+        first, second = ast.values
+        assert isinstance(second, ServiceCallNode)
+        assert second.values[0] is first
+        assert eliminator.stats() == {"calls": 3, "saved": 1}
+
+    def test_whole_subtrees_are_shared(self) -> None:
+        """Test qu'un sous-arbre identique compte chacun de ses appels."""
+        table = _table()
+        ast = _parse(table, 'cmp(stats(load("x")), stats(load("x")))')
+
+        assert CommonSubexpressionEliminator(table).eliminate(ast) == 2
+        assert ast.values[0] is ast.values[1]
+
+    def test_different_arguments_are_not_shared(self) -> None:
+        """Test que les types et valeurs des constantes sont distingués."""
+        table = _table()
+        ast = _parse(table, "cmp(stats([1, 2]), stats([1.0, 2.0]))")
+        eliminator = CommonSubexpressionEliminator(table)
+
+        assert eliminator.eliminate(ast) == 0
+        assert eliminator.eliminate(_parse(table, "cmp(stats([0.0]), stats([-0.0]))")) == 0
+        assert eliminator.eliminate(_parse(table, 'cmp(load("x"), load("y"))')) == 0
+
+    def test_impure_calls_are_not_shared(self) -> None:
+        """Test qu'un appel impur, ou contenant un appel impur, n'est pas fusionné."""
+        table = _table()
+        ast = _parse(table, "cmp(stats(now()), stats(now()))")
+
+        assert CommonSubexpressionEliminator(table).eliminate(ast) == 0
+        assert ast.values[0] is not ast.values[1]
+
+    def test_stream_calls_are_not_shared(self) -> None:
+        """Test qu'un flux, consommable une seule fois, n'est pas partagé."""
+        table = _table()
+        ast = _parse(table, 'cmp(stream("x"), stream("x"))')
+
+        assert CommonSubexpressionEliminator(table).eliminate(ast) == 0
+
+    def test_unknown_service_is_not_shared(self) -> None:
+        """Test qu'un service inconnu n'est jamais fusionné."""
+        table = _table()
+        ast = ServiceCallNode.from_values(
+            "cmp", [ServiceCallNode.from_values("x", []), ServiceCallNode.from_values("x", [])]
+        )
+
+        assert CommonSubexpressionEliminator(table).eliminate(ast) == 0
+
+    def test_argument_nodes_are_rewritten(self) -> None:
+        """Test la réécriture d'un AST construit avec des enveloppes d'arguments."""
+        table = _table()
+        ast = ServiceCallNode(
+            "cmp",
+            [
+                ArgumentNode(ServiceCallNode("stats", [ArgumentNode(IntNode(1))])),
+                ArgumentNode(ServiceCallNode("stats", [ArgumentNode(IntNode(1))])),
+            ],
+        )
+
+        assert CommonSubexpressionEliminator(table).eliminate(ast) == 1
+        assert ast.arguments[0].value is ast.arguments[1].value
+
+    def test_second_pass_is_idempotent(self) -> None:
+        """Test qu'une seconde passe sur un graphe partagé ne fusionne plus rien."""
+        table = _table()
+        ast = _parse(table, 'cmp(load("x"), load("x"))')
+        eliminator = CommonSubexpressionEliminator(table)
+
+        assert eliminator.eliminate(ast) == 1
+        assert eliminator.eliminate(ast) == 0
+
+    def test_call_without_nested_calls(self) -> None:
+        """Test qu'un appel sans appel imbriqué n'est pas compté."""
+        table = _table()
+        eliminator = CommonSubexpressionEliminator(table)
+
+        assert eliminator.eliminate(_parse(table, "stats([1.0])")) == 0
+        assert eliminator.stats() == {"calls": 0, "saved": 0}
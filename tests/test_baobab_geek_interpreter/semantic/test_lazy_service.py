@@ -0,0 +1,99 @@
+"""Tests unitaires pour la classe LazyService."""
+
+import builtins
+import inspect
+import sys
+import threading
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from baobab_geek_interpreter.semantic.lazy_service import LazyService
+
+
+def _write_module(root: Path, name: str, body: str) -> None:
+    """Écrit un module de test dans un répertoire du chemin d'import."""
+    (root / f"{name}.py").write_text(body)
+
+
+class TestLazyService:
+    """Tests pour l'import différé d'un service."""
+
+    @pytest.mark.parametrize("path", ["math", "math:", ":sqrt", "math:sqrt:x"])
+    def test_invalid_path(self, path: str) -> None:
+        """Test le refus d'un chemin sans module ou sans attribut."""
+        with pytest.raises(ValueError, match="module:attribut"):
+            LazyService(path)
+
+    def test_import_on_first_resolution(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test que le module n'est importé qu'à la première résolution."""
+        _write_module(tmp_path, "lazy_heavy", "def double(x: int) -> int:\n    return x * 2\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        lazy = LazyService("lazy_heavy:double")
+        assert "lazy_heavy" not in sys.modules
+        assert not lazy.loaded
+        assert "non chargé" in repr(lazy)
+
+        assert lazy(21) == 42
+        assert lazy.loaded
+        assert lazy.resolve() is sys.modules["lazy_heavy"].double
+
+    def test_nested_attribute(self) -> None:
+        """Test un chemin désignant un attribut imbriqué."""
+        lazy = LazyService("collections:OrderedDict.fromkeys")
+
+        assert list(lazy("ab")) == ["a", "b"]
+
+    def test_signature(self) -> None:
+        """Test la signature fournie, puis celle de la fonction importée."""
+        signature = inspect.Signature(
+            [inspect.Parameter("x", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=int)]
+        )
+        lazy = LazyService("lazy_unknown_module:func", signature)
+
+        assert lazy.signature is signature
+        assert not lazy.loaded
+        assert str(LazyService("json:dumps").signature).startswith("(obj")
+
+    def test_errors_are_not_cached(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test qu'un échec d'import est propagé puis réessayé."""
+        monkeypatch.syspath_prepend(str(tmp_path))
+        lazy = LazyService("lazy_late:run")
+
+        with pytest.raises(ImportError):
+            lazy.resolve()
+        _write_module(tmp_path, "lazy_late", "VALUE = 1\n")
+        with pytest.raises(ImportError, match="ne définit pas 'run'"):
+            lazy.resolve()
+        with pytest.raises(ImportError, match="n'est pas appelable"):
+            LazyService("lazy_late:VALUE").resolve()
+
+    def test_concurrent_resolution_imports_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test que des résolutions simultanées n'importent le module qu'une fois."""
+        _write_module(
+            tmp_path,
+            "lazy_counted",
+            "import builtins\n"
+            "builtins.lazy_counted_imports = getattr(builtins, 'lazy_counted_imports', 0) + 1\n"
+            "def run() -> int:\n    return 1\n",
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        lazy = LazyService("lazy_counted:run")
+        results: List[object] = []
+        threads = [
+            threading.Thread(target=lambda: results.append(lazy.resolve())) for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(map(id, results))) == 1
+        assert getattr(builtins, "lazy_counted_imports") == 1
+        delattr(builtins, "lazy_counted_imports")
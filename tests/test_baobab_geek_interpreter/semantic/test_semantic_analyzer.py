@@ -6,8 +6,11 @@ from baobab_geek_interpreter.exceptions.semantic_exception import (
     BaobabSemanticAnalyserException,
 )
 from baobab_geek_interpreter.execution.service_decorator import service
+from baobab_geek_interpreter.lexical.lexical_analyzer import LexicalAnalyzer
+from baobab_geek_interpreter.semantic.bound_call import BoundCall
 from baobab_geek_interpreter.semantic.semantic_analyzer import SemanticAnalyzer
 from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+from baobab_geek_interpreter.semantic.validation_level import ValidationLevel
 from baobab_geek_interpreter.syntax.ast_node import (
     ArgumentNode,
     ArrayNode,
@@ -16,6 +19,8 @@ from baobab_geek_interpreter.syntax.ast_node import (
     ServiceCallNode,
     StringNode,
 )
+from baobab_geek_interpreter.syntax.columnar_ast import ColumnarAST
+from baobab_geek_interpreter.syntax.syntax_analyzer import SyntaxAnalyzer
 
 
 class TestSemanticAnalyzerBasics:
@@ -319,3 +324,257 @@ class TestSemanticAnalyzerExtractArguments:
 
         values = analyzer._extract_argument_values(ast)
         assert values == [42, ["a", "b"], 3.14]
+
+
+class TestSemanticAnalyzerBoundCall:
+    """Tests pour l'appel lié retourné par l'analyse."""
+
+    def test_analyze_returns_bound_call(self) -> None:
+        """Test que l'analyse retourne le service résolu et les arguments."""
+        table = SymbolTable()
+
+        def add(a: int, b: list[int]) -> int:
+            return a + sum(b)
+
+        table.register("add", add)
+        analyzer = SemanticAnalyzer(table)
+
+        ast = ServiceCallNode(
+            "add",
+            [ArgumentNode(IntNode(1)), ArgumentNode(ArrayNode([IntNode(2), IntNode(3)]))],
+            0,
+            0,
+        )
+        bound = analyzer.analyze(ast)
+
+        assert bound.service_name == "add"
+        assert bound.func is add
+        assert bound.arguments == (1, [2, 3])
+        assert bound.slot == 0
+        assert bound.generation == 0
+
+
+class TestSemanticAnalyzerNestedCalls:
+    """Tests pour les appels de service imbriqués."""
+
+    @staticmethod
+    def _analyze(table: SymbolTable, source: str) -> BoundCall:
+        """Analyse une source contenant des appels imbriqués."""
+        ast = SyntaxAnalyzer(table).parse(LexicalAnalyzer().analyze(source))
+        return SemanticAnalyzer(table).analyze(ast)
+
+    @staticmethod
+    def _table() -> SymbolTable:
+        """Construit une table de services composables."""
+        table = SymbolTable()
+
+        def fetch(key: str) -> list[int]:
+            return [len(key)]
+
+        def merge(a: list[int], b: list[int]) -> int:
+            return len(a + b)
+
+        def name() -> str:
+            return "x"
+
+        table.register("fetch", fetch)
+        table.register("merge", merge)
+        table.register("name", name)
+        return table
+
+    def test_nested_calls_are_bound(self) -> None:
+        """Test que les appels imbriqués deviennent des appels liés."""
+        bound = self._analyze(self._table(), 'merge(fetch("a"), fetch("bc"))')
+
+        assert bound.nested
+        first, second = bound.arguments
+        assert isinstance(first, BoundCall) and isinstance(second, BoundCall)
+        assert (first.service_name, first.arguments) == ("fetch", ("a",))
+        assert second.arguments == ("bc",)
+
+    def test_nested_return_type_mismatch(self) -> None:
+        """Test le refus d'un appel imbriqué dont le type de retour est incompatible."""
+        with pytest.raises(BaobabSemanticAnalyserException, match="merge"):
+            self._analyze(self._table(), 'merge(name(), fetch("a"))')
+
+    def test_shared_nested_call_is_bound_once(self) -> None:
+        """Test qu'un nœud partagé par plusieurs appels est lié une seule fois."""
+        table = self._table()
+        inner = ServiceCallNode.from_values("fetch", [StringNode("a")])
+        ast = ServiceCallNode.from_values("merge", [inner, inner])
+
+        first, second = SemanticAnalyzer(table).analyze(ast).arguments
+        assert first is second
+
+    def test_invalid_inner_call(self) -> None:
+        """Test qu'une erreur dans un appel imbriqué est détectée."""
+        with pytest.raises(BaobabSemanticAnalyserException, match="fetch"):
+            self._analyze(self._table(), "merge(fetch(1), fetch(2))")
+
+    def test_unknown_inner_service(self) -> None:
+        """Test qu'un service imbriqué inconnu est détecté."""
+        with pytest.raises(BaobabSemanticAnalyserException, match="missing"):
+            self._analyze(self._table(), 'merge(missing(), fetch("a"))')
+
+    def test_check_arguments(self) -> None:
+        """Test la validation de valeurs d'arguments hors AST."""
+
+        def total(values: list[int]) -> int:
+            return sum(values)
+
+        analyzer = SemanticAnalyzer(SymbolTable())
+
+        analyzer.check_arguments("total", total, [[1, 2]])
+        with pytest.raises(BaobabSemanticAnalyserException, match="homogènes"):
+            analyzer.check_arguments("total", total, [[1, "2"]])
+        with pytest.raises(BaobabSemanticAnalyserException, match="total"):
+            analyzer.check_arguments("total", total, [1])
+
+    def test_validated_shapes_are_cached_per_service(self) -> None:
+        """Test qu'une forme validée saute la vérification complète."""
+
+        def total(values: list[int]) -> int:
+            return sum(values)
+
+        analyzer = SemanticAnalyzer(SymbolTable())
+        analyzer.check_arguments("total", total, [[1, 2]])
+        analyzer.check_arguments("total", total, [[3]])
+        with pytest.raises(BaobabSemanticAnalyserException):
+            analyzer.check_arguments("total", total, [["a"]])
+
+        stats = analyzer.get_type_cache_stats()["total"]
+        assert (stats["hits"], stats["misses"], stats["shapes"]) == (1, 2, 1)
+
+        analyzer.check_arguments("total", lambda values: 0, [[1]])
+        assert analyzer.get_type_cache_stats()["total"]["hits"] == 0
+
+    def test_shallow_validation_samples_arrays(self) -> None:
+        """Test qu'en validation superficielle, seul un échantillon est vérifié."""
+
+        def total(values: list[int]) -> int:
+            return sum(values)
+
+        analyzer = SemanticAnalyzer(SymbolTable())
+        values = list(range(1000))
+        values[1] = "x"
+
+        analyzer.check_arguments("total", total, [values], ValidationLevel.SHALLOW)
+        values[-1] = "x"
+        with pytest.raises(BaobabSemanticAnalyserException, match="homogènes"):
+            analyzer.check_arguments("total", total, [values], ValidationLevel.SHALLOW)
+        with pytest.raises(BaobabSemanticAnalyserException, match="total"):
+            analyzer.check_arguments("total", total, ["x"], ValidationLevel.SHALLOW)
+        with pytest.raises(BaobabSemanticAnalyserException, match="total"):
+            analyzer.check_arguments("total", total, [[1], [2]], ValidationLevel.SHALLOW)
+        assert analyzer.get_type_cache_stats()["total"]["misses"] == 0
+
+    def test_trusted_validation_checks_arity_only(self) -> None:
+        """Test qu'en validation de confiance, seul le nombre d'arguments est vérifié."""
+
+        def total(values: list[int]) -> int:
+            return sum(values)
+
+        analyzer = SemanticAnalyzer(SymbolTable())
+
+        analyzer.check_arguments("total", total, ["x"], ValidationLevel.TRUSTED)
+        with pytest.raises(BaobabSemanticAnalyserException, match="total"):
+            analyzer.check_arguments("total", total, [], ValidationLevel.TRUSTED)
+
+    def test_validation_level_applies_to_nested_calls(self) -> None:
+        """Test que le niveau de validation s'applique aux appels imbriqués."""
+        table = self._table()
+        ast = SyntaxAnalyzer(table).parse(LexicalAnalyzer().analyze("merge(fetch(1), fetch(2))"))
+
+        bound = SemanticAnalyzer(table).analyze(ast, ValidationLevel.TRUSTED)
+        assert bound.arguments[0].arguments == (1,)
+
+
+class TestSemanticAnalyzerColumnar:
+    """Tests pour le chemin rapide sur l'AST colonnaire."""
+
+    @staticmethod
+    def _parse(table: SymbolTable, source: str) -> ColumnarAST:
+        """Analyse une source en AST colonnaire."""
+        return SyntaxAnalyzer(table).parse_columnar(LexicalAnalyzer().analyze(source))
+
+    def test_analyze_columnar_binds_call(self) -> None:
+        """Test la liaison d'un appel valide."""
+        table = SymbolTable()
+
+        def combine(a: int, b: list[float], c: list[str], d: list[int]) -> int:
+            return a
+
+        table.register("combine", combine)
+        bound = SemanticAnalyzer(table).analyze_columnar(
+            self._parse(table, 'combine(1, [1.5, 2.5], ["a"], [])')
+        )
+
+        assert bound.func is combine
+        assert bound.arguments == (1, [1.5, 2.5], ["a"], [])
+        assert bound.slot == 0
+
+    def test_analyze_columnar_unknown_service(self) -> None:
+        """Test qu'un service inconnu lève une exception."""
+        table = SymbolTable()
+
+        with pytest.raises(BaobabSemanticAnalyserException, match="Service inconnu"):
+            SemanticAnalyzer(table).analyze_columnar(self._parse(table, "unknown()"))
+
+    def test_analyze_columnar_type_mismatch(self) -> None:
+        """Test qu'un type d'élément incompatible est détecté via l'élément témoin."""
+        table = SymbolTable()
+
+        def total(values: list[int]) -> int:
+            return sum(values)
+
+        table.register("total", total)
+
+        with pytest.raises(BaobabSemanticAnalyserException, match="incompatibles"):
+            SemanticAnalyzer(table).analyze_columnar(self._parse(table, "total([1.5, 2.5])"))
+
+    def test_analyze_columnar_validation_levels(self) -> None:
+        """Test les validations superficielle et de confiance sur l'AST colonnaire."""
+        table = SymbolTable()
+
+        def total(values: list[int]) -> int:
+            return sum(values)
+
+        table.register("total", total)
+        analyzer = SemanticAnalyzer(table)
+
+        bound = analyzer.analyze_columnar(
+            self._parse(table, "total([1.5, 2.5])"), ValidationLevel.TRUSTED
+        )
+        assert bound.arguments == ([1.5, 2.5],)
+        with pytest.raises(BaobabSemanticAnalyserException, match="incompatibles"):
+            analyzer.analyze_columnar(
+                self._parse(table, "total([1.5, 2.5])"), ValidationLevel.SHALLOW
+            )
+
+    def test_analyze_columnar_heterogeneous_array(self) -> None:
+        """Test qu'un tableau hétérogène est rejeté."""
+        table = SymbolTable()
+        table.register("svc", lambda values: values)
+
+        with pytest.raises(BaobabSemanticAnalyserException, match="homogènes"):
+            SemanticAnalyzer(table).analyze_columnar(self._parse(table, 'svc([1, "a"])'))
+
+    def test_analyze_columnar_nested_array(self) -> None:
+        """Test qu'un tableau imbriqué est rejeté."""
+        table = SymbolTable()
+        table.register("svc", lambda values: values)
+
+        with pytest.raises(BaobabSemanticAnalyserException, match="imbriqués"):
+            SemanticAnalyzer(table).analyze_columnar(self._parse(table, "svc([[1], [2]])"))
+
+    def test_analyze_columnar_big_int_array(self) -> None:
+        """Test un tableau mêlant entiers int64 et grands entiers."""
+        table = SymbolTable()
+
+        def total(values: list[int]) -> int:
+            return sum(values)
+
+        table.register("total", total)
+        bound = SemanticAnalyzer(table).analyze_columnar(self._parse(table, f"total([1, {2**70}])"))
+
+        assert bound.arguments == ([1, 2**70],)
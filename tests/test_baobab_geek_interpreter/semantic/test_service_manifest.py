@@ -0,0 +1,189 @@
+"""Tests unitaires pour la classe ServiceManifest."""
+
+import inspect
+import json
+import sys
+import typing
+from pathlib import Path
+
+import pytest
+
+from baobab_geek_interpreter.semantic.lazy_service import LazyService
+from baobab_geek_interpreter.semantic.service_manifest import ServiceManifest
+from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+
+SOURCE = '''
+from typing import List, Optional
+
+from baobab_geek_interpreter.execution.service_decorator import service
+
+
+class Point:
+    """Classe propre au module."""
+
+
+@service
+def add(a: int, b: int = 2) -> int:
+    return a + b
+
+
+@service
+def total(values: List[int], label: Optional[str] = None) -> list[int]:
+    return [sum(values)]
+
+
+@service
+def locate(point: Point) -> int:
+    return 0
+
+
+def helper() -> int:
+    return 1
+'''
+
+
+@pytest.fixture(name="module_name")
+def fixture_module_name(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Écrit un module de services sur le chemin d'import et retourne son nom."""
+    name = f"manifest_{tmp_path.name}"
+    (tmp_path / f"{name}.py").write_text(SOURCE)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    return name
+
+
+def _unimport(monkeypatch: pytest.MonkeyPatch, name: str) -> None:
+    """Retire un module importé par la construction du manifeste."""
+    monkeypatch.delitem(sys.modules, name)
+
+
+class TestServiceManifestBuild:
+    """Tests pour la construction et l'enregistrement du manifeste."""
+
+    def test_build_entries(self, module_name: str) -> None:
+        """Test les entrées construites pour chaque service du module."""
+        manifest = ServiceManifest.build([module_name])
+        entries = {entry["name"]: entry for entry in manifest.entries}
+
+        assert len(manifest) == 3
+        assert list(entries) == ["add", "total", "locate"]
+        assert entries["add"]["path"] == f"{module_name}:add"
+        assert len(entries["add"]["source_hash"]) == 64
+        assert entries["add"]["signature"] == {
+            "parameters": [
+                {"name": "a", "kind": "POSITIONAL_OR_KEYWORD", "annotation": "int"},
+                {
+                    "name": "b",
+                    "kind": "POSITIONAL_OR_KEYWORD",
+                    "annotation": "int",
+                    "default": "2",
+                },
+            ],
+            "return": "int",
+        }
+        assert entries["locate"]["signature"] is None
+
+    def test_signature_round_trip(self, module_name: str) -> None:
+        """Test que la signature relue est celle de la fonction."""
+        manifest = ServiceManifest.build([module_name])
+        module = sys.modules[module_name]
+
+        for name, lazy in manifest.lazy_services()[:2]:
+            assert lazy.signature == inspect.signature(getattr(module, name))
+
+    def test_save_and_load(self, module_name: str, tmp_path: Path) -> None:
+        """Test l'enregistrement puis la lecture du manifeste."""
+        path = tmp_path / "services.json"
+        ServiceManifest.build([module_name]).save(path)
+
+        assert ServiceManifest.load(path).entries == ServiceManifest.build([module_name]).entries
+        assert json.loads(path.read_text())["version"] == ServiceManifest.FORMAT_VERSION
+
+    def test_load_rejects_other_versions(self, tmp_path: Path) -> None:
+        """Test le refus d'un fichier qui n'est pas un manifeste de cette version."""
+        path = tmp_path / "services.json"
+        path.write_text(json.dumps({"version": 99, "services": []}))
+
+        with pytest.raises(ValueError, match="version attendue 1"):
+            ServiceManifest.load(path)
+
+    def test_build_recursive(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test la construction récursive à partir d'un paquet."""
+        package = tmp_path / "manifest_package"
+        (package / "inner").mkdir(parents=True)
+        (package / "__init__.py").write_text("")
+        (package / "inner" / "__init__.py").write_text("")
+        (package / "inner" / "ops.py").write_text(SOURCE)
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        assert len(ServiceManifest.build(["manifest_package"])) == 0
+        manifest = ServiceManifest.build(["manifest_package"], recursive=True)
+        assert manifest.entries[0]["path"] == "manifest_package.inner.ops:add"
+
+    @pytest.mark.parametrize(
+        "annotation",
+        [int, list[int], typing.List[int], typing.Optional[str], typing.Dict[str, float], None],
+    )
+    def test_annotations(self, annotation: typing.Any) -> None:
+        """Test l'encodage des annotations usuelles."""
+        expression = ServiceManifest._encode_annotation(annotation)
+
+        assert ServiceManifest._evaluate(expression) == annotation
+
+    @pytest.mark.parametrize("expression", ["__import__('os')", "typing.__dict__", "int()"])
+    def test_evaluate_rejects_other_expressions(self, expression: str) -> None:
+        """Test que seules les expressions de types sont évaluées."""
+        with pytest.raises(ValueError, match="non acceptée"):
+            ServiceManifest._evaluate(expression)
+
+
+class TestServiceManifestLoading:
+    """Tests pour le chargement du manifeste dans la table des symboles."""
+
+    def test_load_manifest_does_not_import(
+        self, module_name: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test que le chargement n'importe aucun module."""
+        manifest = ServiceManifest.build([module_name])
+        _unimport(monkeypatch, module_name)
+        table = SymbolTable()
+
+        assert table.load_manifest(manifest) == 3
+        assert table.list_services() == ["add", "total", "locate"]
+        assert table.signature_fingerprint("add") is not None
+        assert module_name not in sys.modules
+
+    def test_first_use_installs_validated_signature(
+        self, module_name: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test que la signature validée est installée sur la fonction importée."""
+        manifest = ServiceManifest.build([module_name])
+        _unimport(monkeypatch, module_name)
+        table = SymbolTable()
+        table.load_manifest(manifest)
+
+        func = table.get("add")
+
+        assert func is not None
+        assert func(1) == 3
+        assert "__signature__" in vars(func)
+        assert table.generation(table.slot_of("add") or 0) == 0
+
+    def test_stale_source_starts_new_generation(
+        self, module_name: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test qu'un fichier source modifié écarte les métadonnées du manifeste."""
+        manifest = ServiceManifest.build([module_name])
+        _unimport(monkeypatch, module_name)
+        source = tmp_path / f"{module_name}.py"
+        source.write_text(source.read_text().replace("b: int = 2", "b: int = 50"))
+        table = SymbolTable()
+        table.load_manifest(manifest)
+        lazy = table.get("add", resolve=False)
+
+        func = table.get("add")
+
+        assert isinstance(lazy, LazyService)
+        assert lazy.stale
+        assert func is not None and func(1) == 51
+        assert "__signature__" not in vars(func)
+        assert table.generation(table.slot_of("add") or 0) == 1
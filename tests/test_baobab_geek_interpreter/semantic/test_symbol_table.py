@@ -1,9 +1,17 @@
 """Tests unitaires pour la classe SymbolTable."""
 
-import pytest
+import inspect
+import math
+import sys
+import threading
+from pathlib import Path
 from types import ModuleType
+from typing import Any, List
+
+import pytest
 
 from baobab_geek_interpreter.execution.service_decorator import service
+from baobab_geek_interpreter.semantic.lazy_service import LazyService
 from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
 
 
@@ -354,3 +362,482 @@ class TestSymbolTableIntegration:
         assert table.has("service1")
         assert table.has("service2")
         assert len(table.list_services()) == 2
+
+
+class TestSymbolTableSlots:
+    """Tests pour la résolution des services par slot."""
+
+    def test_slots_are_assigned_in_registration_order(self) -> None:
+        """Test que chaque nouveau nom reçoit le slot suivant."""
+        table = SymbolTable()
+        table.register("first", lambda: 1)
+        table.register("second", lambda: 2)
+
+        assert table.slot_of("first") == 0
+        assert table.slot_of("second") == 1
+        assert table.slot_of("unknown") is None
+
+    def test_reregistration_keeps_slot_and_bumps_generation(self) -> None:
+        """Test qu'un ré-enregistrement conserve le slot et change la génération."""
+        table = SymbolTable()
+        table.register("svc", lambda: "old")
+        slot = table.slot_of("svc")
+        assert slot is not None
+        generation = table.generation(slot)
+
+        table.register("svc", lambda: "new")
+
+        assert table.slot_of("svc") == slot
+        assert table.generation(slot) == generation + 1
+        assert table.get_slot(slot, generation) is None
+        func = table.get_slot(slot, generation + 1)
+        assert func is not None
+        assert func() == "new"
+
+    def test_generations_list_is_shared(self) -> None:
+        """Test que la liste des générations suit les ré-enregistrements et clear."""
+        table = SymbolTable()
+        table.register("svc", lambda: None)
+        generations = table.generations
+
+        table.register("svc", lambda: None)
+        assert generations == [1]
+        table.clear()
+        assert generations == [2]
+        assert table.generations is generations
+
+    def test_get_slot_out_of_range(self) -> None:
+        """Test qu'un slot inexistant retourne None."""
+        table = SymbolTable()
+        assert table.get_slot(0, 0) is None
+        assert table.get_slot(-1, -1) is None
+
+    def test_lookup_falls_back_to_name_when_stale(self) -> None:
+        """Test que lookup se replie sur le nom si la génération est périmée."""
+        table = SymbolTable()
+        table.register("svc", lambda: "old")
+        table.register("svc", lambda: "new")
+
+        func = table.lookup("svc", 0, 0)
+        assert func is not None
+        assert func() == "new"
+
+    def test_lookup_without_slot(self) -> None:
+        """Test lookup sans slot résolu."""
+        table = SymbolTable()
+        table.register("svc", lambda: 1)
+        assert table.lookup("svc") is table.get("svc")
+        assert table.lookup("unknown") is None
+
+    def test_clear_invalidates_slots(self) -> None:
+        """Test que clear invalide les slots sans les réattribuer."""
+        table = SymbolTable()
+        table.register("svc", lambda: 1)
+        table.clear()
+
+        assert table.get_slot(0, 0) is None
+        assert table.lookup("svc", 0, 0) is None
+
+        table.register("other", lambda: 2)
+        table.register("svc", lambda: 3)
+        assert table.slot_of("other") == 1
+        assert table.slot_of("svc") == 0
+
+
+class TestSymbolTableSignatureFingerprint:
+    """Tests pour les empreintes de signature."""
+
+    def test_unknown_service(self) -> None:
+        """Vérifie qu'un service inconnu n'a pas d'empreinte."""
+        assert SymbolTable().signature_fingerprint("missing") is None
+
+    def test_stable_for_same_signature(self) -> None:
+        """Vérifie que deux fonctions de même signature ont la même empreinte."""
+        table = SymbolTable()
+
+        def first(a: int, b: int) -> int:
+            return a + b
+
+        def second(a: int, b: int) -> int:
+            return a - b
+
+        table.register("op", first)
+        before = table.signature_fingerprint("op")
+        table.register("op", second)
+
+        assert before is not None
+        assert table.signature_fingerprint("op") == before
+
+    def test_changes_with_signature(self) -> None:
+        """Vérifie qu'un changement de signature change l'empreinte."""
+        table = SymbolTable()
+
+        def narrow(a: int) -> int:
+            return a
+
+        def wide(a: float) -> float:
+            return a
+
+        table.register("op", narrow)
+        before = table.signature_fingerprint("op")
+        table.register("op", wide)
+
+        assert table.signature_fingerprint("op") != before
+
+    def test_depends_on_name(self) -> None:
+        """Vérifie que l'empreinte dépend du nom du service."""
+        table = SymbolTable()
+
+        def func(a: int) -> int:
+            return a
+
+        table.register("one", func)
+        table.register("two", func)
+
+        assert table.signature_fingerprint("one") != table.signature_fingerprint("two")
+
+    def test_cached_per_generation(self) -> None:
+        """Vérifie que l'empreinte est calculée une fois par génération."""
+        table = SymbolTable()
+        table.register("op", lambda a: a)
+
+        assert table.signature_fingerprint("op") is table.signature_fingerprint("op")
+
+    def test_uninspectable_signature(self) -> None:
+        """Vérifie qu'une signature non inspectable n'a pas d'empreinte."""
+        table = SymbolTable()
+        table.register("builtin", type)
+
+        assert table.signature_fingerprint("builtin") is None
+
+    def test_cleared_service(self) -> None:
+        """Vérifie qu'un service supprimé n'a plus d'empreinte."""
+        table = SymbolTable()
+        table.register("op", lambda a: a)
+        table.clear()
+
+        assert table.signature_fingerprint("op") is None
+
+
+def _write_package(root: Path, name: str) -> None:
+    """Écrit un paquet de services de test : racine, module et sous-paquet."""
+    header = "from baobab_geek_interpreter.execution.service_decorator import service\n"
+    package = root / name
+    (package / "sub").mkdir(parents=True)
+    (package / "__init__.py").write_text(header + "@service\ndef root() -> int:\n    return 0\n")
+    (package / "alpha.py").write_text(
+        header
+        + "@service\ndef first() -> int:\n    return 1\n"
+        + "@service\ndef second() -> int:\n    return 2\n"
+        + "def helper() -> int:\n    return 3\n"
+    )
+    (package / "sub" / "__init__.py").write_text("")
+    (package / "sub" / "beta.py").write_text(
+        header + "@service\ndef third() -> int:\n    return 3\n"
+    )
+
+
+class TestSymbolTableDiscoverPackage:
+    """Tests pour la découverte par dictionnaire de module et par paquet."""
+
+    def test_discover_services_does_not_trigger_module_getattr(self) -> None:
+        """Test que la découverte ne lit pas les attributs par le module."""
+        module = ModuleType("lazy_module")
+        requested: List[str] = []
+
+        def module_getattr(name: str) -> Any:
+            requested.append(name)
+            raise AttributeError(name)
+
+        @service
+        def service1() -> int:
+            return 1
+
+        setattr(module, "__getattr__", module_getattr)
+        setattr(module, "service1", service1)
+
+        table = SymbolTable()
+        assert table.discover_services(module) == 1
+        assert table.has("service1")
+        assert not requested
+
+    def test_discover_services_keeps_definition_order(self) -> None:
+        """Test que les services sont enregistrés dans l'ordre de définition."""
+        module = ModuleType("ordered_module")
+
+        @service
+        def zeta() -> int:
+            return 1
+
+        @service
+        def alpha() -> int:
+            return 2
+
+        setattr(module, "zeta", zeta)
+        setattr(module, "alpha", alpha)
+
+        table = SymbolTable()
+        table.discover_services(module)
+
+        assert table.list_services() == ["zeta", "alpha"]
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_discover_package(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, parallel: bool
+    ) -> None:
+        """Test la découverte récursive d'un paquet, en série et en parallèle."""
+        name = f"discovered_services_{int(parallel)}"
+        _write_package(tmp_path, name)
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        table = SymbolTable()
+        report = table.discover_package(name, parallel=parallel, max_workers=2)
+
+        assert table.list_services() == ["root", "first", "second", "third"]
+        assert report["modules"] == 4
+        assert report["services"] == 4
+        assert report["seconds"] >= 0
+        assert sys.modules[f"{name}.sub.beta"].third() == 3
+
+    def test_discover_package_accepts_plain_module(self) -> None:
+        """Test qu'un module sans sous-modules est analysé seul."""
+        module = ModuleType("plain_module")
+
+        @service
+        def service1() -> int:
+            return 1
+
+        setattr(module, "service1", service1)
+
+        table = SymbolTable()
+        report = table.discover_package(module)
+
+        assert (report["modules"], report["services"]) == (1, 1)
+
+    def test_discover_package_propagates_import_errors(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test qu'une erreur d'import d'un sous-module est propagée."""
+        _write_package(tmp_path, "broken_services")
+        (tmp_path / "broken_services" / "sub" / "broken.py").write_text("import missing_module\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        with pytest.raises(ImportError):
+            SymbolTable().discover_package("broken_services", parallel=True)
+
+    def test_discovery_stats(self) -> None:
+        """Test le cumul des statistiques de découverte."""
+        module = ModuleType("stats_module")
+
+        @service
+        def service1() -> int:
+            return 1
+
+        setattr(module, "service1", service1)
+
+        table = SymbolTable()
+        assert table.discovery_stats() == {"modules": 0, "services": 0, "seconds": 0.0}
+        table.discover_services(module)
+        table.discover_package(module)
+
+        stats = table.discovery_stats()
+        assert (stats["modules"], stats["services"]) == (2, 2)
+        assert stats["seconds"] > 0
+
+
+class TestSymbolTableLazyServices:
+    """Tests pour les services enregistrés par chemin d'import."""
+
+    def test_has_and_list_do_not_import(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test que has et list_services n'importent pas le module."""
+        (tmp_path / "table_lazy.py").write_text("def triple(x: int) -> int:\n    return x * 3\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+        table = SymbolTable()
+
+        table.register_lazy("triple", "table_lazy:triple")
+
+        assert table.has("triple")
+        assert table.list_services() == ["triple"]
+        assert isinstance(table.get("triple", resolve=False), LazyService)
+        assert "table_lazy" not in sys.modules
+
+    def test_resolution_replaces_entry_without_new_generation(self) -> None:
+        """Test que la fonction importée remplace l'entrée, génération inchangée."""
+        table = SymbolTable()
+        table.register_lazy("sqrt", "math:sqrt")
+
+        assert table.get_slot(0, 0) is math.sqrt
+        assert table.get("sqrt", resolve=False) is math.sqrt
+        assert table.lookup("sqrt") is math.sqrt
+        assert table.generation(0) == 0
+
+    def test_reregistered_service_is_not_replaced(self) -> None:
+        """Test qu'une résolution ne remplace pas un service ré-enregistré."""
+        table = SymbolTable()
+        table.register_lazy("sqrt", "math:sqrt")
+        lazy = table.get("sqrt", resolve=False)
+        table.register("sqrt", abs)
+
+        assert isinstance(lazy, LazyService)
+        assert lazy.resolve() is math.sqrt
+        assert table.get("sqrt") is abs
+
+    def test_register_lazy_services(self) -> None:
+        """Test l'enregistrement groupé, refusé entièrement si un chemin est invalide."""
+        table = SymbolTable()
+
+        with pytest.raises(ValueError):
+            table.register_lazy_services({"sqrt": "math:sqrt", "bad": "math"})
+        assert table.list_services() == []
+
+        table.register_lazy_services({"sqrt": "math:sqrt", "floor": "math:floor"})
+        assert table.get("floor") is math.floor
+
+    def test_signature_fingerprint_uses_metadata(self) -> None:
+        """Test que l'empreinte utilise la signature fournie, sans import."""
+        signature = inspect.Signature(
+            [inspect.Parameter("x", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=int)]
+        )
+        table = SymbolTable()
+        table.register_lazy("lazy", "lazy_never_imported:func", signature)
+
+        assert table.signature_fingerprint("lazy") is not None
+        assert "lazy_never_imported" not in sys.modules
+
+
+class TestSymbolTableSnapshots:
+    """Tests pour les instantanés, transactions et épinglages de la table."""
+
+    def test_writes_publish_a_new_version(self) -> None:
+        """Test que les écritures publient un nouvel instantané sans modifier l'ancien."""
+        table = SymbolTable()
+        table.register("add", lambda a, b: a + b)
+        before = table.snapshot()
+
+        table.register("sub", lambda a, b: a - b)
+        assert table.has("sub")
+        table.clear()
+
+        assert before.version == 1
+        assert table.snapshot().version == 3
+        assert before.list_services() == ["add"]
+        assert table.list_services() == []
+
+    def test_writes_without_read_publish_once(self) -> None:
+        """Test que des écritures sans lecture intermédiaire ne publient qu'un instantané."""
+        table = SymbolTable()
+        table.register("add", abs)
+        before = table.snapshot()
+
+        for index in range(100):
+            table.register(f"service_{index}", abs)
+            table.register("add", round)
+
+        assert table.snapshot().version == before.version + 1
+        assert table.generation(0) == 100
+        assert table.generations == [100] + [0] * 100
+        assert before.get("add") is abs and len(before) == 1
+
+    def test_transaction_publishes_once(self) -> None:
+        """Test qu'une transaction publie toutes ses écritures ensemble."""
+        table = SymbolTable()
+        table.register("old", abs)
+
+        with table.transaction():
+            table.clear()
+            table.register("add", lambda a, b: a + b)
+            with table.transaction():
+                table.register("sub", lambda a, b: a - b)
+            assert table.list_services() == ["old"]
+
+        assert table.list_services() == ["add", "sub"]
+        assert table.snapshot().version == 2
+        assert table.generations == [1, 0, 0]
+
+    def test_failed_transaction_publishes_nothing(self) -> None:
+        """Test qu'une exception sortant d'une transaction annule ses écritures."""
+        table = SymbolTable()
+        table.register("old", abs)
+
+        with pytest.raises(RuntimeError):
+            with table.transaction():
+                table.clear()
+                table.register("new", abs)
+                raise RuntimeError("rechargement interrompu")
+
+        assert table.list_services() == ["old"]
+        table.register("after", abs)
+        assert table.list_services() == ["old", "after"]
+
+    def test_failed_transaction_releases_its_slots(self) -> None:
+        """Test que les slots d'une transaction annulée, jamais publiés, sont réattribués."""
+        table = SymbolTable()
+        table.register("a", abs)
+        before = table.snapshot()
+
+        with pytest.raises(RuntimeError):
+            with table.transaction():
+                table.register("b", round)
+                raise RuntimeError("rechargement interrompu")
+
+        table.register("c", min)
+
+        assert table.slot_of("c") == 1
+        assert table.slot_of("b") is None
+        assert table.generations == [0, 0]
+        assert before.size == 1 and before.get("c") is None
+
+    def test_pinned_snapshot_ignores_later_writes(self) -> None:
+        """Test que les lectures d'un contexte épinglé ignorent les publications."""
+        table = SymbolTable()
+        table.register("add", abs)
+
+        with table.pinned() as snapshot:
+            table.register("add", round)
+            table.register("sub", min)
+            with table.pinned() as nested:
+                assert nested is snapshot
+            assert table.get("add") is abs
+            assert table.lookup("add", 0, 0) is abs
+            assert not table.has("sub")
+            assert table.generations == [1, 0]
+
+        assert table.get("add") is round
+        assert table.has("sub")
+
+    def test_pinned_snapshot_is_per_thread(self) -> None:
+        """Test que l'épinglage d'un thread n'affecte pas les autres."""
+        table = SymbolTable()
+        table.register("add", abs)
+        seen: List[Any] = []
+
+        with table.pinned():
+            table.register("add", round)
+            reader = threading.Thread(target=lambda: seen.append(table.get("add")))
+            reader.start()
+            reader.join()
+            assert table.get("add") is abs
+
+        assert seen == [round]
+
+    def test_stale_lazy_service_from_pinned_snapshot(self, tmp_path: Path) -> None:
+        """Test qu'un service paresseux périmé lu dans un instantané est republié."""
+        module = tmp_path / "pinned_stale.py"
+        module.write_text("def value() -> int:\n    return 1\n")
+        sys.path.insert(0, str(tmp_path))
+        try:
+            table = SymbolTable()
+            table.register("value", LazyService("pinned_stale:value", None, "0" * 64))
+
+            with table.pinned() as snapshot:
+                func = table.get("value")
+                assert isinstance(snapshot.get("value", resolve=False), LazyService)
+
+            assert func() == 1
+            assert table.get("value") is func
+            assert table.generation(0) == 1
+        finally:
+            sys.path.remove(str(tmp_path))
+            sys.modules.pop("pinned_stale", None)
@@ -0,0 +1,67 @@
+"""Tests unitaires pour la classe SymbolTableSnapshot."""
+
+import math
+from typing import Any, Callable, List, Tuple
+
+from baobab_geek_interpreter.semantic.lazy_service import LazyService
+from baobab_geek_interpreter.semantic.symbol_table_snapshot import SymbolTableSnapshot
+
+
+def _empty(stale: List[Tuple[str, Any, Callable[..., Any]]]) -> SymbolTableSnapshot:
+    """Crée un instantané vide dont les services périmés sont collectés."""
+    return SymbolTableSnapshot(
+        0, 0, 0, {}, [], [], [], {}, lambda *args: stale.append(args)  # type: ignore[arg-type]
+    )
+
+
+class TestSymbolTableSnapshotDerive:
+    """Tests pour la construction des instantanés suivants."""
+
+    def test_derive_leaves_original_unchanged(self) -> None:
+        """Test que derive construit un nouvel instantané sans modifier l'ancien."""
+        empty = _empty([])
+        first = empty.derive([("add", abs), ("sub", min)])
+        second = first.derive([("add", round)])
+
+        assert len(empty) == 0
+        assert (first.version, second.version) == (1, 2)
+        assert first.get("add") is abs
+        assert second.get("add") is round
+        assert first.generations == (0, 0)
+        assert second.generations == (1, 0)
+        assert second.slot_of("sub") == 1
+
+    def test_derive_cleared(self) -> None:
+        """Test qu'un effacement conserve les slots et incrémente les générations."""
+        snapshot = _empty([]).derive([("add", abs), ("sub", min)])
+
+        cleared = snapshot.derive([("sub", max)], cleared=True)
+
+        assert cleared.list_services() == ["sub"]
+        assert cleared.generations == (1, 2)
+        assert cleared.get_slot(0, 1) is None
+        assert cleared.lookup("sub", 1, 0) is max
+        assert snapshot.has("add")
+
+
+class TestSymbolTableSnapshotLazy:
+    """Tests pour la résolution des services paresseux d'un instantané."""
+
+    def test_resolution_replaces_entry_in_place(self) -> None:
+        """Test que la fonction importée remplace l'entrée à génération égale."""
+        snapshot = _empty([]).derive([("sqrt", LazyService("math:sqrt"))])
+
+        assert snapshot.get_slot(0, 0) is math.sqrt
+        assert snapshot.get("sqrt", resolve=False) is math.sqrt
+        assert snapshot.generations == (0,)
+
+    def test_stale_service_is_reported(self) -> None:
+        """Test qu'un service périmé est signalé et non remplacé."""
+        stale: List[Tuple[str, Any, Callable[..., Any]]] = []
+        lazy = LazyService("math:sqrt")
+        lazy.stale = True
+        snapshot = _empty(stale).derive([("sqrt", lazy)])
+
+        assert snapshot.get("sqrt") is math.sqrt
+        assert stale == [("sqrt", lazy, math.sqrt)]
+        assert snapshot.get("sqrt", resolve=False) is lazy
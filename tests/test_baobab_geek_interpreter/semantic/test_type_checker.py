@@ -1,7 +1,11 @@
 """Tests unitaires pour la classe TypeChecker."""
 
+import inspect
+from typing import AsyncGenerator, AsyncIterator, Generator, Iterable, Iterator
+
 import pytest
 
+from baobab_geek_interpreter.semantic.bound_call import BoundCall
 from baobab_geek_interpreter.semantic.type_checker import TypeChecker
 
 
@@ -233,3 +237,134 @@ class TestCheckSingleType:
         assert TypeChecker._check_single_type([1, 2], list[int]) is True
         assert TypeChecker._check_single_type([1, "2"], list[int]) is False
         assert TypeChecker._check_single_type(42, list[int]) is False
+
+
+class TestTypeCheckerNestedCalls:
+    """Tests pour la vérification des appels imbriqués."""
+
+    @pytest.mark.parametrize(
+        "declared, expected",
+        [
+            (int, int),
+            (bool, int),
+            (list[int], list[int]),
+            (list, list[str]),
+            (list[str], list),
+            (list[list[int]], list[list[int]]),
+        ],
+    )
+    def test_assignable(self, declared: object, expected: object) -> None:
+        """Vérifie les types compatibles."""
+        assert TypeChecker.is_assignable(declared, expected)
+
+    @pytest.mark.parametrize(
+        "declared, expected",
+        [(int, float), (str, int), (list[int], list[str]), (int, list[int]), (list[int], int)],
+    )
+    def test_not_assignable(self, declared: object, expected: object) -> None:
+        """Vérifie les types incompatibles."""
+        assert not TypeChecker.is_assignable(declared, expected)
+
+    def test_missing_return_annotation_is_accepted(self) -> None:
+        """Vérifie qu'un service sans annotation de retour est accepté."""
+
+        def untyped():  # type: ignore[no-untyped-def]
+            return 1
+
+        def consumer(value: str) -> str:
+            return value
+
+        assert TypeChecker.check_types(consumer, [BoundCall("untyped", untyped, ())])
+
+    def test_check_types_uses_return_annotation(self) -> None:
+        """Vérifie l'utilisation de l'annotation de retour du service imbriqué."""
+
+        def count() -> int:
+            return 1
+
+        def name() -> str:
+            return "a"
+
+        def consumer(value: int) -> int:
+            return value
+
+        assert TypeChecker.check_types(consumer, [BoundCall("count", count, ())])
+        assert not TypeChecker.check_types(consumer, [BoundCall("name", name, ())])
+
+
+class TestTypeCheckerStreams:
+    """Tests pour les types de flux."""
+
+    @pytest.mark.parametrize(
+        ("declared", "expected"),
+        [
+            (Iterator[int], Iterable[int]),
+            (Generator[int, None, None], Iterator[int]),
+            (list[int], Iterable[int]),
+            (Iterator, Iterable[int]),
+            (Iterator[int], Iterator),
+        ],
+    )
+    def test_assignable_streams(self, declared: object, expected: object) -> None:
+        """Test les flux compatibles."""
+        assert TypeChecker.is_assignable(declared, expected)
+
+    @pytest.mark.parametrize(
+        ("declared", "expected"),
+        [
+            (list[int], Iterator[int]),
+            (Iterator[int], list[int]),
+            (Iterator[str], Iterable[int]),
+            (int, Iterable[int]),
+        ],
+    )
+    def test_incompatible_streams(self, declared: object, expected: object) -> None:
+        """Test les flux incompatibles."""
+        assert not TypeChecker.is_assignable(declared, expected)
+
+    def test_constant_array_for_iterable_parameter(self) -> None:
+        """Test qu'un tableau est accepté pour un paramètre Iterable[T] uniquement."""
+
+        def total(values: Iterable[int]) -> int:
+            return sum(values)
+
+        def consume(values: Iterator[int]) -> int:
+            return sum(values)
+
+        assert TypeChecker.check_types(total, [[1, 2]])
+        assert not TypeChecker.check_types(total, [[1, "2"]])
+        assert not TypeChecker.check_types(consume, [[1, 2]])
+
+    def test_is_stream_type(self) -> None:
+        """Test la reconnaissance des annotations de flux."""
+        assert TypeChecker.is_stream_type(Iterator[int])
+        assert TypeChecker.is_stream_type(Generator[int, None, None])
+        assert TypeChecker.is_stream_type(Iterable)
+        assert TypeChecker.is_stream_type(AsyncIterator[int])
+        assert TypeChecker.is_stream_type(AsyncGenerator[int, None])
+        assert not TypeChecker.is_stream_type(list[int])
+        assert not TypeChecker.is_stream_type(int)
+
+
+class TestTypeCheckerSampling:
+    """Tests pour l'échantillonnage des tableaux et la vérification par paramètres."""
+
+    def test_sample(self) -> None:
+        """Test un échantillon borné, premier et dernier éléments compris."""
+        array = list(range(1_000_000))
+
+        assert TypeChecker.sample(array, 4) == [0, 333333, 666666, 999999]
+        assert TypeChecker.sample([1, 2, 3], 4) == [1, 2, 3]
+        assert TypeChecker.sample([], 4) == []
+
+    def test_check_parameters(self) -> None:
+        """Test la vérification avec des paramètres déjà extraits."""
+
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        params = list(inspect.signature(add).parameters.values())
+
+        assert TypeChecker.check_parameters(params, [1, 2])
+        assert not TypeChecker.check_parameters(params, [1, "2"])
+        assert not TypeChecker.check_parameters(params, [1])
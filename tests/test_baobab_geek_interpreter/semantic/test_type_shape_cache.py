@@ -0,0 +1,76 @@
+"""Tests unitaires pour la classe TypeShapeCache."""
+
+from baobab_geek_interpreter.semantic.bound_call import BoundCall
+from baobab_geek_interpreter.semantic.type_shape_cache import TypeShapeCache
+
+
+def add(a: int, b: int) -> int:
+    """Service d'addition."""
+    return a + b
+
+
+class TestTypeShapeCache:
+    """Tests pour les caches en ligne des formes de types."""
+
+    def test_shape_of_values_arrays_and_calls(self) -> None:
+        """Test la forme des valeurs, des tableaux et des appels imbriqués."""
+        call = BoundCall("add", add, (1, 2))
+
+        assert TypeShapeCache.shape_of([1, "a", [1.0, 2.0], [], call]) == (
+            int,
+            str,
+            (list, float),
+            (list,),
+            (BoundCall, add),
+        )
+
+    def test_heterogeneous_or_nested_array_has_no_shape(self) -> None:
+        """Test qu'un tableau hétérogène ou imbriqué n'a pas de forme."""
+        assert TypeShapeCache.shape_of([[1, True]]) is None
+        assert TypeShapeCache.shape_of([[[1], [2]]]) is None
+
+    def test_monomorphic_hit_after_record(self) -> None:
+        """Test qu'une forme enregistrée est retrouvée pour d'autres valeurs."""
+        cache = TypeShapeCache(add)
+
+        hit, shape = cache.lookup([1, 2])
+        assert not hit
+        cache.record(shape)
+        assert cache.lookup([3, 4]) == (True, (int, int))
+        assert cache.lookup([3, "4"])[0] is False
+        assert cache.stats() == {
+            "hits": 1,
+            "misses": 2,
+            "hit_rate": 1 / 3,
+            "shapes": 1,
+            "megamorphic": 0,
+        }
+
+    def test_polymorphic_then_megamorphic(self) -> None:
+        """Test qu'au-delà de max_shapes formes, le cache devient mégamorphe."""
+        cache = TypeShapeCache(add, max_shapes=2)
+        for args in ([1, 2], [1.0, 2], [1, 2]):
+            hit, shape = cache.lookup(args)
+            cache.record(shape)
+        assert hit
+        assert cache.stats()["shapes"] == 2
+
+        hit, shape = cache.lookup(["a", 2])
+        cache.record(shape)
+        assert cache.megamorphic
+        assert cache.lookup([1, 2]) == (False, None)
+        assert cache.stats()["shapes"] == 0
+
+    def test_record_ignores_missing_shape(self) -> None:
+        """Test qu'un appel sans forme n'est pas enregistré."""
+        cache = TypeShapeCache(add)
+        cache.record(None)
+
+        assert cache.stats()["shapes"] == 0
+
+    def test_parameters_are_read_once(self) -> None:
+        """Test que les paramètres du service sont conservés."""
+        cache = TypeShapeCache(add)
+
+        assert [param.name for param in cache.parameters] == ["a", "b"]
+        assert cache.parameters is cache.parameters
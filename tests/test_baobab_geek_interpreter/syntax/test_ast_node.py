@@ -2,6 +2,8 @@
 
 from typing import Any
 
+import pytest
+
 from baobab_geek_interpreter.syntax.ast_node import (
     ASTNode,
     ASTVisitor,
@@ -310,3 +312,75 @@ class TestASTVisitor:
         # On vérifie juste que ça ne plante pas
         result = node.accept(visitor)
         assert "service:complex" in result
+
+
+class TestNodeSlots:
+    """Tests pour les nœuds sans __dict__."""
+
+    def test_nodes_have_no_instance_dict(self) -> None:
+        """Vérifie que les nœuds sont slottés."""
+        nodes = [
+            IntNode(1),
+            FloatNode(1.5),
+            StringNode("a"),
+            ArrayNode([]),
+            ArgumentNode(IntNode(1)),
+            ServiceCallNode("svc", []),
+        ]
+        for node in nodes:
+            assert not hasattr(node, "__dict__")
+
+    def test_nodes_reject_unknown_attributes(self) -> None:
+        """Vérifie qu'un attribut inconnu ne peut pas être ajouté."""
+        node = IntNode(1)
+        with pytest.raises(AttributeError):
+            node.unknown = 2  # type: ignore[attr-defined]
+
+
+class TestCompactServiceCallNode:
+    """Tests pour les nœuds d'appel compacts."""
+
+    def test_from_values_is_compact(self) -> None:
+        """Vérifie la construction compacte."""
+        node = ServiceCallNode.from_values("svc", [IntNode(1), StringNode("a")], 2, 3)
+
+        assert node.is_compact
+        assert node.name == "svc"
+        assert node.slot == 2
+        assert node.generation == 3
+        assert [value.value for value in node.values] == [1, "a"]  # type: ignore[attr-defined]
+
+    def test_compact_arguments_are_wrapped_on_access(self) -> None:
+        """Vérifie que les arguments sont enveloppés à la demande."""
+        value = IntNode(42)
+        node = ServiceCallNode.from_values("svc", [value])
+
+        arguments = node.arguments
+        assert len(arguments) == 1
+        assert isinstance(arguments[0], ArgumentNode)
+        assert arguments[0].value is value
+
+    def test_compact_node_visitor_receives_arguments(self) -> None:
+        """Vérifie que visit_argument est toujours appelé."""
+        visitor = ConcreteVisitor()
+        node = ServiceCallNode.from_values("svc", [IntNode(7)])
+
+        assert [arg.accept(visitor) for arg in node.arguments] == ["arg:int:7"]
+
+    def test_standard_node_values(self) -> None:
+        """Vérifie l'accès aux valeurs d'un nœud standard."""
+        value = IntNode(1)
+        node = ServiceCallNode("svc", [ArgumentNode(value)])
+
+        assert not node.is_compact
+        assert node.values == [value]
+
+    def test_arguments_setter_replaces_values(self) -> None:
+        """Vérifie le remplacement des arguments d'un nœud compact."""
+        node = ServiceCallNode.from_values("svc", [IntNode(1)])
+        argument = ArgumentNode(IntNode(2))
+
+        node.arguments = [argument]
+
+        assert not node.is_compact
+        assert node.arguments == [argument]
@@ -0,0 +1,163 @@
+"""Tests unitaires pour la classe ASTSerializer."""
+
+from typing import Any, List
+
+import pytest
+
+from baobab_geek_interpreter.lexical.lexical_analyzer import LexicalAnalyzer
+from baobab_geek_interpreter.semantic.bound_call import BoundCall
+from baobab_geek_interpreter.syntax.ast_node import (
+    ArgumentNode,
+    ArrayNode,
+    IntNode,
+    ServiceCallNode,
+    StringNode,
+)
+from baobab_geek_interpreter.syntax.ast_serializer import ASTSerializer
+from baobab_geek_interpreter.syntax.columnar_ast import ColumnarAST
+from baobab_geek_interpreter.syntax.syntax_analyzer import SyntaxAnalyzer
+
+
+def parse(source: str) -> ServiceCallNode:
+    """Analyse une source en AST objet."""
+    return SyntaxAnalyzer().parse(LexicalAnalyzer().analyze(source))
+
+
+def values_of(node: ServiceCallNode) -> List[Any]:
+    """Matérialise les valeurs des arguments d'un appel."""
+    return ColumnarAST.from_node(node).argument_values()
+
+
+class TestASTSerializer:
+    """Tests pour ASTSerializer."""
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "ping()",
+            "add(1, -2)",
+            'concat("a", "été \\"x\\"")',
+            "scale(1.5, -0.25)",
+            "sum([1, 2, 3])",
+            "mean([1.5, 2.5])",
+            'join(["a", "b"])',
+            "big(123456789012345678901234567890, [1, -99999999999999999999999])",
+            'mixed([1, 2.5, "s", [[]], []])',
+        ],
+    )
+    def test_round_trip(self, source: str) -> None:
+        """Vérifie que loads(dumps(ast)) préserve le nom et les valeurs."""
+        node = parse(source)
+
+        restored = ASTSerializer.loads(ASTSerializer.dumps(node))
+
+        assert restored.name == node.name
+        assert restored.is_compact
+        assert values_of(restored) == values_of(node)
+
+    def test_preserves_value_types(self) -> None:
+        """Vérifie que les entiers et flottants ne sont pas confondus."""
+        restored = ASTSerializer.loads(ASTSerializer.dumps(parse("f(1, 1.0, [2], [2.0])")))
+
+        values = values_of(restored)
+
+        assert [type(value) for value in values] == [int, float, list, list]
+        assert isinstance(values[2][0], int)
+        assert isinstance(values[3][0], float)
+
+    def test_header(self) -> None:
+        """Vérifie l'en-tête magique et la version."""
+        data = ASTSerializer.dumps(parse("ping()"))
+
+        assert data.startswith(ASTSerializer.MAGIC)
+        assert data[len(ASTSerializer.MAGIC)] == ASTSerializer.VERSION
+
+    def test_homogeneous_arrays_are_raw_blocks(self) -> None:
+        """Vérifie que les tableaux numériques homogènes sont encodés en bloc."""
+        data = ASTSerializer.dumps(parse("sum([1.0, 2.0, 3.0, 4.0])"))
+
+        assert ASTSerializer.TAG_FLOAT64_ARRAY in data
+        assert len(data) < 4 * 8 + 16
+
+    def test_small_ints_are_varints(self) -> None:
+        """Vérifie que les petits entiers occupent un octet."""
+        short = ASTSerializer.dumps(parse("f(1)"))
+        long = ASTSerializer.dumps(parse("f(1, 2, 3)"))
+
+        assert len(long) - len(short) == 4
+
+    def test_accepts_wrapped_arguments(self) -> None:
+        """Vérifie la sérialisation d'arguments enveloppés."""
+        node = ServiceCallNode("f", [ArgumentNode(IntNode(7)), ArgumentNode(StringNode("x"))])
+
+        assert values_of(ASTSerializer.loads(ASTSerializer.dumps(node))) == [7, "x"]
+
+    def test_bound_call(self) -> None:
+        """Vérifie la sérialisation d'un appel lié."""
+        bound = BoundCall("f", len, (1, 2.5, "s", [1, 2], [[1], ["a", 2.0]], []))
+
+        restored = ASTSerializer.loads(ASTSerializer.dumps(bound))
+
+        assert restored.name == "f"
+        assert values_of(restored) == list(bound.arguments)
+
+    def test_bound_call_with_unsupported_value(self) -> None:
+        """Vérifie le refus d'une valeur non sérialisable."""
+        with pytest.raises(ValueError, match="dict"):
+            ASTSerializer.dumps(BoundCall("f", len, ({},)))
+
+    def test_bound_call_with_bool(self) -> None:
+        """Vérifie le refus des booléens, absents de la grammaire."""
+        with pytest.raises(ValueError, match="bool"):
+            ASTSerializer.dumps(BoundCall("f", len, (True,)))
+
+    def test_unsupported_node(self) -> None:
+        """Vérifie le refus d'un nœud qui n'est pas une constante."""
+        nested = ArrayNode([parse("g()")])  # type: ignore[list-item]
+        node = ServiceCallNode.from_values("f", [nested])
+
+        with pytest.raises(ValueError, match="ServiceCallNode"):
+            ASTSerializer.dumps(node)
+
+    def test_bad_magic(self) -> None:
+        """Vérifie le refus de données sans signature."""
+        with pytest.raises(ValueError, match="magic"):
+            ASTSerializer.loads(b"XYZ\x01\x00\x00")
+
+    def test_bad_version(self) -> None:
+        """Vérifie le refus d'une autre version du format."""
+        data = bytearray(ASTSerializer.dumps(parse("ping()")))
+        data[len(ASTSerializer.MAGIC)] = ASTSerializer.VERSION + 1
+
+        with pytest.raises(ValueError, match="version"):
+            ASTSerializer.loads(bytes(data))
+
+    def test_truncated(self) -> None:
+        """Vérifie le refus de données tronquées."""
+        data = ASTSerializer.dumps(parse('f([1, 2, 3], "abc")'))
+
+        for end in range(len(ASTSerializer.MAGIC) + 1, len(data)):
+            with pytest.raises(ValueError):
+                ASTSerializer.loads(data[:end])
+
+    def test_trailing_data(self) -> None:
+        """Vérifie le refus de données excédentaires."""
+        with pytest.raises(ValueError, match="Trailing"):
+            ASTSerializer.loads(ASTSerializer.dumps(parse("f(1)")) + b"\x00")
+
+    def test_unknown_tag(self) -> None:
+        """Vérifie le refus d'une étiquette inconnue."""
+        data = bytearray(ASTSerializer.dumps(parse("f(1)")))
+        data[-2] = 0x7F
+
+        with pytest.raises(ValueError, match="tag"):
+            ASTSerializer.loads(bytes(data))
+
+    def test_loads_values(self) -> None:
+        """Vérifie le décodage direct en valeurs Python."""
+        data = ASTSerializer.dumps(parse('f(1, [2.5, 3.5], ["a"], [[1], []])'))
+
+        name, values = ASTSerializer.loads_values(data)
+
+        assert name == "f"
+        assert values == [1, [2.5, 3.5], ["a"], [[1], []]]
@@ -0,0 +1,122 @@
+"""Tests unitaires pour la classe ColumnarAST."""
+
+import pytest
+
+from baobab_geek_interpreter.lexical.lexical_analyzer import LexicalAnalyzer
+from baobab_geek_interpreter.syntax.ast_node import (
+    ArgumentNode,
+    ArrayNode,
+    FloatNode,
+    IntNode,
+    ServiceCallNode,
+    StringNode,
+)
+from baobab_geek_interpreter.syntax.columnar_ast import ColumnarAST
+from baobab_geek_interpreter.syntax.node_kind import NodeKind
+from baobab_geek_interpreter.syntax.syntax_analyzer import SyntaxAnalyzer
+
+
+def parse(source: str) -> ColumnarAST:
+    """Analyse une source en AST colonnaire."""
+    return SyntaxAnalyzer().parse_columnar(LexicalAnalyzer().analyze(source))
+
+
+class TestColumnarAST:
+    """Tests pour ColumnarAST."""
+
+    def test_empty_call(self) -> None:
+        """Vérifie un appel sans argument."""
+        ast = parse("ping()")
+
+        assert len(ast) == 1
+        assert ast.name == "ping"
+        assert ast.kinds[0] == NodeKind.SERVICE_CALL
+        assert ast.parents[0] == -1
+        assert ast.argument_values() == []
+
+    def test_scalar_values_are_pooled(self) -> None:
+        """Vérifie le stockage des scalaires dans les pools typés."""
+        ast = parse('svc(1, 2.5, "a")')
+
+        assert list(ast.ints) == [1]
+        assert list(ast.floats) == [2.5]
+        assert ast.strings == ["svc", "a"]
+        assert ast.argument_values() == [1, 2.5, "a"]
+
+    def test_parents_and_spans(self) -> None:
+        """Vérifie les colonnes parent et taille de sous-arbre."""
+        ast = parse("svc([1, 2], 3)")
+
+        assert list(ast.kinds) == [
+            NodeKind.SERVICE_CALL,
+            NodeKind.ARRAY,
+            NodeKind.INT,
+            NodeKind.INT,
+            NodeKind.INT,
+        ]
+        assert list(ast.parents) == [-1, 0, 1, 1, 0]
+        assert list(ast.spans) == [5, 3, 1, 1, 1]
+        assert ast.argument_indices() == [1, 4]
+
+    def test_big_ints_use_object_pool(self) -> None:
+        """Vérifie le stockage des entiers hors int64."""
+        big = 2**70
+        ast = parse(f"svc({big}, [1, {big}])")
+
+        assert ast.kinds[1] == NodeKind.BIG_INT
+        assert ast.argument_values() == [big, [1, big]]
+        assert ast.scalar_kind(2) == -1
+
+    def test_scalar_kind(self) -> None:
+        """Vérifie la détection des tableaux plats homogènes."""
+        ast = parse('svc([1, 2], [1.5], ["a"], [1, "a"], [], [[1]])')
+        kinds = [ast.scalar_kind(index) for index in ast.argument_indices()]
+
+        assert kinds == [NodeKind.INT, NodeKind.FLOAT, NodeKind.STRING, -1, -1, -1]
+
+    def test_materialize_arrays(self) -> None:
+        """Vérifie la matérialisation des tableaux."""
+        ast = parse('svc([1, 2], [1.5, 2.5], ["a", "b"], [1, "a"], [], [[1], [2.5]])')
+
+        assert ast.argument_values() == [
+            [1, 2],
+            [1.5, 2.5],
+            ["a", "b"],
+            [1, "a"],
+            [],
+            [[1], [2.5]],
+        ]
+
+    def test_value_of_non_scalar_raises(self) -> None:
+        """Vérifie qu'une valeur scalaire est requise."""
+        ast = parse("svc([1])")
+
+        with pytest.raises(ValueError):
+            ast.value(1)
+
+    def test_from_node(self) -> None:
+        """Vérifie la conversion depuis l'AST objet."""
+        node = ServiceCallNode(
+            "svc",
+            [
+                ArgumentNode(IntNode(1)),
+                ArgumentNode(FloatNode(2.5)),
+                ArgumentNode(StringNode("a")),
+                ArgumentNode(ArrayNode([IntNode(3), IntNode(4)])),
+            ],
+            2,
+            5,
+        )
+        ast = ColumnarAST.from_node(node)
+
+        assert ast.name == "svc"
+        assert ast.slot == 2
+        assert ast.generation == 5
+        assert ast.argument_values() == [1, 2.5, "a", [3, 4]]
+
+    def test_from_node_rejects_unknown_nodes(self) -> None:
+        """Vérifie le rejet des nœuds non constants."""
+        node = ServiceCallNode("svc", [ArgumentNode(ServiceCallNode("x", []))])  # type: ignore
+
+        with pytest.raises(ValueError):
+            ColumnarAST.from_node(node)
@@ -0,0 +1,88 @@
+"""Tests unitaires pour la classe ColumnarNodeAdapter."""
+
+from typing import Any
+
+from baobab_geek_interpreter.execution.executor import Executor
+from baobab_geek_interpreter.lexical.lexical_analyzer import LexicalAnalyzer
+from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+from baobab_geek_interpreter.syntax.columnar_ast import ColumnarAST
+from baobab_geek_interpreter.syntax.columnar_node_adapter import ColumnarNodeAdapter
+from baobab_geek_interpreter.syntax.node_kind import NodeKind
+from baobab_geek_interpreter.syntax.ast_node import ASTVisitor
+from baobab_geek_interpreter.syntax.syntax_analyzer import SyntaxAnalyzer
+
+
+class DescribingVisitor(ASTVisitor):
+    """Visiteur concret décrivant les nœuds visités."""
+
+    def visit_service_call(self, node: Any) -> Any:
+        """Visite un appel de service."""
+        return f"service:{node.name}"
+
+    def visit_argument(self, node: Any) -> Any:
+        """Visite un argument."""
+        return f"arg:{node.value.accept(self)}"
+
+    def visit_int(self, node: Any) -> Any:
+        """Visite un entier."""
+        return f"int:{node.value}"
+
+    def visit_float(self, node: Any) -> Any:
+        """Visite un flottant."""
+        return f"float:{node.value}"
+
+    def visit_string(self, node: Any) -> Any:
+        """Visite une chaîne."""
+        return f"string:{node.value}"
+
+    def visit_array(self, node: Any) -> Any:
+        """Visite un tableau."""
+        elements = [elem.accept(self) for elem in node.elements]
+        return f"array:[{','.join(elements)}]"
+
+
+def parse(source: str) -> ColumnarAST:
+    """Analyse une source en AST colonnaire."""
+    return SyntaxAnalyzer().parse_columnar(LexicalAnalyzer().analyze(source))
+
+
+class TestColumnarNodeAdapter:
+    """Tests pour ColumnarNodeAdapter."""
+
+    def test_root_attributes(self) -> None:
+        """Vérifie les attributs du nœud d'appel."""
+        ast = parse("svc(1, [2])")
+        ast.slot = 3
+        ast.generation = 4
+        root = ast.root()
+
+        assert isinstance(root, ColumnarNodeAdapter)
+        assert root.kind == NodeKind.SERVICE_CALL
+        assert root.name == "svc"
+        assert root.slot == 3
+        assert root.generation == 4
+        assert len(root.arguments) == 2
+        assert root.values[0].value == 1
+        assert [element.value for element in root.values[1].elements] == [2]
+
+    def test_visitor_over_columns(self) -> None:
+        """Vérifie qu'un visiteur de l'AST objet fonctionne sur les colonnes."""
+        ast = parse('svc(1, 2.5, "a", [1, 2])')
+        visitor = DescribingVisitor()
+
+        assert ast.accept(visitor) == "service:svc"
+        assert [arg.accept(visitor) for arg in ast.root().arguments] == [
+            "arg:int:1",
+            "arg:float:2.5",
+            "arg:string:a",
+            "arg:array:[int:1,int:2]",
+        ]
+
+    def test_executor_visits_adapter(self) -> None:
+        """Vérifie l'exécution via le visiteur standard."""
+        table = SymbolTable()
+        table.register("total", lambda values, extra: sum(values) + extra)
+
+        result = Executor(table).execute(parse("total([1, 2, 3], 4)").root())  # type: ignore
+
+        assert result == 10
@@ -6,6 +6,7 @@ from baobab_geek_interpreter.exceptions.syntax_exception import (
     BaobabSyntaxAnalyserException,
 )
 from baobab_geek_interpreter.lexical.lexical_analyzer import LexicalAnalyzer
+from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
 from baobab_geek_interpreter.syntax.ast_node import (
     ArrayNode,
     FloatNode,
@@ -341,3 +342,254 @@ class TestSyntaxAnalyzerComplexScenarios:
         ast = parser.parse(tokens)
 
         assert "hello\nworld" in ast.arguments[0].value.value
+
+
+class TestSyntaxAnalyzerSlotResolution:
+    """Tests pour la résolution des slots lors de l'analyse syntaxique."""
+
+    def test_parse_without_symbol_table_leaves_slot_unresolved(self) -> None:
+        """Test qu'aucun slot n'est résolu sans table des symboles."""
+        tokens = LexicalAnalyzer().analyze("add(1, 2)")
+        ast = SyntaxAnalyzer().parse(tokens)
+
+        assert ast.slot == -1
+        assert ast.generation == -1
+
+    def test_parse_resolves_registered_service_slot(self) -> None:
+        """Test que le slot et la génération sont résolus."""
+        table = SymbolTable()
+        table.register("other", lambda: None)
+        table.register("add", lambda a, b: a + b)
+        table.register("add", lambda a, b: a + b)
+
+        tokens = LexicalAnalyzer().analyze("add(1, 2)")
+        ast = SyntaxAnalyzer(table).parse(tokens)
+
+        assert ast.slot == 1
+        assert ast.generation == 1
+
+    def test_parse_unknown_service_leaves_slot_unresolved(self) -> None:
+        """Test qu'un service inconnu n'a pas de slot."""
+        tokens = LexicalAnalyzer().analyze("unknown()")
+        ast = SyntaxAnalyzer(SymbolTable()).parse(tokens)
+
+        assert ast.slot == -1
+
+
+class TestSyntaxAnalyzerCompactArguments:
+    """Tests pour le mode compact de construction des appels."""
+
+    def test_parse_compact_arguments(self) -> None:
+        """Test que le mode compact ne crée pas d'enveloppes."""
+        tokens = LexicalAnalyzer().analyze('svc(1, "a", [2, 3])')
+        ast = SyntaxAnalyzer(compact_arguments=True).parse(tokens)
+
+        assert ast.is_compact
+        assert isinstance(ast.values[0], IntNode)
+        assert isinstance(ast.values[1], StringNode)
+        assert isinstance(ast.values[2], ArrayNode)
+        assert ast.arguments[1].value.value == "a"
+
+    def test_parse_compact_resolves_slot(self) -> None:
+        """Test que le mode compact résout aussi le slot."""
+        table = SymbolTable()
+        table.register("svc", lambda: None)
+
+        tokens = LexicalAnalyzer().analyze("svc()")
+        ast = SyntaxAnalyzer(table, compact_arguments=True).parse(tokens)
+
+        assert ast.is_compact
+        assert ast.slot == 0
+
+
+class TestSyntaxAnalyzerColumnar:
+    """Tests pour l'analyse syntaxique vers l'AST colonnaire."""
+
+    def test_parse_columnar(self) -> None:
+        """Test l'analyse d'un appel complet."""
+        tokens = LexicalAnalyzer().analyze('svc(1, -2.5, "a", [1, 2, 3])')
+        ast = SyntaxAnalyzer().parse_columnar(tokens)
+
+        assert ast.name == "svc"
+        assert ast.argument_values() == [1, -2.5, "a", [1, 2, 3]]
+
+    def test_parse_columnar_resolves_slot(self) -> None:
+        """Test la résolution du slot."""
+        table = SymbolTable()
+        table.register("svc", lambda: None)
+
+        ast = SyntaxAnalyzer(table).parse_columnar(LexicalAnalyzer().analyze("svc()"))
+
+        assert ast.slot == 0
+        assert ast.generation == 0
+
+    def test_parse_columnar_empty_tokens_raises(self) -> None:
+        """Test qu'une liste vide lève une exception."""
+        with pytest.raises(BaobabSyntaxAnalyserException, match="vide"):
+            SyntaxAnalyzer().parse_columnar([])
+
+    def test_parse_columnar_invalid_constant_raises(self) -> None:
+        """Test qu'un argument invalide lève une exception."""
+        tokens = LexicalAnalyzer().analyze("svc(other)")
+
+        with pytest.raises(BaobabSyntaxAnalyserException, match="Constante attendue"):
+            SyntaxAnalyzer().parse_columnar(tokens)
+
+    def test_parse_columnar_trailing_content_raises(self) -> None:
+        """Test que du contenu après l'appel lève une exception."""
+        tokens = LexicalAnalyzer().analyze("svc() 1")
+
+        with pytest.raises(BaobabSyntaxAnalyserException, match="Contenu inattendu"):
+            SyntaxAnalyzer().parse_columnar(tokens)
+
+
+class TestSyntaxAnalyzerPipelines:
+    """Tests pour l'opérateur de pipeline."""
+
+    @staticmethod
+    def _parse(source: str) -> ServiceCallNode:
+        """Analyse un appel en AST compact."""
+        return SyntaxAnalyzer(compact_arguments=True).parse(LexicalAnalyzer().analyze(source))
+
+    def test_pipeline_becomes_nested_call(self) -> None:
+        """Test que ``a(1) | b(2)`` est analysé en ``b(a(1), 2)``."""
+        ast = self._parse("a(1) | b(2)")
+
+        assert ast.name == "b"
+        inner, second = ast.values
+        assert isinstance(inner, ServiceCallNode)
+        assert (inner.name, inner.values[0].value) == ("a", 1)  # type: ignore[union-attr]
+        assert second.value == 2  # type: ignore[union-attr]
+
+    def test_pipeline_chain(self) -> None:
+        """Test un pipeline de trois appels, associatif à gauche."""
+        ast = self._parse("a() | b() | c([1])")
+
+        assert ast.name == "c"
+        middle = ast.values[0]
+        assert isinstance(middle, ServiceCallNode) and middle.name == "b"
+        assert isinstance(middle.values[0], ServiceCallNode) and middle.values[0].name == "a"
+        assert isinstance(ast.values[1], ArrayNode)
+
+    def test_pipeline_as_argument(self) -> None:
+        """Test un pipeline en argument d'un appel."""
+        ast = SyntaxAnalyzer().parse(LexicalAnalyzer().analyze("f(a() | b(), 3)"))
+
+        first = ast.arguments[0].value
+        assert isinstance(first, ServiceCallNode) and first.name == "b"
+        assert isinstance(ast.arguments[1].value, IntNode)
+
+    def test_pipeline_in_script(self) -> None:
+        """Test des pipelines dans un script."""
+        calls = SyntaxAnalyzer().parse_script(
+            LexicalAnalyzer().analyze("a() | b(); c()\na() | c()")
+        )
+
+        assert [call.name for call in calls] == ["b", "c", "c"]
+
+    @pytest.mark.parametrize("source", ["a() |", "| a()", "a() | 1", "a() || b()"])
+    def test_invalid_pipeline(self, source: str) -> None:
+        """Test le refus d'un pipeline incomplet."""
+        with pytest.raises(BaobabSyntaxAnalyserException):
+            self._parse(source)
+
+
+class TestSyntaxAnalyzerScripts:
+    """Tests pour les scripts de plusieurs appels."""
+
+    @staticmethod
+    def _parse(source: str) -> list[ServiceCallNode]:
+        """Analyse un script."""
+        return SyntaxAnalyzer().parse_script(LexicalAnalyzer().analyze(source))
+
+    def test_calls_separated_by_semicolons(self) -> None:
+        """Test des appels séparés par des points-virgules."""
+        calls = self._parse("a(1); b(2);; c()")
+
+        assert [call.name for call in calls] == ["a", "b", "c"]
+        assert calls[0].values[0].value == 1  # type: ignore[union-attr]
+
+    def test_calls_separated_by_newlines(self) -> None:
+        """Test des appels séparés par des fins de ligne."""
+        calls = self._parse('a(1)\n\n  b(\n  "x"\n)\nc(d());\n')
+
+        assert [call.name for call in calls] == ["a", "b", "c"]
+        assert isinstance(calls[2].values[0], ServiceCallNode)
+
+    def test_single_call_script(self) -> None:
+        """Test un script d'un seul appel."""
+        assert [call.name for call in self._parse("a()")] == ["a"]
+
+    def test_calls_on_same_line_need_separator(self) -> None:
+        """Test le refus de deux appels sur une même ligne sans séparateur."""
+        with pytest.raises(BaobabSyntaxAnalyserException, match="Contenu inattendu"):
+            self._parse("a(1) b(2)")
+
+    def test_leading_separator_is_rejected(self) -> None:
+        """Test le refus d'un script commençant par un séparateur."""
+        with pytest.raises(BaobabSyntaxAnalyserException):
+            self._parse("; a()")
+
+    def test_parse_rejects_scripts(self) -> None:
+        """Test que l'analyse d'un appel unique refuse un séparateur."""
+        with pytest.raises(BaobabSyntaxAnalyserException, match="SEMICOLON"):
+            SyntaxAnalyzer().parse(LexicalAnalyzer().analyze("a(1);"))
+
+
+class TestSyntaxAnalyzerNestedCalls:
+    """Tests pour les appels de service imbriqués."""
+
+    def test_parse_nested_calls(self) -> None:
+        """Test un appel dont les arguments sont des appels de service."""
+        tokens = LexicalAnalyzer().analyze('merge(fetch("a"), fetch("b"), 3)')
+        ast = SyntaxAnalyzer().parse(tokens)
+
+        first, second, third = ast.values
+        assert isinstance(first, ServiceCallNode)
+        assert isinstance(second, ServiceCallNode)
+        assert (first.name, first.values[0].value) == ("fetch", "a")  # type: ignore[union-attr]
+        assert (second.name, second.values[0].value) == ("fetch", "b")  # type: ignore[union-attr]
+        assert isinstance(third, IntNode)
+
+    def test_parse_deeply_nested_calls(self) -> None:
+        """Test plusieurs niveaux d'imbrication."""
+        tokens = LexicalAnalyzer().analyze("a(b(c(), [1, 2]))")
+        ast = SyntaxAnalyzer(compact_arguments=True).parse(tokens)
+
+        inner = ast.values[0]
+        assert isinstance(inner, ServiceCallNode)
+        assert isinstance(inner.values[0], ServiceCallNode)
+        assert inner.values[0].values == []
+        assert isinstance(inner.values[1], ArrayNode)
+
+    def test_nested_call_slot_is_resolved(self) -> None:
+        """Test la résolution du slot des appels imbriqués."""
+        table = SymbolTable()
+        table.register("inner", lambda: 1)
+        tokens = LexicalAnalyzer().analyze("outer(inner())")
+
+        ast = SyntaxAnalyzer(table).parse(tokens)
+
+        assert ast.slot == -1
+        assert ast.values[0].slot == table.slot_of("inner")  # type: ignore[union-attr]
+
+    def test_nested_call_in_array_is_rejected(self) -> None:
+        """Test que les éléments d'un tableau restent des constantes."""
+        tokens = LexicalAnalyzer().analyze("f([g()])")
+
+        with pytest.raises(BaobabSyntaxAnalyserException, match="Constante attendue"):
+            SyntaxAnalyzer().parse(tokens)
+
+    def test_unclosed_nested_call(self) -> None:
+        """Test un appel imbriqué non fermé."""
+        tokens = LexicalAnalyzer().analyze("f(g(1)")
+
+        with pytest.raises(BaobabSyntaxAnalyserException):
+            SyntaxAnalyzer().parse(tokens)
+
+    def test_nested_call_not_supported_by_columnar(self) -> None:
+        """Test que l'AST colonnaire refuse les appels imbriqués."""
+        tokens = LexicalAnalyzer().analyze("f(g(1))")
+
+        with pytest.raises(BaobabSyntaxAnalyserException, match="Constante attendue"):
+            SyntaxAnalyzer().parse_columnar(tokens)
@@ -1,8 +1,22 @@
 """Tests unitaires pour la classe Interpreter."""
 
+import asyncio
+import inspect
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Iterable, Iterator, List, cast
+
 import pytest
 
-from baobab_geek_interpreter import Interpreter, service
+import baobab_geek_interpreter
+from baobab_geek_interpreter import Interpreter, ValidationLevel, service
+from baobab_geek_interpreter.cache.disk_call_cache import DiskCallCache
+from baobab_geek_interpreter.execution.service_process_pool import ServiceProcessPool
 from baobab_geek_interpreter.exceptions.execution_exception import (
     BaobabExecutionException,
 )
@@ -15,6 +29,13 @@ from baobab_geek_interpreter.exceptions.semantic_exception import (
 from baobab_geek_interpreter.exceptions.syntax_exception import (
     BaobabSyntaxAnalyserException,
 )
+from baobab_geek_interpreter.semantic.service_manifest import ServiceManifest
+
+
+@service(executor="process")
+def hypotenuse(a: float, b: float) -> float:
+    """Service exécuté dans un processus de travail."""
+    return math.hypot(a, b)
 
 
 class TestInterpreterBasics:
@@ -93,6 +114,61 @@ class TestInterpreterServiceRegistration:
         assert interpreter.has_service("service2") is True
         assert interpreter.has_service("not_a_service") is False
 
+    def test_register_package(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test l'enregistrement récursif des services d'un paquet."""
+        package = tmp_path / "interpreter_services"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "maths.py").write_text(
+            "from baobab_geek_interpreter import service\n"
+            "@service\ndef double(x: int) -> int:\n    return x * 2\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        interpreter = Interpreter()
+
+        report = interpreter.register_package("interpreter_services", parallel=True)
+
+        assert (report["modules"], report["services"]) == (2, 1)
+        assert interpreter.interpret("double(21)") == 42
+        assert interpreter.get_stats()["discovery"]["services"] == 1
+
+    def test_register_lazy(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test qu'un service paresseux n'est importé qu'à son premier appel."""
+        (tmp_path / "interpreter_lazy.py").write_text(
+            "from baobab_geek_interpreter import service\n"
+            "@service\ndef square(x: int) -> int:\n    return x * x\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        interpreter = Interpreter()
+        interpreter.register_lazy("square", "interpreter_lazy:square")
+        interpreter.register_lazy_services({"root": "math:sqrt"})
+
+        assert interpreter.has_service("square")
+        assert interpreter.list_services() == ["square", "root"]
+        assert "interpreter_lazy" not in sys.modules
+        assert interpreter.interpret("square(7)") == 49
+        assert "interpreter_lazy" in sys.modules
+        with pytest.raises(BaobabSemanticAnalyserException, match="incompatibles"):
+            interpreter.interpret('square("a")')
+
+    def test_load_manifest(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test l'enregistrement des services d'un manifeste enregistré."""
+        (tmp_path / "interpreter_manifest.py").write_text(
+            "from baobab_geek_interpreter import service\n"
+            "@service\ndef half(x: int) -> int:\n    return x // 2\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        path = tmp_path / "services.json"
+        ServiceManifest.build(["interpreter_manifest"]).save(path)
+        monkeypatch.delitem(sys.modules, "interpreter_manifest")
+        interpreter = Interpreter()
+
+        assert interpreter.load_manifest(str(path)) == 1
+        assert "interpreter_manifest" not in sys.modules
+        assert interpreter.interpret("half(10)") == 5
+        with pytest.raises(BaobabSemanticAnalyserException, match="incompatibles"):
+            interpreter.interpret('half("a")')
+
     def test_clear_services(self) -> None:
         """Test la suppression de tous les services."""
         interpreter = Interpreter()
@@ -333,3 +409,826 @@ class TestInterpreterRealWorld:
         interpreter.register_service("format_report", format_report)
         result = interpreter.interpret('format_report("Sales", 3, [100.0, 200.0, 300.0])')
         assert result == "Sales: 3 items, average = 200.00"
+
+
+class TestInterpreterColumnar:
+    """Tests pour le mode AST colonnaire."""
+
+    def test_interpret_columnar(self) -> None:
+        """Test une interprétation via l'AST colonnaire."""
+        interpreter = Interpreter(columnar=True)
+
+        @service
+        def total(values: list[int], factor: float) -> float:
+            return sum(values) * factor
+
+        interpreter.register_service("total", total)
+        assert interpreter.interpret("total([1, 2, 3], 0.5)") == 3.0
+
+    def test_interpret_columnar_semantic_error(self) -> None:
+        """Test qu'une erreur de type est détectée en mode colonnaire."""
+        interpreter = Interpreter(columnar=True)
+
+        @service
+        def total(values: list[int]) -> int:
+            return sum(values)
+
+        interpreter.register_service("total", total)
+        with pytest.raises(BaobabSemanticAnalyserException):
+            interpreter.interpret('total(["a"])')
+
+
+class TestInterpreterCallCache:
+    """Tests pour le cache persistant des appels analysés."""
+
+    def test_cache_hit_skips_analysis(self, tmp_path) -> None:
+        """Test qu'un appel en cache est exécuté sans ré-analyse après redémarrage."""
+
+        @service
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        path = tmp_path / "calls.sqlite"
+        first = Interpreter(call_cache=DiskCallCache(path))
+        first.register_service("add", add)
+        assert first.interpret("add(1, 2)") == 3
+
+        cache = DiskCallCache(path)
+        restarted = Interpreter(call_cache=cache)
+        restarted.register_service("add", add)
+        restarted._lexer = None  # type: ignore[assignment]
+
+        assert restarted.interpret("add(1, 2)") == 3
+        assert cache.hits == 1
+
+    def test_cache_invalidated_on_signature_change(self) -> None:
+        """Test que la modification d'une signature force une nouvelle validation."""
+
+        @service
+        def echo(value: int) -> int:
+            return value
+
+        @service
+        def echo_text(value: str) -> str:
+            return value
+
+        cache = DiskCallCache(":memory:")
+        interpreter = Interpreter(call_cache=cache)
+        interpreter.register_service("echo", echo)
+        assert interpreter.interpret("echo(1)") == 1
+
+        interpreter.register_service("echo", echo_text)
+        with pytest.raises(BaobabSemanticAnalyserException):
+            interpreter.interpret("echo(1)")
+        assert cache.invalidations == 1
+
+    def test_errors_are_not_cached(self) -> None:
+        """Test qu'un appel invalide n'est pas mis en cache."""
+        cache = DiskCallCache(":memory:")
+        interpreter = Interpreter(call_cache=cache)
+
+        with pytest.raises(BaobabSemanticAnalyserException):
+            interpreter.interpret("missing(1)")
+        assert len(cache) == 0
+
+
+class TestInterpreterStats:
+    """Tests pour les statistiques de l'interpréteur."""
+
+    def test_pure_service_stats(self) -> None:
+        """Test les statistiques de mémorisation d'un service pur."""
+        interpreter = Interpreter()
+
+        @service(pure=True, cache_size=4)
+        def total(values: list[int]) -> int:
+            return sum(values)
+
+        interpreter.register_service("total", total)
+        for _ in range(3):
+            assert interpreter.interpret("total([1, 2, 3])") == 6
+
+        stats = interpreter.get_stats()["results"]["total"]
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+
+    def test_call_cache_stats(self) -> None:
+        """Test que les statistiques incluent le cache d'appels s'il est configuré."""
+        interpreter = Interpreter(call_cache=DiskCallCache(":memory:"))
+
+        assert interpreter.get_stats()["call_cache"] == {
+            "hits": 0,
+            "misses": 0,
+            "invalidations": 0,
+        }
+
+
+class TestInterpreterAsync:
+    """Tests pour l'interprétation asynchrone et la fusion des appels."""
+
+    def test_interpret_async(self) -> None:
+        """Test une interprétation depuis une coroutine."""
+        interpreter = Interpreter()
+
+        @service
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        interpreter.register_service("add", add)
+
+        assert asyncio.run(interpreter.interpret_async("add(1, 2)")) == 3
+
+    def test_interpret_async_semantic_error(self) -> None:
+        """Test qu'une erreur sémantique est levée en mode asynchrone."""
+        interpreter = Interpreter()
+
+        with pytest.raises(BaobabSemanticAnalyserException):
+            asyncio.run(interpreter.interpret_async("missing()"))
+
+    def test_coalesced_burst(self) -> None:
+        """Test qu'une rafale d'appels identiques n'exécute le service qu'une fois."""
+        interpreter = Interpreter(coalesce=True)
+        calls: list[str] = []
+
+        @service
+        def lookup(key: str) -> str:
+            calls.append(key)
+            time.sleep(0.02)
+            return key.upper()
+
+        interpreter.register_service("lookup", lookup)
+
+        async def burst() -> list[str]:
+            return await asyncio.gather(
+                *(interpreter.interpret_async('lookup("a")') for _ in range(20))
+            )
+
+        assert asyncio.run(burst()) == ["A"] * 20
+        assert calls == ["a"]
+        assert interpreter.get_stats()["coalescing"] == {"executions": 1, "coalesced": 19}
+
+
+class TestInterpreterBatching:
+    """Tests pour les services de lot."""
+
+    def test_batch_service_type_checks_individual_calls(self) -> None:
+        """Test que chaque appel est vérifié contre le type des éléments."""
+        interpreter = Interpreter()
+
+        @service(batch=True, max_wait_ms=0)
+        def score(values: list[float]) -> list[float]:
+            return [value / 2 for value in values]
+
+        interpreter.register_service("score", score)
+
+        assert interpreter.interpret("score(3.0)") == 1.5
+        with pytest.raises(BaobabSemanticAnalyserException):
+            interpreter.interpret('score("x")')
+
+    def test_concurrent_interpretations_are_batched(self) -> None:
+        """Test le regroupement d'interprétations simultanées."""
+        interpreter = Interpreter()
+        sizes: list[int] = []
+
+        @service(batch=True, max_batch=10, max_wait_ms=1000)
+        def lookup(keys: list[str]) -> list[str]:
+            sizes.append(len(keys))
+            return [key.upper() for key in keys]
+
+        interpreter.register_service("lookup", lookup)
+
+        async def burst() -> list[str]:
+            return await asyncio.gather(
+                *(interpreter.interpret_async(f'lookup("k{i}")') for i in range(10))
+            )
+
+        assert asyncio.run(burst()) == [f"K{i}" for i in range(10)]
+        assert sizes == [10]
+        assert interpreter.get_stats()["batches"]["lookup"] == {"batches": 1, "items": 10}
+
+
+class TestInterpreterProcess:
+    """Tests pour les services exécutés dans un processus de travail."""
+
+    def test_process_service(self) -> None:
+        """Test l'interprétation d'un appel exécuté dans un processus."""
+        with ServiceProcessPool(max_workers=1) as pool:
+            interpreter = Interpreter(process_pool=pool)
+            interpreter.register_service("hypotenuse", hypotenuse)
+
+            assert interpreter.interpret("hypotenuse(3.0, 4.0)") == 5.0
+            assert interpreter.get_stats()["processes"]["calls"] == 1
+            interpreter.close()
+
+    def test_process_service_type_checking(self) -> None:
+        """Test que la vérification des types reste effectuée localement."""
+        interpreter = Interpreter()
+        interpreter.register_service("hypotenuse", hypotenuse)
+
+        with pytest.raises(BaobabSemanticAnalyserException):
+            interpreter.interpret('hypotenuse("a", 4.0)')
+        assert "processes" not in interpreter.get_stats()
+        interpreter.close()
+
+
+class TestInterpreterNestedCalls:
+    """Tests pour les appels de service imbriqués."""
+
+    @staticmethod
+    def _interpreter(columnar: bool = False) -> Interpreter:
+        """Construit un interpréteur avec des services composables."""
+        interpreter = Interpreter(columnar=columnar)
+
+        @service
+        def fetch(key: str) -> list[int]:
+            return [ord(char) for char in key]
+
+        @service
+        def merge(a: list[int], b: list[int]) -> list[int]:
+            return sorted(a + b)
+
+        interpreter.register_service("fetch", fetch)
+        interpreter.register_service("merge", merge)
+        return interpreter
+
+    @pytest.mark.parametrize("columnar", [False, True])
+    def test_nested_calls(self, columnar: bool) -> None:
+        """Test une composition de services en une seule interprétation."""
+        interpreter = self._interpreter(columnar)
+
+        assert interpreter.interpret('merge(fetch("b"), fetch("a"))') == [97, 98]
+        assert interpreter.interpret('merge(merge(fetch("c"), [1]), fetch(""))') == [1, 99]
+        interpreter.close()
+
+    def test_nested_type_error_is_raised_before_execution(self) -> None:
+        """Test qu'une erreur de type est détectée avant l'exécution."""
+        interpreter = self._interpreter()
+
+        with pytest.raises(BaobabSemanticAnalyserException):
+            interpreter.interpret('fetch(fetch("a"))')
+
+    def test_nested_calls_async(self) -> None:
+        """Test une composition de services en mode asyncio."""
+        interpreter = self._interpreter()
+
+        assert asyncio.run(interpreter.interpret_async('merge(fetch("b"), [0])')) == [0, 98]
+
+    def test_identical_pure_nested_calls_are_evaluated_once(self) -> None:
+        """Test la fusion des appels imbriqués purs identiques et ses statistiques."""
+        interpreter = Interpreter()
+        calls: list[str] = []
+
+        @service(pure=True, cache_size=1)
+        def load(name: str) -> list[float]:
+            calls.append(name)
+            return [float(len(name))]
+
+        @service(pure=True)
+        def stats(values: list[float]) -> list[float]:
+            return [sum(values) * 2]
+
+        @service
+        def cmp(a: list[float], b: list[float]) -> bool:
+            return a < b
+
+        for func in (load, stats, cmp):
+            interpreter.register_service(func.__name__, func)
+
+        assert interpreter.interpret('cmp(load("xy"), stats(load("xy")))') is True
+        assert calls == ["xy"]
+        assert interpreter.get_stats()["cse"] == {"calls": 3, "saved": 1}
+
+    @pytest.mark.parametrize("coalesce", [False, True])
+    def test_pure_call_with_unhashable_nested_result(self, coalesce: bool) -> None:
+        """Test un service pur appelé avec le dictionnaire retourné par un appel imbriqué."""
+        interpreter = Interpreter(coalesce=coalesce)
+
+        @service
+        def mk() -> dict:
+            return {"a": 1}
+
+        @service(pure=True)
+        def use(value: dict) -> int:
+            return len(value)
+
+        interpreter.register_service("mk", mk)
+        interpreter.register_service("use", use)
+
+        assert interpreter.interpret("use(mk())") == 1
+        assert asyncio.run(interpreter.interpret_async("use(mk())")) == 1
+
+    def test_type_check_stats(self) -> None:
+        """Test les statistiques des caches de formes de types."""
+        interpreter = Interpreter()
+
+        @service
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        interpreter.register_service("add", add)
+        assert "type_checks" not in interpreter.get_stats()
+
+        for source in ("add(1, 2)", "add(3, 4)", "add(5, add(6, 7))"):
+            interpreter.interpret(source)
+
+        stats = interpreter.get_stats()["type_checks"]["add"]
+        assert (stats["hits"], stats["misses"], stats["shapes"]) == (2, 2, 2)
+        assert stats["hit_rate"] == 0.5
+        interpreter.close()
+
+
+class TestInterpreterScripts:
+    """Tests pour les scripts de plusieurs appels."""
+
+    @staticmethod
+    def _interpreter() -> Interpreter:
+        """Construit un interpréteur avec des services simples."""
+        interpreter = Interpreter()
+
+        @service
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        @service
+        def total(values: list[int]) -> int:
+            return sum(values)
+
+        interpreter.register_service("add", add)
+        interpreter.register_service("total", total)
+        return interpreter
+
+    @pytest.mark.parametrize("concurrent", [False, True])
+    def test_interpret_script(self, concurrent: bool) -> None:
+        """Test un script de plusieurs appels séparés par ';' et fins de ligne."""
+        interpreter = self._interpreter()
+        source = "add(1, 2); total([1, 2, 3])\nadd(add(1, 1), 1)\n"
+
+        assert interpreter.interpret_script(source, concurrent=concurrent) == [3, 6, 3]
+        interpreter.close()
+
+    def test_script_is_validated_before_execution(self) -> None:
+        """Test qu'une erreur sémantique empêche l'exécution de tout appel."""
+        interpreter = self._interpreter()
+        calls: list[int] = []
+
+        @service
+        def record(x: int) -> int:
+            calls.append(x)
+            return x
+
+        interpreter.register_service("record", record)
+
+        with pytest.raises(BaobabSemanticAnalyserException):
+            interpreter.interpret_script('record(1); add("a", 2)')
+        assert not calls
+
+    def test_interpret_script_async(self) -> None:
+        """Test un script en mode asyncio."""
+        interpreter = self._interpreter()
+
+        result = asyncio.run(interpreter.interpret_script_async("add(1, 2)\nadd(3, 4)", True))
+        assert result == [3, 7]
+
+
+class TestInterpreterPipelines:
+    """Tests pour l'opérateur de pipeline."""
+
+    @staticmethod
+    def _interpreter() -> Interpreter:
+        """Construit un interpréteur avec des services de flux."""
+        interpreter = Interpreter()
+
+        @service
+        def numbers(count: int) -> Iterator[int]:
+            return iter(range(count))
+
+        @service
+        def scale(values: Iterator[int], factor: int) -> Iterator[int]:
+            return (value * factor for value in values)
+
+        @service
+        def total(values: Iterable[int]) -> int:
+            return sum(values)
+
+        @service
+        def as_list(values: Iterable[int]) -> list[int]:
+            return list(values)
+
+        @service
+        def first(values: list[int]) -> int:
+            return values[0]
+
+        for func in (numbers, scale, total, as_list, first):
+            interpreter.register_service(func.__name__, func)
+        return interpreter
+
+    def test_streaming_pipeline(self) -> None:
+        """Test un pipeline de générateurs."""
+        interpreter = self._interpreter()
+
+        assert interpreter.interpret("numbers(1000000) | scale(2) | total()") == 999999000000
+        assert interpreter.interpret("numbers(3) | as_list() | first()") == 0
+        assert interpreter.interpret("total([1, 2, 3])") == 6
+        interpreter.close()
+
+    def test_stream_is_not_accepted_as_list(self) -> None:
+        """Test qu'un flux n'est pas accepté pour un paramètre list[T]."""
+        interpreter = self._interpreter()
+
+        with pytest.raises(BaobabSemanticAnalyserException, match="first"):
+            interpreter.interpret("numbers(3) | first()")
+
+    def test_pipeline_async(self) -> None:
+        """Test un pipeline en mode asyncio."""
+        interpreter = self._interpreter()
+
+        assert asyncio.run(interpreter.interpret_async("numbers(4) | scale(3) | total()")) == 18
+
+
+class TestInterpreterStreaming:
+    """Tests pour la diffusion des résultats de services."""
+
+    @staticmethod
+    def _interpreter(produced: List[int]) -> Interpreter:
+        """Construit un interpréteur avec des services produisant des flux."""
+        interpreter = Interpreter()
+
+        @service
+        def rows(count: int) -> Iterator[int]:
+            for value in range(count):
+                produced.append(value)
+                yield value
+
+        @service
+        async def arows(count: int) -> AsyncIterator[int]:
+            for value in range(count):
+                await asyncio.sleep(0)
+                yield value
+
+        @service
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        for func in (rows, arows, add):
+            interpreter.register_service(func.__name__, func)
+        return interpreter
+
+    def test_interpret_stream(self) -> None:
+        """Test que les éléments sont produits à la demande."""
+        produced: List[int] = []
+        interpreter = self._interpreter(produced)
+        items = interpreter.interpret_stream("rows(1000000)")
+
+        assert next(items) == 0
+        assert produced == [0]
+        items.close()
+        assert list(interpreter.interpret_stream("arows(5)", chunk_size=2)) == [[0, 1], [2, 3], [4]]
+        assert list(interpreter.interpret_stream("add(1, 2)")) == [3]
+
+    def test_interpret_stream_validates_before_executing(self) -> None:
+        """Test qu'une taille de lot invalide est rejetée avant l'appel du service."""
+        produced: List[int] = []
+        interpreter = self._interpreter(produced)
+
+        with pytest.raises(ValueError):
+            interpreter.interpret_stream("rows(3)", chunk_size=0)
+
+    def test_interpret_stream_async(self) -> None:
+        """Test la diffusion asynchrone avec arrêt anticipé."""
+        produced: List[int] = []
+        interpreter = self._interpreter(produced)
+
+        async def consume() -> List[Any]:
+            chunks = []
+            async for chunk in interpreter.interpret_stream_async("rows(1000000)", chunk_size=100):
+                chunks.append(chunk)
+                if len(chunks) == 2:
+                    break
+            chunks.extend([item async for item in interpreter.interpret_stream_async("arows(2)")])
+            return chunks
+
+        chunks = asyncio.run(consume())
+
+        assert chunks == [list(range(100)), list(range(100, 200)), 0, 1]
+        assert len(produced) < 1000
+
+    def test_stream_result_is_not_cached(self) -> None:
+        """Test qu'un générateur asynchrone n'est pas mémorisé."""
+        interpreter = Interpreter()
+
+        @service(pure=True)
+        async def ticks(count: int) -> AsyncIterator[int]:
+            for value in range(count):
+                yield value
+
+        interpreter.register_service("ticks", ticks)
+
+        assert list(interpreter.interpret_stream("ticks(2)")) == [0, 1]
+        assert list(interpreter.interpret_stream("ticks(2)")) == [0, 1]
+
+
+class TestInterpreterCompiled:
+    """Tests pour le mode compilé (machine virtuelle)."""
+
+    @staticmethod
+    def _interpreter() -> Interpreter:
+        """Construit un interpréteur compilé avec des services de test."""
+        interpreter = Interpreter(compiled=True)
+
+        @service
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        @service
+        def total(values: list[int]) -> int:
+            return sum(values)
+
+        for func in (add, total):
+            interpreter.register_service(func.__name__, func)
+        return interpreter
+
+    def test_programs_are_cached_by_source(self) -> None:
+        """Test qu'un code source est compilé une seule fois."""
+        interpreter = self._interpreter()
+
+        assert interpreter.interpret("add(1, total([2, 3]))") == 6
+        assert interpreter.interpret("add(1, total([2, 3]))") == 6
+        assert interpreter.interpret("add(add(1, 2), 3)") == 6
+        programs = interpreter.get_stats()["programs"]
+        assert (programs["hits"], programs["misses"], programs["size"]) == (1, 2, 2)
+
+    def test_reregistered_service_is_recompiled(self) -> None:
+        """Test qu'un programme périmé est recompilé."""
+        interpreter = self._interpreter()
+        assert interpreter.interpret("add(5, 3)") == 8
+
+        @service
+        def add(a: int, b: int) -> int:
+            return a - b
+
+        interpreter.register_service("add", add)
+
+        assert interpreter.interpret("add(5, 3)") == 2
+
+    def test_errors(self) -> None:
+        """Test les erreurs sémantiques et d'exécution en mode compilé."""
+        interpreter = self._interpreter()
+
+        @service
+        def divide(a: int, b: int) -> int:
+            return a // b
+
+        interpreter.register_service("divide", divide)
+
+        with pytest.raises(BaobabSemanticAnalyserException):
+            interpreter.interpret('add(1, "x")')
+        with pytest.raises(BaobabExecutionException, match="divide"):
+            interpreter.interpret("divide(1, 0)")
+
+
+class TestInterpreterPrepared:
+    """Tests pour les appels préparés en fonctions Python générées."""
+
+    @staticmethod
+    def _interpreter() -> Interpreter:
+        """Construit un interpréteur avec des services de test."""
+        interpreter = Interpreter()
+
+        @service
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        @service
+        def total(values: list[int]) -> int:
+            return sum(values)
+
+        for func in (add, total):
+            interpreter.register_service(func.__name__, func)
+        return interpreter
+
+    def test_prepared_functions_are_cached_by_source(self) -> None:
+        """Test qu'un code source est préparé une seule fois."""
+        interpreter = self._interpreter()
+        assert "prepared" not in interpreter.get_stats()
+
+        add = interpreter.prepare("add(1, 2)")
+        assert interpreter.prepare("add(1, 2)") is add
+        assert add() == 3
+        assert add(10, b=20) == 30
+        assert interpreter.prepare("add(1, total([2, 3]))")() == 6
+        prepared = interpreter.get_stats()["prepared"]
+        assert (prepared["hits"], prepared["misses"], prepared["size"]) == (1, 2, 2)
+
+    def test_reregistered_service_is_regenerated(self) -> None:
+        """Test qu'une fonction périmée est régénérée, même déjà retournée."""
+        interpreter = self._interpreter()
+        add = interpreter.prepare("add(5, 3)")
+        assert add() == 8
+
+        @service
+        def subtract(a: int, b: int) -> int:
+            return a - b
+
+        interpreter.register_service("add", subtract)
+
+        assert add() == 2
+        assert add(10, 4) == 6
+        regenerated = interpreter.prepare("add(5, 3)")
+        assert regenerated is not add
+        assert regenerated() == 2
+
+    def test_errors(self) -> None:
+        """Test les erreurs sémantiques et d'exécution des appels préparés."""
+        interpreter = self._interpreter()
+
+        @service
+        def divide(a: int, b: int) -> int:
+            return a // b
+
+        interpreter.register_service("divide", divide)
+
+        with pytest.raises(BaobabSemanticAnalyserException):
+            interpreter.prepare('add(1, "x")')
+        with pytest.raises(BaobabSemanticAnalyserException):
+            interpreter.prepare("total([1, 2])")(["x"])
+        with pytest.raises(BaobabExecutionException, match="divide"):
+            interpreter.prepare("divide(1, 2)")(1, 0)
+        interpreter.clear_services()
+        with pytest.raises(BaobabSemanticAnalyserException):
+            interpreter.prepare("add(1, 2)")
+
+
+class TestInterpreterValidationLevels:
+    """Tests pour les niveaux de validation des arguments."""
+
+    @staticmethod
+    def _interpreter(**options: Any) -> Interpreter:
+        """Construit un interpréteur avec un service de somme."""
+        interpreter = Interpreter(**options)
+
+        @service
+        def total(values: list[int]) -> int:
+            return len(values)
+
+        interpreter.register_service("total", total)
+        return interpreter
+
+    def test_interpreter_level(self) -> None:
+        """Test le niveau de validation par défaut de l'interpréteur."""
+        trusted = self._interpreter(validation="trusted")
+        shallow = self._interpreter(validation=ValidationLevel.SHALLOW)
+        source = "total([" + ", ".join(["1"] * 100 + ['"x"'] + ["1"] * 100) + "])"
+
+        assert trusted.interpret('total(["x"])') == 1
+        assert shallow.interpret(source) == 201
+        with pytest.raises(BaobabSemanticAnalyserException):
+            self._interpreter().interpret(source)
+        with pytest.raises(ValueError):
+            Interpreter(validation="none")
+
+    def test_per_call_level(self) -> None:
+        """Test le niveau de validation choisi pour un appel."""
+        interpreter = self._interpreter()
+
+        assert interpreter.interpret('total(["x"])', validation="trusted") == 1
+        assert interpreter.interpret_script('total(["x"]); total([1])', validation="trusted") == [
+            1,
+            1,
+        ]
+        assert list(interpreter.interpret_stream('total(["x"])', validation="trusted")) == [1]
+        assert asyncio.run(interpreter.interpret_async('total(["x"])', validation="trusted")) == 1
+        with pytest.raises(BaobabSemanticAnalyserException):
+            interpreter.interpret('total(["x"])')
+        with pytest.raises(BaobabSemanticAnalyserException):
+            self._interpreter(validation="trusted").interpret(
+                'total(["x"])', validation=ValidationLevel.FULL
+            )
+
+    def test_weaker_levels_do_not_fill_shared_caches(self) -> None:
+        """Test qu'un appel non validé complètement ne sert pas aux appels complets."""
+        cache = DiskCallCache(":memory:")
+        interpreter = self._interpreter(call_cache=cache)
+        interpreter.interpret('total(["x"])', validation="trusted")
+        with pytest.raises(BaobabSemanticAnalyserException):
+            interpreter.interpret('total(["x"])')
+
+        compiled = self._interpreter(compiled=True)
+        assert compiled.interpret('total(["x"])', validation="trusted") == 1
+        assert compiled.interpret('total(["x"])', validation="trusted") == 1
+        with pytest.raises(BaobabSemanticAnalyserException):
+            compiled.interpret('total(["x"])')
+
+
+class TestInterpreterHotReload:
+    """Tests pour le rechargement de services pendant des interprétations."""
+
+    @staticmethod
+    def _version(number: int) -> List[Any]:
+        """Crée les services ``pair`` et ``value`` d'une version."""
+
+        def pair(x: int) -> List[int]:
+            return [number, x]
+
+        def value() -> int:
+            return number
+
+        return [("pair", pair), ("value", value)]
+
+    def test_update_services(self) -> None:
+        """Test que update_services publie toutes les modifications ensemble."""
+        interpreter = Interpreter()
+        interpreter.register_service("old", abs)
+
+        with interpreter.update_services():
+            interpreter.clear_services()
+            for name, func in self._version(1):
+                interpreter.register_service(name, func)
+            assert interpreter.list_services() == ["old"]
+
+        assert interpreter.list_services() == ["pair", "value"]
+        assert interpreter.interpret("pair(value())") == [1, 1]
+
+    @pytest.mark.parametrize("options", [{}, {"compiled": True}])
+    def test_reload_during_analysis(self, options: Any) -> None:
+        """Test qu'un rechargement pendant l'analyse n'est pas vu par l'interprétation."""
+        interpreter = Interpreter(**options)
+        reload = self._version(2)
+
+        class Reloading:  # pylint: disable=too-few-public-methods
+            """Service qui recharge les services à la lecture de sa signature."""
+
+            def __init__(self, func: Any) -> None:
+                self._func = func
+
+            def __call__(self, *args: Any) -> Any:
+                return self._func(*args)
+
+            @property
+            def __signature__(self) -> Any:
+                if reload:
+                    with interpreter.update_services():
+                        for name, func in reload:
+                            interpreter.register_service(name, func)
+                    reload.clear()
+                return inspect.signature(self._func)
+
+        for name, func in self._version(1):
+            interpreter.register_service(name, Reloading(func))
+
+        assert interpreter.interpret("pair(value())") == [1, 1]
+        assert interpreter.interpret("pair(value())") == [2, 2]
+
+
+class TestInterpreterImports:
+    """Tests pour les modules importés avec l'interpréteur."""
+
+    OPTIONAL = [
+        "asyncio",
+        "concurrent.futures",
+        "multiprocessing",
+        "sqlite3",
+        "baobab_geek_interpreter.cache.disk_call_cache",
+        "baobab_geek_interpreter.execution.result_stream",
+        "baobab_geek_interpreter.execution.service_process_pool",
+        "baobab_geek_interpreter.semantic.service_manifest",
+        "baobab_geek_interpreter.vm.code_generator",
+        "baobab_geek_interpreter.vm.compiler",
+    ]
+
+    @staticmethod
+    def _loaded(statement: str, modules: List[str]) -> List[str]:
+        """Exécute une instruction dans un nouveau processus et liste les modules chargés."""
+        source = Path(baobab_geek_interpreter.__file__).parent.parent
+        code = (
+            f"import json, sys; {statement}; "
+            f"print(json.dumps([m for m in {modules!r} if m in sys.modules]))"
+        )
+        output = subprocess.run(
+            [sys.executable, "-S", "-c", code],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=dict(os.environ, PYTHONPATH=str(source)),
+        ).stdout.strip()
+        return cast(List[str], json.loads(output))
+
+    def test_optional_subsystems_are_not_imported(self) -> None:
+        """Test qu'un appel simple n'importe aucun sous-système optionnel."""
+        statement = (
+            "from baobab_geek_interpreter import Interpreter, service; "
+            "interpreter = Interpreter(); "
+            "interpreter.register_service('add', service(lambda a, b: a + b)); "
+            "assert interpreter.interpret('add(1, 2)') == 3"
+        )
+
+        assert self._loaded(statement, self.OPTIONAL) == []
+
+    def test_compiled_mode_imports_compiler(self) -> None:
+        """Test que le mode compilé importe le compilateur à la première interprétation."""
+        statement = (
+            "from baobab_geek_interpreter import Interpreter, service; "
+            "interpreter = Interpreter(compiled=True); "
+            "interpreter.register_service('add', service(lambda a, b: a + b)); "
+            "assert interpreter.interpret('add(1, 2)') == 3"
+        )
+
+        assert self._loaded(statement, self.OPTIONAL) == ["baobab_geek_interpreter.vm.compiler"]
@@ -0,0 +1,80 @@
+"""Tests unitaires pour les exports paresseux des paquets."""
+
+import importlib
+import math
+import os
+import subprocess
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+import baobab_geek_interpreter
+from baobab_geek_interpreter.lazy_exports import lazy_exports
+
+PACKAGES = [
+    "baobab_geek_interpreter",
+    "baobab_geek_interpreter.cache",
+    "baobab_geek_interpreter.exceptions",
+    "baobab_geek_interpreter.execution",
+    "baobab_geek_interpreter.lexical",
+    "baobab_geek_interpreter.lexical.automaton",
+    "baobab_geek_interpreter.semantic",
+    "baobab_geek_interpreter.syntax",
+    "baobab_geek_interpreter.vm",
+]
+
+
+class TestLazyExports:
+    """Tests pour les fonctions __getattr__ et __dir__ des paquets."""
+
+    def test_attribute_is_imported_then_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test qu'un nom exporté est importé au premier accès puis conservé."""
+        package = ModuleType("lazy_package")
+        monkeypatch.setitem(sys.modules, "lazy_package", package)
+        getattr_, dir_ = lazy_exports("lazy_package", {"sqrt": "math"})
+        setattr(package, "__getattr__", getattr_)
+
+        assert package.sqrt is math.sqrt  # type: ignore[attr-defined]
+        assert vars(package)["sqrt"] is math.sqrt
+        assert "sqrt" in dir_()
+
+    def test_unknown_attribute(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test qu'un nom non exporté lève AttributeError."""
+        monkeypatch.setitem(sys.modules, "lazy_package", ModuleType("lazy_package"))
+        getattr_, _ = lazy_exports("lazy_package", {})
+
+        with pytest.raises(AttributeError, match="'lazy_package' has no attribute 'missing'"):
+            getattr_("missing")
+        with pytest.raises(AttributeError):
+            getattr(baobab_geek_interpreter, "missing")
+
+    @pytest.mark.parametrize("name", PACKAGES)
+    def test_every_export_resolves(self, name: str) -> None:
+        """Test que chaque nom de __all__ est exporté par le paquet."""
+        package = importlib.import_module(name)
+
+        for export in package.__all__:
+            assert getattr(package, export) is not None
+            assert export in dir(package)
+
+    def test_package_import_loads_no_module(self) -> None:
+        """Test que l'import du paquet n'importe aucun module de l'interpréteur."""
+        source = Path(baobab_geek_interpreter.__file__).parent.parent
+        code = (
+            "import sys; import baobab_geek_interpreter; "
+            "print(sorted(m for m in sys.modules if m.startswith('baobab')), "
+            "'typing' in sys.modules)"
+        )
+        output = subprocess.run(
+            [sys.executable, "-S", "-c", code],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=dict(os.environ, PYTHONPATH=str(source)),
+        ).stdout.strip()
+
+        assert output == (
+            "['baobab_geek_interpreter', 'baobab_geek_interpreter.lazy_exports'] False"
+        )
@@ -0,0 +1,182 @@
+"""Tests unitaires pour la classe CodeGenerator."""
+
+from typing import Any, Callable, List
+
+import pytest
+
+from baobab_geek_interpreter.exceptions.execution_exception import (
+    BaobabExecutionException,
+)
+from baobab_geek_interpreter.exceptions.semantic_exception import (
+    BaobabSemanticAnalyserException,
+)
+from baobab_geek_interpreter.execution.service_decorator import service
+from baobab_geek_interpreter.lexical.lexical_analyzer import LexicalAnalyzer
+from baobab_geek_interpreter.semantic.common_subexpression_eliminator import (
+    CommonSubexpressionEliminator,
+)
+from baobab_geek_interpreter.semantic.semantic_analyzer import SemanticAnalyzer
+from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+from baobab_geek_interpreter.syntax.syntax_analyzer import SyntaxAnalyzer
+from baobab_geek_interpreter.vm.code_generator import FILENAME, CodeGenerator
+from baobab_geek_interpreter.vm.compiler import Compiler
+
+
+def add(a: int, b: int) -> int:
+    """Service d'addition."""
+    return a + b
+
+
+def total(values: list[int]) -> int:
+    """Service de somme."""
+    return sum(values)
+
+
+def divide(a: int, b: int) -> int:
+    """Service de division entière."""
+    return a // b
+
+
+def echo(values: list) -> list:
+    """Service retournant son tableau (type non paramétré)."""
+    return values
+
+
+def _table() -> SymbolTable:
+    """Construit une table des symboles de test."""
+    table = SymbolTable()
+    for func in (add, total, divide, echo):
+        table.register(func.__name__, func)
+    return table
+
+
+def _generate(
+    table: SymbolTable, source: str, on_stale: Callable[..., Any] = lambda *args: args
+) -> Callable[..., Any]:
+    """Valide, compile puis génère la fonction d'un code source."""
+    ast = SyntaxAnalyzer(table).parse(LexicalAnalyzer().analyze(source))
+    CommonSubexpressionEliminator(table).eliminate(ast)
+    SemanticAnalyzer(table).analyze(ast)
+    program = Compiler(table).compile(ast)
+    callees = [func for _, func, _, _ in program.services]
+    return CodeGenerator(table).generate(program, callees, on_stale)
+
+
+class TestCodeGenerator:
+    """Tests pour la génération des fonctions spécialisées."""
+
+    def test_constant_arguments_become_parameters(self) -> None:
+        """Test que les constantes racines deviennent des paramètres par défaut."""
+        prepared = _generate(_table(), "add(1, 2)")
+
+        assert prepared() == 3
+        assert prepared(10, b=20) == 30
+        assert prepared.__name__ == "add"
+        assert prepared.__code__.co_filename == FILENAME
+
+    def test_nested_calls(self) -> None:
+        """Test l'exécution des appels imbriqués, sans paramètre."""
+        prepared = _generate(_table(), "add(add(1, 2), total([3, 4]))")
+
+        assert prepared() == 10
+        with pytest.raises(TypeError):
+            prepared(1)
+
+    def test_shared_call_is_evaluated_once(self) -> None:
+        """Test qu'un appel partagé n'est exécuté qu'une fois."""
+        calls: List[str] = []
+
+        @service(pure=True)
+        def size(name: str) -> int:
+            calls.append(name)
+            return len(name)
+
+        table = _table()
+        table.register("size", size)
+        prepared = _generate(table, 'add(size("ab"), size("ab"))')
+
+        assert prepared() == 4
+        assert calls == ["ab"]
+
+    def test_default_arrays_are_copied(self) -> None:
+        """Test que chaque appel reçoit sa propre copie d'un tableau par défaut."""
+        prepared = _generate(_table(), "echo([1, 2])")
+
+        first = prepared()
+        first.append(3)
+        assert prepared() == [1, 2]
+        assert _generate(_table(), "total(echo([1, 2]))")() == 3
+
+    def test_inline_validation(self) -> None:
+        """Test que les validations en ligne lèvent l'erreur de l'analyse sémantique."""
+        prepared = _generate(_table(), "total([1, 2])")
+
+        assert prepared([4, 5]) == 9
+        assert prepared([]) == 0
+        with pytest.raises(BaobabSemanticAnalyserException, match="incompatibles"):
+            prepared(["a"])
+        with pytest.raises(BaobabSemanticAnalyserException, match="homogènes"):
+            prepared([True, 1])
+        with pytest.raises(BaobabSemanticAnalyserException, match="incompatibles"):
+            prepared((1, 2))
+        with pytest.raises(BaobabSemanticAnalyserException, match="incompatibles"):
+            _generate(_table(), "add(1, 2)")(1, "2")
+
+    def test_fallback_validation(self) -> None:
+        """Test la validation complète d'un paramètre non vérifiable en ligne."""
+        prepared = _generate(_table(), "echo([1, 2])")
+
+        assert prepared([3]) == [3]
+        with pytest.raises(BaobabSemanticAnalyserException, match="imbriqués"):
+            prepared([[1]])
+
+    def test_errors_name_the_failing_service(self) -> None:
+        """Test qu'une exception d'un service imbriqué est attribuée à ce service."""
+        prepared = _generate(_table(), "add(divide(1, 0), add(1, 2))")
+
+        with pytest.raises(BaobabExecutionException) as exc_info:
+            prepared()
+        assert exc_info.value.service_name == "divide"
+        assert isinstance(exc_info.value.original_exception, ZeroDivisionError)
+        with pytest.raises(BaobabExecutionException, match="'divide'"):
+            _generate(_table(), "divide(1, 2)")(1, 0)
+
+    def test_execution_exception_is_propagated(self) -> None:
+        """Test qu'une BaobabExecutionException d'un service n'est pas encapsulée."""
+        error = BaobabExecutionException("échec", service_name="fail")
+
+        def fail(a: int) -> int:
+            raise error
+
+        table = _table()
+        table.register("fail", fail)
+
+        with pytest.raises(BaobabExecutionException) as exc_info:
+            _generate(table, "fail(1)")()
+        assert exc_info.value is error
+
+    def test_reregistered_service_delegates_to_on_stale(self) -> None:
+        """Test qu'un service ré-enregistré délègue l'appel à on_stale."""
+        table = _table()
+        prepared = _generate(table, "add(1, 2)", lambda *args: ("stale", args))
+
+        table.register("add", add)
+        assert prepared() == ("stale", (1, 2))
+        assert prepared(3, 4) == ("stale", (3, 4))
+        prepared = _generate(table, "add(1, 2)", lambda *args: ("stale", args))
+        table.clear()
+        assert prepared() == ("stale", (1, 2))
+
+    def test_signature_without_parameters(self) -> None:
+        """Test qu'un service à paramètres positionnels seuls ne donne pas de paramètres."""
+
+        def concat(a: str, b: str, /) -> str:
+            return a + b
+
+        table = _table()
+        table.register("concat", concat)
+        prepared = _generate(table, 'concat("a", "b")')
+
+        assert prepared() == "ab"
+        with pytest.raises(TypeError):
+            prepared("c")
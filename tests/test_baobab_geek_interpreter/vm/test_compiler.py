@@ -0,0 +1,121 @@
+"""Tests unitaires pour la classe Compiler."""
+
+import pytest
+
+from baobab_geek_interpreter.exceptions.semantic_exception import (
+    BaobabSemanticAnalyserException,
+)
+from baobab_geek_interpreter.execution.service_decorator import service
+from baobab_geek_interpreter.lexical.lexical_analyzer import LexicalAnalyzer
+from baobab_geek_interpreter.semantic.common_subexpression_eliminator import (
+    CommonSubexpressionEliminator,
+)
+from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+from baobab_geek_interpreter.syntax.ast_node import IntNode, ServiceCallNode
+from baobab_geek_interpreter.syntax.syntax_analyzer import SyntaxAnalyzer
+from baobab_geek_interpreter.vm.compiler import Compiler
+from baobab_geek_interpreter.vm.opcode import OpCode
+
+
+def add(a: int, b: int) -> int:
+    """Service d'addition."""
+    return a + b
+
+
+def total(values: list[int]) -> int:
+    """Service de somme."""
+    return sum(values)
+
+
+@service(pure=True)
+def load(name: str) -> list[int]:
+    """Service pur de chargement."""
+    return [len(name)]
+
+
+def _table() -> SymbolTable:
+    """Construit une table des symboles de test."""
+    table = SymbolTable()
+    for func in (add, total, load):
+        table.register(func.__name__, func)
+    return table
+
+
+def _parse(table: SymbolTable, source: str, compact: bool = True) -> ServiceCallNode:
+    """Analyse un code source."""
+    parser = SyntaxAnalyzer(table, compact_arguments=compact)
+    return parser.parse(LexicalAnalyzer().analyze(source))
+
+
+class TestCompiler:
+    """Tests pour la compilation d'un AST en instructions."""
+
+    def test_constants_and_arrays(self) -> None:
+        """Test la compilation des constantes et des tableaux."""
+        table = _table()
+        program = Compiler(table).compile(_parse(table, 'total([1, 2.5, "x", []])'))
+
+        assert program.disassemble() == [
+            "PUSH_CONST 1",
+            "PUSH_CONST 2.5",
+            "PUSH_CONST 'x'",
+            "BUILD_LIST 0",
+            "BUILD_LIST 4",
+            "CALL total 1",
+        ]
+        assert program.services == (("total", total, table.slot_of("total"), 0),)
+        assert program.local_count == 0
+
+    def test_nested_calls_in_postfix_order(self) -> None:
+        """Test que les appels imbriqués précèdent l'appel parent."""
+        table = _table()
+        program = Compiler(table).compile(_parse(table, "add(add(1, 2), total([3]))"))
+
+        assert program.disassemble() == [
+            "PUSH_CONST 1",
+            "PUSH_CONST 2",
+            "CALL add 2",
+            "PUSH_CONST 3",
+            "BUILD_LIST 1",
+            "CALL total 1",
+            "CALL add 2",
+        ]
+        assert len(program.services) == 2
+
+    def test_shared_call_is_compiled_once(self) -> None:
+        """Test qu'un appel pur partagé est rangé dans une variable locale."""
+        table = _table()
+        ast = _parse(table, 'add(total(load("ab")), total(load("ab")))')
+        CommonSubexpressionEliminator(table).eliminate(ast)
+        program = Compiler(table).compile(ast)
+
+        assert program.disassemble() == [
+            "PUSH_CONST 'ab'",
+            "CALL load 1",
+            "STORE 0",
+            "CALL total 1",
+            "LOAD 0",
+            "CALL total 1",
+            "CALL add 2",
+        ]
+        assert program.local_count == 1
+
+    def test_argument_nodes(self) -> None:
+        """Test la compilation d'un AST construit avec des enveloppes d'arguments."""
+        table = _table()
+        program = Compiler(table).compile(_parse(table, "add(1, add(2, 3))", compact=False))
+
+        assert [opcode for opcode, _, _ in program.instructions] == [
+            OpCode.PUSH_CONST,
+            OpCode.PUSH_CONST,
+            OpCode.PUSH_CONST,
+            OpCode.CALL,
+            OpCode.CALL,
+        ]
+
+    def test_unknown_service(self) -> None:
+        """Test le rejet d'un service inconnu."""
+        ast = ServiceCallNode.from_values("missing", [IntNode(1)])
+
+        with pytest.raises(BaobabSemanticAnalyserException, match="missing"):
+            Compiler(_table()).compile(ast)
@@ -0,0 +1,50 @@
+"""Tests unitaires pour la classe Program."""
+
+from baobab_geek_interpreter.semantic.symbol_table import SymbolTable
+from baobab_geek_interpreter.vm.opcode import OpCode
+from baobab_geek_interpreter.vm.program import Program
+
+
+def add(a: int, b: int) -> int:
+    """Service d'addition."""
+    return a + b
+
+
+def _program() -> Program:
+    """Construit le programme de ``add(1, 2)``."""
+    return Program(
+        ((OpCode.PUSH_CONST, 1, 0), (OpCode.PUSH_CONST, 2, 0), (OpCode.CALL, 0, 2)),
+        (("add", add, 0, 0),),
+    )
+
+
+class TestProgram:
+    """Tests pour les programmes compilés."""
+
+    def test_is_current(self) -> None:
+        """Test la détection d'un service ré-enregistré ou supprimé."""
+        table = SymbolTable()
+        table.register("add", add)
+        program = _program()
+
+        assert program.is_current(table)
+        table.register("add", lambda a, b: a - b)
+        assert not program.is_current(table)
+        assert not program.is_current(SymbolTable())
+
+    def test_disassemble_and_repr(self) -> None:
+        """Test les représentations du programme."""
+        program = Program(
+            _program().instructions + ((OpCode.STORE, 0, 0), (OpCode.LOAD, 0, 0)),
+            _program().services,
+            1,
+        )
+
+        assert program.disassemble() == [
+            "PUSH_CONST 1",
+            "PUSH_CONST 2",
+            "CALL add 2",
+            "STORE 0",
+            "LOAD 0",
+        ]
+        assert repr(program) == "Program(instructions=5, services=1)"
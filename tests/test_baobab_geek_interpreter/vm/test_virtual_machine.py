@@ -0,0 +1,108 @@
+"""Tests unitaires pour la classe VirtualMachine."""
+
+from typing import List
+
+import pytest
+
+from baobab_geek_interpreter.exceptions.execution_exception import (
+    BaobabExecutionException,
+)
+from baobab_geek_interpreter.vm.opcode import OpCode
+from baobab_geek_interpreter.vm.program import Program
+from baobab_geek_interpreter.vm.virtual_machine import VirtualMachine
+
+
+def add(a: int, b: int) -> int:
+    """Service d'addition."""
+    return a + b
+
+
+def pair(a: List[int], b: List[int]) -> List[List[int]]:
+    """Service retournant ses deux arguments."""
+    return [a, b]
+
+
+class TestVirtualMachine:
+    """Tests pour l'exécution des programmes."""
+
+    def test_call(self) -> None:
+        """Test l'exécution d'un appel et d'un appel imbriqué."""
+        program = Program(
+            (
+                (OpCode.PUSH_CONST, 1, 0),
+                (OpCode.PUSH_CONST, 2, 0),
+                (OpCode.CALL, 0, 2),
+                (OpCode.PUSH_CONST, 3, 0),
+                (OpCode.CALL, 0, 2),
+            ),
+            (("add", add, 0, 0),),
+        )
+
+        assert VirtualMachine.run(program, [add]) == 6
+
+    def test_lists_are_built_for_each_run(self) -> None:
+        """Test que chaque exécution construit ses propres listes."""
+        program = Program(
+            (
+                (OpCode.PUSH_CONST, 1, 0),
+                (OpCode.BUILD_LIST, None, 1),
+                (OpCode.BUILD_LIST, None, 0),
+                (OpCode.CALL, 0, 2),
+            ),
+            (("pair", pair, 0, 0),),
+        )
+
+        first = VirtualMachine.run(program, [pair])
+        first[0].append(2)
+        assert first == [[1, 2], []]
+        assert VirtualMachine.run(program, [pair]) == [[1], []]
+
+    def test_locals_and_call_without_arguments(self) -> None:
+        """Test les variables locales et un appel sans argument."""
+        calls: List[int] = []
+
+        def tick() -> int:
+            calls.append(1)
+            return len(calls)
+
+        program = Program(
+            (
+                (OpCode.CALL, 0, 0),
+                (OpCode.STORE, 0, 0),
+                (OpCode.LOAD, 0, 0),
+                (OpCode.CALL, 1, 2),
+            ),
+            (("tick", tick, 0, 0), ("add", add, 1, 0)),
+            1,
+        )
+
+        assert VirtualMachine.run(program, [tick, add]) == 2
+        assert calls == [1]
+
+    def test_service_error_is_wrapped(self) -> None:
+        """Test l'encapsulation de l'exception d'un service."""
+
+        def fail(a: int) -> int:
+            raise ValueError(f"échec {a}")
+
+        program = Program(
+            ((OpCode.PUSH_CONST, 1, 0), (OpCode.CALL, 0, 1)),
+            (("fail", fail, 0, 0),),
+        )
+
+        with pytest.raises(BaobabExecutionException, match="fail") as exc_info:
+            VirtualMachine.run(program, [fail])
+        assert isinstance(exc_info.value.original_exception, ValueError)
+
+    def test_execution_error_is_not_wrapped_twice(self) -> None:
+        """Test qu'une exception d'exécution est propagée telle quelle."""
+        error = BaobabExecutionException("déjà encapsulée", service_name="inner")
+
+        def dispatch() -> None:
+            raise error
+
+        program = Program(((OpCode.CALL, 0, 0),), (("inner", dispatch, 0, 0),))
+
+        with pytest.raises(BaobabExecutionException) as exc_info:
+            VirtualMachine.run(program, [dispatch])
+        assert exc_info.value is error